@@ -5,25 +5,22 @@ import getpass
 import json
 import os
 import platform as _platform
+import re
+import shutil
 import subprocess
 import sys
 import time
+import traceback
 from pathlib import Path
 
 import pytest
-from appium import webdriver
-from appium.options.android import UiAutomator2Options
-from appium.options.ios import XCUITestOptions
-from appium.webdriver.common.appiumby import AppiumBy
 
 from config.capabilities import ANDROID_CAPS, IOS_CAPS, get_appium_server_url, ENV_TYPE
 
-from utils.initial_screens import handle_initial_screens
-
-try:
-    import allure  # type: ignore
-except Exception:  # pragma: no cover
-    allure = None
+# appium/selenium, utils.initial_screens는 드라이버 픽스처에서, allure는 첫 첨부 때(_allure) import
+# (pytest --collect-only / --help, 후처리 도구가 드라이버 없이 빨리 시작하도록)
+_allure_module = None
+_allure_checked = False
 
 
 def _get_any_driver(item):
@@ -34,9 +31,27 @@ def _get_any_driver(item):
     )
 
 
-def _safe_allure_attach(name: str, data: bytes, attachment_type):
+def _allure():
+    global _allure_module, _allure_checked
+    if not _allure_checked:
+        _allure_checked = True
+        try:
+            import allure  # type: ignore
+            _allure_module = allure
+        except Exception:  # pragma: no cover
+            _allure_module = None
+    return _allure_module
+
+
+def _safe_allure_attach(name: str, data: bytes, attachment_type: str | tuple[str, ...]):
+    """attachment_type: allure.attachment_type 멤버 이름 (튜플이면 앞에서부터 있는 것)."""
+    allure = _allure()
     if allure is None:
         return
+    names = (attachment_type,) if isinstance(attachment_type, str) else attachment_type
+    attachment_type = next(
+        (getattr(allure.attachment_type, n) for n in names if hasattr(allure.attachment_type, n)), None
+    )
     try:
         allure.attach(data, name=name, attachment_type=attachment_type)
     except Exception:
@@ -184,11 +199,16 @@ def _safe_get_ios_app_info(app_path: str) -> tuple[str, str]:
         return "", ""
 
 
-def _safe_get_android_platform_version() -> str:
+def _adb_command(serial: str, *args: str) -> list[str]:
+    """adb 명령 (serial이 있으면 -s로 대상 디바이스 지정 — 여러 대 연결 시 Appium과 같은 디바이스 조회)."""
+    return ["adb", *(["-s", serial] if serial else []), *args]
+
+
+def _safe_get_android_platform_version(serial: str = "") -> str:
     """adb를 통해 Android OS 버전 조회 (예: 14, 13)"""
     try:
         proc = subprocess.run(
-            ["adb", "shell", "getprop", "ro.build.version.release"],
+            _adb_command(serial, "shell", "getprop", "ro.build.version.release"),
             check=True,
             capture_output=True,
             text=True,
@@ -198,7 +218,7 @@ def _safe_get_android_platform_version() -> str:
         return ""
 
 
-def _safe_get_android_device_model(max_retries: int = 3, retry_delay: float = 1.0) -> str:
+def _safe_get_android_device_model(max_retries: int = 3, retry_delay: float = 1.0, serial: str = "") -> str:
     """adb를 통해 디바이스 모델명 조회
 
     조회 우선순위:
@@ -210,12 +230,13 @@ def _safe_get_android_device_model(max_retries: int = 3, retry_delay: float = 1.
     Args:
         max_retries: adb 연결 실패 시 재시도 횟수
         retry_delay: 재시도 간 대기 시간(초)
+        serial: 조회할 디바이스 시리얼 (없으면 adb 기본 디바이스)
     """
     for attempt in range(max_retries):
         # 1) 에뮬레이터: AVD 이름 조회
         try:
             proc = subprocess.run(
-                ["adb", "shell", "getprop", "ro.boot.qemu.avd_name"],
+                _adb_command(serial, "shell", "getprop", "ro.boot.qemu.avd_name"),
                 check=True,
                 capture_output=True,
                 text=True,
@@ -230,7 +251,7 @@ def _safe_get_android_device_model(max_retries: int = 3, retry_delay: float = 1.
         # 2) 실물 디바이스: 모델명 조회
         try:
             proc = subprocess.run(
-                ["adb", "shell", "getprop", "ro.product.model"],
+                _adb_command(serial, "shell", "getprop", "ro.product.model"),
                 check=True,
                 capture_output=True,
                 text=True,
@@ -249,6 +270,185 @@ def _safe_get_android_device_model(max_retries: int = 3, retry_delay: float = 1.
     return ""
 
 
+# 세션 메타데이터 캐시: 앱 파일(경로+mtime+크기), 디바이스(adb serial/transport), git HEAD가 같으면
+# aapt/adb/simctl/git 프로브를 다시 실행하지 않음
+SESSION_META_CACHE = Path(__file__).resolve().parent / ".cache" / "session_meta.json"
+_SESSION_META_KEEP = 8
+
+
+def _file_key(path: str) -> str:
+    """파일 경로+수정시각+크기 (.app 번들은 Info.plist 기준). 없으면 빈 문자열."""
+    if not path:
+        return ""
+    target = Path(path) / "Info.plist" if os.path.isdir(path) else Path(path)
+    try:
+        st = target.stat()
+    except OSError:
+        return ""
+    return f"{target.resolve()}|{st.st_mtime_ns}|{st.st_size}"
+
+
+def _git_head(repo_root: Path) -> str:
+    """.git/HEAD를 직접 읽어 "ref|sha"를 반환합니다 (git 프로세스 없이). 실패 시 빈 문자열."""
+    git_dir = repo_root / ".git"
+    try:
+        if git_dir.is_file():
+            # worktree: "gitdir: <path>"
+            git_dir = (repo_root / git_dir.read_text(encoding="utf-8").split(":", 1)[1].strip()).resolve()
+        common_dir = git_dir
+        if (git_dir / "commondir").is_file():
+            common_dir = (git_dir / (git_dir / "commondir").read_text(encoding="utf-8").strip()).resolve()
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref:"):
+            return f"HEAD|{head}"
+        ref = head[4:].strip()
+        for base in (git_dir, common_dir):
+            ref_file = base / ref
+            if ref_file.is_file():
+                return f"{ref}|{ref_file.read_text(encoding='utf-8').strip()}"
+        for line in (common_dir / "packed-refs").read_text(encoding="utf-8").splitlines():
+            if line.endswith(f" {ref}"):
+                return f"{ref}|{line.split()[0]}"
+    except (OSError, IndexError):
+        pass
+    return ""
+
+
+def _android_serial(caps: dict) -> str:
+    """Appium이 붙을 디바이스 시리얼: caps udid(ANDROID_UDID) → ANDROID_SERIAL 순. 없으면 빈 문자열."""
+    return (
+        str(caps.get("udid", "") or "").strip()
+        or os.environ.get("ANDROID_UDID", "")
+        or os.environ.get("ANDROID_SERIAL", "")
+    )
+
+
+def _adb_device_key(serial: str = "") -> str:
+    """adb devices -l의 대상 디바이스 줄 (serial + model + transport_id). 없으면 빈 문자열.
+
+    transport_id는 디바이스 재연결/에뮬레이터 재부팅 시 바뀌므로 AVD가 바뀐 경우도 구분됩니다.
+    serial이 없으면 첫 번째 디바이스 (adb 기본 대상과 같음).
+    """
+    try:
+        proc = subprocess.run(["adb", "devices", "-l"], capture_output=True, text=True, timeout=3)
+    except Exception:
+        return ""
+    for line in (proc.stdout or "").splitlines()[1:]:
+        parts = line.split()
+        if len(parts) >= 2 and parts[1] == "device" and (not serial or parts[0] == serial):
+            return " ".join(parts)
+    return ""
+
+
+def _load_session_meta_cache() -> dict:
+    try:
+        data = json.loads(SESSION_META_CACHE.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_session_meta_cache(cache: dict) -> None:
+    try:
+        SESSION_META_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = SESSION_META_CACHE.with_name(f".{SESSION_META_CACHE.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(cache, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, SESSION_META_CACHE)
+    except OSError:
+        pass
+
+
+def _probe_git(repo_root: Path) -> dict:
+    return {
+        "branch": _safe_run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_root),
+        "commit": _safe_run_git(["rev-parse", "--short", "HEAD"], cwd=repo_root),
+        "fullCommit": _safe_run_git(["rev-parse", "HEAD"], cwd=repo_root),
+        "message": _safe_run_git(["log", "-1", "--pretty=%s"], cwd=repo_root),
+    }
+
+
+def _probe_android_device(need_version: bool, need_model: bool, serial: str = "") -> dict:
+    return {
+        "platformVersion": _safe_get_android_platform_version(serial) if need_version else "",
+        "model": _safe_get_android_device_model(serial=serial) if need_model else "",
+    }
+
+
+def _probe_ios_simulator() -> dict:
+    name, version = _safe_get_ios_simulator_info()
+    return {"model": name, "platformVersion": version}
+
+
+def _collect_session_meta(platform_name: str, caps: dict, app_path: str, repo_root: Path) -> dict:
+    """앱/디바이스/git 메타데이터를 캐시에서 읽고, 없는 항목만 동시에 조회합니다.
+
+    Returns:
+        {"app": {"name", "version"}, "device": {"platformVersion", "model"},
+         "git": {"branch", "commit", "fullCommit", "message"}}
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    device_name = str(caps.get("deviceName", "") or "").strip()
+    need_version = not str(caps.get("platformVersion", "") or "").strip()
+    need_model = not device_name or device_name == "Android Emulator"
+
+    keys = {"git": _git_head(repo_root)}
+    app_key = _file_key(app_path)
+    keys["app"] = f"{platform_name}|{app_key}" if app_key else ""
+    if platform_name == "ios":
+        udid = str(caps.get("udid", "") or "").strip()
+        keys["device"] = f"ios|{udid}" if udid else ""
+    elif (need_version or need_model) and shutil.which("adb"):
+        device_key = _adb_device_key(_android_serial(caps))
+        keys["device"] = f"android|{int(need_version)}{int(need_model)}|{device_key}" if device_key else ""
+
+    probes = {"git": lambda: _probe_git(repo_root)}
+    if platform_name == "ios":
+        probes["app"] = lambda: dict(zip(("name", "version"), _safe_get_ios_app_info(app_path)))
+        probes["device"] = _probe_ios_simulator
+    else:
+        probes["app"] = lambda: dict(zip(("name", "version"), _safe_get_apk_info(app_path)))
+        # adb가 없으면 재시도 대기 없이 건너뜀
+        if (need_version or need_model) and shutil.which("adb"):
+            serial = _android_serial(caps)
+            probes["device"] = lambda: _probe_android_device(need_version, need_model, serial)
+
+    cache = _load_session_meta_cache()
+    meta: dict[str, dict] = {}
+    missing = []
+    for name in probes:
+        cached = cache.get(name, {}).get(keys.get(name, "")) if keys.get(name) else None
+        if isinstance(cached, dict):
+            meta[name] = cached
+        else:
+            missing.append(name)
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            futures = {name: pool.submit(probes[name]) for name in missing}
+            for name, future in futures.items():
+                try:
+                    meta[name] = future.result()
+                except Exception:
+                    meta[name] = {}
+        changed = False
+        for name in missing:
+            key = keys.get(name, "")
+            # 조회 실패(빈 값)는 캐시하지 않음
+            if key and any(meta[name].values()):
+                section = cache.setdefault(name, {})
+                section.pop(key, None)
+                section[key] = meta[name]
+                while len(section) > _SESSION_META_KEEP:
+                    del section[next(iter(section))]
+                changed = True
+        if changed:
+            _save_session_meta_cache(cache)
+
+    meta.setdefault("device", {})
+    return meta
+
+
 def _write_executor_json(results_path: Path, build_name: str) -> None:
     executor = {
         "name": getpass.getuser() or "local",
@@ -264,6 +464,161 @@ def _write_executor_json(results_path: Path, build_name: str) -> None:
     )
 
 
+# Allure 실패 분류 (categories.json)
+_ALLURE_CATEGORIES = [
+    {
+        "name": "Appium 서버 연결 실패",
+        "matchedStatuses": ["broken", "failed"],
+        "traceRegex": ".*(ConnectionRefusedError|WinError 10061|MaxRetryError|Failed to establish a new connection).*",
+    },
+    {
+        "name": "UI 동기화/대기 타임아웃",
+        "matchedStatuses": ["broken", "failed"],
+        "traceRegex": ".*(TimeoutException|Timed out|WebDriverWait).*",
+    },
+    {
+        "name": "요소 탐색 실패",
+        "matchedStatuses": ["broken", "failed"],
+        "traceRegex": ".*(NoSuchElementException|Unable to locate element).*",
+    },
+    {
+        "name": "Stale element",
+        "matchedStatuses": ["broken", "failed"],
+        "traceRegex": ".*(StaleElementReferenceException|StaleObjectException).*",
+    },
+]
+
+# 같은 세션에서 재실행할 불안정(flaky) 실패 분류 — 위 분류의 traceRegex를 그대로 사용
+_FLAKY_CATEGORY_NAMES = ("UI 동기화/대기 타임아웃", "Stale element")
+_FLAKY_PATTERNS = [
+    (c["name"], re.compile(c["traceRegex"]))
+    for c in _ALLURE_CATEGORIES
+    if c["name"] in _FLAKY_CATEGORY_NAMES
+]
+# 재실행 전 UI 안정화 대기 (초)
+FLAKY_RERUN_DELAY = 2.0
+# run_history.py와 공유하는 파일 이름
+RERUNS_FILE_NAME = "flaky_reruns.json"
+QUARANTINE_FILE_NAME = "quarantine.json"
+# run_allure가 --reports-root 기준 격리 목록 경로를 넘기는 환경 변수
+QUARANTINE_FILE_ENV = "QUARANTINE_FILE"
+
+
+def _allure_full_name(item) -> str:
+    """allure-pytest의 fullName 규칙 (경로.모듈[.클래스]#함수) — run_history 키와 동일."""
+    path = item.nodeid.split("::", 1)[0].rsplit(".", 1)[0].replace("/", ".")
+    cls = item.getparent(pytest.Class)
+    class_part = f".{cls.name}" if cls is not None else ""
+    name = getattr(item, "originalname", None) or item.name.split("[")[0]
+    return f"{path}{class_part}#{name}"
+
+
+def _flaky_signature(exc: BaseException) -> str:
+    """예외가 불안정 실패 분류에 해당하면 분류 이름, 아니면 ""."""
+    text = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+    for name, pattern in _FLAKY_PATTERNS:
+        if pattern.search(text):
+            return name
+    return ""
+
+
+def _install_flaky_rerun(item, reruns: int) -> None:
+    """테스트 본문(call)만 다시 실행하도록 item.runtest를 감쌉니다.
+
+    setup/fixture는 다시 실행하지 않으므로 드라이버와 로그인 상태가 그대로 유지됩니다.
+    불안정 분류(타임아웃, stale element)에 해당하지 않는 실패는 바로 실패 처리합니다.
+    """
+    original = item.runtest
+    item._flaky_attempts = []
+
+    def runtest():
+        for attempt in range(reruns + 1):
+            try:
+                return original()
+            except Exception as exc:
+                signature = _flaky_signature(exc)
+                if not signature or attempt >= reruns:
+                    raise
+                message = (str(exc).strip().splitlines() or [type(exc).__name__])[0][:200]
+                item._flaky_attempts.append({
+                    "attempt": attempt + 1,
+                    "signature": signature,
+                    "error": f"{type(exc).__name__}: {message}",
+                })
+                _safe_allure_attach(
+                    name=f"flaky_rerun_{attempt + 1}_{item.name}.txt",
+                    data="".join(traceback.format_exception(type(exc), exc, exc.__traceback__)).encode("utf-8"),
+                    attachment_type="TEXT",
+                )
+                time.sleep(FLAKY_RERUN_DELAY)
+
+    item.runtest = runtest
+
+
+# 테스트 영향 맵 (tools/test_impact.py가 읽음)
+IMPACT_FILE_NAME = "test_impact.json"
+_IMPACT_PACKAGES = ("utils", "pages")
+
+
+class _ImpactRecorder:
+    """테스트별로 호출된 utils.* / pages.* 함수와 거친 화면(Activity)을 기록합니다.
+
+    sys.setprofile로 함수 호출 이벤트만 보며, 프로젝트의 utils/pages 파일이 아니면 바로 반환합니다.
+    Appium 호출 대기 시간에 비해 오버헤드는 무시할 수준입니다.
+    """
+
+    def __init__(self, repo_root: Path):
+        self._prefixes = tuple(str(repo_root / pkg) + os.sep for pkg in _IMPACT_PACKAGES)
+        self._root_len = len(str(repo_root)) + 1
+        self._modules: dict[str, str | None] = {}
+        self._current: set[str] | None = None
+        self.tests: dict[str, dict[str, set[str]]] = {}
+
+    def _module_of(self, filename: str) -> str | None:
+        module = self._modules.get(filename, "")
+        if module == "":
+            module = None
+            if filename.startswith(self._prefixes) and filename.endswith(".py"):
+                module = filename[self._root_len:-3].replace(os.sep, ".")
+            self._modules[filename] = module
+        return module
+
+    def _profile(self, frame, event, arg):
+        if event != "call":
+            return
+        code = frame.f_code
+        module = self._module_of(code.co_filename)
+        if module is not None and self._current is not None:
+            self._current.add(f"{module}:{getattr(code, 'co_qualname', code.co_name)}")
+
+    def start(self, nodeid: str) -> None:
+        entry = self.tests.setdefault(nodeid, {"symbols": set(), "screens": set()})
+        self._current = entry["symbols"]
+        sys.setprofile(self._profile)
+
+    def stop(self) -> None:
+        sys.setprofile(None)
+        self._current = None
+
+    def add_screen(self, nodeid: str, screen: str) -> None:
+        if screen and nodeid in self.tests:
+            self.tests[nodeid]["screens"].add(screen)
+
+    def write(self, results_path: Path, meta: dict) -> None:
+        data = {
+            **meta,
+            "tests": {
+                nodeid: {key: sorted(values) for key, values in entry.items()}
+                for nodeid, entry in self.tests.items()
+            },
+        }
+        results_path.mkdir(parents=True, exist_ok=True)
+        (results_path / IMPACT_FILE_NAME).write_text(
+            json.dumps(data, ensure_ascii=False, indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+
 def _dismiss_system_ui_dialog(driver, max_attempts=3, wait_after_dismiss=2):
     """
     'System UI isn't responding' 팝업이 있으면 Wait 버튼을 클릭하여 닫음
@@ -273,6 +628,8 @@ def _dismiss_system_ui_dialog(driver, max_attempts=3, wait_after_dismiss=2):
         max_attempts: 최대 시도 횟수
         wait_after_dismiss: 팝업 닫은 후 대기 시간(초)
     """
+    from appium.webdriver.common.appiumby import AppiumBy
+
     for attempt in range(max_attempts):
         try:
             # 짧은 implicit wait 설정 (팝업 확인용)
@@ -330,6 +687,35 @@ def pytest_addoption(parser):
         ),
     )
 
+    parser.addoption(
+        "--flaky-reruns",
+        action="store",
+        type=int,
+        default=0,
+        help=(
+            "타임아웃/stale element 실패 시 같은 세션에서 테스트 본문만 재실행할 횟수 "
+            "(기본 0: 끄기, trigger_listener 실행은 1)"
+        ),
+    )
+
+    parser.addoption(
+        "--quarantine",
+        action="store",
+        default="off",
+        choices=["off", "exclude", "only"],
+        help=(
+            "불안정 테스트 격리 목록(allure-reports/quarantine.json, QUARANTINE_FILE 환경 변수로 변경) 적용: "
+            "exclude=격리 테스트 제외, only=격리 테스트만 실행(격리 레인)"
+        ),
+    )
+
+    parser.addoption(
+        "--record-impact",
+        action="store_true",
+        default=False,
+        help="테스트별로 호출한 utils/pages 함수와 화면(Activity)을 test_impact.json에 기록",
+    )
+
 
 def pytest_configure(config):
     """설정 수집만 수행. 파일 쓰기는 pytest_sessionstart에서 실행.
@@ -359,15 +745,19 @@ def pytest_configure(config):
     caps = ANDROID_CAPS if platform_name == "android" else IOS_CAPS
     effective_app = app_path or str(caps.get("app", ""))
 
-    # 앱 이름/버전 추출 (플랫폼별 분기)
-    if platform_name == "ios":
-        app_name, app_version = _safe_get_ios_app_info(effective_app)
-    else:
-        app_name, app_version = _safe_get_apk_info(effective_app)
-
+    # 앱 이름/버전, OS 버전, 디바이스 모델, git 정보 (캐시 미스 항목만 동시 조회)
+    repo_root = Path(getattr(config, "rootpath", Path.cwd()))
+    session_meta = _collect_session_meta(platform_name, caps, effective_app, repo_root)
+    app_name = session_meta["app"].get("name", "")
+    app_version = session_meta["app"].get("version", "")
+    if app_version:
+        # utils.language 언어 목록 순서 캐시 키
+        os.environ.setdefault("GME_APP_VERSION", app_version)
+
+    device_meta = session_meta["device"]
     platform_version = str(caps.get("platformVersion", "") or "").strip()
     if not platform_version and platform_name == "android":
-        platform_version = _safe_get_android_platform_version()
+        platform_version = device_meta.get("platformVersion", "")
     # OS 버전에 플랫폼명 접두사 추가 (예: "14" → "Android 14")
     if platform_version:
         if platform_name == "android" and not platform_version.lower().startswith("android"):
@@ -378,26 +768,33 @@ def pytest_configure(config):
     # deviceName: 환경변수 > adb/simctl 동적 조회 > 기본값
     device_name = str(caps.get("deviceName", "") or "").strip()
     if platform_name == "android" and (not device_name or device_name == "Android Emulator"):
-        adb_model = _safe_get_android_device_model()
-        if adb_model:
-            device_name = adb_model
+        if device_meta.get("model"):
+            device_name = device_meta["model"]
     elif platform_name == "ios":
-        sim_name, sim_version = _safe_get_ios_simulator_info()
-        if sim_name:
-            device_name = sim_name
-        if sim_version and not platform_version:
-            platform_version = f"iOS {sim_version}"
+        if device_meta.get("model"):
+            device_name = device_meta["model"]
+        if device_meta.get("platformVersion") and not platform_version:
+            platform_version = f"iOS {device_meta['platformVersion']}"
     if not device_name:
         device_name = caps.get("deviceName", "Unknown")
 
-    repo_root = Path(getattr(config, "rootpath", Path.cwd()))
-    git_branch = _safe_run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_root)
-    git_commit = _safe_run_git(["rev-parse", "--short", "HEAD"], cwd=repo_root)
-    git_message = _safe_run_git(["log", "-1", "--pretty=%s"], cwd=repo_root)
+    git_meta = session_meta["git"]
+    git_branch = git_meta.get("branch", "")
+    git_commit = git_meta.get("commit", "")
+    git_message = git_meta.get("message", "")
     build_name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}|{platform_name}" + (
         f"|{git_branch}@{git_commit}" if (git_branch or git_commit) else ""
     )
 
+    if config.getoption("record_impact"):
+        config._impact_recorder = _ImpactRecorder(repo_root)
+        config._impact_meta = {
+            "platform": platform_name,
+            "appVersion": app_version,
+            "gitCommit": git_meta.get("fullCommit", ""),
+            "recordedAt": datetime.now().isoformat(timespec="seconds"),
+        }
+
     # config에 메타정보 저장 (pytest_sessionstart에서 파일로 기록)
     config._allure_meta = {
         "results_dir": results_dir,
@@ -421,28 +818,7 @@ def pytest_configure(config):
             f"gitCommit={git_commit}",
             f"gitMessage={git_message}",
         ],
-        "categories": [
-            {
-                "name": "Appium 서버 연결 실패",
-                "matchedStatuses": ["broken", "failed"],
-                "traceRegex": ".*(ConnectionRefusedError|WinError 10061|MaxRetryError|Failed to establish a new connection).*",
-            },
-            {
-                "name": "UI 동기화/대기 타임아웃",
-                "matchedStatuses": ["broken", "failed"],
-                "traceRegex": ".*(TimeoutException|Timed out|WebDriverWait).*",
-            },
-            {
-                "name": "요소 탐색 실패",
-                "matchedStatuses": ["broken", "failed"],
-                "traceRegex": ".*(NoSuchElementException|Unable to locate element).*",
-            },
-            {
-                "name": "Stale element",
-                "matchedStatuses": ["broken", "failed"],
-                "traceRegex": ".*(StaleElementReferenceException|StaleObjectException).*",
-            },
-        ],
+        "categories": _ALLURE_CATEGORIES,
     }
 
 
@@ -471,6 +847,70 @@ def pytest_sessionstart(session):
     )
 
 
+def pytest_collection_modifyitems(config, items):
+    """--quarantine: 격리 목록의 테스트를 제외하거나 격리 테스트만 남깁니다."""
+    mode = config.getoption("quarantine")
+    if mode == "off":
+        return
+    quarantine_path = Path(
+        os.environ.get(QUARANTINE_FILE_ENV)
+        or Path(getattr(config, "rootpath", Path.cwd())) / "allure-reports" / QUARANTINE_FILE_NAME
+    )
+    try:
+        data = json.loads(quarantine_path.read_text(encoding="utf-8"))
+        names = {t["fullName"] for t in data.get("tests", [])}
+    except (OSError, ValueError, KeyError, TypeError):
+        names = set()
+
+    keep, deselected = [], []
+    for item in items:
+        quarantined = _allure_full_name(item) in names
+        (keep if quarantined == (mode == "only") else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = keep
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    reruns = int(item.config.getoption("flaky_reruns") or 0)
+    if reruns > 0:
+        _install_flaky_rerun(item, reruns)
+
+    recorder = getattr(item.config, "_impact_recorder", None)
+    if recorder is None:
+        yield
+        return
+    recorder.start(item.nodeid)
+    try:
+        yield
+    finally:
+        recorder.stop()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    meta = getattr(session.config, "_allure_meta", None)
+    flaky_records = getattr(session.config, "_flaky_records", None)
+    if meta and flaky_records:
+        try:
+            results_path = Path(meta["results_dir"])
+            results_path.mkdir(parents=True, exist_ok=True)
+            (results_path / RERUNS_FILE_NAME).write_text(
+                json.dumps({"tests": flaky_records}, ensure_ascii=False, indent=2) + "\n",
+                encoding="utf-8",
+            )
+        except OSError:
+            pass
+
+    recorder = getattr(session.config, "_impact_recorder", None)
+    if recorder is None or not meta or not recorder.tests:
+        return
+    try:
+        recorder.write(Path(meta["results_dir"]), session.config._impact_meta)
+    except OSError:
+        pass
+
+
 @pytest.hookimpl(hookwrapper=True, tryfirst=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
@@ -482,6 +922,31 @@ def pytest_runtest_makereport(item, call):
 
     driver = _get_any_driver(item)
 
+    # 불안정 실패 재실행 기록 (run_history가 테스트별 불안정 비율 계산에 사용)
+    if report.when == "call" and getattr(item, "_flaky_attempts", None):
+        records = getattr(item.config, "_flaky_records", None)
+        if records is None:
+            records = item.config._flaky_records = []
+        records.append({
+            "nodeid": item.nodeid,
+            "fullName": _allure_full_name(item),
+            "attempts": item._flaky_attempts,
+            "outcome": report.outcome,
+        })
+
+    # 영향 맵: setup/call 종료 시점의 화면(Activity) 기록 (Android만)
+    recorder = getattr(item.config, "_impact_recorder", None)
+    if (
+        recorder is not None
+        and driver
+        and report.when in ("setup", "call")
+        and item.config._impact_meta.get("platform") == "android"
+    ):
+        try:
+            recorder.add_screen(item.nodeid, driver.current_activity or "")
+        except Exception:
+            pass
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     attach_mode = str(item.config.getoption("allure_attach") or "hybrid")
@@ -523,7 +988,7 @@ def pytest_runtest_makereport(item, call):
                 _safe_allure_attach(
                     name=f"screenshot_{status}_{phase}_{item.name}_{timestamp}.png",
                     data=png,
-                    attachment_type=getattr(allure.attachment_type, "PNG", None),
+                    attachment_type="PNG",
                 )
                 item._allure_screen_attached = True
             except Exception:
@@ -538,8 +1003,7 @@ def pytest_runtest_makereport(item, call):
                 _safe_allure_attach(
                     name=f"page_source_{item.name}_{timestamp}.xml",
                     data=source.encode("utf-8", errors="replace"),
-                    attachment_type=getattr(allure.attachment_type, "XML", None)
-                    or getattr(allure.attachment_type, "TEXT", None),
+                    attachment_type=("XML", "TEXT"),
                 )
         except Exception:
             pass
@@ -550,8 +1014,7 @@ def pytest_runtest_makereport(item, call):
                 _safe_allure_attach(
                     name=f"capabilities_{item.name}_{timestamp}.json",
                     data=json.dumps(caps, ensure_ascii=False, indent=2).encode("utf-8"),
-                    attachment_type=getattr(allure.attachment_type, "JSON", None)
-                    or getattr(allure.attachment_type, "TEXT", None),
+                    attachment_type=("JSON", "TEXT"),
                 )
         except Exception:
             pass
@@ -568,7 +1031,7 @@ def pytest_runtest_makereport(item, call):
                     _safe_allure_attach(
                         name=f"logcat_{item.name}_{timestamp}.txt",
                         data=log_text.encode("utf-8", errors="replace"),
-                        attachment_type=getattr(allure.attachment_type, "TEXT", None),
+                        attachment_type="TEXT",
                     )
         except Exception:
             pass
@@ -588,7 +1051,7 @@ def pytest_runtest_makereport(item, call):
                     _safe_allure_attach(
                         name=f"video_{status}_teardown_{item.name}_{stop_ts}.mp4",
                         data=video_bytes,
-                        attachment_type=getattr(allure.attachment_type, "MP4", None),
+                        attachment_type="MP4",
                     )
                     item._allure_video_attached = True
                 except Exception:
@@ -616,6 +1079,11 @@ def platform(request):
 @pytest.fixture(scope="function")
 def driver(request, platform):
     """Appium 드라이버 생성 픽스처"""
+    from appium import webdriver
+    from appium.options.android import UiAutomator2Options
+    from appium.options.ios import XCUITestOptions
+    from utils.initial_screens import handle_initial_screens
+
     app_path = request.config.getoption("--app")
 
     if platform == "android":
@@ -671,6 +1139,10 @@ def driver(request, platform):
 @pytest.fixture(scope="function")
 def android_driver(request):
     """Android 전용 드라이버"""
+    from appium import webdriver
+    from appium.options.android import UiAutomator2Options
+    from utils.initial_screens import handle_initial_screens
+
     app_path = request.config.getoption("--app")
     caps = ANDROID_CAPS.copy()
     if app_path:
@@ -729,6 +1201,9 @@ def android_driver_logged_in(android_driver):
 @pytest.fixture(scope="function")
 def ios_driver(request):
     """iOS 전용 드라이버"""
+    from appium import webdriver
+    from appium.options.ios import XCUITestOptions
+
     app_path = request.config.getoption("--app")
     caps = IOS_CAPS.copy()
     if app_path:
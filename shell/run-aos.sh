@@ -11,6 +11,7 @@
 #   ./shell/run-aos.sh --live --gme1_test           # Live APK + 특정 테스트
 #   ./shell/run-aos.sh --livetest --gme1_test      # LiveTest APK + 특정 테스트
 #   ./shell/run-aos.sh --report                     # 실행 후 Allure 리포트 열기
+#   ./shell/run-aos.sh --pool --gme1_test           # 웜 에뮬레이터 풀에서 임대해 실행
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
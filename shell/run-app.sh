@@ -15,6 +15,7 @@
 #   --generate    : generate allure html report (without server)
 #   --skip-check  : skip prerequisite checks
 #   --no-auto     : don't auto-start missing prerequisites
+#   --pool        : lease a warm emulator from tools/emulator_pool.py (Android, EMULATOR_POOL_URL)
 
 # Windows cp949 인코딩 문제 방지 (Python UTF-8 강제)
 export PYTHONIOENCODING=utf-8
@@ -35,6 +36,7 @@ RUN_ALL=false
 GENERATE_REPORT=false
 SKIP_CHECK=false
 AUTO_START=true
+USE_POOL=false
 
 APPIUM_CMD="npx appium"
 ALLURE_CMD="allure"
@@ -81,6 +83,10 @@ while [[ $# -gt 0 ]]; do
             AUTO_START=false
             shift
             ;;
+        --pool)
+            USE_POOL=true
+            shift
+            ;;
         --stg)
             ENV_TYPE="stg"
             shift
@@ -114,6 +120,7 @@ while [[ $# -gt 0 ]]; do
             echo "  --generate                Generate HTML report to allure-report folder"
             echo "  --skip-check              Skip prerequisite checks"
             echo "  --no-auto                 Don't auto-start missing prerequisites"
+            echo "  --pool                    Lease a warm emulator from the pool (tools/emulator_pool.py serve)"
             echo "  --help                    Show this help message"
             echo ""
             echo "Examples:"
@@ -124,6 +131,7 @@ while [[ $# -gt 0 ]]; do
             echo "  ./shell/run-app.sh --gme1_test --test test_Login # STG + specific test"
             echo "  ./shell/run-app.sh --app apk/custom.apk          # Custom APK"
             echo "  ./shell/run-app.sh --all --report                # All tests + report"
+            echo "  ./shell/run-app.sh --pool --gme1_test            # Warm emulator from pool"
             echo ""
             echo "iOS Examples:"
             echo "  ./shell/run-ios.sh --ios_contacts_test           # iOS test"
@@ -206,6 +214,24 @@ echo "  Appium Mobile Test Runner"
 echo "========================================"
 echo ""
 
+# ========================================
+# 웜 에뮬레이터 임대 (--pool, Android 전용)
+# emulator_pool.py serve가 스냅샷으로 띄워 둔 에뮬레이터를 1대 임대하고, 종료 시 반납
+# ========================================
+if [[ "$USE_POOL" == true && "$PLATFORM" == "android" ]]; then
+    POOL_SCRIPT="$PROJECT_ROOT/tools/emulator_pool.py"
+    echo "[STEP 0] Leasing warm emulator from pool (${EMULATOR_POOL_URL:-http://127.0.0.1:8791})..."
+    if LEASE_EXPORTS=$(python "$POOL_SCRIPT" lease --owner "run-app:$USER" --format shell); then
+        eval "$LEASE_EXPORTS"
+        trap 'python "$POOL_SCRIPT" release "$EMULATOR_LEASE_ID" > /dev/null 2>&1' EXIT
+        echo -e "${GREEN}[OK] Leased $ANDROID_UDID ($EMULATOR_LEASE_ID)${NC}"
+    else
+        echo -e "${RED}[ERROR] Could not lease an emulator. Start the pool: python tools/emulator_pool.py serve --avd <AVD>${NC}"
+        exit 1
+    fi
+    echo ""
+fi
+
 # ========================================
 # STEP 1: Prerequisite Checks & Auto-Start
 # ========================================
@@ -0,0 +1 @@
+# Offline replay tests package (recorded page_source, no device)
@@ -0,0 +1,136 @@
+"""녹화된 page_source로 utils 흐름을 재생하는 오프라인 테스트 (디바이스 불필요).
+
+실행 방법:
+    pytest tests/replay -v
+
+세션 데이터: tests/replay/sessions/<이름>/ (XML 덤프 + session.json 전이 표)
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from appium.webdriver.common.appiumby import AppiumBy
+from replay_driver import ReplayClock, ReplayDriver, ReplaySession
+
+from utils.initial_screens import handle_initial_screens
+from utils.language import set_language
+
+SESSIONS_DIR = Path(__file__).parent / "sessions"
+PREFIX = "com.gmeremit.online.gmeremittance_native.stag:id"
+
+
+@pytest.fixture
+def clock():
+    """가상 시계: sleep / WebDriverWait 대기를 실제로 기다리지 않습니다."""
+    with ReplayClock() as replay_clock:
+        yield replay_clock
+
+
+@pytest.fixture
+def language_cache(tmp_path, monkeypatch):
+    """언어 목록 순서 캐시를 테스트별 임시 파일로 분리합니다."""
+    path = tmp_path / "language_order.json"
+    monkeypatch.setenv("LANGUAGE_ORDER_CACHE", str(path))
+    monkeypatch.delenv("GME_APP_VERSION", raising=False)
+    return path
+
+
+@pytest.fixture
+def replay(clock, language_cache):
+    """세션 이름 → 재생 드라이버."""
+    return lambda name: ReplayDriver(ReplaySession.load(SESSIONS_DIR / name))
+
+
+def test_first_run_screens_reach_main(replay):
+    driver = replay("first_run")
+    assert driver.current_activity.endswith("SplashActivity")
+
+    assert handle_initial_screens(driver, PREFIX)
+
+    assert driver.screen == "004_Main"
+    assert driver.visited == ["001_Splash", "002_LanguageList", "003_Terms", "004_Main"]
+    assert any("English" in click for click in driver.clicks)
+
+
+def test_set_language_visible_item(replay):
+    driver = replay("language_select")
+    assert set_language(driver, "English", PREFIX)
+    assert driver.screen == "004_MainEnglish"
+
+
+def test_set_language_below_fold_scrolls(replay):
+    driver = replay("language_select")
+    assert set_language(driver, "Русский язык", PREFIX)
+    assert driver.screen == "005_MainRussian"
+    assert ("swipe", "002_LanguageList", "up") in driver.actions
+
+
+def test_set_language_unknown_fails_without_real_wait(replay, clock):
+    driver = replay("language_select")
+    started = time.perf_counter()
+    assert not set_language(driver, "Klingon", PREFIX)
+    assert time.perf_counter() - started < 5
+    # 타임아웃 대기 없이 scrollIntoView 1회 + page_source 탐색으로 실패
+    assert clock.elapsed < 10
+
+
+def test_language_order_cached_per_app_version(replay, language_cache, monkeypatch):
+    monkeypatch.setenv("GME_APP_VERSION", "7.0.0")
+    assert not set_language(replay("language_select"), "Klingon", PREFIX)
+
+    entry = json.loads(language_cache.read_text(encoding="utf-8"))["7.0.0"]
+    assert entry["complete"]
+    assert entry["order"][0] == "한국어" and "Русский язык" in entry["order"]
+
+    # 전체 목록을 아는 버전: 없는 언어는 스와이프 없이 바로 실패
+    driver = replay("language_select")
+    assert not set_language(driver, "Klingon", PREFIX)
+    assert not any(action[0] == "swipe" for action in driver.actions)
+
+    # 순서를 아는 언어는 page_source 없이 scrollIntoView 한 번으로 선택
+    driver = replay("language_select")
+    assert set_language(driver, "Русский язык", PREFIX)
+    assert driver.screen == "005_MainRussian"
+
+
+def test_language_order_not_cached_without_app_version(replay, language_cache):
+    # 앱 버전을 모르면 다른 버전의 "전체 목록" 기록으로 판단하지 않음
+    assert not set_language(replay("language_select"), "Klingon", PREFIX)
+    assert not language_cache.exists()
+
+    driver = replay("language_select")
+    assert set_language(driver, "Русский язык", PREFIX)
+    assert ("swipe", "002_LanguageList", "up") in driver.actions
+
+
+def test_locators_and_stale_elements(replay):
+    driver = replay("language_select")
+
+    button = driver.find_element(AppiumBy.ID, f"{PREFIX}/selectedLanguageText")
+    assert button.text == "한국어"
+    assert driver.find_element(AppiumBy.XPATH, "//*[@text='Login' or @text='로그인']").get_attribute("resource-id").endswith("btn_lgn")
+    assert driver.find_element(
+        AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().clickable(true).textMatches("(?i)new user.*")'
+    ).text.startswith("New User")
+
+    button.click()
+    with pytest.raises(StaleElementReferenceException):
+        button.click()
+
+    row = driver.find_element(AppiumBy.XPATH, f'//*[@resource-id="{PREFIX}/languageRv"]//*[contains(@text, "Engl")]/..')
+    assert row.get_attribute("clickable") == "true"
+    assert len(driver.find_elements(AppiumBy.ID, "countryLanguageText")) == 6
+    with pytest.raises(NoSuchElementException):
+        driver.find_element(AppiumBy.ID, f"{PREFIX}/btn_lgn")
+
+    driver.back()
+    assert driver.screen == "001_Main"
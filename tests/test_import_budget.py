@@ -0,0 +1,107 @@
+"""conftest / 도구 CLI import 시간 예산 테스트 (디바이스 불필요).
+
+pytest --collect-only / --help, run_allure 후처리, trigger_listener 기동이 느려지지 않도록
+`python -X importtime`으로 모듈 import 누적 시간을 재고, 무거운 의존성(appium, selenium,
+allure, Pillow, NumPy)을 import 시점에 끌어오지 않는지 확인합니다.
+`pytest --collect-only`는 프로세스 기동부터 수집 완료까지의 실제 시간도 잽니다.
+
+실행 방법:
+    pytest tests/test_import_budget.py -v
+
+느린 머신에서는 IMPORT_BUDGET_SCALE=2 처럼 예산 배율을 줄 수 있습니다.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+TOOLS = ROOT / "tools"
+
+# 측정 횟수 (최솟값 사용 — 디스크 캐시/스케줄링 잡음 제거)
+RUNS = 3
+BUDGET_SCALE = float(os.environ.get("IMPORT_BUDGET_SCALE", "1"))
+
+# (모듈, 실행 위치, 예산 ms, import되면 안 되는 모듈)
+# 측정치(Python 3.11): conftest ~165ms (pytest ~110ms 포함), 도구 30~80ms
+_DRIVER_MODULES = ("appium", "selenium", "allure", "utils.initial_screens")
+_HEAVY_MODULES = ("appium", "selenium", "PIL", "numpy")
+CASES = [
+    ("conftest", ROOT, 350, _DRIVER_MODULES),
+    ("run_allure", TOOLS, 150, _HEAVY_MODULES),
+    ("upload_to_dashboard", TOOLS, 200, _HEAVY_MODULES + ("failure_clusters",)),
+    ("update_dashboard", TOOLS, 150, _HEAVY_MODULES),
+    ("trigger_listener", TOOLS, 200, _HEAVY_MODULES + ("failure_clusters", "test_impact")),
+    ("teams_notify", TOOLS, 150, _HEAVY_MODULES),
+    ("export_summary", TOOLS, 150, _HEAVY_MODULES),
+]
+
+# pytest --collect-only 전체(인터프리터 기동 + 플러그인 + conftest + 수집) 예산
+# 측정치(Python 3.11): tests/replay 수집 ~800ms
+COLLECT_TARGET = "tests/replay"
+COLLECT_BUDGET_MS = 2000
+
+
+def _import_profile(module: str, cwd: Path) -> tuple[float, set[str]]:
+    """module import의 누적 시간(ms)과 함께 import된 모듈 이름들."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    total_us = None
+    names: set[str] = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # 헤더
+        names.add(name.strip())
+        if name.strip() == module and not name.startswith("  "):
+            total_us = int(cumulative)
+    assert total_us is not None, f"{module} import 시간을 찾지 못함"
+    return total_us / 1000, names
+
+
+@pytest.mark.parametrize("module,cwd,budget_ms,forbidden", CASES, ids=[c[0] for c in CASES])
+def test_import_budget(module, cwd, budget_ms, forbidden):
+    profiles = [_import_profile(module, cwd) for _ in range(RUNS)]
+    elapsed_ms = min(ms for ms, _ in profiles)
+
+    imported = profiles[0][1]
+    eager = sorted(
+        name for name in imported
+        if any(name == f or name.startswith(f + ".") for f in forbidden)
+    )
+    assert not eager, f"{module} import 시 무거운 모듈을 바로 불러옴: {eager}"
+
+    limit = budget_ms * BUDGET_SCALE
+    assert elapsed_ms <= limit, f"{module} import {elapsed_ms:.0f}ms > 예산 {limit:.0f}ms"
+
+
+def test_collect_only_budget():
+    elapsed = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", COLLECT_TARGET],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        elapsed.append((time.perf_counter() - started) * 1000)
+        assert proc.returncode == 0, (proc.stdout + proc.stderr)[-2000:]
+    elapsed_ms = min(elapsed)
+
+    limit = COLLECT_BUDGET_MS * BUDGET_SCALE
+    assert elapsed_ms <= limit, f"pytest --collect-only {COLLECT_TARGET} {elapsed_ms:.0f}ms > 예산 {limit:.0f}ms"
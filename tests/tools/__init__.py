@@ -0,0 +1 @@
+# Offline tools tests package (no device)
@@ -0,0 +1,102 @@
+"""allure_widgets 오프라인 테스트 (재실행 결과 합치기, 통계/시간, 그룹 위젯, 환경 정보).
+
+실행 방법:
+    pytest tests/tools/test_allure_widgets.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+from allure_widgets import DEFAULT_REPORT_NAME, build_widgets, write_widgets
+
+T0 = 1_700_000_000_000
+
+
+def _write_result(results_dir: Path, uuid: str, name: str, status: str, start: int, stop: int,
+                  history_id: str = "", labels: dict[str, str] | None = None) -> None:
+    results_dir.mkdir(parents=True, exist_ok=True)
+    data = {
+        "uuid": uuid,
+        "name": name,
+        "fullName": f"tests.android.gme1_test#{name}",
+        "status": status,
+        "start": start,
+        "stop": stop,
+        "labels": [{"name": k, "value": v} for k, v in (labels or {}).items()],
+    }
+    if history_id:
+        data["historyId"] = history_id
+    (results_dir / f"{uuid}-result.json").write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_reruns_collapse_to_latest_attempt(tmp_path):
+    results_dir = tmp_path / "20260101_000000"
+    labels = {"parentSuite": "tests.android", "feature": "송금"}
+    # test_send: 실패 → 재실행 통과 (같은 historyId), 마지막 시도만 집계
+    _write_result(results_dir, "a1", "test_send", "failed", T0, T0 + 4_000, "h-send", labels)
+    _write_result(results_dir, "a2", "test_send", "passed", T0 + 5_000, T0 + 8_000, "h-send", labels)
+    # historyId가 없으면 fullName으로 합침
+    _write_result(results_dir, "b1", "test_home", "broken", T0 + 1_000, T0 + 2_000, labels=labels)
+    _write_result(results_dir, "b2", "test_home", "broken", T0 + 9_000, T0 + 10_000, labels=labels)
+    _write_result(results_dir, "c1", "test_login", "skipped", T0 + 2_000, T0 + 2_500,
+                  labels={"suite": "login", "feature": "로그인"})
+
+    widgets = build_widgets(results_dir)
+    stat = widgets["summary"]["statistic"]
+    assert stat == {"passed": 1, "failed": 0, "broken": 1, "skipped": 1, "unknown": 0, "total": 3}
+
+    time = widgets["summary"]["time"]
+    # 전체 시간은 남은(마지막) 시도 기준
+    assert time["start"] == T0 + 2_000 and time["stop"] == T0 + 10_000
+    assert time["duration"] == 8_000
+    assert (time["minDuration"], time["maxDuration"], time["sumDuration"]) == (500, 3_000, 4_500)
+
+    suites = {item["name"]: item["statistic"]["total"] for item in widgets["suites"]["items"]}
+    assert suites == {"tests.android": 2, "login": 1}
+    assert [item["name"] for item in widgets["suites"]["items"]] == ["tests.android", "login"]
+    behaviors = {item["name"]: item["statistic"] for item in widgets["behaviors"]["items"]}
+    assert behaviors["송금"]["passed"] == 1 and behaviors["송금"]["broken"] == 1
+    # package 라벨이 없는 결과는 그룹에서 제외
+    assert widgets["packages"] == {"total": 0, "items": []}
+
+
+def test_environment_executor_and_write(tmp_path):
+    results_dir = tmp_path / "allure-results" / "20260101_000000"
+    _write_result(results_dir, "a1", "test_send", "passed", T0, T0 + 1_000, "h-send")
+    (results_dir / "environment.properties").write_text(
+        "# 주석\nplatform=android\ndeviceName = 갤럭시 S22\ngitBranch: main\nbroken\n", encoding="utf-8")
+    (results_dir / "executor.json").write_text(json.dumps({
+        "name": "trigger_listener", "type": "local", "reportName": "GME nightly",
+    }), encoding="utf-8")
+
+    widgets = build_widgets(results_dir)
+    assert widgets["summary"]["reportName"] == "GME nightly"
+    assert widgets["executors"] == [{"name": "trigger_listener", "type": "local", "reportName": "GME nightly"}]
+    assert widgets["environment"] == [
+        {"name": "platform", "values": ["android"]},
+        {"name": "deviceName", "values": ["갤럭시 S22"]},
+        {"name": "gitBranch", "values": ["main"]},
+    ]
+
+    report_dir = tmp_path / "allure-reports" / "20260101_000000"
+    assert write_widgets(results_dir, report_dir)
+    written = sorted(p.name for p in (report_dir / "widgets").iterdir())
+    assert written == ["behaviors.json", "environment.json", "executors.json",
+                       "packages.json", "suites.json", "summary.json"]
+    summary = json.loads((report_dir / "widgets" / "summary.json").read_text(encoding="utf-8"))
+    assert summary["statistic"]["total"] == 1
+
+
+def test_empty_results(tmp_path):
+    results_dir = tmp_path / "20260101_000000"
+    results_dir.mkdir()
+    assert build_widgets(results_dir) == {}
+    assert not write_widgets(results_dir, tmp_path / "report")
+    assert not (tmp_path / "report").exists()
+
+    _write_result(results_dir, "a1", "test_send", "passed", T0, T0 + 1_000)
+    assert build_widgets(results_dir)["summary"]["reportName"] == DEFAULT_REPORT_NAME
@@ -0,0 +1,120 @@
+"""blob_ledger 오프라인 테스트 (정리 정책, 목표 용량, 저널과의 정합성).
+
+실행 방법:
+    pytest tests/tools/test_blob_ledger.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import blob_ledger
+from blob_ledger import EVICTION_POLICIES, BlobLedger, ensure_capacity
+
+MB = 1024 * 1024
+
+# (타임스탬프, 브랜치, 실패 여부, 크기 MB)
+RUNS = [
+    ("20260101_000000", "main", True, 10),
+    ("20260102_000000", "main", False, 10),
+    ("20260103_000000", "feat", False, 10),
+    ("20260104_000000", "main", False, 10),
+    ("20260105_000000", "feat", True, 10),
+]
+
+
+@pytest.fixture
+def ledger(tmp_path, monkeypatch):
+    ledger = BlobLedger(tmp_path / "ledger.sqlite3")
+    for ts, branch, failed, size_mb in RUNS:
+        ledger.record_run(ts, branch, failed)
+        ledger.record_blob(f"attachments/{ts}/shot.png", f"https://blob.test/{ts}", size_mb * MB)
+
+    deleted: list[str] = []
+
+    def fake_delete(urls, token, api_url, **kwargs):
+        deleted.extend(urls)
+        return list(urls)
+
+    monkeypatch.setattr(blob_ledger, "delete_blobs", fake_delete)
+    monkeypatch.setattr(blob_ledger, "reconcile_ledger", lambda *a: True)
+    ledger.deleted = deleted
+    yield ledger
+    ledger.close()
+
+
+def _order(policy: str, ledger: BlobLedger, keep_last: int = 1) -> list[str]:
+    return [r.timestamp[:8] for r in EVICTION_POLICIES[policy](ledger.runs_usage(), keep_last)]
+
+
+def test_policy_orders(ledger):
+    assert _order("oldest-first", ledger) == ["20260101", "20260102", "20260103", "20260104", "20260105"]
+    # 통과한 실행을 먼저, 실패한 실행은 마지막
+    assert _order("keep-failed", ledger) == ["20260102", "20260103", "20260104", "20260101", "20260105"]
+    # 브랜치별 최근 1개(main 0104, feat 0105)는 마지막
+    assert _order("keep-last-per-branch", ledger) == ["20260101", "20260102", "20260103", "20260104", "20260105"]
+    assert _order("keep-last-per-branch", ledger, keep_last=2)[:2] == ["20260101", "20260102"]
+
+
+def test_under_threshold_deletes_nothing(ledger):
+    assert ensure_capacity(ledger, "t", "api", needed_bytes=0, limit_bytes=100 * MB, threshold=0.8) == 0
+    assert ledger.deleted == []
+
+
+def test_target_without_margin(ledger):
+    # evict --target-mb 30: 50MB → 30MB, 실행 2개(20MB)만 삭제
+    freed = ensure_capacity(ledger, "t", "api", needed_bytes=0, limit_bytes=30 * MB, threshold=1.0)
+    assert freed == 20 * MB
+    assert ledger.deleted == ["https://blob.test/20260101_000000", "https://blob.test/20260102_000000"]
+    assert ledger.usage_bytes() == 30 * MB
+
+
+def test_margin_and_protect(ledger):
+    # 업로드 직전 정리: 필요 용량 + 여유 공간까지 확보하되 현재 실행은 보존
+    freed = ensure_capacity(
+        ledger, "t", "api", needed_bytes=5 * MB, limit_bytes=50 * MB, threshold=1.0,
+        policy="keep-failed", protect={"20260102_000000"}, margin_bytes=12 * MB,
+    )
+    assert freed == 20 * MB
+    assert ledger.deleted == ["https://blob.test/20260103_000000", "https://blob.test/20260104_000000"]
+
+
+def test_dry_run_keeps_ledger(ledger):
+    planned = ensure_capacity(ledger, "t", "api", needed_bytes=0, limit_bytes=40 * MB,
+                              threshold=1.0, dry_run=True)
+    assert planned == 10 * MB
+    assert ledger.deleted == [] and ledger.usage_bytes() == 50 * MB
+
+
+def test_evicted_blob_is_reuploaded(ledger, tmp_path, monkeypatch):
+    import upload_to_dashboard as uploader
+
+    ts = "20260101_000000"
+    path = tmp_path / "shot.png"
+    path.write_bytes(b"png")
+    monkeypatch.setattr(uploader, "_collect_attachments", lambda _dir: [{
+        "name": "shot", "source": "shot.png", "type": "text/plain", "size": 3, "file_path": str(path),
+    }])
+    monkeypatch.setattr(uploader, "_save_artifact_metadata", lambda *a: True)
+    monkeypatch.setattr(uploader, "_cleanup_old_blobs", lambda *a, **k: None)
+    puts: list[str] = []
+    monkeypatch.setattr(uploader._BlobClient, "put_file",
+                        lambda self, fp, bp, ct, size: puts.append(bp) or f"https://blob.test/{ts}")
+
+    journal = uploader._UploadJournal(tmp_path / "journal.jsonl")
+    journal.record_blob(f"attachments/{ts}/shot.png", uploader._sha256_file(str(path)), 3,
+                        f"https://blob.test/{ts}")
+
+    # 장부에 남아 있으면 저널 기록 재사용
+    assert uploader.upload_attachments(tmp_path, ts, "http://dash", "t", journal=journal, ledger=ledger)
+    assert puts == []
+
+    # 정리로 삭제되면 다시 업로드
+    ensure_capacity(ledger, "t", "api", needed_bytes=0, limit_bytes=45 * MB, threshold=1.0)
+    assert not ledger.has_blob(f"attachments/{ts}/shot.png", f"https://blob.test/{ts}")
+    assert uploader.upload_attachments(tmp_path, ts, "http://dash", "t", journal=journal, ledger=ledger)
+    assert puts == [f"attachments/{ts}/shot.png"]
@@ -0,0 +1,227 @@
+"""emulator_pool 오프라인 테스트 (임대/반납, 스냅샷 복원, TTL 회수, 재부팅, 임대 API).
+
+adb / emulator 실행은 가짜 디바이스로 대체합니다 (SDK 불필요).
+
+실행 방법:
+    pytest tests/tools/test_emulator_pool.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import emulator_pool
+from emulator_pool import EmulatorPool, PoolError, PoolServer, lease_emulator, pool_status, release_emulator
+
+PACKAGE = "com.gmeremit.online.gmeremittance_native.stag"
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class _FakeProcess:
+    def __init__(self, exit_code: int | None = None):
+        self.returncode = exit_code
+        self.killed = False
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        self.returncode = 0 if self.returncode is None else self.returncode
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+
+
+class _FakeSdk:
+    """시리얼별 가짜 에뮬레이터. adb 명령과 emulator 기동을 기록합니다."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.starts: list[tuple[int, list[str]]] = []
+        self.commands: list[tuple[str, tuple[str, ...]]] = []
+        self.offline: set[str] = set()
+        self.crashing_ports: set[int] = set()
+
+    def start_emulator(self, avd, port, extra, headless):
+        with self.lock:
+            self.starts.append((port, list(extra)))
+        return _FakeProcess(1 if port in self.crashing_ports else None)
+
+    def adb(self, serial, *args, timeout=None):
+        with self.lock:
+            self.commands.append((serial, args))
+            offline = serial in self.offline
+        if offline:
+            return ""
+        if args == ("get-state",):
+            return "device"
+        if args[:3] == ("shell", "getprop", "sys.boot_completed"):
+            return "1"
+        if args[:3] == ("shell", "pm", "path"):
+            return f"package:/data/app/{args[3]}/base.apk"
+        if args[0] == "emu":
+            return "OK"
+        return ""
+
+    def count(self, serial: str, *prefix: str) -> int:
+        with self.lock:
+            return sum(1 for s, args in self.commands if s == serial and args[:len(prefix)] == prefix)
+
+
+@pytest.fixture
+def sdk(monkeypatch):
+    fake = _FakeSdk()
+    monkeypatch.setattr(emulator_pool, "_start_emulator", fake.start_emulator)
+    monkeypatch.setattr(emulator_pool, "_adb", fake.adb)
+    return fake
+
+
+@pytest.fixture
+def make_pool(sdk):
+    pools: list[EmulatorPool] = []
+
+    def make(size: int = 2) -> EmulatorPool:
+        pool = EmulatorPool("Pixel_6", size, package=PACKAGE)
+        pools.append(pool)
+        pool.start()
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.stop()
+
+
+def _ready(pool: EmulatorPool) -> int:
+    return pool.status()["ready"]
+
+
+def test_boot_from_snapshot_and_lease(make_pool, sdk):
+    pool = make_pool(2)
+    assert _wait_until(lambda: _ready(pool) == 2)
+    assert sorted(port for port, _ in sdk.starts) == [5580, 5582]
+    assert all(extra == ["-read-only", "-snapshot", emulator_pool.SNAPSHOT_NAME, "-no-snapshot-save"]
+               for _, extra in sdk.starts)
+
+    first = pool.lease("run-1", wait=1)
+    second = pool.lease("run-2", wait=1)
+    assert {first["serial"], second["serial"]} == {"emulator-5580", "emulator-5582"}
+    assert first["id"] != second["id"]
+    assert first["env"]["ANDROID_UDID"] == first["serial"]
+    assert "Pixel_6" in first["env"]["ANDROID_DEVICE_NAME"]
+
+    started = time.time()
+    assert pool.lease("run-3", wait=0.2) is None
+    assert time.time() - started < 2
+
+
+def test_release_restores_snapshot(make_pool, sdk):
+    pool = make_pool(1)
+    lease = pool.lease("run-1", wait=5)
+    serial = lease["serial"]
+
+    # 임대 중이면 대기하다가, 반납 → 스냅샷 복원이 끝나면 바로 임대
+    waiter: list[dict | None] = []
+    thread = threading.Thread(target=lambda: waiter.append(pool.lease("run-2", wait=5)))
+    thread.start()
+    time.sleep(0.1)
+    assert pool.release(lease["id"])
+    assert not pool.release(lease["id"])
+    assert not pool.release("lease-unknown")
+    thread.join(5)
+
+    assert waiter[0]["serial"] == serial and waiter[0]["id"] != lease["id"]
+    assert sdk.count(serial, "emu", "avd", "snapshot", "load") == 1
+    assert len(sdk.starts) == 1  # 재부팅 없음
+
+
+def test_unhealthy_release_recycles(make_pool, sdk):
+    pool = make_pool(1)
+    lease = pool.lease("run-1", wait=5)
+    assert pool.release(lease["id"], healthy=False)
+
+    assert _wait_until(lambda: _ready(pool) == 1)
+    emu = pool.status()["emulators"][0]
+    assert emu["boots"] == 2
+    assert emu["lastError"] == ""
+    assert sdk.count(lease["serial"], "emu", "kill") >= 1
+    assert sdk.count(lease["serial"], "emu", "avd", "snapshot", "load") == 0
+
+
+def test_expired_lease_is_reclaimed(make_pool, sdk, monkeypatch):
+    monkeypatch.setattr(emulator_pool, "HEALTH_INTERVAL", 0.05)
+    pool = make_pool(1)
+    lease = pool.lease("crashed-client", wait=5, ttl=0.1)
+
+    assert _wait_until(lambda: _ready(pool) == 1)
+    assert pool.status()["emulators"][0]["owner"] == ""
+    assert not pool.release(lease["id"])
+    assert sdk.count(lease["serial"], "emu", "avd", "snapshot", "load") == 1
+
+
+def test_health_check_recycles_offline_emulator(make_pool, sdk, monkeypatch):
+    monkeypatch.setattr(emulator_pool, "HEALTH_INTERVAL", 0.05)
+    pool = make_pool(1)
+    assert _wait_until(lambda: _ready(pool) == 1)
+
+    sdk.offline.add("emulator-5580")
+    assert _wait_until(lambda: pool.status()["emulators"][0]["state"] != "ready")
+    sdk.offline.clear()
+    assert _wait_until(lambda: _ready(pool) == 1 and pool.status()["emulators"][0]["boots"] >= 2)
+
+
+def test_repeated_boot_failures_mark_bad(make_pool, sdk):
+    sdk.crashing_ports.add(5582)
+    pool = make_pool(2)
+
+    assert _wait_until(lambda: [e["state"] for e in pool.status()["emulators"]] == ["ready", "bad"])
+    bad = pool.status()["emulators"][1]
+    assert bad["boots"] == emulator_pool.MAX_BOOT_FAILURES
+    assert bad["lastError"] == "부팅 타임아웃"
+
+    assert pool.lease("run-1", wait=1)["serial"] == "emulator-5580"
+    # 모든 슬롯이 bad면 wait를 기다리지 않고 바로 실패
+    sdk.crashing_ports.add(5580)
+    only_bad = make_pool(1)
+    assert _wait_until(lambda: only_bad.status()["emulators"][0]["state"] == "bad")
+    started = time.time()
+    assert only_bad.lease("run-2", wait=5) is None
+    assert time.time() - started < 1
+
+
+def test_http_lease_api(make_pool, sdk):
+    pool = make_pool(1)
+    server = PoolServer(("127.0.0.1", 0), pool)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        lease = lease_emulator(url, owner="trigger-1", wait=5, ttl=60)
+        assert lease["serial"] == "emulator-5580"
+        assert pool_status(url)["emulators"][0]["owner"] == "trigger-1"
+
+        with pytest.raises(PoolError, match="503"):
+            lease_emulator(url, owner="trigger-2", wait=0.1)
+
+        assert release_emulator(lease["id"], url)
+        assert not release_emulator(lease["id"], url)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    with pytest.raises(PoolError):
+        pool_status(url)
+    assert not release_emulator("lease-1", url)
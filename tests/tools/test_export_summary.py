@@ -0,0 +1,90 @@
+"""export_summary 오프라인 테스트 (요약 HTML, 썸네일 프로세스 풀).
+
+실행 방법:
+    pytest tests/tools/test_export_summary.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import export_summary
+from export_summary import generate_summary_html
+
+Image = pytest.importorskip("PIL.Image")
+
+CASES = 6
+
+
+@pytest.fixture
+def report_dir(tmp_path):
+    """스크린샷 2장씩 첨부된 테스트 케이스 CASES개짜리 Allure 리포트."""
+    report = tmp_path / "allure-reports" / "20260101_000000"
+    (report / "widgets").mkdir(parents=True)
+    cases_dir = report / "data" / "test-cases"
+    cases_dir.mkdir(parents=True)
+    attachments_dir = report / "data" / "attachments"
+    attachments_dir.mkdir()
+
+    (report / "widgets" / "summary.json").write_text(json.dumps({
+        "reportName": "nightly",
+        "statistic": {"passed": CASES - 1, "failed": 1, "total": CASES},
+        "time": {"start": 0, "stop": 60000, "duration": 60000},
+    }), encoding="utf-8")
+    (report / "widgets" / "environment.json").write_text(json.dumps([
+        {"name": "platform", "values": ["android"]},
+    ]), encoding="utf-8")
+
+    for i in range(CASES):
+        attachments = []
+        for j in range(2):
+            source = f"shot{i}_{j}.png"
+            Image.new("RGB", (1080, 2340), (i * 40, j * 100, 90)).save(attachments_dir / source)
+            attachments.append({"name": "screenshot", "source": source, "type": "image/png"})
+        (cases_dir / f"case{i}.json").write_text(json.dumps({
+            "uid": f"uid{i}",
+            "name": f"test_{i}",
+            "fullName": f"tests.android.sample_test#test_{i}",
+            "status": "failed" if i == 0 else "passed",
+            "statusMessage": "AssertionError: boom" if i == 0 else "",
+            "time": {"duration": 1500},
+            "testStage": {"attachments": attachments},
+        }), encoding="utf-8")
+    return report
+
+
+def test_thumbnails_in_spawned_pool(report_dir, tmp_path, monkeypatch):
+    contexts = []
+    real_pool = export_summary.ProcessPoolExecutor
+
+    def spy_pool(*args, **kwargs):
+        contexts.append(kwargs.get("mp_context"))
+        return real_pool(*args, **kwargs)
+
+    monkeypatch.setattr(export_summary, "ProcessPoolExecutor", spy_pool)
+    output = tmp_path / "export" / "summary.html"
+    generate_summary_html(report_dir, output, workers=2)
+
+    assert [c.get_start_method() for c in contexts] == ["spawn"]
+    html = output.read_text(encoding="utf-8")
+    assert "test_0" in html and "AssertionError: boom" in html
+    thumbs = sorted((tmp_path / "export" / "summary_files").iterdir())
+    assert len(thumbs) == CASES * 2
+    assert all(f"summary_files/{t.name}" in html for t in thumbs)
+    with Image.open(thumbs[0]) as img:
+        assert max(img.size) <= export_summary.THUMB_MAX_SIDE
+
+
+def test_single_file_inlines_without_pool(report_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr(export_summary, "ProcessPoolExecutor", None)
+    output = tmp_path / "summary.html"
+    generate_summary_html(report_dir, output, single_file=True, workers=1)
+
+    html = output.read_text(encoding="utf-8")
+    assert html.count("data:image/") == CASES * 2
+    assert not (tmp_path / "summary_files").exists()
@@ -0,0 +1,197 @@
+"""failure_cache 오프라인 테스트 (실패 시그니처 정규화, 분석 캐시, 병렬 분석 중복 제거).
+
+실행 방법:
+    pytest tests/tools/test_failure_cache.py -v
+"""
+
+import json
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import allure_model
+import upload_to_dashboard
+from failure_cache import FailureAnalysisCache, failure_signature, signature_key
+
+TRACE = """\
+Traceback (most recent call last):
+  File "/work/tests/android/gme1_test.py", line {line}, in test_send
+    send_money(driver)
+  File "/work/utils/transfer.py", line 88, in send_money
+    wait_for(driver, "btn_send")
+  File "/work/utils/wait.py", line 12, in wait_for
+    raise TimeoutException(msg)
+selenium.common.exceptions.TimeoutException: Message: element not found
+"""
+
+PAGE_SOURCE = '<!-- Activity: {activity} | Package: com.gme.app -->\n<hierarchy package="com.gme.app"/>\n'
+
+
+def _page_source(tmp_path: Path, name: str, activity: str) -> str:
+    path = tmp_path / name
+    path.write_text(PAGE_SOURCE.format(activity=activity), encoding="utf-8")
+    return str(path)
+
+
+def test_signature_ignores_volatile_values(tmp_path):
+    source = _page_source(tmp_path, "a.xml", ".SendActivity")
+    first = failure_signature("Message: timed out after 10.5s (session 5f2a9c01d3)", TRACE.format(line=41), source)
+    again = failure_signature("Message: timed out after 30s (session 0a9b8c7d6e)", TRACE.format(line=57), source)
+    assert first == again
+    assert first.startswith("TimeoutException|gme1_test.py::test_send,transfer.py::send_money,wait.py::wait_for|")
+    assert "com.gme.app/.SendActivity" in first
+
+
+def test_signature_differs_by_screen_and_exception(tmp_path):
+    trace = TRACE.format(line=41)
+    send = failure_signature("Message: timed out", trace, _page_source(tmp_path, "a.xml", ".SendActivity"))
+    home = failure_signature("Message: timed out", trace, _page_source(tmp_path, "b.xml", ".MainActivity"))
+    stale = failure_signature("Message: timed out", trace.replace("TimeoutException", "StaleElementReferenceException"))
+    assert len({send, home, stale}) == 3
+    # page_source가 없으면 화면 부분은 비움
+    assert failure_signature("Message: x", trace, str(tmp_path / "missing.xml")).split("|")[2] == ""
+
+
+def test_cache_matches_similar_screenshots_and_persists(tmp_path):
+    path = tmp_path / "allure-reports" / "ai_analysis_cache.json"
+    cache = FailureAnalysisCache(path)
+    key = signature_key("TimeoutException|a.py::f||Message: #")
+
+    cache.put(key, 0xFFFF_0000_FFFF_0000, "버튼 로딩 지연")
+    cache.put(key, None, "스크린샷 없음")
+    cache.put(key, 0x1234, "")  # 빈 분석은 저장하지 않음
+    assert cache.get(key, 0xFFFF_0000_FFFF_0001) == "버튼 로딩 지연"  # 1bit 차이
+    assert cache.get(key, 0x0000_FFFF_0000_FFFF) is None
+    assert cache.get(key, None) == "스크린샷 없음"
+    assert cache.get("other", None) is None
+
+    cache.save()
+    reloaded = FailureAnalysisCache(path)
+    assert reloaded.get(key, 0xFFFF_0000_FFFF_0000) == "버튼 로딩 지연"
+    assert len(json.loads(path.read_text(encoding="utf-8"))[key]) == 2
+    assert not list(path.parent.glob(".*.tmp"))
+
+
+def test_cache_keeps_latest_entries_per_signature(tmp_path):
+    cache = FailureAnalysisCache(tmp_path / "cache.json")
+    # 서로 8bit 이상 다른 해시
+    hashes = [(1 << (8 * i)) - 1 for i in range(8)]
+    for i, phash in enumerate(hashes):
+        cache.put("k", phash, f"분석 {i}")
+    assert cache.get("k", hashes[0]) is None  # 오래된 항목은 밀려남
+    assert cache.get("k", hashes[7]) == "분석 7"
+
+    broken = tmp_path / "broken.json"
+    broken.write_text("{", encoding="utf-8")
+    assert FailureAnalysisCache(broken).get("k", None) is None
+
+
+def _save_in_process(path: str, key: str) -> None:
+    cache = FailureAnalysisCache(Path(path))
+    cache.put(key, None, f"{key} 분석")
+    cache.save()
+
+
+def test_concurrent_saves_keep_every_run(tmp_path):
+    path = tmp_path / "allure-reports" / "ai_analysis_cache.json"
+    keys = [f"sig{i}" for i in range(8)]
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_save_in_process, [str(path)] * len(keys), keys))
+
+    assert sorted(json.loads(path.read_text(encoding="utf-8"))) == keys
+    assert not list(path.parent.glob(".*.tmp"))
+
+
+def test_save_merges_entries_written_meanwhile(tmp_path):
+    path = tmp_path / "cache.json"
+    first = FailureAnalysisCache(path)
+    second = FailureAnalysisCache(path)
+    first.put("k", None, "첫 실행")
+    second.put("k", 0xFF, "두 번째 실행")
+    first.save()
+    second.save()
+
+    merged = FailureAnalysisCache(path)
+    assert merged.get("k", None) == "첫 실행"
+    assert merged.get("k", 0xFF) == "두 번째 실행"
+
+
+@pytest.fixture
+def fake_ai(monkeypatch):
+    """_analyze_failed_case 대신 호출 기록 + 고정 응답 (서로 다른 2건이 동시에 실행되는지 측정)."""
+    calls: list[str] = []
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def analyze(test_name, error_message, status_trace, screenshot_path, page_source_path):
+        with lock:
+            calls.append(test_name)
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        if test_name == "test_no_key":
+            return ""  # API 키 없음
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        with lock:
+            state["active"] -= 1
+        return f"{test_name} 분석"
+
+    monkeypatch.setattr(upload_to_dashboard, "_analyze_failed_case", analyze)
+    return calls, state
+
+
+def _result(uuid: str, name: str, message: str, line: int, page_source: str) -> allure_model.TestResult:
+    return allure_model.TestResult(
+        uuid=uuid, name=name, full_name=f"tests.android.gme1_test#{name}", status="failed",
+        start=0, stop=0, message=message, trace=TRACE.format(line=line),
+        attachments=(allure_model.Attachment("page_source", page_source, "text/xml"),),
+    )
+
+
+def test_analyze_failures_dedupes_and_reuses_cache(tmp_path, fake_ai):
+    calls, state = fake_ai
+    results_dir = tmp_path / "20260101_000000"
+    results_dir.mkdir()
+    _page_source(results_dir, "send.xml", ".SendActivity")
+    _page_source(results_dir, "home.xml", ".MainActivity")
+    failed = [
+        (0, _result("u0", "test_send", "Message: timed out after 10s", 41, "send.xml")),
+        (1, _result("u1", "test_send_again", "Message: timed out after 12s", 57, "send.xml")),
+        (2, _result("u2", "test_home", "Message: timed out after 10s", 41, "home.xml")),
+        (3, _result("u3", "test_other_screen", "Message: boom", 41, "home.xml")),
+    ]
+    cache = FailureAnalysisCache(tmp_path / "cache.json")
+
+    # 같은 시그니처(0, 1)는 한 번만, 같은 클러스터(2, 3)도 한 번만 분석 — 서로 다른 2건은 동시에
+    analyses = upload_to_dashboard._analyze_failures(failed, results_dir, cache, clusters={"u2": 7, "u3": 7})
+    assert sorted(calls) == ["test_home", "test_send"]
+    assert state["peak"] == 2
+    assert analyses == {0: "test_send 분석", 1: "test_send 분석", 2: "test_home 분석", 3: "test_home 분석"}
+
+    # 다음 실행: 같은 실패는 캐시에서 바로 (클러스터 정보 없이도 시그니처로 적중)
+    calls.clear()
+    rerun = upload_to_dashboard._analyze_failures(failed[:3], results_dir, FailureAnalysisCache(tmp_path / "cache.json"))
+    assert calls == []
+    assert rerun == {0: "test_send 분석", 1: "test_send 분석", 2: "test_home 분석"}
+
+
+def test_analyze_failures_skips_empty_analysis(tmp_path, fake_ai):
+    calls, _ = fake_ai
+    results_dir = tmp_path / "20260101_000000"
+    results_dir.mkdir()
+    _page_source(results_dir, "send.xml", ".SendActivity")
+    cache_path = tmp_path / "cache.json"
+
+    failed = [(0, _result("u0", "test_no_key", "Message: x", 41, "send.xml"))]
+    assert upload_to_dashboard._analyze_failures(failed, results_dir, FailureAnalysisCache(cache_path)) == {}
+    assert calls == ["test_no_key"]
+    assert not cache_path.exists()
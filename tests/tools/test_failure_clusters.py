@@ -0,0 +1,127 @@
+"""failure_clusters 오프라인 테스트 (클러스터 배정, 동시 갱신).
+
+실행 방법:
+    pytest tests/tools/test_failure_clusters.py -v
+"""
+
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import failure_clusters
+from failure_clusters import STATE_NAME, FailureClusterer, cluster_run
+
+TIMEOUT_TRACE = (
+    'File "tests/android/gme1_test.py", line 42, in test_send\n'
+    'File "utils/auth.py", line 88, in login\n'
+    "selenium.common.exceptions.TimeoutException: Message: login button not found"
+)
+ASSERT_TRACE = (
+    'File "tests/android/basic_01_test.py", line 17, in test_balance\n'
+    "AssertionError: balance mismatch 100 != 90"
+)
+
+
+def _features(exception: str, screen: str, message: str, frames: list[str]) -> dict:
+    return {"exception": exception, "frames": frames, "screen": screen, "message": message, "phash": None}
+
+
+def _write_run(results_dir: Path, failures: list[tuple[str, str, str]]) -> None:
+    """(uuid, message, trace) 실패들을 allure-results 형식으로 기록."""
+    results_dir.mkdir(parents=True)
+    for uuid, message, trace in failures:
+        (results_dir / f"{uuid}-result.json").write_text(json.dumps({
+            "uuid": uuid, "name": uuid, "fullName": f"tests.{uuid}", "status": "failed",
+            "statusDetails": {"message": message, "trace": trace},
+        }), encoding="utf-8")
+
+
+def test_assign_groups_same_root_cause(tmp_path):
+    clusterer = FailureClusterer(tmp_path / STATE_NAME)
+    login = _features("TimeoutException", "LoginActivity", "login button not found", ["auth.py:login"])
+    balance = _features("AssertionError", "HomeActivity", "balance mismatch", ["basic_01_test.py:test_balance"])
+
+    first = clusterer.assign(login, {"timestamp": "20260101_000000", "fullName": "a"})
+    second = clusterer.assign(dict(login, message="login button not found after 30s"),
+                              {"timestamp": "20260102_000000", "fullName": "b"})
+    other = clusterer.assign(balance, {"timestamp": "20260102_000000", "fullName": "c"})
+
+    assert first == second != other
+    cluster = clusterer.clusters[first - 1]
+    assert cluster["count"] == 2
+    assert (cluster["firstSeen"], cluster["lastSeen"]) == ("20260101_000000", "20260102_000000")
+    assert cluster["tests"] == {"a": 1, "b": 1}
+
+
+def test_state_round_trip(tmp_path):
+    state_path = tmp_path / STATE_NAME
+    clusterer = FailureClusterer(state_path)
+    login = _features("TimeoutException", "LoginActivity", "login button not found", ["auth.py:login"])
+    cid = clusterer.assign(login, {"timestamp": "20260101_000000", "fullName": "a"})
+    clusterer.save()
+    assert not list(tmp_path.glob(".*.tmp"))
+
+    reloaded = FailureClusterer(state_path)
+    assert reloaded.assign(login, {"timestamp": "20260102_000000", "fullName": "a"}) == cid
+
+
+def _cluster_in_process(results_dir: str, reports_root: str) -> int:
+    return len(cluster_run(Path(results_dir), Path(reports_root))[0])
+
+
+def test_concurrent_cluster_runs_keep_every_run(tmp_path):
+    results_root = tmp_path / "allure-results"
+    reports_root = tmp_path / "allure-reports"
+    runs = [f"20260101_00000{i}" for i in range(6)]
+    for i, ts in enumerate(runs):
+        _write_run(results_root / ts, [
+            (f"login{i}", "Message: login button not found", TIMEOUT_TRACE),
+            (f"balance{i}", "balance mismatch 100 != 90", ASSERT_TRACE),
+        ])
+
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        counts = list(pool.map(_cluster_in_process, [str(results_root / ts) for ts in runs],
+                               [str(reports_root)] * len(runs)))
+
+    assert counts == [2] * len(runs)
+    state = json.loads((reports_root / STATE_NAME).read_text(encoding="utf-8"))
+    assert sorted(state["processed"]) == runs
+    assert sorted(c["count"] for c in state["clusters"]) == [len(runs), len(runs)]
+    # 이미 처리한 실행은 기존 배정을 그대로 반환
+    assigned, summary = cluster_run(results_root / runs[0], reports_root)
+    assert len(assigned) == 2 and summary["rootCauses"] == 2
+
+
+
+def _cluster_all(results_root: Path, state_path: Path) -> tuple[list[list[int]], list[int]]:
+    clusterer = FailureClusterer(state_path)
+    assigned = [clusterer.ingest_run(run) for run in sorted(results_root.glob("2026*"))]
+    return [sorted(a.values()) for a in assigned], [c["count"] for c in clusterer.clusters]
+
+
+def test_numpy_and_pure_python_assign_alike(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    results_root = tmp_path / "allure-results"
+    messages = [
+        ("Message: login button not found", TIMEOUT_TRACE),
+        ("Message: login button not found after retry", TIMEOUT_TRACE),
+        ("balance mismatch 100 != 90", ASSERT_TRACE),
+        ("balance mismatch 5 != 7", ASSERT_TRACE),
+        ("Message: element is stale", TIMEOUT_TRACE.replace("TimeoutException", "StaleElementReferenceException")),
+    ]
+    for i in range(4):
+        _write_run(results_root / f"2026010{i + 1}_000000", [
+            (f"t{i}_{j}", message, trace) for j, (message, trace) in enumerate(messages[i:] + messages[:i])
+        ])
+
+    with_numpy = _cluster_all(results_root, tmp_path / "numpy.json")
+    assert failure_clusters.np is not None
+
+    monkeypatch.setattr(failure_clusters, "np", None)
+    assert _cluster_all(results_root, tmp_path / "pure.json") == with_numpy
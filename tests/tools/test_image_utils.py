@@ -0,0 +1,157 @@
+"""image_utils 오프라인 테스트 (화면 프레임, 지각 해시).
+
+실행 방법:
+    pytest tests/tools/test_image_utils.py -v
+"""
+
+import io
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import image_utils
+from image_utils import frame_change_ratio, screen_frame
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _image_bytes(color: int, fmt: str = "PNG") -> bytes:
+    buf = io.BytesIO()
+    Image.new("L", (240, 480), color).save(buf, format=fmt)
+    return buf.getvalue()
+
+
+class _StubDriver:
+    def __init__(self, png: bytes | None):
+        self.png = png
+        self.screenshots = 0
+
+    def get_screenshot_as_png(self) -> bytes:
+        self.screenshots += 1
+        if self.png is None:
+            raise RuntimeError("session gone")
+        return self.png
+
+
+@pytest.fixture
+def mjpeg_url():
+    """JPEG 프레임을 multipart로 흘려보내는 로컬 MJPEG 서버."""
+    frame = _image_bytes(200, "JPEG")
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "multipart/x-mixed-replace; boundary=frame")
+            self.end_headers()
+            self.wfile.write(b"--frame\r\nContent-Type: image/jpeg\r\n\r\n" + frame + b"\r\n")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+
+
+def test_screen_frame_from_screenshot(monkeypatch):
+    monkeypatch.delenv("MJPEG_URL", raising=False)
+    driver = _StubDriver(_image_bytes(30))
+
+    frame = screen_frame(driver)
+
+    assert frame is not None and driver.screenshots == 1
+    assert frame_change_ratio(frame, screen_frame(driver)) == 0.0
+    assert screen_frame(_StubDriver(None)) is None
+
+
+def test_screen_frame_prefers_mjpeg(monkeypatch, mjpeg_url):
+    monkeypatch.setenv("MJPEG_URL", mjpeg_url)
+    driver = _StubDriver(_image_bytes(30))
+
+    frame = screen_frame(driver)
+
+    assert driver.screenshots == 0
+    # 스트림 프레임(밝은 화면)과 스크린샷(어두운 화면)은 모든 블록이 다름
+    monkeypatch.delenv("MJPEG_URL")
+    assert frame_change_ratio(frame, screen_frame(driver)) == 1.0
+
+
+def test_screen_frame_falls_back_when_stream_down(monkeypatch):
+    monkeypatch.setenv("MJPEG_URL", "http://127.0.0.1:1/")
+    driver = _StubDriver(_image_bytes(30))
+    assert screen_frame(driver) is not None
+    assert driver.screenshots == 1
+
+
+@pytest.fixture
+def pure_python(monkeypatch):
+    """NumPy를 불러온 뒤 np=None으로 바꿔 순수 파이썬 경로를 실행하게 합니다."""
+    pytest.importorskip("numpy")
+    image_utils._load_deps()
+
+    def run(func, *args):
+        with monkeypatch.context() as m:
+            m.setattr(image_utils, "np", None)
+            return func(*args)
+
+    return run
+
+
+def _screens(tmp_path: Path) -> list[Path]:
+    """비슷한 화면 두 벌 + 다른 화면 두 개 + 읽을 수 없는 파일."""
+    falling = Image.linear_gradient("L").rotate(90).resize((240, 480))
+    images = [
+        falling,
+        falling.point(lambda v: min(255, v + 3)),
+        falling.transpose(Image.FLIP_LEFT_RIGHT),
+        Image.new("L", (240, 480), 30),
+    ]
+    images[3].paste(250, (0, 0, 120, 480))
+    paths = []
+    for index, img in enumerate(images):
+        path = tmp_path / f"shot{index}.png"
+        img.save(path)
+        paths.append(path)
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not an image")
+    return paths + [broken]
+
+
+def test_dhash_many_matches_dhash(tmp_path, pure_python):
+    paths = _screens(tmp_path)
+    vectorized = image_utils.dhash_many(paths)
+    assert vectorized == [image_utils.dhash(p) for p in paths]
+    assert vectorized == pure_python(image_utils.dhash_many, paths)
+    assert vectorized[-1] is None
+
+
+def test_group_similar_numpy_matches_pure(tmp_path, pure_python):
+    hashes = image_utils.dhash_many(_screens(tmp_path))
+    groups = image_utils.group_similar(hashes)
+    assert groups == [0, 0, 2, 3, 4]
+    assert groups == pure_python(image_utils.group_similar, hashes)
+
+    # 임의 해시: 대표 선택(가장 가까운 대표 vs 처음 일치한 대표)이 달라지지 않는 간격
+    base = [0, 0xFFFF_0000_0000_0000, 0x0000_0000_FFFF_0000]
+    hashes = [b ^ (1 << bit) for b in base for bit in range(0, 60, 7)] + [None]
+    assert image_utils.group_similar(hashes) == pure_python(image_utils.group_similar, hashes)
+
+
+def test_frame_change_ratio_numpy_matches_pure(pure_python):
+    before, after = _image_bytes(30), Image.new("L", (240, 480), 30)
+    after.paste(220, (0, 240, 240, 480))
+    buf = io.BytesIO()
+    after.save(buf, format="PNG")
+
+    ratio = frame_change_ratio(image_utils.frame_signature(before), image_utils.frame_signature(buf.getvalue()))
+    pure = pure_python(lambda: frame_change_ratio(
+        image_utils.frame_signature(before), image_utils.frame_signature(buf.getvalue())))
+    assert ratio == pytest.approx(pure)
+    assert 0.4 < ratio < 0.6
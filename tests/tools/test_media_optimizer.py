@@ -0,0 +1,110 @@
+"""media_optimizer 오프라인 테스트 (결과 JSON 첨부 갱신, 원본 보존, 프로세스 풀).
+
+실행 방법:
+    pytest tests/tools/test_media_optimizer.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import media_optimizer
+from media_optimizer import ORIGINALS_DIR, optimize_results
+
+Image = pytest.importorskip("PIL.Image")
+
+SHOTS = media_optimizer._POOL_MIN_JOBS + 1
+
+
+def _screenshot(path: Path, seed: int) -> None:
+    """압축이 잘 안 되는 원본 해상도 PNG (잡음)."""
+    img = Image.effect_noise((720, 1560), 40 + seed).convert("RGB")
+    img.save(path)
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    """스크린샷 SHOTS장이 step / 테스트 / 컨테이너 첨부로 걸린 Allure 결과 폴더."""
+    results = tmp_path / "20260101_000000"
+    results.mkdir()
+    for i in range(SHOTS):
+        _screenshot(results / f"shot{i}-attachment.png", i)
+    (results / "notes-attachment.txt").write_text("log", encoding="utf-8")
+
+    (results / "a-result.json").write_text(json.dumps({
+        "name": "test_a",
+        "attachments": [
+            {"name": "screenshot", "source": "shot0-attachment.png", "type": "image/png", "size": 1},
+            {"name": "log", "source": "notes-attachment.txt", "type": "text/plain"},
+        ],
+        "steps": [{"name": "step", "attachments": [
+            {"name": "screenshot", "source": f"shot{i}-attachment.png", "type": "image/png"}
+            for i in range(1, SHOTS)
+        ]}],
+    }), encoding="utf-8")
+    (results / "b-container.json").write_text(json.dumps({
+        "afters": [{"name": "teardown", "attachments": [
+            {"name": "screenshot", "source": "shot0-attachment.png", "type": "image/png"},
+        ]}],
+    }), encoding="utf-8")
+    return results
+
+
+def _attachments(path: Path) -> list[dict]:
+    return list(media_optimizer._iter_attachments(json.loads(path.read_text(encoding="utf-8"))))
+
+
+def test_optimize_rewrites_attachments_in_spawned_pool(results_dir, monkeypatch):
+    contexts = []
+    real_pool = media_optimizer.ProcessPoolExecutor
+
+    def spy_pool(*args, **kwargs):
+        contexts.append(kwargs.get("mp_context"))
+        return real_pool(*args, **kwargs)
+
+    monkeypatch.setattr(media_optimizer, "ProcessPoolExecutor", spy_pool)
+    stats = optimize_results(results_dir, fmt="JPEG", videos=False, workers=2)
+
+    assert [c.get_start_method() for c in contexts] == ["spawn"]
+    assert stats["images"] == SHOTS and stats["errors"] == 0
+    assert stats["after"] < stats["before"]
+
+    attachments = _attachments(results_dir / "a-result.json")
+    shots = [a for a in attachments if a["name"] == "screenshot"]
+    assert [a["source"] for a in shots] == [f"shot{i}-attachment.jpg" for i in range(SHOTS)]
+    assert all(a["type"] == "image/jpeg" for a in shots)
+    assert shots[0]["size"] == (results_dir / "shot0-attachment.jpg").stat().st_size
+    assert "size" not in shots[1]
+    assert {"name": "log", "source": "notes-attachment.txt", "type": "text/plain"} in attachments
+    assert _attachments(results_dir / "b-container.json")[0]["source"] == "shot0-attachment.jpg"
+
+    # 원본은 originals/ 로 이동, 결과 폴더에는 변환본만 남음
+    originals = results_dir / ORIGINALS_DIR
+    assert sorted(p.name for p in originals.iterdir()) == [f"shot{i}-attachment.png" for i in range(SHOTS)]
+    assert not list(results_dir.glob("*.png"))
+    assert not list(results_dir.glob(".*.tmp"))
+    with Image.open(results_dir / "shot0-attachment.jpg") as img:
+        assert max(img.size) <= media_optimizer.DEFAULT_MAX_SIDE
+
+
+def test_optimize_is_idempotent(results_dir):
+    optimize_results(results_dir, fmt="JPEG", videos=False, workers=1)
+    before = (results_dir / "a-result.json").read_text(encoding="utf-8")
+
+    stats = optimize_results(results_dir, fmt="JPEG", videos=False, workers=1)
+    assert stats == {"images": 0, "videos": 0, "before": 0, "after": 0, "errors": 0}
+    assert (results_dir / "a-result.json").read_text(encoding="utf-8") == before
+
+
+def test_dry_run_leaves_results_untouched(results_dir):
+    before = (results_dir / "a-result.json").read_text(encoding="utf-8")
+    stats = optimize_results(results_dir, videos=False, dry_run=True)
+
+    assert stats["images"] == SHOTS and stats["before"] == stats["after"] > 0
+    assert (results_dir / "a-result.json").read_text(encoding="utf-8") == before
+    assert not (results_dir / ORIGINALS_DIR).exists()
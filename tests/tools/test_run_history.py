@@ -0,0 +1,163 @@
+"""run_history 오프라인 테스트 (증분 반영, 소요시간 회귀, 불안정 비율, 격리 목록).
+
+실행 방법:
+    pytest tests/tools/test_run_history.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+from run_history import (
+    RERUNS_FILE_NAME,
+    build_flakiness,
+    find_regressions,
+    ingest_results,
+    write_quarantine,
+)
+
+LOGIN = "tests.android.gme1_test#test_login"
+SEND = "tests.android.gme1_test#test_send"
+HOME = "tests.android.basic_01_test#test_home"
+
+
+def _write_run(results_root: Path, ts: str, tests: list[tuple[str, str, int]],
+               reruns: list[dict] | None = None) -> None:
+    """(fullName, status, duration_ms) 목록으로 *-result.json을 씁니다."""
+    run_dir = results_root / ts
+    run_dir.mkdir(parents=True)
+    start = 1_700_000_000_000
+    for i, (full_name, status, duration_ms) in enumerate(tests):
+        (run_dir / f"{ts}-{i}-result.json").write_text(json.dumps({
+            "uuid": f"{ts}-{i}",
+            "name": full_name.rsplit("#", 1)[1],
+            "fullName": full_name,
+            "status": status,
+            "start": start,
+            "stop": start + duration_ms,
+        }), encoding="utf-8")
+        start += duration_ms
+    if reruns is not None:
+        (run_dir / RERUNS_FILE_NAME).write_text(json.dumps({"tests": reruns}), encoding="utf-8")
+
+
+@pytest.fixture
+def db(tmp_path):
+    return tmp_path / "allure-reports" / "run_history.sqlite3"
+
+
+def test_ingest_only_new_runs(tmp_path, db):
+    results_root = tmp_path / "allure-results"
+    _write_run(results_root, "20260101_000000", [(LOGIN, "passed", 10_000)])
+    (results_root / "20260102_000000").mkdir()  # 실행 중(결과 없음)
+    (results_root / "latest").mkdir()
+
+    assert ingest_results(results_root, db) == ["20260101_000000"]
+    assert ingest_results(results_root, db) == []
+
+    _write_run(results_root, "20260103_000000", [(LOGIN, "passed", 10_000)])
+    assert ingest_results(results_root, db) == ["20260103_000000"]
+    assert ingest_results(tmp_path / "missing", db) == []
+
+
+def test_ingest_reparses_runs_still_being_written(tmp_path, db):
+    results_root = tmp_path / "allure-results"
+    # 병렬 작업의 pytest가 아직 쓰는 중: 결과 1건만 있고 flaky_reruns.json 없음
+    _write_run(results_root, "20260101_000000", [(LOGIN, "passed", 10_000)])
+    assert ingest_results(results_root, db) == ["20260101_000000"]
+
+    run_dir = results_root / "20260101_000000"
+    for path in run_dir.iterdir():
+        path.unlink()
+    run_dir.rmdir()
+    _write_run(results_root, "20260101_000000", [(LOGIN, "passed", 10_000), (SEND, "passed", 1_000)],
+               reruns=[{"fullName": SEND, "outcome": "passed", "attempts": [{"attempt": 1, "signature": "x"}]}])
+    assert ingest_results(results_root, db) == ["20260101_000000"]
+    assert ingest_results(results_root, db) == []
+
+    flaky = {f["fullName"]: f for f in build_flakiness(db)}
+    assert flaky[LOGIN]["runs"] == 1 and flaky[SEND]["runs"] == 1
+    assert flaky[SEND]["recovered"] == 1
+
+
+def test_find_regressions_against_baseline(tmp_path, db):
+    results_root = tmp_path / "allure-results"
+    for day, (login_ms, send_ms, home_status) in enumerate([
+        (10_000, 1_000, "failed"),
+        (11_000, 1_100, "failed"),
+        (9_000, 900, "passed"),
+        (10_500, 1_000, "passed"),
+    ]):
+        _write_run(results_root, f"2026010{day + 1}_000000", [
+            (LOGIN, "passed", login_ms), (SEND, "passed", send_ms), (HOME, home_status, 5_000)])
+    # 최신 실행: LOGIN 2배 느려짐, SEND는 2.5배지만 증가폭이 작음, HOME은 기준선 표본 부족
+    _write_run(results_root, "20260105_000000", [
+        (LOGIN, "passed", 21_000), (SEND, "passed", 2_500), (HOME, "passed", 50_000)])
+    ingest_results(results_root, db)
+
+    regressions = find_regressions(db)
+    assert [r["fullName"] for r in regressions] == [LOGIN]
+    login = regressions[0]
+    assert login["timestamp"] == "20260105_000000"
+    assert login["baselineP50"] == 10_250
+    assert login["ratio"] == 2.05
+    assert login["samples"] == 4
+
+    assert find_regressions(db, threshold=2.1) == []
+    # 회귀 비율이 큰 순서
+    assert [r["fullName"] for r in find_regressions(db, min_delta_ms=1_000)] == [SEND, LOGIN]
+    assert [r["fullName"] for r in find_regressions(db, min_samples=2, min_delta_ms=0)] == [HOME, SEND, LOGIN]
+    # 과거 실행 기준 검사: 이전 표본이 부족하면 회귀 없음
+    assert find_regressions(db, timestamp="20260102_000000") == []
+
+
+def test_find_regressions_skips_failed_current_run(tmp_path, db):
+    results_root = tmp_path / "allure-results"
+    for day in range(3):
+        _write_run(results_root, f"2026010{day + 1}_000000", [(LOGIN, "passed", 10_000)])
+    _write_run(results_root, "20260104_000000", [(LOGIN, "failed", 60_000)])
+    ingest_results(results_root, db)
+
+    assert find_regressions(db) == []
+    assert find_regressions(tmp_path / "empty.sqlite3") == []
+
+
+def test_flakiness_counts_flips_and_recovered_reruns(tmp_path, db):
+    results_root = tmp_path / "allure-results"
+    statuses = {
+        LOGIN: ["passed", "failed", "passed", "passed", "passed", "passed"],
+        SEND: ["passed"] * 6,
+        HOME: ["skipped"] * 6,
+    }
+    for day in range(6):
+        ts = f"2026010{day + 1}_000000"
+        reruns = None
+        if day == 4:
+            # 재실행으로 통과한 실행 (결과 JSON에는 최종 passed만 남음)
+            reruns = [{"fullName": SEND, "outcome": "passed", "attempts": [
+                {"attempt": 1, "signature": "TimeoutException@login.py:12"}]}]
+        _write_run(results_root, ts, [(name, s[day], 1_000) for name, s in statuses.items()], reruns)
+    ingest_results(results_root, db)
+
+    flaky = {f["fullName"]: f for f in build_flakiness(db)}
+    assert HOME not in flaky  # skipped만 있는 테스트는 제외
+    assert flaky[LOGIN]["runs"] == 6 and flaky[LOGIN]["flakyRuns"] == 2
+    assert flaky[LOGIN]["rate"] == 0.333
+    assert flaky[SEND]["flakyRuns"] == 1 and flaky[SEND]["recovered"] == 1
+    assert flaky[SEND]["signatures"] == {"TimeoutException@login.py:12": 1}
+    # 최근 window회만 반영: 뒤집힘이 window 밖으로 밀리면 안정
+    assert {f["fullName"]: f["flakyRuns"] for f in build_flakiness(db, window=3)} == {LOGIN: 0, SEND: 1}
+
+    path = tmp_path / "allure-reports" / "quarantine.json"
+    quarantined = write_quarantine(db, path, threshold=0.3, min_runs=5)
+    assert [q["fullName"] for q in quarantined] == [LOGIN]
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["threshold"] == 0.3 and data["minRuns"] == 5
+    assert [t["fullName"] for t in data["tests"]] == [LOGIN]
+    assert not list(path.parent.glob(".*.tmp"))
+    assert write_quarantine(db, path, threshold=0.3, min_runs=7) == []
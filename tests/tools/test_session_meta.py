@@ -0,0 +1,122 @@
+"""conftest 세션 메타데이터 캐시 오프라인 테스트 (캐시 적중/미스, 디바이스 지정).
+
+실행 방법:
+    pytest tests/tools/test_session_meta.py -v
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+import conftest
+
+DEVICES = {
+    "emulator-5554": ("Pixel_6_API_34", "14"),
+    "R3CT30": ("", "13"),
+}
+
+
+class _FakeAdb:
+    """adb devices -l / adb -s <serial> shell getprop 응답."""
+
+    def __init__(self):
+        self.commands: list[list[str]] = []
+        self.transport = 1
+
+    def __call__(self, cmd, **kwargs):
+        self.commands.append(cmd)
+        if cmd[1:] == ["devices", "-l"]:
+            lines = ["List of devices attached"] + [
+                f"{serial} device product:x model:{serial} transport_id:{self.transport + i}"
+                for i, serial in enumerate(DEVICES)
+            ]
+            return subprocess.CompletedProcess(cmd, 0, "\n".join(lines) + "\n", "")
+        serial = cmd[2] if cmd[1] == "-s" else next(iter(DEVICES))
+        avd, version = DEVICES[serial]
+        prop = cmd[-1]
+        value = {"ro.build.version.release": version, "ro.boot.qemu.avd_name": avd,
+                 "ro.product.model": "SM-S901N"}[prop]
+        return subprocess.CompletedProcess(cmd, 0, value + "\n", "")
+
+    def getprops(self) -> list[list[str]]:
+        return [c for c in self.commands if "getprop" in c]
+
+
+@pytest.fixture
+def fake_env(tmp_path, monkeypatch):
+    adb = _FakeAdb()
+    monkeypatch.setattr(conftest, "SESSION_META_CACHE", tmp_path / "session_meta.json")
+    monkeypatch.setattr(conftest.subprocess, "run", adb)
+    monkeypatch.setattr(conftest.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(conftest, "_probe_git", lambda repo_root: {"branch": "main", "commit": "abc"})
+    monkeypatch.setattr(conftest, "_git_head", lambda repo_root: "refs/heads/main|abc")
+    monkeypatch.delenv("ANDROID_UDID", raising=False)
+    monkeypatch.delenv("ANDROID_SERIAL", raising=False)
+
+    apk = tmp_path / "app.apk"
+    apk.write_bytes(b"apk")
+    app_calls: list[str] = []
+
+    def fake_apk_info(path):
+        app_calls.append(path)
+        return "GME", "7.0.0"
+
+    monkeypatch.setattr(conftest, "_safe_get_apk_info", fake_apk_info)
+    return adb, str(apk), app_calls
+
+
+def _collect(caps: dict, app_path: str) -> dict:
+    return conftest._collect_session_meta("android", {"deviceName": "Android Emulator", **caps}, app_path, ROOT)
+
+
+def test_cache_hit_skips_probes(fake_env):
+    adb, apk, app_calls = fake_env
+
+    first = _collect({"udid": "R3CT30"}, apk)
+    assert first["device"] == {"platformVersion": "13", "model": "SM-S901N (Device)"}
+    assert first["app"] == {"name": "GME", "version": "7.0.0"}
+    assert all(c[1:3] == ["-s", "R3CT30"] for c in adb.getprops())
+
+    probes = len(adb.getprops())
+    second = _collect({"udid": "R3CT30"}, apk)
+    assert second == first
+    assert len(adb.getprops()) == probes
+    assert len(app_calls) == 1
+
+
+def test_udid_env_selects_device(fake_env, monkeypatch):
+    adb, apk, _ = fake_env
+    monkeypatch.setenv("ANDROID_UDID", "emulator-5554")
+
+    meta = _collect({}, apk)
+    assert meta["device"] == {"platformVersion": "14", "model": "Pixel_6_API_34 (Emulator)"}
+    assert {tuple(c[1:3]) for c in adb.getprops()} == {("-s", "emulator-5554")}
+
+    # 다른 디바이스는 캐시 미스
+    monkeypatch.setenv("ANDROID_UDID", "R3CT30")
+    assert _collect({}, apk)["device"]["platformVersion"] == "13"
+
+
+def test_reconnected_device_and_new_app_miss(fake_env, tmp_path):
+    adb, apk, app_calls = fake_env
+    _collect({"udid": "R3CT30"}, apk)
+    probes = len(adb.getprops())
+
+    # 재연결로 transport_id가 바뀌면 디바이스만 다시 조회
+    adb.transport = 10
+    _collect({"udid": "R3CT30"}, apk)
+    assert len(adb.getprops()) > probes
+    assert len(app_calls) == 1
+
+    # 다른 APK는 앱 정보만 다시 조회
+    other = tmp_path / "other.apk"
+    other.write_bytes(b"apk2")
+    probes = len(adb.getprops())
+    _collect({"udid": "R3CT30"}, str(other))
+    assert len(adb.getprops()) == probes
+    assert len(app_calls) == 2
@@ -0,0 +1,182 @@
+"""test_impact 오프라인 테스트 (diff 파싱, 심볼 매핑, 테스트 선택, 맵 갱신).
+
+실행 방법:
+    pytest tests/tools/test_test_impact.py -v
+"""
+
+import json
+import sys
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+from test_impact import (
+    IMPACT_FILE_NAME,
+    _changed_lines,
+    _symbols_in_ranges,
+    ingest_impact,
+    load_map,
+    select_tests,
+)
+
+DIFF = """\
+diff --git a/utils/auth.py b/utils/auth.py
+--- a/utils/auth.py
++++ b/utils/auth.py
+@@ -10,0 +11,2 @@ def login(driver):
++    wait(driver)
++    tap(driver)
+@@ -30 +32 @@ class Session:
+-        return 1
++        return 2
+diff --git a/utils/old.py b/utils/old.py
+--- a/utils/old.py
++++ /dev/null
+@@ -1,3 +0,0 @@
+-x = 1
+"""
+
+SOURCE = """\
+import os
+
+TIMEOUT = 10
+
+
+def login(driver):
+    driver.find()
+    driver.tap()
+    return True
+
+
+class Session:
+    def open(self):
+        return 1
+
+    def close(self):
+        return 2
+"""
+
+IMPACT_MAP = {
+    "tests": {
+        "tests/android/gme1_test.py::test_login": {
+            "symbols": ["utils.auth:login"], "screens": [".MainActivity"], "platform": "android"},
+        "tests/android/gme1_test.py::test_logout": {
+            "symbols": ["utils.auth:Session.close"], "screens": [], "platform": "android"},
+        "tests/android/basic_01_test.py::test_home": {
+            "symbols": ["utils.home:go_home"], "screens": [".transfer.LocalTransferActivity"], "platform": "android"},
+        "tests/ios/test_ios_first.py::test_login": {
+            "symbols": ["utils.auth:login"], "screens": [], "platform": "ios"},
+    },
+}
+
+
+def test_changed_lines():
+    assert _changed_lines(DIFF) == {
+        "utils/auth.py": [(11, 12), (32, 32)],
+        "utils/old.py": [],
+    }
+
+
+def test_symbols_in_ranges():
+    # 함수 안, 메서드 안, 모듈 수준 변경
+    assert _symbols_in_ranges(SOURCE, "utils.auth", [(7, 7)]) == {"utils.auth:login"}
+    assert _symbols_in_ranges(SOURCE, "utils.auth", [(17, 17)]) == {"utils.auth:Session.close"}
+    assert _symbols_in_ranges(SOURCE, "utils.auth", [(3, 3)]) == {"utils.auth:*"}
+    assert _symbols_in_ranges("def broken(:\n", "utils.bad", [(1, 1)]) == {"utils.bad:*"}
+
+
+def test_select_tests_by_symbol_class_and_module():
+    assert select_tests(IMPACT_MAP, "android", {"utils.auth:login"}) == ["tests/android/gme1_test.py::test_login"]
+    # 클래스 변경 → 그 메서드를 호출한 테스트
+    assert select_tests(IMPACT_MAP, "android", {"utils.auth:Session"}) == ["tests/android/gme1_test.py::test_logout"]
+    # 모듈 수준 변경 → 그 모듈을 쓰는 테스트 전체 (플랫폼별)
+    assert select_tests(IMPACT_MAP, "ios", {"utils.auth:*"}) == ["tests/ios/test_ios_first.py::test_login"]
+
+
+def test_select_tests_by_screen_and_changed_test_file():
+    assert select_tests(IMPACT_MAP, "android", screens={"LocalTransferActivity"}) == [
+        "tests/android/basic_01_test.py::test_home"]
+    # 변경된 테스트 파일은 노드 대신 파일 전체
+    assert select_tests(IMPACT_MAP, "android", {"utils.auth:login"}, {"tests/android/gme1_test.py"}) == [
+        "tests/android/gme1_test.py"]
+
+
+def _write_impact(results_root: Path, ts: str, nodeid: str, symbols: list[str]) -> None:
+    run_dir = results_root / ts
+    run_dir.mkdir(parents=True)
+    (run_dir / IMPACT_FILE_NAME).write_text(json.dumps({
+        "platform": "android",
+        "gitCommit": "abc123",
+        "tests": {nodeid: {"symbols": symbols, "screens": []}},
+    }), encoding="utf-8")
+
+
+def test_ingest_merges_runs(tmp_path):
+    results_root = tmp_path / "allure-results"
+    map_path = tmp_path / "allure-reports" / "map.json"
+    _write_impact(results_root, "20260101_000000", "t.py::a", ["utils.auth:login"])
+    _write_impact(results_root, "20260102_000000", "t.py::a", ["utils.auth:logout"])
+
+    assert ingest_impact(results_root, map_path) == ["20260101_000000", "20260102_000000"]
+    assert ingest_impact(results_root, map_path) == []
+    entry = load_map(map_path)["tests"]["t.py::a"]
+    assert entry["symbols"] == ["utils.auth:login", "utils.auth:logout"]
+    assert entry["lastSeen"] == "20260102_000000"
+    assert not list(map_path.parent.glob(".*.tmp"))
+
+
+def test_ingest_reports_unwritable_map(tmp_path, capsys):
+    results_root = tmp_path / "allure-results"
+    _write_impact(results_root, "20260101_000000", "t.py::a", ["utils.auth:login"])
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+
+    assert ingest_impact(results_root, blocker / "map.json") == []
+    assert "영향 맵 갱신 실패" in capsys.readouterr().out
+
+
+def _ingest_in_process(results_root: str, map_path: str) -> list[str]:
+    return ingest_impact(Path(results_root), Path(map_path))
+
+
+def test_concurrent_ingest_records_each_run_once(tmp_path):
+    results_root = tmp_path / "allure-results"
+    map_path = tmp_path / "allure-reports" / "map.json"
+    runs = [f"20260101_00000{i}" for i in range(8)]
+    for i, ts in enumerate(runs):
+        _write_impact(results_root, ts, f"t.py::test{i}", [f"utils.m:f{i}"])
+
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        added = list(pool.map(_ingest_in_process, [str(results_root)] * 4, [str(map_path)] * 4))
+
+    assert sorted(ts for batch in added for ts in batch) == runs
+    data = load_map(map_path)
+    assert sorted(data["ingested"]) == runs
+    assert len(data["tests"]) == len(runs)
+
+
+def test_push_trigger_carries_impact_options():
+    from trigger_intake import start_push_server
+    from trigger_listener import _job_from_trigger
+
+    received: list[dict] = []
+    server = start_push_server(received.append)
+    try:
+        body = json.dumps({"testTarget": "impacted", "baseRef": "origin/main",
+                           "changedScreens": ".MainActivity, .transfer.LocalTransferActivity"}).encode()
+        req = urllib.request.Request(f"{server.base_url}/trigger", data=body, method="POST",
+                                     headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            assert resp.status == 202
+    finally:
+        server.shutdown()
+
+    job = _job_from_trigger(received[0], 600)
+    assert job.target == "impacted"
+    assert job.options == {
+        "baseRef": "origin/main",
+        "changedScreens": [".MainActivity", ".transfer.LocalTransferActivity"],
+    }
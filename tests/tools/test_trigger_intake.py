@@ -0,0 +1,156 @@
+"""trigger_intake 오프라인 테스트 (SSE → long-poll → poll 전환, 오류 백오프) — fake_dashboard 사용.
+
+실행 방법:
+    pytest tests/tools/test_trigger_intake.py -v
+"""
+
+import json
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import fake_dashboard
+from fake_dashboard import FakeServiceConfig, start_fake_server
+from trigger_intake import TriggerIntake, backoff_delay
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def _post_trigger(server, target: str) -> str:
+    req = urllib.request.Request(f"{server.base_url}/api/trigger", method="POST",
+                                 data=json.dumps({"testTarget": target}).encode(),
+                                 headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=5) as resp:
+        return json.loads(resp.read())["id"]
+
+
+@pytest.fixture
+def server(monkeypatch):
+    # SSE keep-alive 주석을 자주 보내 stop 후 스트림 읽기가 바로 끝나도록
+    monkeypatch.setattr(fake_dashboard, "SSE_KEEPALIVE_SEC", 0.1)
+    config = FakeServiceConfig()
+    srv = start_fake_server(config)
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def run_intake():
+    """TriggerIntake를 스레드에서 실행하고, 테스트가 끝나면 멈춥니다."""
+    started: list[tuple[TriggerIntake, threading.Event, threading.Thread]] = []
+
+    def start(base_url: str, **kwargs) -> tuple[TriggerIntake, list[str]]:
+        received: list[str] = []
+        intake = TriggerIntake(base_url, lambda t: received.append(t["id"]), **kwargs)
+        stop = threading.Event()
+        thread = threading.Thread(target=intake.run, args=(stop,), daemon=True)
+        thread.start()
+        started.append((intake, stop, thread))
+        return intake, received
+
+    yield start
+    for _, stop, thread in started:
+        stop.set()
+    for _, _, thread in started:
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+
+
+def test_sse_delivers_pushed_trigger(server, run_intake):
+    backlog = _post_trigger(server, "gme1")
+    intake, received = run_intake(server.base_url, interval=30)
+
+    # 연결 직후 누락분 조회 + 스트림 이벤트 (같은 트리거가 두 번 올 수 있음)
+    assert _wait_until(lambda: backlog in received)
+    started = time.time()
+    fresh = _post_trigger(server, "basic_01")
+    assert _wait_until(lambda: fresh in received)
+    assert time.time() - started < 2  # 폴링 간격(30초)을 기다리지 않음
+    assert intake.mode == "sse" and intake.errors == 0
+
+
+def test_auto_downgrades_to_long_poll(server, run_intake, monkeypatch):
+    def no_stream(handler):
+        handler._send_json(404, {"error": "not found"})
+
+    monkeypatch.setattr(fake_dashboard._Handler, "_stream_triggers", no_stream)
+    intake, received = run_intake(server.base_url, interval=30, long_poll_wait=1)
+
+    assert _wait_until(lambda: intake.mode == "longpoll")
+    time.sleep(0.2)  # long-poll 요청이 서버에서 대기 중
+    started = time.time()
+    trigger_id = _post_trigger(server, "gme1")
+    assert _wait_until(lambda: trigger_id in received)
+    assert time.time() - started < 2
+    assert intake.errors == 0
+
+
+def test_auto_downgrades_to_poll(server, run_intake, monkeypatch):
+    real_get = fake_dashboard._Handler._handle_get
+
+    def no_stream(handler):
+        handler._send_json(405, {"error": "method not allowed"})
+
+    def no_long_poll(handler, path, query, body):
+        if "wait" in query:
+            handler._send_json(404, {"error": "not found"})
+            return
+        real_get(handler, path, query, body)
+
+    monkeypatch.setattr(fake_dashboard._Handler, "_stream_triggers", no_stream)
+    monkeypatch.setattr(fake_dashboard._Handler, "_handle_get", no_long_poll)
+    intake, received = run_intake(server.base_url, interval=0.05)
+
+    assert _wait_until(lambda: intake.mode == "poll")
+    trigger_id = _post_trigger(server, "gme1")
+    assert _wait_until(lambda: trigger_id in received)
+    assert intake.errors == 0
+
+
+def test_fixed_mode_backs_off_and_recovers(server, run_intake):
+    server.config.fail_rate = 1.0
+    server.config.fail_prefixes = ("/api/trigger",)
+    intake, received = run_intake(server.base_url, mode="poll", interval=0.01, max_backoff=0.05)
+
+    # 503은 미지원이 아니므로 방식 전환 없이 백오프 후 재시도
+    assert _wait_until(lambda: intake.errors >= 3)
+    assert intake.mode == "poll"
+    assert "503" in intake.last_error
+
+    server.config.fail_rate = 0.0
+    trigger_id = _post_trigger(server, "gme1")
+    assert _wait_until(lambda: trigger_id in received)
+    assert _wait_until(lambda: intake.errors == 0)
+
+
+def test_fixed_mode_does_not_downgrade(server, run_intake, monkeypatch):
+    monkeypatch.setattr(fake_dashboard._Handler, "_stream_triggers",
+                        lambda handler: handler._send_json(404, {"error": "not found"}))
+    intake, _ = run_intake(server.base_url, mode="sse", interval=0.01, max_backoff=0.05)
+
+    assert _wait_until(lambda: intake.errors >= 2)
+    assert intake.mode == "sse"
+
+
+def test_backoff_delay_bounds():
+    for attempt, full in [(1, 10), (2, 20), (3, 40), (10, 300)]:
+        delays = [backoff_delay(attempt, 10) for _ in range(50)]
+        assert all(full / 2 <= d <= full for d in delays)
+    assert backoff_delay(20, 10, cap=60) <= 60
+    with pytest.raises(ValueError):
+        TriggerIntake("http://127.0.0.1:1", print, mode="websocket")
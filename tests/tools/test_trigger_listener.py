@@ -0,0 +1,80 @@
+"""trigger_listener 오프라인 테스트 (pytest 인자 구성, 격리 레인 대상).
+
+실행 방법:
+    pytest tests/tools/test_trigger_listener.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import trigger_listener
+from trigger_listener import _quarantined_tests, _resolve_pytest_args
+
+
+@pytest.fixture
+def quarantine_root(tmp_path, monkeypatch):
+    reports = tmp_path / "allure-reports"
+    reports.mkdir()
+    (reports / "quarantine.json").write_text(json.dumps({"tests": [
+        {"fullName": "tests.android.gme1_test#test_send"},
+        {"fullName": "tests.android.basic_01_test#test_home"},
+        {"fullName": "tests.ios.ios_contacts_test#test_search"},
+    ]}), encoding="utf-8")
+    monkeypatch.setattr(trigger_listener, "PROJECT_ROOT", tmp_path)
+    monkeypatch.delenv("QUARANTINE_FILE", raising=False)
+    return tmp_path
+
+
+def test_quarantine_lane_limited_to_target(quarantine_root):
+    assert _quarantined_tests("android", "gme1") == ["tests.android.gme1_test#test_send"]
+    assert _quarantined_tests("android", "tests/android/basic_01_test.py") == [
+        "tests.android.basic_01_test#test_home"]
+    assert _quarantined_tests("android", "local_transfer") == []
+
+
+def test_quarantine_whole_platform_targets(quarantine_root):
+    expected = ["tests.android.gme1_test#test_send", "tests.android.basic_01_test#test_home"]
+    assert _quarantined_tests("android") == expected
+    assert _quarantined_tests("android", "all") == expected
+    assert _quarantined_tests("android", "impacted") == expected
+    assert _quarantined_tests("ios", "ios_contacts") == ["tests.ios.ios_contacts_test#test_search"]
+
+
+def test_quarantine_missing_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(trigger_listener, "PROJECT_ROOT", tmp_path)
+    monkeypatch.delenv("QUARANTINE_FILE", raising=False)
+    assert _quarantined_tests("android", "gme1") == []
+
+
+def test_quarantine_file_from_environment(quarantine_root, monkeypatch):
+    custom = quarantine_root / "custom-reports" / "quarantine.json"
+    custom.parent.mkdir()
+    custom.write_text(json.dumps({"tests": [{"fullName": "tests.android.gme1_test#test_login"}]}),
+                      encoding="utf-8")
+    monkeypatch.setenv("QUARANTINE_FILE", str(custom))
+    assert _quarantined_tests("android", "gme1") == ["tests.android.gme1_test#test_login"]
+
+
+@pytest.mark.parametrize("quarantine,expected", [("exclude", 0), ("only", 0), ("off", 5)])
+def test_fully_quarantined_target_is_not_failure(tmp_path, monkeypatch, quarantine, expected):
+    # 본 실행에서 대상 테스트가 모두 격리되면 pytest는 "선택된 테스트 없음"(5)으로 끝남
+    monkeypatch.setattr(trigger_listener, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(trigger_listener, "_run_process_group", lambda cmd, cwd, env, timeout: 5)
+    result = trigger_listener.run_tests(target="gme1", platform="android", notify=False,
+                                        quarantine=quarantine)
+    assert "error" not in result
+    assert result["returncode"] == expected
+
+
+def test_listener_enables_flaky_reruns():
+    args = _resolve_pytest_args("gme1", "smoke", "android", quarantine="exclude")
+    assert args[0] == "tests/android/gme1_test.py"
+    assert args[args.index("--quarantine") + 1] == "exclude"
+    assert args[args.index("--flaky-reruns") + 1] == str(trigger_listener.FLAKY_RERUNS)
+    assert _resolve_pytest_args("nope", None) == []
@@ -0,0 +1,118 @@
+"""trigger_scheduler / trigger_listener 실행 제어 오프라인 테스트 (슬롯 배정, 타임아웃).
+
+실행 방법:
+    pytest tests/tools/test_trigger_scheduler.py -v
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+from trigger_scheduler import DeviceSlot, Job, TriggerScheduler
+
+
+class _Recorder:
+    """run_job / on_status 콜백 기록. release 이벤트가 set될 때까지 작업을 붙잡아 둡니다."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started: list[tuple[str, str]] = []
+        self.statuses: list[tuple[str, str]] = []
+        self.release = threading.Event()
+
+    def run_job(self, job: Job, slot: DeviceSlot) -> dict:
+        with self.lock:
+            self.started.append((job.trigger_id, slot.name))
+        self.release.wait(5)
+        return {"error": "boom"} if job.target == "fail" else {"passed": 1}
+
+    def on_status(self, trigger_id: str, status: str, payload: dict | None = None) -> None:
+        with self.lock:
+            self.statuses.append((trigger_id, status))
+
+
+def _wait_for(predicate, timeout: float = 5) -> None:
+    deadline = time.time() + timeout
+    while not predicate():
+        assert time.time() < deadline, "조건 대기 시간 초과"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def recorder():
+    rec = _Recorder()
+    yield rec
+    rec.release.set()
+
+
+def test_jobs_fill_matching_slots_in_order(recorder):
+    slots = [DeviceSlot("a1", "android"), DeviceSlot("a2", "android"), DeviceSlot("i1", "ios")]
+    scheduler = TriggerScheduler(slots, recorder.run_job, recorder.on_status, heartbeat_interval=60)
+    for trigger_id, platform in (("t1", "android"), ("t2", "android"), ("t3", "android"), ("t4", "ios")):
+        assert scheduler.submit(Job(trigger_id, platform=platform))
+
+    _wait_for(lambda: len(recorder.started) == 3)
+    assert sorted(recorder.started) == [("t1", "a1"), ("t2", "a2"), ("t4", "i1")]
+    assert scheduler.pending_count() == 1
+
+    recorder.release.set()
+    assert scheduler.wait_idle(5)
+    assert {t for t, _ in recorder.started} == {"t1", "t2", "t3", "t4"}
+    assert ("t3", "complete") in recorder.statuses
+    scheduler.stop()
+
+
+def test_duplicate_and_unsupported_platform(recorder):
+    scheduler = TriggerScheduler([DeviceSlot("a1", "android")], recorder.run_job, recorder.on_status)
+    assert scheduler.submit(Job("t1"))
+    assert not scheduler.submit(Job("t1"))
+    assert not scheduler.submit(Job("t2", platform="ios"))
+    _wait_for(lambda: ("t2", "failed") in recorder.statuses)
+
+    recorder.release.set()
+    assert scheduler.wait_idle(5)
+    assert not scheduler.submit(Job("t1"))
+    scheduler.stop()
+
+
+def test_finished_ids_are_forgotten_after_retention(recorder):
+    recorder.release.set()
+    scheduler = TriggerScheduler([DeviceSlot("a1", "android")], recorder.run_job, recorder.on_status,
+                                 seen_retention=0.05)
+    assert scheduler.submit(Job("t1", target="fail"))
+    assert scheduler.wait_idle(5)
+    assert ("t1", "failed") in recorder.statuses
+
+    time.sleep(0.1)
+    assert scheduler.submit(Job("t1"))
+    assert scheduler.wait_idle(5)
+    assert len(scheduler._leased) == 1
+    scheduler.stop()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc으로 프로세스 상태를 확인 (Linux 전용)")
+def test_timeout_kills_whole_process_group(tmp_path):
+    import trigger_listener
+
+    pid_file = tmp_path / "grandchild.pid"
+    script = (
+        "import subprocess, sys, time\n"
+        "p = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+        f"open({str(pid_file)!r}, 'w').write(str(p.pid))\n"
+        "time.sleep(60)\n"
+    )
+    with pytest.raises(subprocess.TimeoutExpired):
+        trigger_listener._run_process_group([sys.executable, "-c", script], str(tmp_path), dict(os.environ), 2)
+
+    grandchild = int(pid_file.read_text())
+    stat = Path(f"/proc/{grandchild}/stat")
+    # 종료됐거나(사라짐) 부모에게 회수되기 전 좀비 상태
+    _wait_for(lambda: not stat.exists() or stat.read_text().split(")")[1].split()[0] == "Z")
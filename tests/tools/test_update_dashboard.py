@@ -0,0 +1,176 @@
+"""update_dashboard 오프라인 테스트 (증분 manifest, git 메시지 메모이즈, runs.json).
+
+실행 방법:
+    pytest tests/tools/test_update_dashboard.py -v
+"""
+
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import update_dashboard
+from update_dashboard import update_dashboard as run_update
+
+RUNS = {
+    "20260101_000000": "abc123",
+    "20260102_000000": "abc123",
+    "20260103_000000": "def456",
+}
+
+
+def _write_report(reports_root: Path, ts: str, commit: str, passed: int = 3) -> Path:
+    widgets = reports_root / ts / "widgets"
+    widgets.mkdir(parents=True, exist_ok=True)
+    (widgets / "summary.json").write_text(json.dumps({
+        "reportName": f"run {ts}",
+        "statistic": {"total": passed + 1, "passed": passed, "failed": 1},
+        "time": {"start": 0, "stop": 65000, "duration": 65000},
+    }), encoding="utf-8")
+    (widgets / "executors.json").write_text(json.dumps([
+        {"name": "local", "type": "pytest", "buildName": f"GME | android | main@{commit}"},
+    ]), encoding="utf-8")
+    return reports_root / ts
+
+
+@pytest.fixture
+def dashboard(tmp_path, monkeypatch):
+    """리포트 3개짜리 allure-reports + 파싱/git 호출 기록."""
+    reports_root = tmp_path / "allure-reports"
+    for ts, commit in RUNS.items():
+        _write_report(reports_root, ts, commit)
+    (reports_root / "dashboard").mkdir()
+    (reports_root / "20260104_000000").mkdir()  # summary 없음 (allure generate 전)
+
+    calls = {"parsed": [], "git": []}
+    real_load = update_dashboard._load_run_summary
+
+    def spy_load(report_dir, results_root=None):
+        calls["parsed"].append(report_dir.name)
+        return real_load(report_dir, results_root)
+
+    def fake_git(repo_root, commit):
+        calls["git"].append(commit)
+        return f"commit {commit}"
+
+    monkeypatch.setattr(update_dashboard, "_load_run_summary", spy_load)
+    monkeypatch.setattr(update_dashboard, "_safe_git_message", fake_git)
+    return reports_root, calls
+
+
+def _runs(reports_root: Path) -> list[dict]:
+    return json.loads((reports_root / "dashboard" / "runs.json").read_text(encoding="utf-8"))
+
+
+def test_first_run_parses_all_and_memoizes_git(dashboard):
+    reports_root, calls = dashboard
+    run_update(reports_root)
+
+    assert sorted(calls["parsed"]) == [*RUNS, "20260104_000000"]
+    assert sorted(calls["git"]) == ["abc123", "def456"]
+    runs = _runs(reports_root)
+    assert [r["timestamp"] for r in runs] == sorted(RUNS, reverse=True)
+    assert runs[0]["environment"]["gitMessage"] == "commit def456"
+    assert runs[0]["environment"]["gitBranch"] == "main"
+    assert runs[0]["durationText"] and runs[0]["hasReport"] is False
+    assert not list((reports_root / "dashboard").glob(".*.tmp"))
+
+
+def test_unchanged_runs_come_from_manifest(dashboard):
+    reports_root, calls = dashboard
+    run_update(reports_root)
+    first = _runs(reports_root)
+    calls["parsed"].clear()
+    calls["git"].clear()
+
+    run_update(reports_root)
+    assert calls == {"parsed": [], "git": []}
+    assert _runs(reports_root) == first
+
+
+def test_changed_and_new_runs_are_reparsed(dashboard):
+    reports_root, calls = dashboard
+    run_update(reports_root)
+    calls["parsed"].clear()
+    calls["git"].clear()
+
+    # 위젯 재생성 (크기/mtime 변경) + 새 실행 + HTML 리포트 생성 + 삭제된 실행
+    summary = _write_report(reports_root, "20260102_000000", "abc123", passed=10) / "widgets" / "summary.json"
+    st = summary.stat()
+    os.utime(summary, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    _write_report(reports_root, "20260105_000000", "abc123")
+    (reports_root / "20260103_000000" / "index.html").write_text("<html></html>", encoding="utf-8")
+    _write_report(reports_root, "20260104_000000", "fff000")
+    for path in (reports_root / "20260101_000000" / "widgets").iterdir():
+        path.unlink()
+    (reports_root / "20260101_000000" / "widgets").rmdir()
+    (reports_root / "20260101_000000").rmdir()
+
+    run_update(reports_root)
+    assert sorted(calls["parsed"]) == [
+        "20260102_000000", "20260103_000000", "20260104_000000", "20260105_000000"]
+    # abc123 메시지는 manifest에 메모이즈되어 있어 새 커밋만 조회
+    assert calls["git"] == ["fff000"]
+
+    runs = {r["timestamp"]: r for r in _runs(reports_root)}
+    assert sorted(runs) == ["20260102_000000", "20260103_000000", "20260104_000000", "20260105_000000"]
+    assert runs["20260102_000000"]["stats"]["passed"] == 10
+    assert runs["20260103_000000"]["hasReport"] is True
+    manifest = json.loads((reports_root / "dashboard" / "manifest.json").read_text(encoding="utf-8"))
+    assert "20260101_000000" not in manifest["runs"]
+
+
+def test_manifest_version_mismatch_rebuilds(dashboard):
+    reports_root, calls = dashboard
+    run_update(reports_root)
+    manifest_path = reports_root / "dashboard" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["version"] = -1
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    calls["parsed"].clear()
+
+    run_update(reports_root)
+    assert len(calls["parsed"]) == len(RUNS) + 1
+
+
+def test_custom_results_root_environment(dashboard, tmp_path):
+    reports_root, calls = dashboard
+    results_root = tmp_path / "elsewhere" / "results"
+    env_props = results_root / "20260103_000000" / "environment.properties"
+    env_props.parent.mkdir(parents=True)
+    env_props.write_text("deviceName=갤럭시 S22\n", encoding="utf-8")
+
+    run_update(reports_root, results_root)
+    runs = {r["timestamp"]: r for r in _runs(reports_root)}
+    assert runs["20260103_000000"]["environment"]["deviceName"] == "갤럭시 S22"
+
+    # 결과 폴더의 environment.properties가 바뀌면 그 실행만 다시 파싱
+    calls["parsed"].clear()
+    env_props.write_text("deviceName=Pixel 6 에뮬레이터\n", encoding="utf-8")
+    run_update(reports_root, results_root)
+    assert calls["parsed"] == ["20260103_000000"]
+    runs = {r["timestamp"]: r for r in _runs(reports_root)}
+    assert runs["20260103_000000"]["environment"]["deviceName"] == "Pixel 6 에뮬레이터"
+
+
+def _update_in_process(reports_root: str, ts: str) -> int:
+    _write_report(Path(reports_root), ts, "abc123")
+    return len(update_dashboard.update_dashboard(Path(reports_root)).name)
+
+
+def test_concurrent_updates_keep_every_run(tmp_path):
+    reports_root = tmp_path / "allure-reports"
+    reports_root.mkdir()
+    stamps = [f"20260101_00000{i}" for i in range(6)]
+    with ProcessPoolExecutor(max_workers=3) as pool:
+        list(pool.map(_update_in_process, [str(reports_root)] * len(stamps), stamps))
+
+    run_update(reports_root)
+    assert sorted(r["timestamp"] for r in _runs(reports_root)) == stamps
+    assert not list((reports_root / "dashboard").glob(".*.tmp"))
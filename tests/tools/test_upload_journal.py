@@ -0,0 +1,129 @@
+"""upload_to_dashboard 업로드 저널 오프라인 테스트 (재개, --force, 실패 집계).
+
+실행 방법:
+    pytest tests/tools/test_upload_journal.py -v
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import upload_to_dashboard as uploader
+from upload_to_dashboard import _BlobClient, _UploadJournal, upload_attachments
+
+
+@pytest.fixture
+def report(tmp_path, monkeypatch):
+    """첨부파일 2개짜리 리포트 + Blob PUT/메타데이터 POST 스텁."""
+    files = []
+    for name, body in (("a.txt", b"alpha"), ("b.txt", b"beta")):
+        path = tmp_path / name
+        path.write_bytes(body)
+        files.append({
+            "name": name, "source": name, "type": "text/plain",
+            "size": len(body), "file_path": str(path),
+        })
+    monkeypatch.setattr(uploader, "_collect_attachments", lambda _dir: [dict(f) for f in files])
+
+    puts: list[str] = []
+
+    def fake_put(self, file_path, blob_path, content_type, size):
+        puts.append(blob_path)
+        return f"https://blob.test/{blob_path}"
+
+    monkeypatch.setattr(_BlobClient, "put_file", fake_put)
+    monkeypatch.setattr(uploader, "_save_artifact_metadata", lambda ts, arts, url: True)
+    return tmp_path, files, puts
+
+
+def _upload(tmp_path, journal, **kwargs):
+    return upload_attachments(tmp_path, "20260101_000000", "http://dash.test", "token",
+                              workers=2, journal=journal, **kwargs)
+
+
+def test_journal_resume_skips_uploaded(report):
+    tmp_path, _, puts = report
+    journal_path = tmp_path / "journal.jsonl"
+
+    assert _upload(tmp_path, _UploadJournal(journal_path))
+    assert sorted(puts) == ["attachments/20260101_000000/a.txt", "attachments/20260101_000000/b.txt"]
+
+    # 새 프로세스에서 저널을 다시 읽어도 같은 내용은 건너뜀
+    puts.clear()
+    assert _upload(tmp_path, _UploadJournal(journal_path))
+    assert puts == []
+
+
+def test_journal_reuploads_changed_content(report):
+    tmp_path, files, puts = report
+    journal_path = tmp_path / "journal.jsonl"
+    assert _upload(tmp_path, _UploadJournal(journal_path))
+
+    Path(files[0]["file_path"]).write_bytes(b"alpha v2")
+    puts.clear()
+    assert _upload(tmp_path, _UploadJournal(journal_path))
+    assert puts == ["attachments/20260101_000000/a.txt"]
+
+
+def test_force_ignores_journal(report):
+    tmp_path, _, puts = report
+    journal_path = tmp_path / "journal.jsonl"
+    assert _upload(tmp_path, _UploadJournal(journal_path))
+
+    puts.clear()
+    assert _upload(tmp_path, _UploadJournal(journal_path), force=True)
+    assert len(puts) == 2
+
+
+def test_vanished_file_counts_as_failure(report):
+    tmp_path, files, puts = report
+    Path(files[1]["file_path"]).unlink()
+
+    assert not _upload(tmp_path, _UploadJournal(tmp_path / "journal.jsonl"))
+    assert puts == ["attachments/20260101_000000/a.txt"]
+
+
+def test_put_exception_does_not_abort_batch(report, monkeypatch):
+    tmp_path, _, _ = report
+
+    def flaky_put(self, file_path, blob_path, content_type, size):
+        if blob_path.endswith("a.txt"):
+            raise RuntimeError("boom")
+        return f"https://blob.test/{blob_path}"
+
+    monkeypatch.setattr(_BlobClient, "put_file", flaky_put)
+    journal = _UploadJournal(tmp_path / "journal.jsonl")
+
+    assert not _upload(tmp_path, journal)
+    assert journal.uploaded_url("attachments/20260101_000000/b.txt", uploader._sha256_file(
+        str(tmp_path / "b.txt"))) == "https://blob.test/attachments/20260101_000000/b.txt"
+
+
+def test_put_file_non_json_success_body(tmp_path):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_PUT(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = b"<html>proxy</html>"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"alpha")
+        client = _BlobClient("token", base_url=f"http://127.0.0.1:{server.server_address[1]}")
+        assert client.put_file(str(path), "attachments/a.txt", "text/plain", 5) is None
+    finally:
+        server.shutdown()
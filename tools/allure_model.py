@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""Allure results / report 폴더를 한 번만 파싱해 여러 도구가 공유하는 결과 모델입니다.
+
+  load_results(allure-results/<ts>)  → ResultsModel  (*-result.json 기반)
+  load_report(allure-reports/<ts>)   → ReportModel   (widgets/*.json + data/test-cases/*.json)
+
+파싱 결과는 폴더 옆의 숨김 파일(.<ts>.model.json)에 캐시되고, 폴더 안 JSON 파일의
+개수/크기/수정시각이 바뀌면 다시 파싱합니다. 같은 프로세스 안에서는 메모리에도 보관합니다.
+trigger_listener, upload_to_dashboard, update_dashboard, export_summary, run_history가 사용합니다.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+MODEL_VERSION = 2
+# 파일 수가 이보다 많으면 스레드 풀로 읽기
+PARALLEL_THRESHOLD = 64
+PARSE_WORKERS = 8
+# 프로세스 내 메모리 캐시 최대 항목 수 (trigger_listener 등 장시간 실행 대비)
+_MEMO_LIMIT = 32
+REPORT_WIDGETS = ("summary", "executors", "environment", "suites", "behaviors", "packages")
+STATUSES = ("passed", "failed", "broken", "skipped", "unknown")
+_LABEL_KEYS = ("epic", "feature", "story", "severity", "parentSuite", "suite", "subSuite", "package")
+
+_memo: dict[tuple[str, str], Any] = {}
+_memo_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Attachment:
+    name: str
+    source: str
+    type: str
+    size: int = 0
+
+
+@dataclass(frozen=True)
+class TestResult:
+    """allure-results의 *-result.json 1개."""
+    uuid: str
+    name: str
+    full_name: str
+    status: str
+    start: int
+    stop: int
+    message: str = ""
+    trace: str = ""
+    test_case_id: str = ""
+    history_id: str = ""
+    labels: dict[str, str] = field(default_factory=dict)
+    # 결과/스텝에 첨부된 파일 (순서 유지)
+    attachments: tuple[Attachment, ...] = ()
+
+    @property
+    def duration_ms(self) -> int:
+        return self.stop - self.start if self.start and self.stop > self.start else 0
+
+    def find_attachment(self, results_dir: Path, suffix: str | tuple[str, ...]) -> str | None:
+        """source가 suffix(들 중 하나)로 끝나는 첫 첨부파일의 경로를 반환합니다."""
+        for att in self.attachments:
+            if att.source.endswith(suffix):
+                path = results_dir / att.source
+                if path.is_file():
+                    return str(path)
+        return None
+
+
+@dataclass(frozen=True)
+class ResultsModel:
+    results_dir: Path
+    results: tuple[TestResult, ...]
+
+    def stats(self) -> dict[str, int]:
+        counts = dict.fromkeys(STATUSES, 0)
+        for r in self.results:
+            counts[r.status if r.status in counts else "unknown"] += 1
+        return counts
+
+    def sum_duration_ms(self) -> int:
+        return sum(r.duration_ms for r in self.results)
+
+    def wall_duration_ms(self) -> int:
+        starts = [r.start for r in self.results if r.start]
+        stops = [r.stop for r in self.results if r.start]
+        return max(stops) - min(starts) if starts else 0
+
+
+@dataclass(frozen=True)
+class ReportCase:
+    """allure-reports의 data/test-cases/*.json 1개."""
+    uid: str
+    name: str
+    full_name: str
+    status: str
+    duration_ms: int
+    message: str = ""
+    trace: str = ""
+    # testStage → beforeStages → afterStages 순서, 스텝 내부 포함
+    attachments: tuple[Attachment, ...] = ()
+
+
+@dataclass(frozen=True)
+class ReportModel:
+    report_dir: Path
+    widgets: dict[str, Any]
+    cases: tuple[ReportCase, ...]
+
+    def widget(self, name: str) -> Any:
+        return self.widgets.get(name)
+
+
+# ─── 파싱 ─────────────────────────────────────────────
+
+def _read_json(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _read_many(files: list[Path]) -> list[Any]:
+    if len(files) <= PARALLEL_THRESHOLD:
+        return [_read_json(f) for f in files]
+    with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as pool:
+        return list(pool.map(_read_json, files))
+
+
+def _collect_attachments(obj: Any, out: list[Attachment]) -> None:
+    """dict/list에서 attachments를 재귀적으로 수집합니다 (steps 포함)."""
+    if isinstance(obj, dict):
+        for att in obj.get("attachments") or []:
+            if isinstance(att, dict) and att.get("source"):
+                out.append(Attachment(
+                    name=str(att.get("name") or att["source"]),
+                    source=str(att["source"]),
+                    type=str(att.get("type") or "application/octet-stream"),
+                    size=int(att.get("size") or 0),
+                ))
+        for step in obj.get("steps") or []:
+            _collect_attachments(step, out)
+    elif isinstance(obj, list):
+        for item in obj:
+            _collect_attachments(item, out)
+
+
+def _to_test_result(data: Any, file_name: str) -> TestResult | None:
+    if not isinstance(data, dict):
+        return None
+    details = data.get("statusDetails") or {}
+    attachments: list[Attachment] = []
+    _collect_attachments(data, attachments)
+    return TestResult(
+        uuid=str(data.get("uuid") or file_name.split("-result.json")[0]),
+        name=str(data.get("name") or ""),
+        full_name=str(data.get("fullName") or data.get("name") or ""),
+        status=str(data.get("status") or "unknown"),
+        start=int(data.get("start") or 0),
+        stop=int(data.get("stop") or 0),
+        message=str(details.get("message") or ""),
+        trace=str(details.get("trace") or ""),
+        test_case_id=str(data.get("testCaseId") or ""),
+        history_id=str(data.get("historyId") or ""),
+        labels={
+            label.get("name", ""): str(label.get("value", ""))
+            for label in data.get("labels") or []
+            if label.get("name") in _LABEL_KEYS
+        },
+        attachments=tuple(attachments),
+    )
+
+
+def _to_report_case(data: Any) -> ReportCase | None:
+    if not isinstance(data, dict):
+        return None
+    attachments: list[Attachment] = []
+    for stage_key in ("testStage", "beforeStages", "afterStages"):
+        _collect_attachments(data.get(stage_key), attachments)
+    return ReportCase(
+        uid=str(data.get("uid") or ""),
+        name=str(data.get("name") or ""),
+        full_name=str(data.get("fullName") or data.get("name") or ""),
+        status=str(data.get("status") or "unknown"),
+        duration_ms=int((data.get("time") or {}).get("duration") or 0),
+        message=str(data.get("statusMessage") or ""),
+        trace=str(data.get("statusTrace") or ""),
+        attachments=tuple(attachments),
+    )
+
+
+# ─── 캐시 ─────────────────────────────────────────────
+
+def _dir_signature(*dirs: Path) -> str:
+    """폴더 안 JSON 파일들의 개수/크기/수정시각 요약."""
+    count = size = latest = 0
+    for d in dirs:
+        try:
+            entries = list(os.scandir(d))
+        except OSError:
+            continue
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            st = entry.stat()
+            count += 1
+            size += st.st_size
+            latest = max(latest, st.st_mtime_ns)
+    return f"v{MODEL_VERSION}:{count}:{size}:{latest}"
+
+
+def _cache_path(target_dir: Path) -> Path:
+    return target_dir.parent / f".{target_dir.name}.model.json"
+
+
+def _load_cached(target_dir: Path, signature: str) -> dict | None:
+    data = _read_json(_cache_path(target_dir))
+    if isinstance(data, dict) and data.get("signature") == signature:
+        return data
+    return None
+
+
+def _save_cache(target_dir: Path, signature: str, payload: dict) -> None:
+    path = _cache_path(target_dir)
+    tmp = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp.write_text(json.dumps({"signature": signature, **payload}, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _attachments_from(items: list[dict]) -> tuple[Attachment, ...]:
+    return tuple(Attachment(**a) for a in items)
+
+
+def _memoized(target_dir: Path, signature: str, build):
+    key = (str(target_dir.resolve()), signature)
+    with _memo_lock:
+        if key in _memo:
+            return _memo[key]
+    model = build()
+    with _memo_lock:
+        _memo[key] = model
+        while len(_memo) > _MEMO_LIMIT:
+            del _memo[next(iter(_memo))]
+    return model
+
+
+# ─── 공개 API ─────────────────────────────────────────────
+
+def load_results(results_dir: Path, use_cache: bool = True) -> ResultsModel:
+    """allure-results/<ts> 폴더를 파싱합니다. 폴더가 없으면 빈 모델을 반환합니다."""
+    results_dir = Path(results_dir)
+    if not results_dir.is_dir():
+        return ResultsModel(results_dir, ())
+    signature = _dir_signature(results_dir)
+
+    def build() -> ResultsModel:
+        cached = _load_cached(results_dir, signature) if use_cache else None
+        if cached:
+            results = tuple(
+                TestResult(**{**r, "attachments": _attachments_from(r["attachments"])})
+                for r in cached["results"]
+            )
+            return ResultsModel(results_dir, results)
+
+        files = sorted(results_dir.glob("*-result.json"))
+        parsed = [_to_test_result(data, f.name) for f, data in zip(files, _read_many(files))]
+        model = ResultsModel(results_dir, tuple(r for r in parsed if r))
+        if use_cache and model.results:
+            _save_cache(results_dir, signature, {"results": [asdict(r) for r in model.results]})
+        return model
+
+    return _memoized(results_dir, signature, build) if use_cache else build()
+
+
+def load_report(report_dir: Path, use_cache: bool = True) -> ReportModel | None:
+    """allure-reports/<ts> 폴더를 파싱합니다. summary 위젯이 없으면 None."""
+    report_dir = Path(report_dir)
+    widgets_dir = report_dir / "widgets"
+    cases_dir = report_dir / "data" / "test-cases"
+    if not (widgets_dir / "summary.json").exists():
+        return None
+    signature = _dir_signature(widgets_dir, cases_dir)
+
+    def build() -> ReportModel:
+        cached = _load_cached(report_dir, signature) if use_cache else None
+        if cached:
+            cases = tuple(
+                ReportCase(**{**c, "attachments": _attachments_from(c["attachments"])})
+                for c in cached["cases"]
+            )
+            return ReportModel(report_dir, cached["widgets"], cases)
+
+        widgets = {name: _read_json(widgets_dir / f"{name}.json") for name in REPORT_WIDGETS}
+        files = sorted(cases_dir.glob("*.json")) if cases_dir.is_dir() else []
+        parsed = [_to_report_case(data) for data in _read_many(files)]
+        model = ReportModel(report_dir, widgets, tuple(c for c in parsed if c))
+        if use_cache:
+            _save_cache(report_dir, signature, {
+                "widgets": widgets,
+                "cases": [asdict(c) for c in model.cases],
+            })
+        return model
+
+    return _memoized(report_dir, signature, build) if use_cache else build()
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""allure-results/<ts>에서 리포트 위젯(widgets/*.json)을 직접 계산합니다 (Allure CLI 불필요).
+
+대시보드 갱신/업로드에 필요한 위젯만 만듭니다:
+  summary.json       통계(statistic) + 시간(time)
+  executors.json     executor.json 내용
+  environment.json   environment.properties 내용
+  suites.json        parentSuite → suite → subSuite 최상위 그룹별 통계
+  behaviors.json     epic → feature → story 최상위 그룹별 통계
+  packages.json      package 라벨별 통계
+
+같은 historyId의 결과가 여러 개면(재실행) Allure와 같이 마지막 결과만 집계합니다.
+
+사용법:
+  python tools/allure_widgets.py allure-results/20260216_024413
+  python tools/allure_widgets.py allure-results/20260216_024413 -o allure-reports/20260216_024413
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from allure_model import STATUSES, TestResult, load_results
+
+DEFAULT_REPORT_NAME = "Allure Report"
+_SUITE_LABELS = ("parentSuite", "suite", "subSuite")
+_BEHAVIOR_LABELS = ("epic", "feature", "story")
+_PACKAGE_LABELS = ("package",)
+
+
+def _statistic(results: list[TestResult]) -> dict[str, int]:
+    stat = dict.fromkeys(STATUSES, 0)
+    for r in results:
+        stat[r.status if r.status in stat else "unknown"] += 1
+    stat["total"] = len(results)
+    return stat
+
+
+def _group_widget(results: list[TestResult], label_keys: tuple[str, ...]) -> dict[str, Any]:
+    """라벨 우선순위에서 처음 값이 있는 라벨로 최상위 그룹을 만듭니다 (라벨 없는 결과는 제외)."""
+    groups: dict[str, list[TestResult]] = {}
+    for r in results:
+        name = next((r.labels[key] for key in label_keys if r.labels.get(key)), "")
+        if name:
+            groups.setdefault(name, []).append(r)
+    items = [
+        {
+            "uid": hashlib.md5(name.encode("utf-8")).hexdigest(),
+            "name": name,
+            "statistic": _statistic(items),
+        }
+        for name, items in groups.items()
+    ]
+    items.sort(key=lambda item: item["statistic"]["total"], reverse=True)
+    return {"total": len(items), "items": items}
+
+
+def _read_properties(path: Path) -> dict[str, str]:
+    """environment.properties를 UTF-8로 읽습니다 (Allure CLI는 Latin-1로 읽어 한글이 깨짐)."""
+    props: dict[str, str] = {}
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return props
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(("#", "!")):
+            continue
+        sep = min((i for i in (line.find("="), line.find(":")) if i >= 0), default=-1)
+        if sep <= 0:
+            continue
+        key, value = line[:sep].strip(), line[sep + 1:].strip()
+        if key:
+            props[key] = value
+    return props
+
+
+def _latest_attempts(results: tuple[TestResult, ...]) -> list[TestResult]:
+    latest: dict[str, TestResult] = {}
+    for r in results:
+        key = r.history_id or r.full_name or r.uuid
+        prev = latest.get(key)
+        if prev is None or r.stop >= prev.stop:
+            latest[key] = r
+    return list(latest.values())
+
+
+def build_widgets(results_dir: Path) -> dict[str, Any]:
+    """위젯 이름 → JSON 데이터. 결과 파일이 없으면 빈 dict."""
+    model = load_results(results_dir)
+    if not model.results:
+        return {}
+    results = _latest_attempts(model.results)
+
+    durations = [r.duration_ms for r in results]
+    starts = [r.start for r in results if r.start]
+    stops = [r.stop for r in results if r.stop]
+    start = min(starts) if starts else 0
+    stop = max(stops) if stops else 0
+
+    try:
+        executor = json.loads((results_dir / "executor.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        executor = None
+    executors = [executor] if isinstance(executor, dict) else []
+
+    environment = [
+        {"name": key, "values": [value]}
+        for key, value in _read_properties(results_dir / "environment.properties").items()
+    ]
+
+    summary = {
+        "reportName": (executor or {}).get("reportName") or DEFAULT_REPORT_NAME,
+        "testRuns": [],
+        "statistic": _statistic(results),
+        "time": {
+            "start": start,
+            "stop": stop,
+            "duration": stop - start if start and stop > start else 0,
+            "minDuration": min(durations),
+            "maxDuration": max(durations),
+            "sumDuration": sum(durations),
+        },
+    }
+
+    return {
+        "summary": summary,
+        "executors": executors,
+        "environment": environment,
+        "suites": _group_widget(results, _SUITE_LABELS),
+        "behaviors": _group_widget(results, _BEHAVIOR_LABELS),
+        "packages": _group_widget(results, _PACKAGE_LABELS),
+    }
+
+
+def write_widgets(results_dir: Path, report_dir: Path) -> bool:
+    """report_dir/widgets/*.json을 씁니다. 결과가 없으면 False."""
+    widgets = build_widgets(results_dir)
+    if not widgets:
+        return False
+    widgets_dir = report_dir / "widgets"
+    widgets_dir.mkdir(parents=True, exist_ok=True)
+    for name, data in widgets.items():
+        (widgets_dir / f"{name}.json").write_text(
+            json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="allure-results에서 리포트 위젯 JSON 생성 (Allure CLI 없이)")
+    parser.add_argument("results_dir", help="allure-results/<timestamp> 경로")
+    parser.add_argument("--output", "-o", default=None,
+                        help="리포트 폴더 (기본: allure-reports/<timestamp>)")
+    args = parser.parse_args()
+
+    results_dir = Path(args.results_dir)
+    report_dir = (
+        Path(args.output) if args.output
+        else results_dir.parent.parent / "allure-reports" / results_dir.name
+    )
+    if not write_widgets(results_dir, report_dir):
+        print(f"[allure_widgets] 결과 파일이 없습니다: {results_dir}")
+        return 1
+    print(f"[allure_widgets] widgets: {report_dir / 'widgets'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
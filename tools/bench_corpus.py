@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+"""벤치마크용 합성 데이터 생성기 (디바이스/실제 리포트 불필요).
+
+- UiAutomator2 / XCUITest page_source XML (노드 수 지정, 민감정보 문자열 포함)
+- Allure results/report 트리: 실행 N개 × 케이스 M개 × 첨부파일(스크린샷 PNG, page_source, logcat, stdout)
+
+같은 seed면 같은 데이터가 만들어지므로 최적화 전후 측정을 같은 입력으로 비교할 수 있습니다.
+bench_hotpaths.py가 사용하며, 단독으로 실행해 코퍼스를 남길 수도 있습니다.
+
+사용법:
+  python tools/bench_corpus.py --out bench_corpus
+  python tools/bench_corpus.py --out bench_corpus --runs 5 --cases 300 --attachments 4 --dump-nodes 1500
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import struct
+import sys
+import uuid
+import zlib
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from xml.sax.saxutils import quoteattr
+
+PACKAGE = "com.gmeremit.online.gmeremittance_native.stag"
+BASE_TIME = datetime(2026, 2, 16, 2, 44, 13)
+
+_TEXTS = [
+    "Send Money", "Receive Money", "Exchange Rate", "Transaction History", "My Account",
+    "송금하기", "받는 사람", "환율 조회", "거래 내역", "내 계좌", "확인", "취소", "다음",
+    "Amount", "Service Charge", "Total Payable", "Recipient Name", "Bank Name", "Branch",
+    "Please check the information below", "오늘 송금 한도는 5,000,000원입니다",
+]
+# 마스킹 경로를 타도록 넣는 개인정보 형식 문자열
+_SENSITIVE = [
+    "010-1234-5678", "01098765432", "02 123 4567", "sample.user@gmail.com",
+    "kim.minsu@gmeremit.com", "1990-01-15", "19851231", "Account 110-234-567890",
+]
+_ANDROID_CONTAINERS = [
+    "android.widget.LinearLayout", "android.widget.FrameLayout", "android.view.ViewGroup",
+    "androidx.recyclerview.widget.RecyclerView", "android.widget.ScrollView",
+    "androidx.viewpager.widget.ViewPager",
+]
+_ANDROID_LEAVES = [
+    "android.widget.TextView", "android.widget.TextView", "android.widget.Button",
+    "android.widget.EditText", "android.widget.ImageView", "android.widget.CheckBox",
+    "android.widget.Switch", "android.widget.ImageButton",
+]
+_ANDROID_IDS = [
+    "btnNext", "btn_confirm", "amountEditText", "recipientName", "bankName", "countryFlagImage",
+    "rowContainer", "tvTitle", "ivIcon", "switchNotification", "cbAgree", "toolbarTitle",
+    "navigation_home", "navigation_history", "navigation_profile", "content", "listContainer",
+]
+_IOS_CONTAINERS = ["XCUIElementTypeOther", "XCUIElementTypeCell", "XCUIElementTypeTable",
+                   "XCUIElementTypeScrollView", "XCUIElementTypeCollectionView"]
+_IOS_LEAVES = ["XCUIElementTypeStaticText", "XCUIElementTypeStaticText", "XCUIElementTypeButton",
+               "XCUIElementTypeTextField", "XCUIElementTypeImage", "XCUIElementTypeSwitch"]
+_ACTIVITIES = ["MainActivity", "SendMoneyActivity", "RecipientListActivity", "ExchangeRateActivity",
+               "TransactionHistoryActivity", "ProfileActivity"]
+_FAILURES = [
+    ("selenium.common.exceptions.TimeoutException",
+     "Message: timed out waiting for element id=btnNext after 10s", "utils/auth.py", "login"),
+    ("selenium.common.exceptions.NoSuchElementException",
+     "Message: An element could not be located on the page using the given search parameters.",
+     "pages/base_page.py", "find"),
+    ("AssertionError", "assert 'Send Money' in ['송금하기', 'Receive Money']",
+     "tests/android/gme1_test.py", "test_send_money"),
+    ("selenium.common.exceptions.StaleElementReferenceException",
+     "Message: Cached elements 'By.id: amountEditText' do not exist in DOM anymore",
+     "utils/helpers.py", "scroll_to"),
+]
+
+
+@dataclass
+class CorpusSpec:
+    runs: int = 3
+    cases: int = 200
+    attachments: int = 3
+    dumps: int = 40
+    dump_nodes: int = 800
+    image_width: int = 1080
+    image_height: int = 2400
+    image_kb: int = 250
+    image_variants: int = 6
+    seed: int = 1234
+
+
+# ─── page_source XML ─────────────────────────────────────────────
+
+def _bounds(rng: random.Random) -> str:
+    x1, y1 = rng.randrange(0, 900), rng.randrange(0, 2200)
+    return f"[{x1},{y1}][{x1 + rng.randrange(40, 1080 - x1 + 40)},{y1 + rng.randrange(40, 240)}]"
+
+
+def _text(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.08:
+        return rng.choice(_SENSITIVE)
+    if roll < 0.55:
+        return rng.choice(_TEXTS)
+    return ""
+
+
+def android_dump(nodes: int, seed: int = 0, title: bool = True) -> str:
+    """UiAutomator2 page_source 형식의 XML (요소 약 nodes개)."""
+    rng = random.Random(seed)
+    remaining = [nodes]
+    lines = ["<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>",
+             '<hierarchy index="0" class="hierarchy" rotation="0" width="1080" height="2400">']
+
+    def attrs(cls: str, index: int, rid: str, text: str, clickable: bool, scrollable: bool) -> str:
+        checkable = cls in ("android.widget.CheckBox", "android.widget.Switch")
+        return (
+            f'index="{index}" package="{PACKAGE}" class="{cls}" text={quoteattr(text)} '
+            f'resource-id="{PACKAGE + ":id/" + rid if rid else ""}" checkable="{str(checkable).lower()}" '
+            f'checked="false" clickable="{str(clickable).lower()}" enabled="true" '
+            f'focusable="{str(clickable).lower()}" focused="false" long-clickable="false" password="false" '
+            f'scrollable="{str(scrollable).lower()}" selected="false" bounds="{_bounds(rng)}" displayed="true"'
+        )
+
+    def emit(depth: int, index: int) -> None:
+        remaining[0] -= 1
+        pad = "  " * depth
+        if remaining[0] > 0 and (depth < 3 or (depth < 12 and rng.random() < 0.3)):
+            cls = rng.choice(_ANDROID_CONTAINERS) if depth >= 3 else "android.widget.FrameLayout"
+            rid = rng.choice(_ANDROID_IDS) if rng.random() < 0.4 else ""
+            scrollable = "RecyclerView" in cls or "ScrollView" in cls or "ViewPager" in cls
+            lines.append(f"{pad}<{cls} {attrs(cls, index, rid, '', rng.random() < 0.3, scrollable)}>")
+            for child in range(rng.randint(2, 6)):
+                if remaining[0] <= 0:
+                    break
+                emit(depth + 1, child)
+            lines.append(f"{pad}</{cls}>")
+        else:
+            cls = rng.choice(_ANDROID_LEAVES)
+            rid = rng.choice(_ANDROID_IDS) if rng.random() < 0.7 else ""
+            text = _text(rng) if cls != "android.widget.ImageView" else ""
+            clickable = cls in ("android.widget.Button", "android.widget.ImageButton") or rng.random() < 0.2
+            lines.append(f"{pad}<{cls} {attrs(cls, index, rid, text, clickable, False)} />")
+
+    if title:
+        remaining[0] -= 1
+        lines.append(f'  <android.widget.TextView {attrs("android.widget.TextView", 0, "screenTitle", rng.choice(_TEXTS), False, False)} />')
+    while remaining[0] > 0:
+        emit(1, 1)
+    lines.append("</hierarchy>")
+    return "\n".join(lines) + "\n"
+
+
+def ios_dump(nodes: int, seed: int = 0, title: bool = True) -> str:
+    """XCUITest page_source 형식의 XML (요소 약 nodes개)."""
+    rng = random.Random(seed)
+    remaining = [nodes]
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', "<AppiumAUT>",
+             '  <XCUIElementTypeApplication type="XCUIElementTypeApplication" name="GME" label="GME" '
+             'enabled="true" visible="true" accessible="false" x="0" y="0" width="390" height="844" index="0">']
+
+    def attrs(kind: str, index: int, name: str, label: str) -> str:
+        x, y = rng.randrange(0, 360), rng.randrange(0, 800)
+        value = f' value={quoteattr(label)}' if kind == "XCUIElementTypeTextField" else ""
+        return (f'type="{kind}" name={quoteattr(name)} label={quoteattr(label)}{value} enabled="true" '
+                f'visible="{str(rng.random() < 0.9).lower()}" accessible="{str(bool(label)).lower()}" '
+                f'x="{x}" y="{y}" width="{rng.randrange(20, 390 - x + 20)}" height="{rng.randrange(20, 80)}" index="{index}"')
+
+    def emit(depth: int, index: int) -> None:
+        remaining[0] -= 1
+        pad = "  " * depth
+        if remaining[0] > 0 and (depth < 4 or (depth < 14 and rng.random() < 0.3)):
+            kind = rng.choice(_IOS_CONTAINERS) if depth >= 4 else "XCUIElementTypeWindow" if depth == 2 else "XCUIElementTypeOther"
+            lines.append(f"{pad}<{kind} {attrs(kind, index, '', '')}>")
+            for child in range(rng.randint(2, 6)):
+                if remaining[0] <= 0:
+                    break
+                emit(depth + 1, child)
+            lines.append(f"{pad}</{kind}>")
+        else:
+            kind = rng.choice(_IOS_LEAVES)
+            label = _text(rng) if kind != "XCUIElementTypeImage" else ""
+            name = label or (rng.choice(_ANDROID_IDS) if rng.random() < 0.5 else "")
+            lines.append(f"{pad}<{kind} {attrs(kind, index, name, label)}/>")
+
+    if title:
+        remaining[0] -= 1
+        heading = rng.choice(_TEXTS)
+        lines.append(f'    <XCUIElementTypeNavigationBar {attrs("XCUIElementTypeNavigationBar", 0, heading, "")}/>')
+    while remaining[0] > 0:
+        emit(2, 1)
+    lines.append("  </XCUIElementTypeApplication>")
+    lines.append("</AppiumAUT>")
+    return "\n".join(lines) + "\n"
+
+
+# ─── 스크린샷 PNG (Pillow 없이) ─────────────────────────────────────────────
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+def synthetic_png(width: int, height: int, target_kb: int, seed: int = 0) -> bytes:
+    """앱 화면처럼 단색 띠 + 노이즈 행으로 된 RGB PNG (압축 후 약 target_kb)."""
+    rng = random.Random(seed)
+    row_bytes = width * 3
+    palette = [bytes([rng.randrange(256), rng.randrange(256), rng.randrange(256)]) * width for _ in range(6)]
+    # 노이즈 행은 거의 압축되지 않으므로 목표 크기만큼만 넣음
+    noisy_rows = min(height, max(0, target_kb * 1024 // row_bytes))
+    noisy = set(rng.sample(range(height), noisy_rows))
+    raw = bytearray()
+    band = palette[0]
+    for y in range(height):
+        if y % 120 == 0:
+            band = rng.choice(palette)
+        raw += b"\x00"
+        raw += rng.randbytes(row_bytes) if y in noisy else band
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(bytes(raw), 6)) + _png_chunk(b"IEND", b""))
+
+
+# ─── Allure results / report 트리 ─────────────────────────────────────────────
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _attachment_specs(status: str, count: int) -> list[tuple[str, str, str]]:
+    """(이름, 확장자, MIME) — 실패 케이스는 스크린샷/page_source 우선."""
+    order = [("stdout", "txt", "text/plain"), ("logcat", "txt", "text/plain")]
+    if status in ("failed", "broken"):
+        order = [("Failure Screenshot", "png", "image/png"), ("page_source", "xml", "text/xml"), *order]
+    else:
+        order = [*order, ("screenshot", "png", "image/png"), ("page_source", "xml", "text/xml")]
+    return [order[i % len(order)] for i in range(count)]
+
+
+def build_allure_tree(root: Path, spec: CorpusSpec) -> list[str]:
+    """root/allure-results/<ts>, root/allure-reports/<ts>를 만들고 타임스탬프 목록을 반환합니다."""
+    rng = random.Random(spec.seed)
+    images = [synthetic_png(spec.image_width, spec.image_height, spec.image_kb, spec.seed + i)
+              for i in range(max(1, spec.image_variants))]
+    timestamps = []
+    for run in range(spec.runs):
+        started = BASE_TIME + timedelta(hours=run)
+        ts = started.strftime("%Y%m%d_%H%M%S")
+        timestamps.append(ts)
+        results_dir = root / "allure-results" / ts
+        report_dir = root / "allure-reports" / ts
+        cases_dir = report_dir / "data" / "test-cases"
+        report_att_dir = report_dir / "data" / "attachments"
+        for d in (results_dir, cases_dir, report_att_dir, report_dir / "widgets"):
+            d.mkdir(parents=True, exist_ok=True)
+
+        stats = dict.fromkeys(("passed", "failed", "broken", "skipped", "unknown"), 0)
+        start_ms = int(started.timestamp() * 1000)
+        clock = start_ms
+        durations = []
+        for case in range(spec.cases):
+            roll = rng.random()
+            status = "passed" if roll < 0.8 else "failed" if roll < 0.9 else "broken" if roll < 0.95 else "skipped"
+            stats[status] += 1
+            module = f"tests.android.module_{case % 12:02d}_test"
+            name = f"test_scenario_{case:04d}"
+            duration = rng.randrange(800, 45000)
+            durations.append(duration)
+            attachments = []
+            for att_name, ext, mime in _attachment_specs(status, spec.attachments):
+                source = f"{uuid.UUID(int=rng.getrandbits(128))}-attachment.{ext}"
+                if ext == "png":
+                    (results_dir / source).write_bytes(rng.choice(images))
+                elif ext == "xml":
+                    (results_dir / source).write_text(android_dump(spec.dump_nodes // 2, rng.randrange(1 << 30)),
+                                                      encoding="utf-8")
+                else:
+                    lines = [f"{started + timedelta(milliseconds=clock - start_ms):%m-%d %H:%M:%S.%f} I/GME: {rng.choice(_TEXTS)} {rng.choice(_SENSITIVE)}"
+                             for _ in range(rng.randrange(20, 200))]
+                    (results_dir / source).write_text("\n".join(lines), encoding="utf-8")
+                _link_or_copy(results_dir / source, report_att_dir / source)
+                attachments.append({"name": att_name, "source": source, "type": mime,
+                                    "size": (results_dir / source).stat().st_size})
+
+            details = {}
+            if status in ("failed", "broken"):
+                exc, message, path, func = rng.choice(_FAILURES)
+                details = {"message": f"{exc.rsplit('.', 1)[-1]}: {message}",
+                           "trace": f'  File "{path}", line {rng.randrange(10, 900)}, in {func}\n    ...\n{exc}: {message}'}
+            result_uuid = str(uuid.UUID(int=rng.getrandbits(128)))
+            labels = [{"name": "feature", "value": f"Feature {case % 7}"}, {"name": "suite", "value": module},
+                      {"name": "severity", "value": rng.choice(["critical", "normal", "minor"])}]
+            result = {
+                "uuid": result_uuid, "name": name, "fullName": f"{module}#{name}", "status": status,
+                "statusDetails": details, "start": clock, "stop": clock + duration, "labels": labels,
+                "testCaseId": f"{case:032x}", "historyId": f"{case:032x}",
+                "steps": [{"name": "setup", "status": "passed", "attachments": attachments[:1]}],
+                "attachments": attachments[1:],
+            }
+            (results_dir / f"{result_uuid}-result.json").write_text(json.dumps(result, ensure_ascii=False),
+                                                                    encoding="utf-8")
+            report_case = {
+                "uid": f"{case:016x}", "name": name, "fullName": f"{module}#{name}", "status": status,
+                "time": {"start": clock, "stop": clock + duration, "duration": duration},
+                "statusMessage": details.get("message", ""), "statusTrace": details.get("trace", ""),
+                "testStage": {"status": status, "steps": [], "attachments": attachments},
+                "beforeStages": [], "afterStages": [], "labels": labels,
+            }
+            (cases_dir / f"{case:016x}.json").write_text(json.dumps(report_case, ensure_ascii=False),
+                                                         encoding="utf-8")
+            clock += duration
+
+        widgets = {
+            "summary": {"reportName": "Allure Report", "statistic": {**stats, "total": spec.cases},
+                        "time": {"start": start_ms, "stop": clock, "duration": clock - start_ms,
+                                 "minDuration": min(durations, default=0), "maxDuration": max(durations, default=0),
+                                 "sumDuration": sum(durations)}},
+            "executors": [{"name": "bench", "type": "local", "buildName": f"bench {ts}"}],
+            "environment": [{"name": "platform", "values": ["android"]}, {"name": "appVersion", "values": ["7.5.0"]},
+                            {"name": "gitBranch", "values": ["main"]}],
+            "suites": {"items": []}, "behaviors": {"items": []}, "packages": {"items": []},
+        }
+        for name, data in widgets.items():
+            (report_dir / "widgets" / f"{name}.json").write_text(json.dumps(data), encoding="utf-8")
+    return timestamps
+
+
+def build_corpus(root: Path, spec: CorpusSpec) -> dict:
+    """XML 덤프 + Allure 트리를 만들고 corpus.json(명세)를 남깁니다."""
+    root.mkdir(parents=True, exist_ok=True)
+    for platform, make in (("android", android_dump), ("ios", ios_dump)):
+        dump_dir = root / "dumps" / platform
+        dump_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(spec.dumps):
+            # 일부 화면은 제목이 없어 화면 이름 추출의 느린 경로를 탐
+            xml = make(spec.dump_nodes, spec.seed + i, title=i % 4 != 0)
+            if platform == "android":
+                xml = xml.replace("?>\n", f"?>\n<!-- Activity: .{_ACTIVITIES[i % len(_ACTIVITIES)]} | Package: {PACKAGE} -->\n", 1)
+            (dump_dir / f"{i + 1:03d}_screen.xml").write_text(xml, encoding="utf-8")
+    timestamps = build_allure_tree(root, spec)
+    info = {"spec": asdict(spec), "timestamps": timestamps}
+    (root / "corpus.json").write_text(json.dumps(info, indent=2) + "\n", encoding="utf-8")
+    return info
+
+
+def load_or_build(root: Path, spec: CorpusSpec) -> dict:
+    """명세가 같은 코퍼스가 이미 있으면 재사용합니다."""
+    try:
+        info = json.loads((root / "corpus.json").read_text(encoding="utf-8"))
+        if info.get("spec") == asdict(spec):
+            return info
+    except (OSError, ValueError):
+        pass
+    if root.exists():
+        shutil.rmtree(root)
+    return build_corpus(root, spec)
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = CorpusSpec()
+    parser.add_argument("--runs", type=int, default=defaults.runs, help="Allure 실행 수")
+    parser.add_argument("--cases", type=int, default=defaults.cases, help="실행당 테스트 케이스 수")
+    parser.add_argument("--attachments", type=int, default=defaults.attachments, help="케이스당 첨부파일 수")
+    parser.add_argument("--dumps", type=int, default=defaults.dumps, help="플랫폼별 XML 덤프 수")
+    parser.add_argument("--dump-nodes", type=int, default=defaults.dump_nodes, help="덤프당 요소 수")
+    parser.add_argument("--image-size", default=f"{defaults.image_width}x{defaults.image_height}", help="스크린샷 해상도 WxH")
+    parser.add_argument("--image-kb", type=int, default=defaults.image_kb, help="스크린샷 대략 크기 (KB)")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="난수 seed")
+
+
+def spec_from_args(args: argparse.Namespace) -> CorpusSpec:
+    width, height = (int(v) for v in args.image_size.lower().split("x"))
+    return CorpusSpec(
+        runs=args.runs, cases=args.cases, attachments=args.attachments, dumps=args.dumps,
+        dump_nodes=args.dump_nodes, image_width=width, image_height=height, image_kb=args.image_kb,
+        seed=args.seed,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 덤프/Allure 코퍼스 생성")
+    parser.add_argument("--out", default="bench_corpus", help="출력 폴더")
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+
+    info = build_corpus(Path(args.out), spec_from_args(args))
+    size = sum(f.stat().st_size for f in Path(args.out).rglob("*") if f.is_file())
+    print(f"[bench_corpus] {args.out}: 실행 {len(info['timestamps'])}개, {size / 1024 / 1024:.1f}MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""파싱/해시/마스킹/리포트 핫패스 벤치마크 (디바이스 불필요).
+
+bench_corpus.py가 만든 합성 코퍼스(UiAutomator2/XCUITest 덤프, Allure results/report 트리)로
+아래 함수들의 소요시간(중앙값/p95/최소)과 최대 메모리를 측정합니다.
+
+  ui_dump._get_screen_hash / _extract_screen_name / _mask_sensitive_data (Android, iOS)
+  explore_app._log_interactive_elements
+  upload_to_dashboard._collect_attachments
+  update_dashboard._load_run_summary
+  export_summary.generate_summary_html
+  replay_driver XPath / UiSelector 탐색
+
+결과는 이력 파일(JSON)에 쌓이고, 기준선(baseline)과 비교해 느려진 항목을 표시합니다.
+Allure 모델 캐시(.<ts>.model.json, 프로세스 메모리)는 반복마다 지우므로 기본은 콜드 측정입니다.
+
+사용법:
+  python tools/bench_hotpaths.py                                  # 기본 코퍼스로 전체 측정
+  python tools/bench_hotpaths.py --only mask,screen_hash --repeat 10
+  python tools/bench_hotpaths.py --dump-nodes 3000 --cases 500    # 코퍼스 크기 조절
+  python tools/bench_hotpaths.py --save-baseline                  # 현재 결과를 기준선으로
+  python tools/bench_hotpaths.py --fail-on-regression --threshold 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import bench_corpus
+from bench_corpus import CorpusSpec
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "bench_results"
+HISTORY_NAME = "history.json"
+BASELINE_NAME = "baseline.json"
+# 이 비율 이상 느려지면 회귀로 표시
+DEFAULT_THRESHOLD = 0.15
+_HISTORY_LIMIT = 200
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # 측정 1회 = items 전체에 fn 적용. 결과는 항목당 시간
+    fn: Callable[[Any], Any]
+    items: list
+    # 매 반복 전에 호출 (캐시 비우기 등)
+    reset: Callable[[], None] | None = None
+
+
+class _ActivityDriver:
+    """_extract_screen_name이 읽는 current_activity만 가진 드라이버 대역."""
+
+    def __init__(self, activity: str):
+        self.current_activity = activity
+
+
+def _reset_allure_cache(corpus: Path) -> Callable[[], None]:
+    import allure_model
+
+    def reset() -> None:
+        with allure_model._memo_lock:
+            allure_model._memo.clear()
+        for cache in corpus.glob("allure-*/.*.model.json"):
+            cache.unlink(missing_ok=True)
+    return reset
+
+
+def _build_benchmarks(corpus: Path, info: dict, out_dir: Path) -> list[Benchmark]:
+    android = [p.read_text(encoding="utf-8") for p in sorted((corpus / "dumps" / "android").glob("*.xml"))]
+    ios = [p.read_text(encoding="utf-8") for p in sorted((corpus / "dumps" / "ios").glob("*.xml"))]
+    report_dirs = [corpus / "allure-reports" / ts for ts in info["timestamps"]]
+    reset_cache = _reset_allure_cache(corpus)
+    benches: list[Benchmark] = []
+
+    # appium 클라이언트가 없는 환경에서는 덤프 도구 항목을 건너뜀
+    try:
+        import ui_dump
+        import ui_dump_ios
+        driver = _ActivityDriver("com.gme.ui.main.MainActivity")
+        benches += [
+            Benchmark("android.screen_hash", ui_dump._get_screen_hash, android),
+            Benchmark("android.screen_name", lambda xml: ui_dump._extract_screen_name(driver, xml), android),
+            Benchmark("android.mask", ui_dump._mask_sensitive_data, android),
+            Benchmark("ios.screen_hash", ui_dump_ios._get_screen_hash, ios),
+            Benchmark("ios.screen_name", lambda xml: ui_dump_ios._extract_screen_name(driver, xml), ios),
+            Benchmark("ios.mask", ui_dump_ios._mask_sensitive_data, ios),
+        ]
+    except ImportError as e:
+        print(f"[bench_hotpaths] ui_dump 건너뜀: {e}")
+    try:
+        import explore_app
+        # 스크롤 전/후 2장을 합쳐 분석하는 실제 사용 형태
+        pairs = [android[i:i + 2] for i in range(0, len(android) - 1, 2)]
+        benches.append(Benchmark("explore.interactive_elements",
+                                 lambda sources: explore_app._log_interactive_elements(sources, "bench"), pairs))
+    except ImportError as e:
+        print(f"[bench_hotpaths] explore_app 건너뜀: {e}")
+
+    import export_summary
+    import update_dashboard
+    import upload_to_dashboard
+    benches += [
+        Benchmark("report.collect_attachments", upload_to_dashboard._collect_attachments, report_dirs, reset_cache),
+        Benchmark("report.load_run_summary", update_dashboard._load_run_summary, report_dirs, reset_cache),
+        Benchmark("report.summary_html",
+                  lambda d: export_summary.generate_summary_html(d, out_dir / f"summary_{d.name}.html"),
+                  report_dirs, reset_cache),
+    ]
+
+    try:
+        from replay_driver import ReplayDriver, ReplaySession
+        session = ReplaySession.load(corpus / "dumps" / "android")
+        replay = ReplayDriver(session)
+        names = list(session.screens)
+
+        def locate(name: str) -> None:
+            replay._goto(name)
+            replay.find_elements("xpath", "//*[@clickable='true' and (contains(@text, 'Send') or @text='확인')]")
+            replay.find_elements("-android uiautomator", 'new UiSelector().resourceIdMatches(".*:id/btn.*").enabled(true)')
+        benches.append(Benchmark("replay.locators", locate, names))
+    except ImportError as e:
+        print(f"[bench_hotpaths] replay_driver 건너뜀: {e}")
+    return benches
+
+
+def _measure(bench: Benchmark, repeat: int, warmup: int) -> dict:
+    sink = io.StringIO()
+    samples = []
+    with contextlib.redirect_stdout(sink):
+        for i in range(warmup + repeat):
+            if bench.reset:
+                bench.reset()
+            t0 = time.perf_counter()
+            for item in bench.items:
+                bench.fn(item)
+            elapsed = time.perf_counter() - t0
+            if i >= warmup:
+                samples.append(elapsed / max(1, len(bench.items)))
+            sink.seek(0)
+            sink.truncate()
+
+        # 메모리는 tracemalloc 오버헤드가 커서 별도 1회 측정
+        if bench.reset:
+            bench.reset()
+        tracemalloc.start()
+        for item in bench.items:
+            bench.fn(item)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    samples.sort()
+    p95 = samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))]
+    return {
+        "items": len(bench.items),
+        "medianMs": round(statistics.median(samples) * 1000, 4),
+        "p95Ms": round(p95 * 1000, 4),
+        "minMs": round(samples[0] * 1000, 4),
+        "peakKB": round(peak / 1024, 1),
+    }
+
+
+def _git_commit() -> str:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, timeout=10)
+        return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def _load_json(path: Path, default: Any) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return default
+
+
+def _compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """기준선 대비 중앙값이 threshold 이상 느려진 항목 이름."""
+    regressions = []
+    base_results = baseline.get("results", {})
+    print(f"\n[bench_hotpaths] 기준선 비교 ({baseline.get('timestamp', '?')}, {baseline.get('gitCommit') or '-'})")
+    print(f"  {'benchmark':<30} {'base ms':>10} {'now ms':>10} {'ratio':>7}")
+    for name, now in results.items():
+        base = base_results.get(name)
+        if not base or not base.get("medianMs"):
+            print(f"  {name:<30} {'-':>10} {now['medianMs']:>10.3f} {'new':>7}")
+            continue
+        ratio = now["medianMs"] / base["medianMs"]
+        mark = ""
+        if ratio >= 1 + threshold:
+            mark = "  ▲ 느려짐"
+            regressions.append(name)
+        elif ratio <= 1 - threshold:
+            mark = "  ▼ 빨라짐"
+        print(f"  {name:<30} {base['medianMs']:>10.3f} {now['medianMs']:>10.3f} {ratio:>6.2f}x{mark}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="파싱/해시/마스킹/리포트 핫패스 벤치마크")
+    parser.add_argument("--corpus", default=None, help="코퍼스 폴더 (기본: 임시 폴더에 생성, 명세가 같으면 재사용)")
+    bench_corpus.add_spec_arguments(parser)
+    parser.add_argument("--only", default="", help="이름에 포함된 벤치마크만 (쉼표 구분, 예: mask,summary_html)")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--warmup", type=int, default=1, help="버리는 워밍업 횟수")
+    parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR), help="이력/기준선 저장 폴더")
+    parser.add_argument("--label", default="", help="이번 측정 메모 (예: before-lxml)")
+    parser.add_argument("--baseline", default=None, help="비교할 기준선 JSON (기본: <output-dir>/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀 판정 비율 (0.15 = 15%% 느려짐)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="회귀가 있으면 종료 코드 1")
+    args = parser.parse_args()
+
+    spec: CorpusSpec = bench_corpus.spec_from_args(args)
+    corpus = Path(args.corpus) if args.corpus else Path(tempfile.gettempdir()) / f"appium_bench_corpus_{spec.seed}"
+    t0 = time.perf_counter()
+    info = bench_corpus.load_or_build(corpus, spec)
+    print(f"[bench_hotpaths] 코퍼스: {corpus} ({time.perf_counter() - t0:.1f}s)")
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    only = [s.strip() for s in args.only.split(",") if s.strip()]
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory(prefix="bench_html_") as html_dir:
+        benches = _build_benchmarks(corpus, info, Path(html_dir))
+        for bench in benches:
+            if only and not any(key in bench.name for key in only):
+                continue
+            results[bench.name] = _measure(bench, args.repeat, args.warmup)
+            r = results[bench.name]
+            print(f"  {bench.name:<30} median {r['medianMs']:>9.3f}ms  p95 {r['p95Ms']:>9.3f}ms  "
+                  f"peak {r['peakKB']:>9.1f}KB  ({r['items']}건)")
+
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "label": args.label,
+        "gitCommit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()} ({os.cpu_count()} cpu)",
+        "corpus": info["spec"],
+        "repeat": args.repeat,
+        "results": results,
+    }
+    history_path = output_dir / HISTORY_NAME
+    history = _load_json(history_path, [])
+    history.append(record)
+    history_path.write_text(json.dumps(history[-_HISTORY_LIMIT:], ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(f"[bench_hotpaths] 이력 저장: {history_path} ({len(history[-_HISTORY_LIMIT:])}회)")
+
+    baseline_path = Path(args.baseline) if args.baseline else output_dir / BASELINE_NAME
+    regressions: list[str] = []
+    baseline = _load_json(baseline_path, None)
+    if baseline and not args.save_baseline:
+        if baseline.get("corpus") != record["corpus"]:
+            print("[bench_hotpaths] 기준선과 코퍼스 명세가 다릅니다 — 비교 결과는 참고용")
+        regressions = _compare(results, baseline, args.threshold)
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(record, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"[bench_hotpaths] 기준선 저장: {baseline_path}")
+
+    if regressions:
+        print(f"[bench_hotpaths] 회귀 {len(regressions)}건: {', '.join(regressions)}")
+        return 1 if args.fail_on_regression else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
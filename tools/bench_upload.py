@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""기록된 리포트를 로컬 대역 서버(fake_dashboard)로 업로드하며 처리량을 측정합니다.
+
+운영 대시보드/Blob을 건드리지 않고 upload_to_dashboard의 전체 경로
+(페이로드 생성 → 실행 메타데이터 POST → 첨부파일 업로드 → 아티팩트 메타데이터 POST)를
+재생합니다. AI 분석은 측정에서 제외합니다.
+
+사용법:
+  python tools/bench_upload.py 20260216_024413
+  python tools/bench_upload.py 20260216_024413 --workers 1,4,8 --repeat 3
+  python tools/bench_upload.py 20260216_024413 --latency-ms 80 --bandwidth-kbps 2048 --fail-rate 0.02
+  python tools/bench_upload.py 20260216_024413 --output bench_upload.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from fake_dashboard import FakeServiceConfig, FakeState, start_fake_server
+
+# 측정 중 외부 AI API 호출 방지
+_AI_ENV_KEYS = ("ANTHROPIC_API_KEY", "AI_GATEWAY_API_KEY")
+
+
+def _run_trial(uploader, report_dir: Path, repo_root: Path, server, workers: int, journal_path: Path) -> dict:
+    server.state = FakeState()
+
+    t0 = time.perf_counter()
+    payload = uploader._build_payload(report_dir, repo_root)
+    t1 = time.perf_counter()
+    if payload is None:
+        raise SystemExit(f"[bench_upload] 페이로드 생성 실패: {report_dir}")
+    run_ok = uploader.upload_run(payload, server.base_url)
+    t2 = time.perf_counter()
+    attachments_ok = uploader.upload_attachments(
+        report_dir,
+        payload["timestamp"],
+        server.base_url,
+        os.environ["BLOB_READ_WRITE_TOKEN"],
+        workers=workers,
+        journal=uploader._UploadJournal(journal_path),
+    )
+    t3 = time.perf_counter()
+
+    state = server.state.summary()
+    upload_s = t3 - t2
+    blob_mb = state["blobBytes"] / (1024 * 1024)
+    return {
+        "workers": workers,
+        "ok": bool(run_ok and attachments_ok),
+        "payloadSec": round(t1 - t0, 3),
+        "runPostSec": round(t2 - t1, 3),
+        "attachmentsSec": round(upload_s, 3),
+        "totalSec": round(t3 - t0, 3),
+        "blobCount": state["blobCount"],
+        "blobMB": round(blob_mb, 2),
+        "filesPerSec": round(state["blobCount"] / upload_s, 2) if upload_s else 0,
+        "mbPerSec": round(blob_mb / upload_s, 2) if upload_s else 0,
+        "connections": state["connections"],
+        "failuresInjected": state["failuresInjected"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="업로드 파이프라인 오프라인 벤치마크")
+    parser.add_argument("timestamp", help="재생할 리포트 타임스탬프 (예: 20260216_024413)")
+    parser.add_argument("--reports-root", default="allure-reports", help="Allure reports 루트 폴더")
+    parser.add_argument("--workers", default="1,4,8", help="비교할 동시 업로드 수 목록 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=1, help="설정별 반복 횟수")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="요청당 지연(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="지연 지터 최대값(ms)")
+    parser.add_argument("--bandwidth-kbps", type=float, default=0.0, help="업로드 대역폭 제한 KB/s (0: 제한 없음)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Blob 업로드 실패 주입 비율 (0~1)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    reports_root = Path(args.reports_root)
+    report_dir = reports_root / args.timestamp
+    if not report_dir.is_dir():
+        print(f"[bench_upload] 리포트 폴더가 없습니다: {report_dir}")
+        return 1
+
+    config = FakeServiceConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        fail_rate=args.fail_rate,
+        fail_prefixes=("/blob/attachments",),
+        bandwidth_kbps=args.bandwidth_kbps,
+    )
+    server = start_fake_server(config)
+
+    # upload_to_dashboard는 import 시점에 환경변수를 읽으므로 먼저 설정
+    os.environ.update(server.client_env())
+    for key in _AI_ENV_KEYS:
+        os.environ.pop(key, None)
+    import upload_to_dashboard as uploader
+
+    worker_list = [int(w) for w in args.workers.split(",") if w.strip()]
+    results: list[dict] = []
+    with tempfile.TemporaryDirectory(prefix="bench_upload_") as tmp:
+        for workers in worker_list:
+            for i in range(args.repeat):
+                print(f"\n[bench_upload] workers={workers} ({i + 1}/{args.repeat})")
+                journal_path = Path(tmp) / f"journal_{workers}_{i}.jsonl"
+                results.append(
+                    _run_trial(uploader, report_dir, reports_root.resolve().parent, server, workers, journal_path)
+                )
+    server.shutdown()
+
+    print(f"\n[bench_upload] {args.timestamp} (latency {args.latency_ms}ms, "
+          f"bandwidth {args.bandwidth_kbps or '∞'}KB/s, fail-rate {args.fail_rate})")
+    print(f"{'workers':>7} {'files':>6} {'MB':>7} {'upload':>8} {'files/s':>8} {'MB/s':>7} {'conns':>6} {'ok':>4}")
+    for r in results:
+        print(f"{r['workers']:>7} {r['blobCount']:>6} {r['blobMB']:>7} {r['attachmentsSec']:>7}s "
+              f"{r['filesPerSec']:>8} {r['mbPerSec']:>7} {r['connections']:>6} {'Y' if r['ok'] else 'N':>4}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"[bench_upload] 결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+"""Vercel Blob 사용량을 로컬 SQLite 장부(ledger)로 추적하고 용량 초과 시 정리합니다.
+
+업로드할 때마다 Blob 전체 목록(최대 1000개)을 조회하던 방식 대신,
+업로드한 Blob의 경로/크기/실행 타임스탬프를 장부에 기록하여 즉시 사용량을 계산합니다.
+장부는 주기적으로(기본 24시간) 페이지네이션 목록 조회로 실제 상태와 맞춥니다.
+
+정리 정책:
+  oldest-first           가장 오래된 실행부터 삭제
+  keep-failed            통과한 실행을 먼저 삭제하고, 실패한 실행은 마지막까지 보존
+  keep-last-per-branch   브랜치별 최근 N개 실행을 보존하고 나머지를 오래된 순으로 삭제
+
+사용법:
+  python tools/blob_ledger.py status
+  python tools/blob_ledger.py reconcile
+  python tools/blob_ledger.py evict --target-mb 300 --policy keep-failed --dry-run
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+_TIMESTAMP_DIR_RE = re.compile(r"^\d{8}_\d{6}$")
+
+LEDGER_NAME = "blob_ledger.sqlite3"
+DEFAULT_POLICY = "oldest-first"
+DEFAULT_KEEP_LAST = 3
+DEFAULT_RECONCILE_HOURS = 24
+DELETE_BATCH_SIZE = 100
+DELETE_WORKERS = 4
+# 업로드 전 정리 시 목표치보다 추가로 확보할 여유 공간 (evict --target-mb에는 적용하지 않음)
+EVICTION_MARGIN_BYTES = 50 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    pathname    TEXT PRIMARY KEY,
+    url         TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    timestamp   TEXT NOT NULL,
+    uploaded_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_blobs_timestamp ON blobs (timestamp);
+CREATE TABLE IF NOT EXISTS runs (
+    timestamp TEXT PRIMARY KEY,
+    branch    TEXT NOT NULL,
+    failed    INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def extract_timestamp_from_blob(pathname: str) -> str:
+    """Blob 경로에서 타임스탬프를 추출합니다. (예: attachments/20260221_153012/xxx → 20260221_153012)"""
+    parts = pathname.strip("/").split("/")
+    if len(parts) >= 2:
+        candidate = parts[1]
+        if _TIMESTAMP_DIR_RE.match(candidate):
+            return candidate
+    return ""
+
+
+@dataclass(frozen=True)
+class RunUsage:
+    timestamp: str
+    branch: str
+    failed: bool
+    size: int
+    urls: tuple[str, ...]
+
+
+class BlobLedger:
+    """업로드한 Blob과 실행 메타데이터(브랜치, 실패 여부)를 기록하는 장부."""
+
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        # 업로드 워커 스레드에서도 기록하므로 같은 연결을 공유 (sqlite3 모듈 내부 직렬화)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def record_blob(self, pathname: str, url: str, size: int) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?)",
+                (pathname, url, size, extract_timestamp_from_blob(pathname),
+                 datetime.now().isoformat(timespec="seconds")),
+            )
+
+    def record_run(self, timestamp: str, branch: str, failed: bool) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?)",
+                (timestamp, branch or "", int(failed)),
+            )
+
+    def remove_urls(self, urls: list[str]) -> None:
+        with self._conn:
+            self._conn.executemany("DELETE FROM blobs WHERE url = ?", [(u,) for u in urls])
+
+    def has_blob(self, pathname: str, url: str) -> bool:
+        """장부에 pathname이 같은 URL로 남아 있는지 (정리로 삭제된 Blob이면 False)."""
+        row = self._conn.execute("SELECT url FROM blobs WHERE pathname = ?", (pathname,)).fetchone()
+        return bool(row) and row[0] == url
+
+    def usage_bytes(self) -> int:
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        return int(row[0])
+
+    def blob_count(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0])
+
+    def runs_usage(self) -> list[RunUsage]:
+        """타임스탬프가 있는 Blob을 실행 단위로 묶어 반환합니다 (오래된 순)."""
+        grouped: dict[str, list[tuple[str, int]]] = {}
+        for ts, url, size in self._conn.execute(
+            "SELECT timestamp, url, size FROM blobs WHERE timestamp != '' ORDER BY timestamp"
+        ):
+            grouped.setdefault(ts, []).append((url, size))
+        meta = {
+            ts: (branch, bool(failed))
+            for ts, branch, failed in self._conn.execute("SELECT timestamp, branch, failed FROM runs")
+        }
+        return [
+            RunUsage(
+                timestamp=ts,
+                branch=meta.get(ts, ("", False))[0],
+                failed=meta.get(ts, ("", False))[1],
+                size=sum(size for _, size in items),
+                urls=tuple(url for url, _ in items),
+            )
+            for ts, items in grouped.items()
+        ]
+
+    def last_reconciled(self) -> datetime | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'last_reconciled'").fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def needs_reconcile(self, max_age_hours: float = DEFAULT_RECONCILE_HOURS) -> bool:
+        last = self.last_reconciled()
+        return last is None or datetime.now() - last > timedelta(hours=max_age_hours)
+
+    def reconcile(self, remote_blobs: list[dict]) -> tuple[int, int]:
+        """원격 목록으로 장부의 Blob 테이블을 교체합니다.
+
+        Returns:
+            (장부에만 있던 Blob 수, 원격에만 있던 Blob 수)
+        """
+        local = {row[0] for row in self._conn.execute("SELECT pathname FROM blobs")}
+        remote = {b.get("pathname", "") for b in remote_blobs}
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._conn:
+            self._conn.execute("DELETE FROM blobs")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?)",
+                [
+                    (b.get("pathname", ""), b.get("url", ""), int(b.get("size") or 0),
+                     extract_timestamp_from_blob(b.get("pathname", "")),
+                     b.get("uploadedAt") or now)
+                    for b in remote_blobs if b.get("pathname")
+                ],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('last_reconciled', ?)", (now,)
+            )
+        return len(local - remote), len(remote - local)
+
+
+# ─── 정리 정책 ─────────────────────────────────────────────
+# 정책은 실행 목록을 "삭제 우선순위 순서"로 반환합니다. 보존 대상도 목록 끝에 포함하여
+# 다른 실행을 모두 지워도 공간이 부족할 때만 삭제되도록 합니다.
+
+def _policy_oldest_first(runs: list[RunUsage], keep_last: int) -> list[RunUsage]:
+    return sorted(runs, key=lambda r: r.timestamp)
+
+
+def _policy_keep_failed(runs: list[RunUsage], keep_last: int) -> list[RunUsage]:
+    return sorted(runs, key=lambda r: (r.failed, r.timestamp))
+
+
+def _policy_keep_last_per_branch(runs: list[RunUsage], keep_last: int) -> list[RunUsage]:
+    protected: set[str] = set()
+    by_branch: dict[str, list[RunUsage]] = {}
+    for r in runs:
+        by_branch.setdefault(r.branch, []).append(r)
+    for items in by_branch.values():
+        for r in sorted(items, key=lambda r: r.timestamp, reverse=True)[:keep_last]:
+            protected.add(r.timestamp)
+    return sorted(runs, key=lambda r: (r.timestamp in protected, r.timestamp))
+
+
+EVICTION_POLICIES: dict[str, Callable[[list[RunUsage], int], list[RunUsage]]] = {
+    "oldest-first": _policy_oldest_first,
+    "keep-failed": _policy_keep_failed,
+    "keep-last-per-branch": _policy_keep_last_per_branch,
+}
+
+
+# ─── Blob API ─────────────────────────────────────────────
+
+def list_blobs(token: str, api_url: str, page_size: int = 1000) -> list[dict]:
+    """Blob 전체 목록을 cursor 페이지네이션으로 조회합니다."""
+    blobs: list[dict] = []
+    cursor = ""
+    while True:
+        query = {"limit": str(page_size)}
+        if cursor:
+            query["cursor"] = cursor
+        req = urllib.request.Request(
+            f"{api_url}?{urllib.parse.urlencode(query)}",
+            headers={"Authorization": f"Bearer {token}", "x-api-version": "7"},
+            method="GET",
+        )
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            result = json.loads(resp.read().decode("utf-8"))
+        blobs.extend(result.get("blobs", []))
+        cursor = result.get("cursor") or ""
+        if not result.get("hasMore") or not cursor:
+            return blobs
+
+
+def _delete_batch(urls: list[str], token: str, api_url: str) -> bool:
+    data = json.dumps({"urls": urls}).encode("utf-8")
+    req = urllib.request.Request(
+        f"{api_url}/delete",
+        data=data,
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            "x-api-version": "7",
+        },
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=30):
+            return True
+    except (urllib.error.URLError, OSError) as e:
+        print(f"    [cleanup] 삭제 요청 실패 ({len(urls)}개): {e}")
+        return False
+
+
+def delete_blobs(
+    urls: list[str],
+    token: str,
+    api_url: str,
+    batch_size: int = DELETE_BATCH_SIZE,
+    workers: int = DELETE_WORKERS,
+) -> list[str]:
+    """URL 목록을 batch_size개씩 묶어 병렬로 삭제합니다. 삭제된 URL 목록을 반환합니다."""
+    batches = [urls[i:i + batch_size] for i in range(0, len(urls), batch_size)]
+    if not batches:
+        return []
+    deleted: list[str] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches)))) as pool:
+        for batch, ok in zip(batches, pool.map(lambda b: _delete_batch(b, token, api_url), batches)):
+            if ok:
+                deleted.extend(batch)
+    return deleted
+
+
+def reconcile_ledger(ledger: BlobLedger, token: str, api_url: str) -> bool:
+    try:
+        remote = list_blobs(token, api_url)
+    except Exception as e:
+        print(f"    [ledger] Blob 목록 조회 실패 (장부 기준으로 진행): {e}")
+        return False
+    missing, unknown = ledger.reconcile(remote)
+    print(f"    [ledger] 원격 목록과 동기화: {len(remote)}개 "
+          f"(장부에만 있던 항목 {missing}개, 원격에만 있던 항목 {unknown}개)")
+    return True
+
+
+def ensure_capacity(
+    ledger: BlobLedger,
+    token: str,
+    api_url: str,
+    needed_bytes: int,
+    limit_bytes: int,
+    threshold: float,
+    policy: str = DEFAULT_POLICY,
+    keep_last: int = DEFAULT_KEEP_LAST,
+    protect: set[str] | None = None,
+    reconcile_hours: float = DEFAULT_RECONCILE_HOURS,
+    dry_run: bool = False,
+    margin_bytes: int = 0,
+) -> int:
+    """사용량 + needed_bytes가 limit_bytes * threshold를 넘으면 정책에 따라 실행 단위로 삭제합니다.
+
+    margin_bytes만큼 목표치보다 더 확보합니다 (업로드 직전 정리가 매번 반복되지 않도록).
+
+    Returns:
+        확보한 바이트 수 (dry_run이면 확보 예정 바이트 수)
+    """
+    if ledger.needs_reconcile(reconcile_hours):
+        reconcile_ledger(ledger, token, api_url)
+
+    usage = ledger.usage_bytes()
+    threshold_bytes = int(limit_bytes * threshold)
+    if usage + needed_bytes <= threshold_bytes:
+        return 0
+
+    mb = 1024 * 1024
+    print(f"    [cleanup] Blob 사용량: {usage / mb:.1f}MB / {limit_bytes / mb:.0f}MB "
+          f"({usage / limit_bytes * 100:.0f}%), 정책: {policy}")
+
+    ordered = EVICTION_POLICIES[policy](ledger.runs_usage(), keep_last)
+    target = usage + needed_bytes - threshold_bytes + margin_bytes
+    selected: list[RunUsage] = []
+    planned = 0
+    for run in ordered:
+        if planned >= target:
+            break
+        if protect and run.timestamp in protect:
+            continue
+        selected.append(run)
+        planned += run.size
+
+    if not selected:
+        print("    [cleanup] 삭제할 수 있는 실행이 없습니다.")
+        return 0
+
+    if dry_run:
+        for run in selected:
+            print(f"    [cleanup] (dry-run) {run.timestamp} [{run.branch or '-'}"
+                  f"{', failed' if run.failed else ''}]: {len(run.urls)}개 ({run.size / mb:.1f}MB)")
+        return planned
+
+    deleted = set(delete_blobs([u for r in selected for u in r.urls], token, api_url))
+    ledger.remove_urls(list(deleted))
+
+    freed = 0
+    for run in selected:
+        run_deleted = [u for u in run.urls if u in deleted]
+        if not run_deleted:
+            continue
+        run_freed = run.size if len(run_deleted) == len(run.urls) else 0
+        freed += run_freed
+        print(f"    [cleanup] {run.timestamp}: {len(run_deleted)}개 파일 삭제 ({run_freed / mb:.1f}MB 확보)")
+    print(f"    [cleanup] 총 {freed / mb:.1f}MB 확보 완료")
+    return freed
+
+
+def main() -> int:
+    # upload_to_dashboard와 같은 .env / 한도 설정을 사용
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from upload_to_dashboard import BLOB_API_URL, BLOB_CLEANUP_THRESHOLD, BLOB_STORAGE_LIMIT_MB
+
+    parser = argparse.ArgumentParser(description="Vercel Blob 사용량 장부 관리")
+    parser.add_argument("--reports-root", default="allure-reports", help="Allure reports 루트 폴더 (장부 위치)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="장부 기준 사용량/실행별 용량 출력")
+    sub.add_parser("reconcile", help="원격 목록으로 장부 동기화")
+    evict_parser = sub.add_parser("evict", help="정책에 따라 오래된 실행 삭제")
+    evict_parser.add_argument("--target-mb", type=float, required=True, help="정리 후 목표 사용량(MB)")
+    evict_parser.add_argument("--policy", choices=sorted(EVICTION_POLICIES), default=DEFAULT_POLICY)
+    evict_parser.add_argument("--keep-last", type=int, default=DEFAULT_KEEP_LAST,
+                              help="keep-last-per-branch 정책의 브랜치별 보존 수")
+    evict_parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 출력")
+    args = parser.parse_args()
+
+    token = os.environ.get("BLOB_READ_WRITE_TOKEN", "")
+    ledger = BlobLedger(Path(args.reports_root) / LEDGER_NAME)
+    mb = 1024 * 1024
+    try:
+        if args.command in ("reconcile", "evict"):
+            if not token:
+                print("[blob_ledger] BLOB_READ_WRITE_TOKEN 미설정")
+                return 1
+        if args.command == "reconcile":
+            return 0 if reconcile_ledger(ledger, token, BLOB_API_URL) else 1
+
+        if args.command == "status":
+            usage = ledger.usage_bytes()
+            last = ledger.last_reconciled()
+            print(f"[blob_ledger] {ledger.blob_count()}개, {usage / mb:.1f}MB / {BLOB_STORAGE_LIMIT_MB}MB "
+                  f"(정리 기준 {BLOB_CLEANUP_THRESHOLD * 100:.0f}%), "
+                  f"마지막 동기화: {last.isoformat(timespec='seconds') if last else '없음'}")
+            for run in ledger.runs_usage():
+                print(f"  {run.timestamp}  {run.size / mb:7.1f}MB  {len(run.urls):4d}개  "
+                      f"{run.branch or '-'}{'  (failed)' if run.failed else ''}")
+            return 0
+
+        ensure_capacity(
+            ledger,
+            token,
+            BLOB_API_URL,
+            needed_bytes=0,
+            limit_bytes=int(args.target_mb * mb),
+            threshold=1.0,
+            policy=args.policy,
+            keep_last=args.keep_last,
+            dry_run=args.dry_run,
+        )
+        return 0
+    finally:
+        ledger.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,580 @@
+# -*- coding: utf-8 -*-
+"""웜 에뮬레이터 풀: 스냅샷으로 부팅한 AVD N개를 유지하고, 실행(워커)마다 1대씩 임대합니다.
+
+콜드 부팅 + 앱/UiAutomator2 서버 설치가 새 실행에서 가장 느린 구간이라,
+한 번 준비(prepare)한 quick-boot 스냅샷에서 부팅·복원해 수 초 안에 테스트를 시작합니다.
+
+  prepare  AVD를 콜드 부팅 → 앱 APK, UiAutomator2 서버 APK 설치, 애니메이션 끄기 → 스냅샷 저장
+  serve    스냅샷에서 읽기 전용(-read-only) 인스턴스 N개 부팅 + 헬스 체크 + 임대 API
+           - 반납된 에뮬레이터는 스냅샷을 다시 불러와(수 초) 깨끗한 상태로 돌려놓음
+           - 헬스 체크(adb 상태, 부팅 완료, 앱 설치) 실패·프로세스 종료 시 재부팅(recycle)
+           - 임대 TTL이 지나면(클라이언트 비정상 종료) 회수
+  lease / release / status   임대 API 클라이언트 (run-app.sh --pool, trigger_listener --emulator-pool)
+
+임대 API (기본 http://127.0.0.1:8791, EMULATOR_POOL_URL):
+  POST /lease    {"owner": "trigger-12", "wait": 300, "ttl": 1200}
+                 → 200 {"id": "lease-1", "serial": "emulator-5580", "env": {"ANDROID_UDID": ...}}
+                 → 503 (wait 초 안에 빈 에뮬레이터 없음)
+  POST /release  {"id": "lease-1", "healthy": true}
+  GET  /status   에뮬레이터별 상태
+  GET  /health
+
+사용법:
+  python tools/emulator_pool.py prepare --avd Pixel_6
+  python tools/emulator_pool.py serve --avd Pixel_6 --size 2
+  eval "$(python tools/emulator_pool.py lease --owner run-aos --format shell)"
+  python tools/emulator_pool.py release "$EMULATOR_LEASE_ID"
+  python tools/emulator_pool.py status
+"""
+
+import argparse
+import glob
+import json
+import os
+import shlex
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_POOL_URL = os.environ.get("EMULATOR_POOL_URL", "http://127.0.0.1:8791")
+SNAPSHOT_NAME = "appium_warm"
+# 개발자가 띄운 에뮬레이터(5554~)와 겹치지 않도록 콘솔 포트를 따로 사용
+BASE_CONSOLE_PORT = 5580
+BOOT_TIMEOUT = 300
+RESTORE_TIMEOUT = 60
+HEALTH_INTERVAL = 30
+ADB_TIMEOUT = 15
+LEASE_WAIT = 300
+LEASE_TTL = 3600
+# 연속으로 이만큼 재부팅에 실패하면 해당 슬롯을 포기 (bad)
+MAX_BOOT_FAILURES = 3
+
+# appium driver install uiautomator2 가 서버 APK를 두는 위치 (APPIUM_HOME 기본: ~/.appium)
+_UIA2_SERVER_APKS = (
+    "node_modules/appium-uiautomator2-driver/node_modules/appium-uiautomator2-server/apks/*.apk",
+    "node_modules/appium-uiautomator2-server/apks/*.apk",
+)
+_ANIMATION_SETTINGS = ("window_animation_scale", "transition_animation_scale", "animator_duration_scale")
+
+
+class PoolError(Exception):
+    """풀 API 오류 (서버 없음, 임대 실패)."""
+
+
+def _sdk_tool(name: str) -> str:
+    """adb / emulator 실행 파일 (PATH → ANDROID_HOME / ANDROID_SDK_ROOT)."""
+    found = shutil.which(name)
+    if found:
+        return found
+    subdir = "platform-tools" if name == "adb" else "emulator"
+    for root in (os.environ.get("ANDROID_HOME"), os.environ.get("ANDROID_SDK_ROOT")):
+        if root:
+            candidate = Path(root) / subdir / name
+            if candidate.exists():
+                return str(candidate)
+    return name
+
+
+def _adb(serial: str, *args: str, timeout: float = ADB_TIMEOUT) -> str:
+    """adb -s <serial> ... 출력. 실패/타임아웃이면 빈 문자열."""
+    try:
+        proc = subprocess.run(
+            [_sdk_tool("adb"), "-s", serial, *args], capture_output=True, text=True, timeout=timeout
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    return proc.stdout.strip() if proc.returncode == 0 else ""
+
+
+def _wait_boot(serial: str, timeout: float, process: subprocess.Popen | None = None) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        if _adb(serial, "shell", "getprop", "sys.boot_completed", timeout=5) == "1":
+            return True
+        time.sleep(1)
+    return False
+
+
+def _start_emulator(avd: str, port: int, extra: list[str], headless: bool) -> subprocess.Popen:
+    cmd = [_sdk_tool("emulator"), "-avd", avd, "-port", str(port), "-no-boot-anim", "-no-audio", *extra]
+    if headless:
+        cmd.append("-no-window")
+    return subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _kill_emulator(serial: str, process: subprocess.Popen | None) -> None:
+    _adb(serial, "emu", "kill", timeout=10)
+    if process is None:
+        return
+    try:
+        process.wait(timeout=20)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait(timeout=10)
+
+
+def _app_installed(serial: str, package: str) -> bool:
+    return _adb(serial, "shell", "pm", "path", package).startswith("package:")
+
+
+def health_error(serial: str, package: str = "") -> str:
+    """헬스 체크. 정상이면 빈 문자열, 아니면 사유."""
+    if _adb(serial, "get-state", timeout=5) != "device":
+        return "adb offline"
+    if _adb(serial, "shell", "getprop", "sys.boot_completed", timeout=5) != "1":
+        return "부팅 미완료"
+    if package and not _app_installed(serial, package):
+        return f"앱 미설치 ({package})"
+    return ""
+
+
+# ─── 스냅샷 준비 ─────────────────────────────────────────────
+
+def _uia2_server_apks() -> list[str]:
+    appium_home = os.environ.get("APPIUM_HOME") or str(Path.home() / ".appium")
+    for pattern in _UIA2_SERVER_APKS:
+        apks = sorted(glob.glob(os.path.join(appium_home, pattern)))
+        if apks:
+            return apks
+    return []
+
+
+def prepare_snapshot(avd: str, apk: str = "", snapshot: str = SNAPSHOT_NAME,
+                     port: int = BASE_CONSOLE_PORT, headless: bool = True) -> bool:
+    """AVD를 콜드 부팅해 앱/UiAutomator2 서버를 설치하고 quick-boot 스냅샷으로 저장합니다."""
+    serial = f"emulator-{port}"
+    print(f"[emulator_pool] {avd} 콜드 부팅 ({serial})...")
+    process = _start_emulator(avd, port, ["-no-snapshot-load"], headless)
+    try:
+        if not _wait_boot(serial, BOOT_TIMEOUT, process):
+            print(f"[emulator_pool] 부팅 실패: {avd}")
+            return False
+
+        for name in _ANIMATION_SETTINGS:
+            _adb(serial, "shell", "settings", "put", "global", name, "0")
+        server_apks = _uia2_server_apks()
+        if not server_apks:
+            print("[emulator_pool] UiAutomator2 서버 APK를 찾지 못함 — 첫 세션에서 Appium이 설치합니다")
+        for path in ([apk] if apk else []) + server_apks:
+            print(f"[emulator_pool] 설치: {Path(path).name}")
+            if not _adb(serial, "install", "-r", "-g", path, timeout=BOOT_TIMEOUT):
+                print(f"[emulator_pool] 설치 실패: {path}")
+                return False
+
+        if not _adb(serial, "emu", "avd", "snapshot", "save", snapshot, timeout=RESTORE_TIMEOUT):
+            print(f"[emulator_pool] 스냅샷 저장 실패: {snapshot}")
+            return False
+        print(f"[emulator_pool] ✅ 스냅샷 저장: {avd}/{snapshot}")
+        return True
+    finally:
+        _kill_emulator(serial, process)
+
+
+# ─── 풀 ─────────────────────────────────────────────
+
+@dataclass
+class PoolEmulator:
+    name: str
+    avd: str
+    port: int
+    # stopped | booting | ready | checking | leased | resetting | bad
+    state: str = "stopped"
+    process: subprocess.Popen | None = None
+    lease_id: str = ""
+    owner: str = ""
+    lease_expires: float = 0.0
+    boot_failures: int = 0
+    boots: int = 0
+    last_error: str = ""
+
+    @property
+    def serial(self) -> str:
+        return f"emulator-{self.port}"
+
+    def info(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "serial": self.serial,
+            "avd": self.avd,
+            "state": self.state,
+            "owner": self.owner,
+            "boots": self.boots,
+            "lastError": self.last_error,
+        }
+
+
+class EmulatorPool:
+    """스냅샷에서 부팅한 읽기 전용 에뮬레이터 N대를 유지하고 임대합니다.
+
+    상태 전이: booting → ready → leased → resetting(스냅샷 복원) → ready
+    헬스 체크 실패/복원 실패/프로세스 종료 → recycle(재부팅), 연속 실패 시 bad.
+    """
+
+    def __init__(self, avd: str, size: int, snapshot: str = SNAPSHOT_NAME, package: str = "",
+                 base_port: int = BASE_CONSOLE_PORT, headless: bool = True):
+        self.snapshot = snapshot
+        self.package = package
+        self.headless = headless
+        self.emulators = [
+            PoolEmulator(f"pool-{i + 1}", avd, base_port + 2 * i) for i in range(size)
+        ]
+        self._cond = threading.Condition()
+        self._stopped = threading.Event()
+        self._next_lease = 1
+
+    # ─── 수명 주기 ─────────────────────────────────────────────
+
+    def start(self) -> None:
+        for emu in self.emulators:
+            emu.state = "booting"
+            threading.Thread(target=self._boot, args=(emu,), name=f"boot-{emu.name}", daemon=True).start()
+        threading.Thread(target=self._health_loop, name="pool-health", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        threads = [
+            threading.Thread(target=_kill_emulator, args=(emu.serial, emu.process), daemon=True)
+            for emu in self.emulators
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(30)
+
+    def _boot(self, emu: PoolEmulator) -> None:
+        """스냅샷에서 부팅합니다 (스냅샷이 없으면 에뮬레이터가 콜드 부팅)."""
+        while not self._stopped.is_set():
+            emu.process = _start_emulator(
+                emu.avd, emu.port, ["-read-only", "-snapshot", self.snapshot, "-no-snapshot-save"], self.headless
+            )
+            start = time.time()
+            error = "" if _wait_boot(emu.serial, BOOT_TIMEOUT, emu.process) else "부팅 타임아웃"
+            error = error or health_error(emu.serial, self.package)
+            with self._cond:
+                emu.boots += 1
+                if not error:
+                    emu.state = "ready"
+                    emu.boot_failures = 0
+                    emu.last_error = ""
+                    self._cond.notify_all()
+                    print(f"[emulator_pool] {emu.name} 준비 ({emu.serial}, {time.time() - start:.0f}s)")
+                    return
+                emu.boot_failures += 1
+                emu.last_error = error
+            print(f"[emulator_pool] {emu.name} 부팅 실패: {error}")
+            _kill_emulator(emu.serial, emu.process)
+            if emu.boot_failures >= MAX_BOOT_FAILURES:
+                with self._cond:
+                    emu.state = "bad"
+                print(f"[emulator_pool] {emu.name} 연속 {emu.boot_failures}회 실패 → 제외")
+                return
+
+    def _recycle(self, emu: PoolEmulator, reason: str) -> None:
+        print(f"[emulator_pool] {emu.name} 재부팅: {reason}")
+        with self._cond:
+            emu.state = "booting"
+            emu.last_error = reason
+        _kill_emulator(emu.serial, emu.process)
+        self._boot(emu)
+
+    def _reset(self, emu: PoolEmulator, healthy: bool) -> None:
+        """반납된 에뮬레이터를 스냅샷으로 되돌립니다. 실패하면 재부팅."""
+        if healthy:
+            restored = _adb(emu.serial, "emu", "avd", "snapshot", "load", self.snapshot, timeout=RESTORE_TIMEOUT)
+            error = health_error(emu.serial, self.package) if restored else "스냅샷 복원 실패"
+            if not error:
+                with self._cond:
+                    emu.state = "ready"
+                    self._cond.notify_all()
+                return
+        else:
+            error = "클라이언트가 비정상 반납"
+        self._recycle(emu, error)
+
+    def _health_loop(self) -> None:
+        while not self._stopped.wait(HEALTH_INTERVAL):
+            now = time.time()
+            with self._cond:
+                ready = [e for e in self.emulators if e.state == "ready"]
+                expired = [e for e in self.emulators if e.state == "leased" and e.lease_expires < now]
+                for emu in ready:
+                    emu.state = "checking"
+            for emu in expired:
+                print(f"[emulator_pool] {emu.name} 임대 만료 회수 ({emu.owner})")
+                self.release(emu.lease_id, healthy=True)
+            for emu in ready:
+                exited = emu.process is not None and emu.process.poll() is not None
+                error = "프로세스 종료" if exited else health_error(emu.serial, self.package)
+                if error:
+                    threading.Thread(target=self._recycle, args=(emu, error), daemon=True).start()
+                    continue
+                with self._cond:
+                    emu.state = "ready"
+                    self._cond.notify_all()
+
+    # ─── 임대 ─────────────────────────────────────────────
+
+    def lease(self, owner: str = "", wait: float = LEASE_WAIT, ttl: float = LEASE_TTL) -> dict | None:
+        """빈 에뮬레이터 1대를 임대합니다. wait 초 안에 없으면 None."""
+        deadline = time.time() + wait
+        with self._cond:
+            while True:
+                emu = next((e for e in self.emulators if e.state == "ready"), None)
+                if emu is not None:
+                    break
+                remaining = deadline - time.time()
+                if remaining <= 0 or all(e.state == "bad" for e in self.emulators):
+                    return None
+                self._cond.wait(remaining)
+            emu.state = "leased"
+            emu.lease_id = f"lease-{self._next_lease}"
+            emu.owner = owner
+            emu.lease_expires = time.time() + ttl
+            self._next_lease += 1
+        print(f"[emulator_pool] 임대: {emu.lease_id} → {emu.name} ({owner or '-'})")
+        return {
+            "id": emu.lease_id,
+            "name": emu.name,
+            "serial": emu.serial,
+            "env": {"ANDROID_UDID": emu.serial, "ANDROID_DEVICE_NAME": f"{emu.avd} ({emu.name})"},
+        }
+
+    def release(self, lease_id: str, healthy: bool = True) -> bool:
+        with self._cond:
+            emu = next((e for e in self.emulators if e.state == "leased" and e.lease_id == lease_id), None)
+            if emu is None:
+                return False
+            emu.state = "resetting"
+            emu.lease_id = ""
+            emu.owner = ""
+        print(f"[emulator_pool] 반납: {lease_id} ← {emu.name}")
+        threading.Thread(target=self._reset, args=(emu, healthy), name=f"reset-{emu.name}", daemon=True).start()
+        return True
+
+    def status(self) -> dict[str, Any]:
+        with self._cond:
+            emulators = [e.info() for e in self.emulators]
+        return {
+            "size": len(emulators),
+            "ready": sum(1 for e in emulators if e["state"] == "ready"),
+            "emulators": emulators,
+        }
+
+
+# ─── 임대 API 서버 ─────────────────────────────────────────────
+
+class _PoolHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "PoolServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send_json(self, status: int, obj: Any) -> None:
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        path = urllib.parse.urlsplit(self.path).path.rstrip("/")
+        if path == "/health":
+            self._send_json(200, {"ok": True})
+        elif path == "/status":
+            self._send_json(200, self.server.pool.status())
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            data = json.loads(self.rfile.read(length).decode("utf-8")) if length else {}
+        except (UnicodeDecodeError, ValueError):
+            data = None
+        if not isinstance(data, dict):
+            self._send_json(400, {"error": "JSON object required"})
+            return
+
+        path = urllib.parse.urlsplit(self.path).path.rstrip("/")
+        pool = self.server.pool
+        if path == "/lease":
+            try:
+                wait = float(data.get("wait", LEASE_WAIT))
+                ttl = float(data.get("ttl", LEASE_TTL))
+            except (TypeError, ValueError):
+                self._send_json(400, {"error": "wait/ttl must be numbers"})
+                return
+            lease = pool.lease(str(data.get("owner", "")), wait=wait, ttl=ttl)
+            if lease is None:
+                self._send_json(503, {"error": "no emulator available", **pool.status()})
+            else:
+                self._send_json(200, lease)
+        elif path == "/release":
+            released = pool.release(str(data.get("id", "")), healthy=bool(data.get("healthy", True)))
+            self._send_json(200 if released else 404, {"released": released})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+
+class PoolServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], pool: EmulatorPool):
+        super().__init__(address, _PoolHandler)
+        self.pool = pool
+
+
+# ─── 클라이언트 ─────────────────────────────────────────────
+
+def _request(url: str, path: str, data: dict | None = None, timeout: float = 10) -> tuple[int, dict]:
+    body = json.dumps(data).encode("utf-8") if data is not None else None
+    req = urllib.request.Request(
+        url.rstrip("/") + path, data=body, method="POST" if body is not None else "GET",
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, json.loads(resp.read().decode("utf-8") or "{}")
+    except urllib.error.HTTPError as e:
+        try:
+            return e.code, json.loads(e.read().decode("utf-8") or "{}")
+        except ValueError:
+            return e.code, {}
+    except (OSError, ValueError) as e:
+        raise PoolError(f"에뮬레이터 풀 연결 실패 ({url}): {e}") from e
+
+
+def lease_emulator(url: str = DEFAULT_POOL_URL, owner: str = "", wait: float = LEASE_WAIT,
+                   ttl: float = LEASE_TTL) -> dict:
+    """풀에서 에뮬레이터를 임대합니다. 실패하면 PoolError."""
+    status, body = _request(url, "/lease", {"owner": owner, "wait": wait, "ttl": ttl}, timeout=wait + 10)
+    if status != 200:
+        raise PoolError(f"임대 실패 ({status}): {body.get('error', '')}")
+    return body
+
+
+def release_emulator(lease_id: str, url: str = DEFAULT_POOL_URL, healthy: bool = True) -> bool:
+    try:
+        status, _ = _request(url, "/release", {"id": lease_id, "healthy": healthy})
+    except PoolError as e:
+        print(f"[emulator_pool] 반납 실패: {e}")
+        return False
+    return status == 200
+
+
+def pool_status(url: str = DEFAULT_POOL_URL) -> dict:
+    status, body = _request(url, "/status")
+    if status != 200:
+        raise PoolError(f"상태 조회 실패 ({status})")
+    return body
+
+
+# ─── CLI ─────────────────────────────────────────────
+
+def _default_app() -> tuple[str, str]:
+    """config.capabilities 기준 (APK 경로, 앱 패키지)."""
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from config.capabilities import ANDROID_CAPS, get_env_config
+
+    return ANDROID_CAPS.get("app", ""), get_env_config()["resource_id_prefix"].split(":", 1)[0]
+
+
+def _serve(args: argparse.Namespace) -> int:
+    package = args.package if args.package is not None else _default_app()[1]
+    pool = EmulatorPool(args.avd, args.size, snapshot=args.snapshot, package=package,
+                        base_port=args.base_port, headless=not args.window)
+    parts = urllib.parse.urlsplit(args.url)
+    server = PoolServer((parts.hostname or "127.0.0.1", parts.port or 8791), pool)
+    # 서비스로 실행될 때(SIGTERM)도 에뮬레이터를 정리
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    pool.start()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"[emulator_pool] {args.avd} × {args.size} (스냅샷: {args.snapshot}, 앱: {package or '-'})")
+    print(f"[emulator_pool] 임대 API: {args.url} — Ctrl+C로 종료")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("\n[emulator_pool] 종료 중 (에뮬레이터 정리)...")
+    finally:
+        server.shutdown()
+        pool.stop()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="웜 에뮬레이터 풀 (스냅샷 부팅, 헬스 체크, 임대 API)")
+    parser.add_argument("--url", default=DEFAULT_POOL_URL, help=f"임대 API 주소 (기본: {DEFAULT_POOL_URL})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("prepare", help="콜드 부팅 + 앱/UiAutomator2 서버 설치 후 스냅샷 저장")
+    p.add_argument("--avd", required=True, help="AVD 이름 (emulator -list-avds)")
+    p.add_argument("--apk", default=None, help="설치할 APK (기본: APP_ENV 폴더의 최신 APK)")
+    p.add_argument("--snapshot", default=SNAPSHOT_NAME, help=f"스냅샷 이름 (기본: {SNAPSHOT_NAME})")
+    p.add_argument("--window", action="store_true", help="에뮬레이터 창 표시")
+
+    p = sub.add_parser("serve", help="에뮬레이터 N대 유지 + 임대 API")
+    p.add_argument("--avd", required=True, help="AVD 이름")
+    p.add_argument("--size", type=int, default=2, help="유지할 에뮬레이터 수 (기본: 2)")
+    p.add_argument("--snapshot", default=SNAPSHOT_NAME, help=f"스냅샷 이름 (기본: {SNAPSHOT_NAME})")
+    p.add_argument("--package", default=None, help="헬스 체크할 앱 패키지 (기본: APP_ENV 기준, ''이면 확인 안 함)")
+    p.add_argument("--base-port", type=int, default=BASE_CONSOLE_PORT,
+                   help=f"첫 에뮬레이터 콘솔 포트 (기본: {BASE_CONSOLE_PORT}, 짝수)")
+    p.add_argument("--window", action="store_true", help="에뮬레이터 창 표시")
+
+    p = sub.add_parser("lease", help="에뮬레이터 임대")
+    p.add_argument("--owner", default="", help="임대자 (상태 표시용)")
+    p.add_argument("--wait", type=float, default=LEASE_WAIT, help=f"빈 에뮬레이터 대기 초 (기본: {LEASE_WAIT})")
+    p.add_argument("--ttl", type=float, default=LEASE_TTL, help=f"임대 만료 초 (기본: {LEASE_TTL})")
+    p.add_argument("--format", choices=("json", "shell"), default="json",
+                   help="출력 형식 (shell: eval용 export 문)")
+
+    p = sub.add_parser("release", help="에뮬레이터 반납")
+    p.add_argument("lease_id")
+    p.add_argument("--unhealthy", action="store_true", help="스냅샷 복원 대신 재부팅")
+
+    sub.add_parser("status", help="풀 상태")
+    args = parser.parse_args()
+
+    if args.command == "prepare":
+        apk = args.apk if args.apk is not None else _default_app()[0]
+        return 0 if prepare_snapshot(args.avd, apk, args.snapshot, headless=not args.window) else 1
+    if args.command == "serve":
+        return _serve(args)
+
+    try:
+        if args.command == "lease":
+            lease = lease_emulator(args.url, args.owner, args.wait, args.ttl)
+            if args.format == "shell":
+                env = {**lease["env"], "EMULATOR_LEASE_ID": lease["id"]}
+                print("\n".join(f"export {k}={shlex.quote(v)}" for k, v in env.items()))
+            else:
+                print(json.dumps(lease, ensure_ascii=False))
+            return 0
+        if args.command == "release":
+            return 0 if release_emulator(args.lease_id, args.url, healthy=not args.unhealthy) else 1
+        print(json.dumps(pool_status(args.url), ensure_ascii=False, indent=2))
+        return 0
+    except PoolError as e:
+        print(f"[emulator_pool] {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
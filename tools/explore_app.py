@@ -42,6 +42,9 @@ from utils.auth import login, _handle_simple_password_screen
 from utils.initial_screens import handle_initial_screens
 from utils.helpers import save_error_logcat
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from image_utils import frame_change_ratio, screen_frame
+
 # Live / Staging 전환 설정
 # USE_LIVE=True → Live 앱, False → Staging 앱
 USE_LIVE = os.getenv("USE_LIVE", "true").lower() in ("true", "1", "yes")
@@ -63,6 +66,10 @@ else:
 # 간편비밀번호 (Simple Password)
 _SIMPLE_PIN = os.getenv("SIMPLE_PIN", "1234")
 
+# 화면 변화 감지 (축소 프레임 블록 비율): 이 미만이면 변화 없음 / 이 이상이면 화면 전환
+FRAME_STILL_RATIO = 0.01
+FRAME_CHANGED_RATIO = 0.1
+
 # 캡처 파일 번호 카운터
 _file_counter = 0
 
@@ -1397,27 +1404,72 @@ def explore_card(driver, folder):
     _capture_sub_tabs(driver, folder, "card")
 
 
-def _has_screen_changed(before_texts, driver):
+class ScreenState:
+    """클릭 전 화면 상태: 축소 프레임 + page_source 텍스트 (둘 중 하나는 없을 수 있음)."""
+
+    def __init__(self, frame=None, texts=None):
+        self.frame = frame
+        self.texts = texts
+
+
+def capture_screen_state(driver):
+    """현재 화면 상태를 저장합니다.
+
+    프레임만으로는 작은 변화(토스트, 값 하나 변경 등)를 구분할 수 없어 텍스트도 함께 저장합니다.
+    클릭 후에는 프레임이 그대로면 page_source를 가져오지 않으므로 변화 없는 클릭에서 덤프 1회를 아낍니다.
+    """
+    frame = screen_frame(driver)
+    try:
+        texts = _extract_visible_texts(driver.page_source)
+    except Exception:
+        texts = None if frame is not None else set()
+    return ScreenState(frame=frame, texts=texts)
+
+
+def _has_screen_changed(before, driver):
     """클릭 전/후 화면이 변했는지 판별.
 
-    클릭 후 page_source의 텍스트를 추출하여, 클릭 전 텍스트와 비교.
-    새로운 텍스트가 3개 이상이거나, 전체 텍스트의 30% 이상 변했으면 화면 전환으로 판단.
+    1. 축소 스크린샷(또는 MJPEG 프레임)의 블록 차이가 FRAME_STILL_RATIO 미만이면
+       page_source 없이 "변화 없음"으로 판단
+    2. 프레임이 바뀐 경우에만 page_source를 가져오고, 바뀐 블록이 FRAME_CHANGED_RATIO 이상이면
+       (텍스트 변화 없는 순수 시각 변화 포함) 화면 전환으로 판단
+    3. 그 사이(일부 블록만 바뀜)이거나 프레임이 없으면 클릭 전 텍스트와 비교해
+       새로운 텍스트가 3개 이상이거나 전체 텍스트의 30% 이상 변했을 때 화면 전환으로 판단
+
+    Args:
+        before: capture_screen_state() 결과 또는 클릭 전 텍스트 set
 
     Returns:
         tuple: (changed: bool, after_source: str)
     """
+    if not isinstance(before, ScreenState):
+        before = ScreenState(texts=set(before))
+
+    ratio = None
+    if before.frame is not None:
+        ratio = frame_change_ratio(before.frame, screen_frame(driver))
+        if ratio < FRAME_STILL_RATIO:
+            print(f"    → 화면 변화 없음 (프레임 변화 {ratio:.0%})")
+            return False, ""
+
     try:
         after_source = driver.page_source
     except Exception:
         return False, ""
+
+    if before.texts is None:
+        changed = ratio >= FRAME_CHANGED_RATIO
+        print(f"    → 화면 변화 {'감지' if changed else '없음'} (프레임 변화 {ratio:.0%})")
+        return changed, after_source
+
     after_texts = _extract_visible_texts(after_source)
-    new_texts = after_texts - before_texts
-    removed_texts = before_texts - after_texts
+    new_texts = after_texts - before.texts
+    removed_texts = before.texts - after_texts
     total_change = len(new_texts) + len(removed_texts)
-    total_all = len(before_texts | after_texts) or 1
+    total_all = len(before.texts | after_texts) or 1
 
     change_ratio = total_change / total_all
-    changed = len(new_texts) >= 3 or change_ratio >= 0.3
+    changed = len(new_texts) >= 3 or change_ratio >= 0.3 or (ratio is not None and ratio >= FRAME_CHANGED_RATIO)
 
     if changed:
         print(f"    → 화면 변화 감지 (신규 텍스트 {len(new_texts)}개, 변화율 {change_ratio:.0%})")
@@ -1453,11 +1505,8 @@ def explore_card_3rd_depth(driver, folder):
         return True
 
     def _get_card_texts():
-        """현재 Card 화면의 텍스트를 추출 (비교 기준용)"""
-        try:
-            return _extract_visible_texts(driver.page_source)
-        except Exception:
-            return set()
+        """현재 Card 화면 상태 저장 (비교 기준용, 가능하면 축소 프레임만)"""
+        return capture_screen_state(driver)
 
     if not _go_to_card():
         print("  [error] Card 탭 클릭 실패")
@@ -1504,13 +1553,13 @@ def explore_card_3rd_depth(driver, folder):
                     driver.back()
                     time.sleep(1)
                 else:
-                    # 일반 서브화면: 스크롤 아래 콘텐츠 확인
+                    # 일반 서브화면: 스크롤 아래 콘텐츠 확인 (스크롤로 화면이 바뀐 경우만 캡처)
+                    before_scroll = capture_screen_state(driver)
                     scroll_down(driver)
                     time.sleep(0.5)
                     try:
-                        scrolled_source = driver.page_source
-                        scrolled_texts = _extract_visible_texts(scrolled_source)
-                        if scrolled_texts - before_texts:
+                        scrolled, _ = _has_screen_changed(before_scroll, driver)
+                        if scrolled:
                             save_dump(driver, folder, f"card3_{code}_{name}_scrolled")
                     except Exception:
                         pass
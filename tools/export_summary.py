@@ -1,23 +1,32 @@
 """
 Allure 리포트 요약 HTML 생성
 - 핵심 정보만 포함 (테스트 결과, 실패 상세, 환경 정보)
-- 스크린샷은 Base64 인라인 (비디오 제외)
-- 단일 HTML 파일로 출력
+- 스크린샷은 축소 썸네일(WebP, 미지원 시 JPEG)로 변환 (비디오 제외)
+  - 기본: summary_<ts>_files/ 에 썸네일 파일 저장 후 lazy-load 참조 (원본 링크)
+  - --single-file: 썸네일만 Base64 인라인한 단일 HTML 파일
+- 썸네일은 프로세스 풀에서 병렬 생성, HTML은 디스크에 순차 기록
 """
 
 import argparse
 import base64
-import json
+import html
+import multiprocessing
+import os
 import re
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from allure_model import load_report
+from image_utils import downscale_image
 
-def _read_json(path: Path) -> dict | list | None:
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return None
+# 썸네일 긴 변 (px) / 품질 / 테스트당 최대 스크린샷 수
+THUMB_MAX_SIDE = 480
+THUMB_QUALITY = 70
+MAX_SCREENSHOTS = 3
+# 이 개수 미만이면 프로세스 풀 없이 현재 프로세스에서 변환
+_POOL_MIN_JOBS = 8
+_SUFFIX = {"image/webp": ".webp", "image/jpeg": ".jpg", "image/png": ".png", "image/gif": ".gif"}
 
 
 def _format_duration(ms: int) -> str:
@@ -38,23 +47,73 @@ def _format_timestamp(ts: str) -> str:
     return ts
 
 
-def _inline_image(path: Path) -> str | None:
-    if not path.exists():
-        return None
-    try:
-        data = path.read_bytes()
-        b64 = base64.b64encode(data).decode("ascii")
-        suffix = path.suffix.lower()
-        mime = {"png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg", "gif": "image/gif"}.get(
-            suffix.lstrip("."), "image/png"
-        )
-        return f"data:{mime};base64,{b64}"
-    except Exception:
-        return None
+def _inline_image(data: bytes, mime: str) -> str:
+    b64 = base64.b64encode(data).decode("ascii")
+    return f"data:{mime};base64,{b64}"
+
 
+def _make_thumbnail(src: str, dest_stem: str | None) -> tuple[bytes | None, str, str | None]:
+    """썸네일 생성 (프로세스 풀 워커).
 
-def generate_summary_html(report_dir: Path, output_path: Path, include_screenshots: bool = True) -> None:
-    summary = _read_json(report_dir / "widgets" / "summary.json")
+    dest_stem이 있으면 파일로 저장하고 (None, mime, 파일 경로)를, 없으면 (바이트, mime, None)을 반환합니다.
+    이미 생성된 최신 썸네일은 재사용합니다.
+    """
+    src_path = Path(src)
+    if not src_path.exists():
+        return None, "", None
+    if dest_stem:
+        for mime, suffix in _SUFFIX.items():
+            existing = Path(dest_stem + suffix)
+            if existing.exists() and existing.stat().st_mtime >= src_path.stat().st_mtime:
+                return None, mime, str(existing)
+    try:
+        data, mime = downscale_image(src_path, THUMB_MAX_SIDE, THUMB_QUALITY, fmt="WEBP")
+    except OSError:
+        return None, "", None
+    if not dest_stem:
+        return data, mime, None
+    dest = Path(dest_stem + _SUFFIX.get(mime, src_path.suffix))
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, dest)
+    return None, mime, str(dest)
+
+
+def _submit_thumbnails(jobs: list[tuple[str, str | None]], workers: int | None) -> tuple[dict, ProcessPoolExecutor | None]:
+    """썸네일 작업을 제출합니다. 작업이 적거나 풀을 만들 수 없으면 즉시 계산합니다."""
+    futures: dict[str, Future] = {}
+    pool = None
+    if len(jobs) >= _POOL_MIN_JOBS and workers != 1:
+        try:
+            # run_allure는 업로드 스레드가 도는 중에 이 풀을 만들므로 fork 대신 spawn
+            pool = ProcessPoolExecutor(
+                max_workers=workers or min(8, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            for src, dest_stem in jobs:
+                futures[src] = pool.submit(_make_thumbnail, src, dest_stem)
+            return futures, pool
+        except (OSError, NotImplementedError, PermissionError):
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            pool = None
+            futures = {}
+    for src, dest_stem in jobs:
+        future: Future = Future()
+        future.set_result(_make_thumbnail(src, dest_stem))
+        futures[src] = future
+    return futures, None
+
+
+def generate_summary_html(
+    report_dir: Path,
+    output_path: Path,
+    include_screenshots: bool = True,
+    single_file: bool = False,
+    workers: int | None = None,
+) -> None:
+    model = load_report(report_dir)
+    summary = model.widget("summary") if model else None
     if not summary:
         raise FileNotFoundError(f"summary.json not found in {report_dir}")
 
@@ -63,7 +122,7 @@ def generate_summary_html(report_dir: Path, output_path: Path, include_screensho
     report_name = summary.get("reportName", report_dir.name)
 
     # Environment info
-    env_data = _read_json(report_dir / "widgets" / "environment.json") or []
+    env_data = model.widget("environment") or []
     env_map = {}
     for item in env_data:
         name = item.get("name", "")
@@ -72,23 +131,58 @@ def generate_summary_html(report_dir: Path, output_path: Path, include_screensho
             env_map[name] = values[0]
 
     # Test cases
-    test_cases = []
-    data_dir = report_dir / "data" / "test-cases"
-    if data_dir.exists():
-        for tc_file in data_dir.glob("*.json"):
-            tc = _read_json(tc_file)
-            if tc:
-                test_cases.append(tc)
+    test_cases = list(model.cases)
 
     # Sort by status (failed first)
     status_order = {"failed": 0, "broken": 1, "skipped": 2, "passed": 3, "unknown": 4}
-    test_cases.sort(key=lambda x: status_order.get(x.get("status", "unknown"), 5))
+    test_cases.sort(key=lambda x: status_order.get(x.status, 5))
 
     # Attachments mapping
     attachments_dir = report_dir / "data" / "attachments"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    assets_dir = output_path.parent / f"{output_path.stem}_files"
+
+    # 썸네일 작업을 먼저 제출 (HTML 기록과 병렬 진행)
+    jobs: list[tuple[str, str | None]] = []
+    screenshots_by_case: dict[int, list] = {}
+    if include_screenshots:
+        if not single_file:
+            assets_dir.mkdir(parents=True, exist_ok=True)
+        for index, tc in enumerate(test_cases):
+            shots = [a for a in tc.attachments if a.type.startswith("image/")][:MAX_SCREENSHOTS]
+            if shots:
+                screenshots_by_case[index] = shots
+            for att in shots:
+                src = str(attachments_dir / att.source)
+                jobs.append((src, None if single_file else str(assets_dir / Path(att.source).stem)))
+    futures, pool = _submit_thumbnails(jobs, workers)
+
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    out = tmp_path.open("w", encoding="utf-8")
+    try:
+        _write_html(
+            out, report_dir, output_path, report_name, stats, time_info, env_map,
+            test_cases, screenshots_by_case, attachments_dir, futures,
+        )
+    finally:
+        out.close()
+        if pool is not None:
+            pool.shutdown()
+    os.replace(tmp_path, output_path)
+
+    total = output_path.stat().st_size
+    if assets_dir.exists():
+        total += sum(p.stat().st_size for p in assets_dir.iterdir() if p.is_file())
+    print(f"Summary HTML generated: {output_path}")
+    print(f"File size: {output_path.stat().st_size:,} bytes (with thumbnails: {total:,} bytes)")
+
 
-    # Build HTML
-    html_parts = [
+def _write_html(
+    out, report_dir, output_path, report_name, stats, time_info, env_map,
+    test_cases, screenshots_by_case, attachments_dir, futures,
+) -> None:
+    """요약 HTML을 파일에 순차 기록합니다 (스크린샷은 썸네일 완료 순서대로 대기)."""
+    out.write(
         """<!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -128,7 +222,7 @@ h2{font-size:18px;margin:24px 0 12px;border-bottom:1px solid var(--border);paddi
 .test-section:last-child{margin-bottom:0}
 .section-title{font-size:13px;color:var(--muted);margin-bottom:8px}
 .error-msg{background:rgba(250,82,82,.1);border:1px solid rgba(250,82,82,.3);border-radius:8px;padding:12px;font-family:monospace;font-size:12px;white-space:pre-wrap;word-break:break-all;color:#ff8080}
-.screenshot{max-width:100%;max-height:300px;border-radius:8px;border:1px solid var(--border)}
+.screenshot{max-width:100%;max-height:300px;border-radius:8px;border:1px solid var(--border);margin-right:8px}
 .steps{font-size:13px}
 .step{padding:6px 0;border-bottom:1px solid var(--border)}
 .step:last-child{border-bottom:none}
@@ -138,82 +232,79 @@ h2{font-size:18px;margin:24px 0 12px;border-bottom:1px solid var(--border);paddi
 <body>
 <div class="container">
 """
-    ]
+    )
 
     # Header
-    html_parts.append(f'<h1>{report_name}</h1>')
-    html_parts.append(f'<div class="meta">Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | Report: {_format_timestamp(report_dir.name)}</div>')
+    out.write(f'<h1>{report_name}</h1>')
+    out.write(f'<div class="meta">Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | Report: {_format_timestamp(report_dir.name)}</div>')
 
     # Stats card
-    html_parts.append('<div class="card"><div class="stats">')
-    html_parts.append(f'<div class="stat"><div class="stat-value">{stats.get("total", 0)}</div><div class="stat-label">Total</div></div>')
-    html_parts.append(f'<div class="stat passed"><div class="stat-value">{stats.get("passed", 0)}</div><div class="stat-label">Passed</div></div>')
-    html_parts.append(f'<div class="stat failed"><div class="stat-value">{stats.get("failed", 0)}</div><div class="stat-label">Failed</div></div>')
-    html_parts.append(f'<div class="stat broken"><div class="stat-value">{stats.get("broken", 0)}</div><div class="stat-label">Broken</div></div>')
-    html_parts.append(f'<div class="stat skipped"><div class="stat-value">{stats.get("skipped", 0)}</div><div class="stat-label">Skipped</div></div>')
-    html_parts.append(f'<div class="stat"><div class="stat-value">{_format_duration(time_info.get("duration", 0))}</div><div class="stat-label">Duration</div></div>')
-    html_parts.append('</div></div>')
+    out.write('<div class="card"><div class="stats">')
+    out.write(f'<div class="stat"><div class="stat-value">{stats.get("total", 0)}</div><div class="stat-label">Total</div></div>')
+    out.write(f'<div class="stat passed"><div class="stat-value">{stats.get("passed", 0)}</div><div class="stat-label">Passed</div></div>')
+    out.write(f'<div class="stat failed"><div class="stat-value">{stats.get("failed", 0)}</div><div class="stat-label">Failed</div></div>')
+    out.write(f'<div class="stat broken"><div class="stat-value">{stats.get("broken", 0)}</div><div class="stat-label">Broken</div></div>')
+    out.write(f'<div class="stat skipped"><div class="stat-value">{stats.get("skipped", 0)}</div><div class="stat-label">Skipped</div></div>')
+    out.write(f'<div class="stat"><div class="stat-value">{_format_duration(time_info.get("duration", 0))}</div><div class="stat-label">Duration</div></div>')
+    out.write('</div></div>')
 
     # Environment card
     if env_map:
-        html_parts.append('<div class="card"><div class="env">')
+        out.write('<div class="card"><div class="env">')
         for k, v in env_map.items():
-            html_parts.append(f'<div class="env-item"><span class="env-key">{k}:</span> {v}</div>')
-        html_parts.append('</div></div>')
+            out.write(f'<div class="env-item"><span class="env-key">{k}:</span> {v}</div>')
+        out.write('</div></div>')
 
     # Test cases
-    html_parts.append('<h2>Test Cases</h2>')
-    for tc in test_cases:
-        status = tc.get("status", "unknown")
-        name = tc.get("name", "Unknown")
-        full_name = tc.get("fullName", name)
-        duration = tc.get("time", {}).get("duration", 0)
-        status_trace = tc.get("statusTrace", "") or tc.get("statusMessage", "")
-
-        html_parts.append(f'<div class="test" data-status="{status}">')
-        html_parts.append(f'<div class="test-header" onclick="this.parentElement.classList.toggle(\'open\')">')
-        html_parts.append(f'<span class="status-badge status-{status}">{status}</span>')
-        html_parts.append(f'<span class="test-name">{name}</span>')
-        html_parts.append(f'<span class="test-duration">{_format_duration(duration)}</span>')
-        html_parts.append('</div>')
-        html_parts.append('<div class="test-body">')
+    out.write('<h2>Test Cases</h2>')
+    for index, tc in enumerate(test_cases):
+        status = tc.status
+        name = tc.name or "Unknown"
+        full_name = tc.full_name or name
+        duration = tc.duration_ms
+        status_trace = tc.trace or tc.message
+
+        out.write(f'<div class="test" data-status="{status}">')
+        out.write(f'<div class="test-header" onclick="this.parentElement.classList.toggle(\'open\')">')
+        out.write(f'<span class="status-badge status-{status}">{status}</span>')
+        out.write(f'<span class="test-name">{name}</span>')
+        out.write(f'<span class="test-duration">{_format_duration(duration)}</span>')
+        out.write('</div>')
+        out.write('<div class="test-body">')
 
         # Full name
-        html_parts.append(f'<div class="test-section"><div class="section-title">Full Name</div><div>{full_name}</div></div>')
+        out.write(f'<div class="test-section"><div class="section-title">Full Name</div><div>{full_name}</div></div>')
 
         # Error message
         if status in ("failed", "broken") and status_trace:
-            html_parts.append(f'<div class="test-section"><div class="section-title">Error</div><div class="error-msg">{status_trace[:2000]}</div></div>')
-
-        # Screenshots - search in all stages
-        if include_screenshots:
-            all_attachments = []
-            def collect_attachments(obj):
-                if isinstance(obj, dict):
-                    if "attachments" in obj and isinstance(obj["attachments"], list):
-                        all_attachments.extend(obj["attachments"])
-                    for v in obj.values():
-                        collect_attachments(v)
-                elif isinstance(obj, list):
-                    for item in obj:
-                        collect_attachments(item)
-            collect_attachments(tc)
-            screenshots = [a for a in all_attachments if a.get("type", "").startswith("image/")]
-            if screenshots:
-                html_parts.append('<div class="test-section"><div class="section-title">Screenshots</div>')
-                for att in screenshots[:3]:  # Max 3 screenshots
-                    source = att.get("source", "")
-                    if source:
-                        img_path = attachments_dir / source
-                        data_uri = _inline_image(img_path)
-                        if data_uri:
-                            html_parts.append(f'<img class="screenshot" src="{data_uri}" alt="{att.get("name", "screenshot")}">')
-                html_parts.append('</div>')
-
-        html_parts.append('</div></div>')
+            out.write(f'<div class="test-section"><div class="section-title">Error</div><div class="error-msg">{status_trace[:2000]}</div></div>')
+
+        # Screenshots - 썸네일 (원본은 링크)
+        shots = screenshots_by_case.get(index)
+        if shots:
+            out.write('<div class="test-section"><div class="section-title">Screenshots</div>')
+            for att in shots:
+                src = attachments_dir / att.source
+                try:
+                    data, mime, thumb = futures[str(src)].result()
+                except Exception:
+                    continue
+                alt = html.escape(att.name or "screenshot", quote=True)
+                if data is not None:
+                    out.write(f'<img class="screenshot" src="{_inline_image(data, mime)}" alt="{alt}">')
+                elif thumb:
+                    thumb_rel = Path(os.path.relpath(thumb, output_path.parent)).as_posix()
+                    orig_rel = Path(os.path.relpath(src, output_path.parent)).as_posix()
+                    out.write(
+                        f'<a href="{html.escape(orig_rel, quote=True)}" target="_blank">'
+                        f'<img class="screenshot" loading="lazy" src="{html.escape(thumb_rel, quote=True)}" alt="{alt}"></a>'
+                    )
+            out.write('</div>')
+
+        out.write('</div></div>')
 
     # Footer
-    html_parts.append("""
+    out.write("""
 </div>
 <script>
 // Auto-open failed tests
@@ -223,17 +314,14 @@ document.querySelectorAll('.test[data-status="failed"], .test[data-status="broke
 </html>
 """)
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text("".join(html_parts), encoding="utf-8")
-    print(f"Summary HTML generated: {output_path}")
-    print(f"File size: {output_path.stat().st_size:,} bytes")
-
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Generate summary HTML from Allure report")
     parser.add_argument("report_dir", help="Allure report directory (e.g., allure-reports/20260127_153847)")
     parser.add_argument("--output", "-o", default=None, help="Output HTML file path")
     parser.add_argument("--no-screenshots", action="store_true", help="Exclude screenshots (smaller file)")
+    parser.add_argument("--single-file", action="store_true", help="Inline thumbnails into a single HTML file")
+    parser.add_argument("--workers", type=int, default=None, help="Thumbnail worker processes (default: CPU count, max 8)")
     args = parser.parse_args()
 
     report_dir = Path(args.report_dir)
@@ -243,7 +331,13 @@ def main() -> int:
 
     output = Path(args.output) if args.output else report_dir.parent / "export" / f"summary_{report_dir.name}.html"
 
-    generate_summary_html(report_dir, output, include_screenshots=not args.no_screenshots)
+    generate_summary_html(
+        report_dir,
+        output,
+        include_screenshots=not args.no_screenshots,
+        single_file=args.single_file,
+        workers=args.workers,
+    )
     return 0
 
 
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""AI 실패 분석 결과 캐시.
+
+같은 실패(예외 타입 + 상위 스택 프레임 + 화면 Activity)가 비슷한 화면(스크린샷 dHash)에서
+반복되면 이전 분석 결과를 재사용합니다. 캐시는 allure-reports/ai_analysis_cache.json에 저장됩니다.
+여러 실행이 동시에 저장할 수 있으므로 save()는 file_lock 안에서 파일을 다시 읽어 합친 뒤 씁니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from file_lock import file_lock
+from image_utils import is_similar
+
+CACHE_NAME = "ai_analysis_cache.json"
+_MAX_ENTRIES_PER_SIGNATURE = 5
+_TOP_FRAMES = 3
+
+_EXCEPTION_RE = re.compile(r"\b((?:[A-Za-z_]\w*\.)*[A-Za-z_]\w*(?:Exception|Error|Timeout))\b")
+_FRAME_RE = re.compile(r'File "([^"]+)", line \d+, in (\S+)')
+_ACTIVITY_COMMENT_RE = re.compile(r"<!--\s*Activity:\s*(\S+)\s*\|\s*Package:\s*(\S+)\s*-->")
+_PACKAGE_ATTR_RE = re.compile(r'\bpackage="([^"]+)"')
+# 실행마다 달라지는 값 (세션 ID, 좌표, 시간, 메모리 주소 등)
+_VOLATILE_RE = re.compile(r"0x[0-9a-fA-F]+|\b[0-9a-f]{8,}\b|\d+(?:\.\d+)?")
+
+
+def _screen_of(page_source_path: str | None) -> str:
+    if not page_source_path or not os.path.isfile(page_source_path):
+        return ""
+    try:
+        with open(page_source_path, "r", encoding="utf-8", errors="replace") as f:
+            head = f.read(4000)
+    except OSError:
+        return ""
+    m = _ACTIVITY_COMMENT_RE.search(head)
+    if m:
+        return f"{m.group(2)}/{m.group(1)}"
+    m = _PACKAGE_ATTR_RE.search(head)
+    return m.group(1) if m else ""
+
+
+def failure_signature(error_message: str, status_trace: str, page_source_path: str | None = None) -> str:
+    """실패를 정규화한 시그니처 문자열을 반환합니다."""
+    text = f"{error_message}\n{status_trace}"
+    m = _EXCEPTION_RE.search(text)
+    exc_type = m.group(1).rsplit(".", 1)[-1] if m else ""
+
+    # 스택 상위 프레임 (파일명::함수, 줄 번호는 코드 수정에 따라 바뀌므로 제외)
+    frames = [f"{Path(path).name}::{func}" for path, func in _FRAME_RE.findall(status_trace or "")]
+    top_frames = frames[-_TOP_FRAMES:]
+
+    first_line = (error_message or "").strip().splitlines()[0] if (error_message or "").strip() else ""
+    message = _VOLATILE_RE.sub("#", first_line)[:200]
+
+    return "|".join([exc_type, ",".join(top_frames), _screen_of(page_source_path), message])
+
+
+def signature_key(signature: str) -> str:
+    return hashlib.sha256(signature.encode("utf-8")).hexdigest()[:16]
+
+
+class FailureAnalysisCache:
+    """시그니처 키 → [{phash, analysis, createdAt}] 형태의 JSON 캐시."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        # 이 프로세스에서 추가한 항목 (저장 시 다른 실행이 쓴 파일 내용과 합침)
+        self._added: dict[str, list[dict]] = {}
+        self._entries = self._read()
+
+    def _read(self) -> dict[str, list[dict]]:
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, key: str, phash: int | None) -> str | None:
+        with self._lock:
+            for entry in self._entries.get(key, []):
+                cached = entry.get("phash")
+                if is_similar(int(cached, 16) if cached else None, phash):
+                    return entry.get("analysis") or None
+        return None
+
+    def put(self, key: str, phash: int | None, analysis: str) -> None:
+        if not analysis:
+            return
+        with self._lock:
+            entry = {
+                "phash": f"{phash:016x}" if phash is not None else "",
+                "analysis": analysis,
+                "createdAt": datetime.now().isoformat(timespec="seconds"),
+            }
+            entries = self._entries.setdefault(key, [])
+            entries.append(entry)
+            del entries[:-_MAX_ENTRIES_PER_SIGNATURE]
+            self._added.setdefault(key, []).append(entry)
+
+    def save(self) -> None:
+        """추가한 항목을 파일에 합쳐 저장합니다 (다른 실행이 그사이 저장한 항목 유지)."""
+        with self._lock:
+            if not self._added:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with file_lock(self.path):
+                merged = self._read()
+                for key, added in self._added.items():
+                    entries = merged.setdefault(key, [])
+                    entries.extend(added)
+                    del entries[:-_MAX_ENTRIES_PER_SIGNATURE]
+                tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+                try:
+                    tmp.write_text(json.dumps(merged, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+                    os.replace(tmp, self.path)
+                finally:
+                    tmp.unlink(missing_ok=True)
+            self._entries = merged
+            self._added = {}
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""allure-results의 실패를 근본 원인별로 묶습니다 (오프라인 클러스터링).
+
+실패(failed/broken) 1건마다 특징을 뽑아 고정 크기 벡터로 해싱합니다:
+  예외 타입, 정규화한 메시지 토큰, 상위 스택 프레임, 화면(page_source의 Activity 주석),
+  스크린샷 dHash.
+기존 클러스터 중심과의 코사인 유사도(+ dHash 해밍 거리)가 기준 이상이면 그 클러스터에,
+아니면 새 클러스터에 넣습니다. 상태는 allure-reports/failure_clusters.json에 저장되어
+새 실행분만 추가로 처리합니다 (증분). NumPy가 있으면 행렬 연산으로, 없으면 순수 파이썬으로 계산합니다.
+
+대시보드 업로드(failureClusters)와 Teams 카드("N건 실패 / K개 원인"), AI 분석 묶음에 사용됩니다.
+
+사용법:
+  python tools/failure_clusters.py ingest
+  python tools/failure_clusters.py report --top 10
+  python tools/failure_clusters.py report --timestamp 20260216_024413
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from allure_model import TestResult, load_results
+from failure_cache import failure_signature
+from file_lock import file_lock
+from image_utils import IMAGE_SUFFIXES, dhash, hamming
+from lazy_import import UNLOADED, optional_import
+
+# NumPy는 클러스터링을 처음 할 때 import (trigger_listener/업로드 도구 시작 시간 단축)
+np = UNLOADED
+
+
+def _load_numpy() -> None:
+    global np
+    if np is UNLOADED:
+        np = optional_import("numpy")
+
+
+STATE_NAME = "failure_clusters.json"
+STATE_VERSION = 1
+DIM = 512
+# 코사인 유사도(스크린샷 유사도 반영 후) 기준
+DEFAULT_THRESHOLD = 0.75
+# 스크린샷 해시 유사도 가중치 (둘 다 해시가 있을 때만)
+PHASH_WEIGHT = 0.2
+_MAX_MEMBERS = 200
+
+_FEATURE_WEIGHTS = {"exc": 3.0, "frame": 2.0, "screen": 2.0, "msg": 1.0}
+_TIMESTAMP_DIR_RE = re.compile(r"^\d{8}_\d{6}$")
+_TOKEN_RE = re.compile(r"[a-z가-힣_#][a-z0-9가-힣_#]+")
+
+
+# ─── 특징 추출 ─────────────────────────────────────────────
+
+def failure_features(r: TestResult, results_dir: Path) -> dict[str, Any]:
+    """실패 1건의 특징 (시그니처 구성요소 + 스크린샷 해시)."""
+    page_source = r.find_attachment(results_dir, ".xml")
+    screenshot = r.find_attachment(results_dir, IMAGE_SUFFIXES)
+    exc, frames, screen, message = (failure_signature(r.message, r.trace, page_source).split("|", 3) + [""] * 4)[:4]
+    return {
+        "exception": exc,
+        "frames": [f for f in frames.split(",") if f],
+        "screen": screen,
+        "message": message,
+        "phash": dhash(screenshot) if screenshot else None,
+    }
+
+
+def _bucket(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8")) % DIM
+
+
+def feature_vector(features: dict[str, Any]) -> dict[int, float]:
+    """특징 → L2 정규화된 희소 벡터 {차원: 값} (feature hashing)."""
+    tokens: list[tuple[str, float]] = []
+    if features["exception"]:
+        tokens.append((f"exc:{features['exception']}", _FEATURE_WEIGHTS["exc"]))
+    tokens += [(f"frame:{f}", _FEATURE_WEIGHTS["frame"]) for f in features["frames"]]
+    if features["screen"]:
+        tokens.append((f"screen:{features['screen']}", _FEATURE_WEIGHTS["screen"]))
+    tokens += [(f"msg:{t}", _FEATURE_WEIGHTS["msg"]) for t in _TOKEN_RE.findall(features["message"].lower())]
+
+    vec: dict[int, float] = {}
+    for token, weight in tokens:
+        index = _bucket(token)
+        vec[index] = vec.get(index, 0.0) + weight
+    norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+    return {i: v / norm for i, v in vec.items()}
+
+
+# ─── 클러스터링 ─────────────────────────────────────────────
+
+class FailureClusterer:
+    """증분 리더(leader) 클러스터링. 중심 벡터는 멤버 벡터의 평균(정규화)입니다.
+
+    여러 실행이 동시에 상태 파일을 갱신할 수 있으므로, 읽기부터 저장까지는
+    file_lock(state_path) 안에서 수행합니다 (cluster_run, CLI ingest).
+    """
+
+    def __init__(self, state_path: Path, threshold: float = DEFAULT_THRESHOLD):
+        _load_numpy()
+        self.state_path = state_path
+        self.threshold = threshold
+        try:
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+            if state.get("version") != STATE_VERSION or state.get("dim") != DIM:
+                state = {}
+        except (OSError, ValueError):
+            state = {}
+        self.processed: list[str] = state.get("processed", [])
+        self.clusters: list[dict[str, Any]] = state.get("clusters", [])
+        self._sums = [self._dense({int(k): v for k, v in c["sum"].items()}) for c in self.clusters]
+        self._centroids = self._stack([self._normalized(s) for s in self._sums])
+
+    # 벡터 연산 (NumPy / 순수 파이썬)
+
+    @staticmethod
+    def _dense(sparse: dict[int, float]):
+        if np is not None:
+            vec = np.zeros(DIM, dtype=np.float32)
+            for i, v in sparse.items():
+                vec[i] = v
+            return vec
+        vec = [0.0] * DIM
+        for i, v in sparse.items():
+            vec[i] = v
+        return vec
+
+    @staticmethod
+    def _normalized(vec):
+        if np is not None:
+            norm = float(np.linalg.norm(vec)) or 1.0
+            return vec / norm
+        norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+        return [v / norm for v in vec]
+
+    @staticmethod
+    def _stack(rows: list):
+        if np is not None:
+            return np.vstack(rows) if rows else np.zeros((0, DIM), dtype=np.float32)
+        return list(rows)
+
+    def _similarities(self, vec: dict[int, float]) -> list[float]:
+        if not self.clusters:
+            return []
+        if np is not None:
+            idx = np.fromiter(vec.keys(), dtype=np.int64, count=len(vec))
+            val = np.fromiter(vec.values(), dtype=np.float32, count=len(vec))
+            return (self._centroids[:, idx] @ val).tolist() if len(vec) else [0.0] * len(self.clusters)
+        return [sum(c[i] * v for i, v in vec.items()) for c in self._centroids]
+
+    def _score(self, sims: list[float], phash: int | None) -> list[float]:
+        if phash is None:
+            return sims
+        scores = []
+        for sim, cluster in zip(sims, self.clusters):
+            rep = cluster.get("phash")
+            if not rep:
+                scores.append(sim)
+                continue
+            visual = 1.0 - hamming(int(rep, 16), phash) / 64
+            scores.append((1 - PHASH_WEIGHT) * sim + PHASH_WEIGHT * visual)
+        return scores
+
+    def assign(self, features: dict[str, Any], member: dict[str, str]) -> int:
+        """실패 1건을 클러스터에 넣고 클러스터 id를 반환합니다."""
+        vec = feature_vector(features)
+        scores = self._score(self._similarities(vec), features["phash"])
+        best = max(range(len(scores)), key=scores.__getitem__) if scores else -1
+        now = member.get("timestamp", "")
+
+        if best >= 0 and scores[best] >= self.threshold:
+            cluster = self.clusters[best]
+            dense = self._dense(vec)
+            if np is not None:
+                self._sums[best] = self._sums[best] + dense
+                self._centroids[best] = self._normalized(self._sums[best])
+            else:
+                self._sums[best] = [a + b for a, b in zip(self._sums[best], dense)]
+                self._centroids[best] = self._normalized(self._sums[best])
+            cluster["count"] += 1
+            cluster["lastSeen"] = max(cluster["lastSeen"], now)
+            if not cluster.get("phash") and features["phash"] is not None:
+                cluster["phash"] = f"{features['phash']:016x}"
+        else:
+            best = len(self.clusters)
+            cluster = {
+                "id": best + 1,
+                "count": 1,
+                "exception": features["exception"],
+                "screen": features["screen"],
+                "message": features["message"],
+                "frames": features["frames"],
+                "phash": f"{features['phash']:016x}" if features["phash"] is not None else "",
+                "firstSeen": now,
+                "lastSeen": now,
+                "tests": {},
+                "members": [],
+            }
+            self.clusters.append(cluster)
+            dense = self._dense(vec)
+            self._sums.append(dense)
+            if np is not None:
+                self._centroids = np.vstack([self._centroids, self._normalized(dense)[None, :]])
+            else:
+                self._centroids.append(self._normalized(dense))
+
+        test = member.get("fullName", "")
+        cluster["tests"][test] = cluster["tests"].get(test, 0) + 1
+        cluster["members"].append(member)
+        del cluster["members"][:-_MAX_MEMBERS]
+        return cluster["id"]
+
+    def ingest_run(self, results_dir: Path) -> dict[str, int]:
+        """한 실행의 실패를 클러스터에 넣습니다. 이미 처리한 실행이면 기존 배정을 반환합니다.
+
+        Returns:
+            결과 uuid → 클러스터 id
+        """
+        ts = results_dir.name
+        if ts in self.processed:
+            return {
+                m["uuid"]: c["id"] for c in self.clusters for m in c["members"] if m.get("timestamp") == ts
+            }
+        assigned: dict[str, int] = {}
+        for r in load_results(results_dir).results:
+            if r.status not in ("failed", "broken") or not (r.message or r.trace):
+                continue
+            member = {"timestamp": ts, "uuid": r.uuid, "fullName": r.full_name}
+            assigned[r.uuid] = self.assign(failure_features(r, results_dir), member)
+        self.processed.append(ts)
+        return assigned
+
+    def ingest_all(self, results_root: Path) -> list[str]:
+        added = []
+        if results_root.is_dir():
+            for child in sorted(results_root.iterdir(), key=lambda p: p.name):
+                if child.is_dir() and _TIMESTAMP_DIR_RE.match(child.name) and child.name not in self.processed:
+                    if load_results(child).results:
+                        self.ingest_run(child)
+                        added.append(child.name)
+        return added
+
+    def save(self) -> None:
+        sums = self._sums
+        for cluster, vec in zip(self.clusters, sums):
+            values = vec.tolist() if np is not None else vec
+            cluster["sum"] = {str(i): round(v, 5) for i, v in enumerate(values) if v}
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_name(f".{self.state_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({
+            "version": STATE_VERSION,
+            "dim": DIM,
+            "threshold": self.threshold,
+            "updatedAt": datetime.now().isoformat(timespec="seconds"),
+            "processed": self.processed,
+            "clusters": self.clusters,
+        }, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp, self.state_path)
+
+    def run_summary(self, timestamp: str) -> dict[str, Any]:
+        """한 실행의 'N건 실패 / K개 원인' 요약 (대시보드 failureClusters, Teams 카드용)."""
+        clusters = []
+        for c in self.clusters:
+            members = [m for m in c["members"] if m.get("timestamp") == timestamp]
+            if members:
+                clusters.append({
+                    "id": c["id"],
+                    "failures": len(members),
+                    "totalSeen": c["count"],
+                    "firstSeen": c["firstSeen"],
+                    "exception": c["exception"],
+                    "screen": c["screen"],
+                    "message": c["message"],
+                    "tests": sorted({m["fullName"] for m in members}),
+                })
+        clusters.sort(key=lambda c: c["failures"], reverse=True)
+        return {
+            "failures": sum(c["failures"] for c in clusters),
+            "rootCauses": len(clusters),
+            "clusters": clusters,
+        }
+
+
+def cluster_run(results_dir: Path, reports_root: Path) -> tuple[dict[str, int], dict[str, Any]]:
+    """실행 1건을 클러스터링하고 (uuid → 클러스터 id, 요약)을 반환합니다."""
+    state_path = reports_root / STATE_NAME
+    with file_lock(state_path):
+        clusterer = FailureClusterer(state_path)
+        assigned = clusterer.ingest_run(results_dir)
+        if assigned:
+            clusterer.save()
+    return assigned, clusterer.run_summary(results_dir.name)
+
+
+# ─── CLI ─────────────────────────────────────────────
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="실패 근본 원인 클러스터링 (Allure 이력)")
+    parser.add_argument("--results-root", default="allure-results", help="Allure results 루트 폴더")
+    parser.add_argument("--reports-root", default="allure-reports", help="Allure reports 루트 폴더 (상태 파일 위치)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="클러스터 유사도 기준")
+
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("ingest", help="새 실행의 실패를 클러스터에 반영")
+    report_parser = sub.add_parser("report", help="클러스터 목록 출력")
+    report_parser.add_argument("--timestamp", default=None, help="이 실행의 클러스터만 (기본: 전체 이력)")
+    report_parser.add_argument("--top", type=int, default=20, help="출력할 클러스터 수")
+    report_parser.add_argument("--json", default=None, help="요약 JSON 저장 경로")
+
+    args = parser.parse_args()
+    state_path = Path(args.reports_root) / STATE_NAME
+    with file_lock(state_path):
+        clusterer = FailureClusterer(state_path, threshold=args.threshold)
+        added = clusterer.ingest_all(Path(args.results_root))
+        if added:
+            clusterer.save()
+    if added:
+        print(f"[failure_clusters] {len(added)}개 실행 반영 (NumPy: {'사용' if np is not None else '없음'})")
+
+    if args.command == "ingest":
+        print(f"[failure_clusters] 클러스터 {len(clusterer.clusters)}개 → {clusterer.state_path}")
+        return 0
+
+    if args.timestamp:
+        summary = clusterer.run_summary(args.timestamp)
+    else:
+        clusters = sorted(clusterer.clusters, key=lambda c: c["count"], reverse=True)
+        summary = {
+            "failures": sum(c["count"] for c in clusters),
+            "rootCauses": len(clusters),
+            "clusters": [
+                {k: c[k] for k in ("id", "count", "firstSeen", "lastSeen", "exception", "screen", "message")}
+                | {"tests": sorted(c["tests"])}
+                for c in clusters
+            ],
+        }
+    print(f"[failure_clusters] {summary['failures']}건 실패 / {summary['rootCauses']}개 원인")
+    for c in summary["clusters"][: args.top]:
+        count = c.get("failures", c.get("count"))
+        where = f" @ {c['screen']}" if c["screen"] else ""
+        print(f"  #{c['id']:<4} {count:>4}건  {c['exception'] or '-'}{where}: {c['message'][:80]}")
+        for test in c["tests"][:3]:
+            print(f"          - {test}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(summary, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,460 @@
+# -*- coding: utf-8 -*-
+"""대시보드 / Blob / 트리거 / Teams Webhook을 흉내 내는 로컬 서버입니다.
+
+upload_to_dashboard.py, trigger_listener.py, teams_notify.py를 운영 서비스 없이
+오프라인으로 검증하거나 업로드 처리량을 측정할 때 사용합니다.
+응답 지연, 대역폭 제한, 실패 주입을 설정할 수 있습니다.
+
+지원 엔드포인트:
+  POST  /api/runs                       실행 메타데이터 저장
+  POST  /api/runs/<ts>/artifacts        첨부파일 메타데이터 저장
+  GET   /api/trigger?status=pending     대기 중 트리거 조회 (오래된 순, &wait=<초>면 long-poll)
+  GET   /api/trigger/stream             대기 중 트리거 SSE 스트림 (keep-alive 주석 포함)
+  POST  /api/trigger                    트리거 등록
+  PATCH /api/trigger                    트리거 상태 변경
+  PUT   /blob/<pathname>                Blob 업로드
+  GET   /blob?limit=&cursor=&prefix=    Blob 목록 (페이지네이션)
+  GET   /blob?url=<url>                 Blob 메타데이터 조회
+  POST  /blob/delete                    Blob 삭제 ({"urls": [...]})
+  POST  /webhook/<name>                 Teams Webhook 수신
+  POST  /v1/messages                    AI 분석 API (고정 응답, 요청 기록)
+  GET   /_state                         서버 상태 요약 (요청 수, 저장된 항목)
+
+사용법:
+  python tools/fake_dashboard.py --port 8787
+  python tools/fake_dashboard.py --port 8787 --latency-ms 80 --fail-rate 0.05
+
+  # 다른 터미널에서 (서버 시작 시 출력되는 환경변수 사용)
+  BLOB_API_URL=http://127.0.0.1:8787/blob BLOB_READ_WRITE_TOKEN=fake \\
+    python tools/upload_to_dashboard.py --dashboard-url http://127.0.0.1:8787 20260216_024413
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+
+@dataclass
+class FakeServiceConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    fail_rate: float = 0.0
+    # 실패 주입 대상 경로 접두사 (비어 있으면 /_state를 제외한 전체)
+    fail_prefixes: tuple[str, ...] = ()
+    # Blob 업로드 대역폭 제한 (0이면 제한 없음)
+    bandwidth_kbps: float = 0.0
+    list_page_limit: int = 1000
+
+
+class FakeState:
+    """서버 메모리 상태. 핸들러 스레드 간 공유되므로 lock으로 보호합니다."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # 트리거 등록/변경 알림 (long-poll, SSE 대기용)
+        self.trigger_changed = threading.Condition(self.lock)
+        self.runs: dict[str, dict] = {}
+        self.artifacts: dict[str, list[dict]] = {}
+        self.triggers: list[dict] = []
+        self.blobs: dict[str, dict] = {}
+        self.webhooks: list[dict] = []
+        self.ai_requests: list[dict] = []
+        self.requests: dict[str, int] = {}
+        self.failures_injected = 0
+        self.bytes_received = 0
+        self.connections: set[tuple] = set()
+        self._next_trigger_id = 1
+
+    def count(self, key: str) -> None:
+        with self.lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+    def next_trigger_id(self) -> str:
+        with self.lock:
+            trigger_id = f"fake-{self._next_trigger_id}"
+            self._next_trigger_id += 1
+            return trigger_id
+
+    def summary(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "requests": dict(self.requests),
+                "failuresInjected": self.failures_injected,
+                "bytesReceived": self.bytes_received,
+                "connections": len(self.connections),
+                "runs": sorted(self.runs),
+                "artifacts": {ts: len(items) for ts, items in self.artifacts.items()},
+                "triggers": list(self.triggers),
+                "blobCount": len(self.blobs),
+                "blobBytes": sum(b["size"] for b in self.blobs.values()),
+                "webhooks": len(self.webhooks),
+                "aiRequests": len(self.ai_requests),
+            }
+
+
+def _parse_json(body: bytes) -> Any:
+    try:
+        return json.loads(body.decode("utf-8")) if body else None
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+# SSE 스트림에서 이벤트가 없을 때 keep-alive 주석을 보내는 간격
+SSE_KEEPALIVE_SEC = 15.0
+LONG_POLL_MAX_SEC = 60.0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    server: "FakeDashboardServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # ── 공통 ──
+
+    def _send_json(self, status: int, obj: Any) -> None:
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        data = self.rfile.read(length) if length else b""
+        with self.server.state.lock:
+            self.server.state.bytes_received += len(data)
+        return data
+
+    def _simulate(self, path: str, size: int = 0) -> bool:
+        """지연/대역폭/실패 주입. 실패를 주입했으면 True."""
+        cfg = self.server.config
+        state = self.server.state
+        with state.lock:
+            state.connections.add(self.client_address)
+
+        delay = cfg.latency_ms + random.uniform(0, cfg.jitter_ms)
+        if cfg.bandwidth_kbps > 0 and size:
+            delay += size / (cfg.bandwidth_kbps * 1024) * 1000
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        targeted = not cfg.fail_prefixes or any(path.startswith(p) for p in cfg.fail_prefixes)
+        if cfg.fail_rate > 0 and targeted and random.random() < cfg.fail_rate:
+            with state.lock:
+                state.failures_injected += 1
+            self._send_json(503, {"error": "injected failure"})
+            return True
+        return False
+
+    def _route(self, method: str) -> None:
+        parsed = urllib.parse.urlsplit(self.path)
+        path = parsed.path.rstrip("/") or "/"
+        query = urllib.parse.parse_qs(parsed.query)
+        self.server.state.count(f"{method} {path.split('/')[1] if path != '/' else '/'}")
+
+        if path == "/_state":
+            self._send_json(200, self.server.state.summary())
+            return
+
+        # 요청 본문은 실패 주입 여부와 관계없이 먼저 읽어야 keep-alive 연결이 유지됨
+        body = self._read_body() if method in ("POST", "PUT", "PATCH") else b""
+        if self._simulate(path, len(body)):
+            return
+
+        handler = getattr(self, f"_handle_{method.lower()}", None)
+        if handler is None:
+            self._send_json(405, {"error": "method not allowed"})
+            return
+        handler(path, query, body)
+
+    def do_GET(self) -> None:
+        self._route("GET")
+
+    def do_POST(self) -> None:
+        self._route("POST")
+
+    def do_PUT(self) -> None:
+        self._route("PUT")
+
+    def do_PATCH(self) -> None:
+        self._route("PATCH")
+
+    # ── 메서드별 처리 ──
+
+    def _handle_get(self, path: str, query: dict, body: bytes) -> None:
+        state = self.server.state
+        if path == "/api/trigger":
+            status = (query.get("status") or [""])[0]
+            try:
+                wait = min(float((query.get("wait") or ["0"])[0]), LONG_POLL_MAX_SEC)
+            except ValueError:
+                wait = 0.0
+            deadline = time.time() + wait
+            with state.lock:
+                while True:
+                    triggers = [t for t in state.triggers if not status or t["status"] == status]
+                    remaining = deadline - time.time()
+                    if triggers or remaining <= 0:
+                        break
+                    state.trigger_changed.wait(remaining)
+            self._send_json(200, {"triggers": triggers})
+            return
+
+        if path == "/api/trigger/stream":
+            self._stream_triggers()
+            return
+
+        if path == "/blob":
+            if "url" in query:
+                url = query["url"][0]
+                with state.lock:
+                    blob = next((b for b in state.blobs.values() if b["url"] == url), None)
+                if blob is None:
+                    self._send_json(404, {"error": {"code": "not_found"}})
+                else:
+                    self._send_json(200, blob)
+                return
+            limit = min(int((query.get("limit") or ["1000"])[0]), self.server.config.list_page_limit)
+            cursor = int((query.get("cursor") or ["0"])[0] or 0)
+            prefix = (query.get("prefix") or [""])[0]
+            with state.lock:
+                items = [b for p, b in sorted(state.blobs.items()) if p.startswith(prefix)]
+            page = items[cursor:cursor + limit]
+            has_more = cursor + limit < len(items)
+            self._send_json(200, {
+                "blobs": page,
+                "cursor": str(cursor + limit) if has_more else None,
+                "hasMore": has_more,
+            })
+            return
+
+        self._send_json(404, {"error": "not found"})
+
+    def _stream_triggers(self) -> None:
+        """pending 트리거를 SSE 이벤트로 보냅니다. 연결이 끊길 때까지 유지됩니다."""
+        state = self.server.state
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        sent: set[str] = set()
+        try:
+            while True:
+                with state.lock:
+                    fresh = [t for t in state.triggers if t["status"] == "pending" and t["id"] not in sent]
+                    if not fresh:
+                        state.trigger_changed.wait(SSE_KEEPALIVE_SEC)
+                        fresh = [t for t in state.triggers if t["status"] == "pending" and t["id"] not in sent]
+                if not fresh:
+                    self.wfile.write(b": keepalive\n\n")
+                for trigger in fresh:
+                    sent.add(trigger["id"])
+                    data = json.dumps(trigger, ensure_ascii=False)
+                    self.wfile.write(f"id: {trigger['id']}\nevent: trigger\ndata: {data}\n\n".encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            return
+
+    def _handle_post(self, path: str, query: dict, body: bytes) -> None:
+        state = self.server.state
+        data = _parse_json(body)
+
+        if path == "/api/runs":
+            if not isinstance(data, dict) or not data.get("timestamp"):
+                self._send_json(400, {"error": "timestamp required"})
+                return
+            with state.lock:
+                created = data["timestamp"] not in state.runs
+                state.runs[data["timestamp"]] = data
+            self._send_json(201 if created else 200, {"ok": True, "timestamp": data["timestamp"]})
+            return
+
+        if path.startswith("/api/runs/") and path.endswith("/artifacts"):
+            timestamp = path.split("/")[3]
+            items = data if isinstance(data, list) else []
+            with state.lock:
+                state.artifacts[timestamp] = items
+            self._send_json(201, {"saved": len(items)})
+            return
+
+        if path == "/api/trigger":
+            data = data if isinstance(data, dict) else {}
+            trigger = {
+                "id": state.next_trigger_id(),
+                "status": "pending",
+                "testTarget": data.get("testTarget"),
+                "platform": data.get("platform", "android"),
+                "marker": data.get("marker"),
+                "requestedBy": data.get("requestedBy", ""),
+                "createdAt": _now_iso(),
+            }
+            with state.lock:
+                state.triggers.append(trigger)
+                state.trigger_changed.notify_all()
+            self._send_json(201, trigger)
+            return
+
+        if path == "/blob/delete":
+            urls = set((data or {}).get("urls") or [])
+            with state.lock:
+                for pathname in [p for p, b in state.blobs.items() if b["url"] in urls]:
+                    del state.blobs[pathname]
+            self._send_json(200, {})
+            return
+
+        if path == "/v1/messages":
+            data = data if isinstance(data, dict) else {}
+            with state.lock:
+                state.ai_requests.append({"model": data.get("model"), "bytes": len(body)})
+            self._send_json(200, {
+                "content": [{"type": "text", "text": "1. 이슈 발생 사유: (fake)\n2. 수정 방향: (fake)"}],
+            })
+            return
+
+        if path.startswith("/webhook"):
+            with state.lock:
+                state.webhooks.append({"path": path, "receivedAt": _now_iso(), "card": data})
+            # Teams Incoming Webhook은 본문 "1"을 반환
+            body_out = b"1"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body_out)))
+            self.end_headers()
+            self.wfile.write(body_out)
+            return
+
+        self._send_json(404, {"error": "not found"})
+
+    def _handle_put(self, path: str, query: dict, body: bytes) -> None:
+        if not path.startswith("/blob/"):
+            self._send_json(404, {"error": "not found"})
+            return
+        pathname = urllib.parse.unquote(path[len("/blob/"):])
+        host = self.headers.get("Host") or f"{self.server.server_address[0]}:{self.server.server_address[1]}"
+        blob = {
+            "url": f"http://{host}/files/{urllib.parse.quote(pathname)}",
+            "pathname": pathname,
+            "size": len(body),
+            "contentType": self.headers.get("x-content-type", "application/octet-stream"),
+            "uploadedAt": _now_iso(),
+        }
+        with self.server.state.lock:
+            self.server.state.blobs[pathname] = blob
+        self._send_json(200, blob)
+
+    def _handle_patch(self, path: str, query: dict, body: bytes) -> None:
+        if path != "/api/trigger":
+            self._send_json(404, {"error": "not found"})
+            return
+        data = _parse_json(body) or {}
+        state = self.server.state
+        with state.lock:
+            trigger = next((t for t in state.triggers if t["id"] == data.get("id")), None)
+            if trigger is not None:
+                trigger["status"] = data.get("status", trigger["status"])
+                if "result" in data:
+                    trigger["result"] = data["result"]
+                trigger["updatedAt"] = _now_iso()
+                state.trigger_changed.notify_all()
+        if trigger is None:
+            self._send_json(404, {"error": "trigger not found"})
+        else:
+            self._send_json(200, trigger)
+
+
+class FakeDashboardServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: FakeServiceConfig, verbose: bool = False):
+        super().__init__(address, _Handler)
+        self.config = config
+        self.state = FakeState()
+        self.verbose = verbose
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def client_env(self) -> dict[str, str]:
+        """이 서버를 가리키도록 도구들이 읽는 환경변수 모음."""
+        return {
+            "DASHBOARD_URL": self.base_url,
+            "DASHBOARD_API_URL": self.base_url,
+            "BLOB_API_URL": f"{self.base_url}/blob",
+            "BLOB_READ_WRITE_TOKEN": "fake-token",
+            "TEAMS_WEBHOOK_URL": f"{self.base_url}/webhook/teams",
+            "AI_API_URL": f"{self.base_url}/v1/messages",
+            "AI_GATEWAY_URL": f"{self.base_url}/v1/messages",
+        }
+
+
+def start_fake_server(
+    config: FakeServiceConfig | None = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    verbose: bool = False,
+) -> FakeDashboardServer:
+    """백그라운드 스레드에서 서버를 시작합니다. port=0이면 빈 포트를 자동 선택합니다."""
+    server = FakeDashboardServer((host, port), config or FakeServiceConfig(), verbose=verbose)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="로컬 대시보드/Blob/트리거/Webhook 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 호스트 (기본: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8787, help="포트 (기본: 8787)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="요청마다 추가할 지연(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="지연에 더할 무작위 지터 최대값(ms)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="실패(503) 주입 비율 (0~1)")
+    parser.add_argument("--fail-prefix", action="append", default=[],
+                        help="실패 주입 대상 경로 접두사 (여러 번 지정 가능, 예: /blob)")
+    parser.add_argument("--bandwidth-kbps", type=float, default=0.0,
+                        help="요청 본문 대역폭 제한 KB/s (0: 제한 없음)")
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args()
+
+    config = FakeServiceConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        fail_rate=args.fail_rate,
+        fail_prefixes=tuple(args.fail_prefix),
+        bandwidth_kbps=args.bandwidth_kbps,
+    )
+    server = FakeDashboardServer((args.host, args.port), config, verbose=args.verbose)
+
+    print(f"[fake_dashboard] 서버 시작: {server.base_url}")
+    print("[fake_dashboard] 클라이언트 환경변수:")
+    for key, value in server.client_env().items():
+        print(f"  {key}={value}")
+    print("[fake_dashboard] Ctrl+C로 종료\n")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[fake_dashboard] 종료")
+        print(json.dumps(server.state.summary(), ensure_ascii=False, indent=2))
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
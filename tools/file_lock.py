@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""여러 프로세스가 같은 상태 파일을 읽고-고치고-쓰는 동안 거는 배타 파일 잠금입니다.
+
+트리거 리스너가 작업을 병렬로 실행하면 failure_clusters / test_impact 상태 파일을
+동시에 갱신할 수 있어, 상태 파일 옆의 .lock 파일로 순서를 맞춥니다.
+
+사용 예:
+  with file_lock(state_path):
+      state = load(state_path)
+      ...
+      save(state_path, state)
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """path에 대한 배타 잠금 (.{이름}.lock 파일). 다른 프로세스가 잡고 있으면 풀릴 때까지 대기."""
+    lock_path = path.with_name(f".{path.name}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            while True:
+                try:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""스크린샷 이미지 공통 유틸 (지각 해시, 축소 인코딩).
+
+Pillow(requirements.txt 포함)가 없으면:
+  - dhash: 파일 내용 기반 해시로 대체 (완전히 같은 이미지만 일치)
+  - downscale_image: 원본 바이트를 그대로 반환
+NumPy가 있으면 dhash_many / group_similar가 여러 이미지를 한 번에 벡터 연산으로 처리합니다.
+WebP 인코더가 없는 Pillow 빌드에서는 JPEG로 대체합니다.
+"""
+
+import hashlib
+import io
+import os
+import urllib.request
+from pathlib import Path
+
+from lazy_import import UNLOADED, optional_import
+
+# Pillow/NumPy는 처음 사용할 때 import (이 모듈을 import만 하는 도구 CLI의 시작 시간 단축)
+Image = UNLOADED
+np = UNLOADED
+
+
+def _load_deps() -> None:
+    global Image, np
+    if Image is UNLOADED:
+        Image = optional_import("PIL.Image")
+    if np is UNLOADED:
+        np = optional_import("numpy")
+
+
+# dHash 64bit 기준, 이 거리 이하면 같은 화면으로 간주
+HASH_DISTANCE_THRESHOLD = 6
+
+# 스크린샷 첨부 확장자 (media_optimizer가 PNG를 WebP/JPEG로 바꾼 경우 포함)
+IMAGE_SUFFIXES = (".png", ".webp", ".jpg", ".jpeg")
+
+# 화면 변화 감지: 격자 (가로, 세로) 블록 수 / 바뀐 블록으로 볼 평균 밝기 차 / 상단 상태바 제외 비율
+FRAME_GRID = (24, 48)
+FRAME_BLOCK_DIFF = 12
+FRAME_CROP_TOP = 0.05
+
+_MEDIA_TYPES = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".webp": "image/webp"}
+
+
+def _open_image(source: str | Path | bytes):
+    if isinstance(source, bytes):
+        return Image.open(io.BytesIO(source))
+    return Image.open(source)
+
+
+def dhash(source: str | Path | bytes, hash_size: int = 8) -> int | None:
+    """이미지의 difference hash(64bit)를 반환합니다. 읽을 수 없으면 None."""
+    _load_deps()
+    try:
+        if Image is None:
+            data = source if isinstance(source, bytes) else Path(source).read_bytes()
+            return int.from_bytes(hashlib.sha256(data).digest()[:8], "big")
+        with _open_image(source) as img:
+            small = img.convert("L").resize((hash_size + 1, hash_size), Image.BILINEAR)
+            pixels = list(small.tobytes())
+    except Exception:
+        return None
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def is_similar(a: int | None, b: int | None, threshold: int = HASH_DISTANCE_THRESHOLD) -> bool:
+    if a is None or b is None:
+        return a is None and b is None
+    return hamming(a, b) <= threshold
+
+
+def dhash_many(sources: list[str | Path], hash_size: int = 8) -> list[int | None]:
+    """여러 이미지의 dHash를 계산합니다 (dhash와 같은 값, NumPy로 비트 계산을 일괄 처리)."""
+    _load_deps()
+    if np is None or Image is None:
+        return [dhash(source, hash_size) for source in sources]
+    rows: list = []
+    indexes: list[int] = []
+    for index, source in enumerate(sources):
+        try:
+            with _open_image(source) as img:
+                small = img.convert("L").resize((hash_size + 1, hash_size), Image.BILINEAR)
+                rows.append(np.asarray(small, dtype=np.int16))
+                indexes.append(index)
+        except Exception:
+            continue
+    result: list[int | None] = [None] * len(sources)
+    if rows:
+        stack = np.stack(rows)
+        bits = (stack[:, :, :-1] > stack[:, :, 1:]).reshape(len(rows), -1)
+        packed = np.packbits(bits, axis=1)
+        for index, row in zip(indexes, packed):
+            result[index] = int.from_bytes(row.tobytes(), "big")
+    return result
+
+
+def group_similar(hashes: list[int | None], threshold: int = HASH_DISTANCE_THRESHOLD) -> list[int]:
+    """해시가 threshold 이내인 이미지를 묶어, 항목별 그룹 대표(처음 나온 항목)의 index를 반환합니다.
+
+    해시가 None인 항목은 자기 자신이 대표입니다.
+    """
+    _load_deps()
+    groups = list(range(len(hashes)))
+    reps: list[int] = []
+    if np is not None and any(h is not None for h in hashes):
+        width = max((h.bit_length() for h in hashes if h is not None), default=1)
+        nbytes = max(1, (width + 7) // 8)
+        matrix = np.zeros((len(hashes), nbytes), dtype=np.uint8)
+        for index, h in enumerate(hashes):
+            if h is not None:
+                matrix[index] = np.frombuffer(h.to_bytes(nbytes, "big"), dtype=np.uint8)
+        for index, h in enumerate(hashes):
+            if h is None:
+                continue
+            if reps:
+                distances = np.unpackbits(matrix[reps] ^ matrix[index], axis=1).sum(axis=1)
+                nearest = int(distances.argmin())
+                if distances[nearest] <= threshold:
+                    groups[index] = reps[nearest]
+                    continue
+            reps.append(index)
+        return groups
+
+    for index, h in enumerate(hashes):
+        if h is None:
+            continue
+        match = next((rep for rep in reps if hamming(hashes[rep], h) <= threshold), None)
+        if match is None:
+            reps.append(index)
+        else:
+            groups[index] = match
+    return groups
+
+
+def downscale_image(
+    path: str | Path, max_side: int = 1024, quality: int = 80, fmt: str = "JPEG"
+) -> tuple[bytes, str]:
+    """긴 변을 max_side 이하로 줄인 이미지 바이트와 media type을 반환합니다 (fmt: JPEG | WEBP)."""
+    _load_deps()
+    path = Path(path)
+    if Image is not None:
+        try:
+            with Image.open(path) as img:
+                img = img.convert("RGB")
+                img.thumbnail((max_side, max_side), Image.LANCZOS)
+                if fmt.upper() == "WEBP":
+                    try:
+                        buf = io.BytesIO()
+                        img.save(buf, format="WEBP", quality=quality, method=4)
+                        return buf.getvalue(), "image/webp"
+                    except (KeyError, OSError):
+                        pass
+                buf = io.BytesIO()
+                img.save(buf, format="JPEG", quality=quality, optimize=True)
+                return buf.getvalue(), "image/jpeg"
+        except Exception:
+            pass
+    return path.read_bytes(), _MEDIA_TYPES.get(path.suffix.lower(), "image/png")
+
+
+def frame_signature(source: str | Path | bytes, grid: tuple[int, int] = FRAME_GRID,
+                    crop_top: float = FRAME_CROP_TOP):
+    """이미지를 grid 블록 평균 밝기로 줄입니다 (NumPy 배열 또는 리스트). 읽을 수 없으면 None."""
+    _load_deps()
+    if Image is None:
+        return None
+    try:
+        with _open_image(source) as img:
+            if img.format == "JPEG":
+                # JPEG(MJPEG 프레임)는 디코딩 단계에서 축소
+                img.draft("L", (grid[0] * 4, grid[1] * 4))
+            gray = img.convert("L")
+            width, height = gray.size
+            gray = gray.crop((0, int(height * crop_top), width, height))
+            small = gray.resize(grid, Image.BOX)
+            if np is not None:
+                return np.asarray(small, dtype=np.int16)
+            return list(small.tobytes())
+    except Exception:
+        return None
+
+
+def frame_change_ratio(a, b, block_diff: int = FRAME_BLOCK_DIFF) -> float:
+    """두 frame_signature 사이에서 바뀐 블록의 비율 (0.0~1.0). 비교할 수 없으면 1.0."""
+    _load_deps()
+    if a is None or b is None:
+        return 1.0
+    if np is not None and hasattr(a, "shape") and hasattr(b, "shape"):
+        if a.shape != b.shape:
+            return 1.0
+        return float((np.abs(a - b) >= block_diff).mean())
+    a = a.ravel().tolist() if hasattr(a, "ravel") else a
+    b = b.ravel().tolist() if hasattr(b, "ravel") else b
+    if len(a) != len(b):
+        return 1.0
+    return sum(abs(x - y) >= block_diff for x, y in zip(a, b)) / (len(a) or 1)
+
+
+def read_mjpeg_frame(url: str, timeout: float = 3.0, max_bytes: int = 4 * 1024 * 1024) -> bytes | None:
+    """MJPEG 스트림(예: UiAutomator2 mjpegServerPort)에서 JPEG 프레임 1장을 읽습니다."""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            buf = b""
+            while len(buf) < max_bytes:
+                chunk = resp.read(16384)
+                if not chunk:
+                    return None
+                buf += chunk
+                start = buf.find(b"\xff\xd8")
+                end = buf.find(b"\xff\xd9", start + 2) if start >= 0 else -1
+                if end >= 0:
+                    return buf[start:end + 2]
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+def screen_frame(driver, mjpeg_url: str | None = None):
+    """현재 화면의 축소 프레임 (frame_signature). MJPEG_URL이 있으면 스트림 프레임을 우선 사용합니다."""
+    mjpeg_url = mjpeg_url if mjpeg_url is not None else os.environ.get("MJPEG_URL", "")
+    data = read_mjpeg_frame(mjpeg_url) if mjpeg_url else None
+    if data is None:
+        try:
+            data = driver.get_screenshot_as_png()
+        except Exception:
+            return None
+    return frame_signature(data)
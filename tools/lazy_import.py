@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""선택 의존성(Pillow, NumPy 등)을 처음 사용할 때 import하는 공통 헬퍼.
+
+도구 CLI는 run_allure / trigger_listener가 실행마다 여러 번 띄우므로, 무거운 모듈을
+모듈 import 시점이 아니라 실제로 쓰는 함수 안에서 불러옵니다.
+
+사용 패턴 (모듈 전역은 그대로 두고, 처음 한 번만 채움):
+    from lazy_import import UNLOADED, optional_import
+
+    np = UNLOADED
+
+    def _load_numpy() -> None:
+        global np
+        if np is UNLOADED:
+            np = optional_import("numpy")
+
+전역이 None이면 "없음"으로 확정된 상태라 다시 import하지 않습니다
+(테스트에서 module.np = None 으로 순수 파이썬 경로를 강제할 수 있음).
+"""
+
+import importlib
+
+# 아직 import를 시도하지 않았음을 나타내는 값 (None = 시도했지만 없음)
+UNLOADED = object()
+
+
+def optional_import(name: str):
+    """모듈 name을 import해 반환합니다. 설치되어 있지 않으면 None."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""Allure 결과의 첨부 미디어(스크린샷/녹화)를 업로드·리포트 전에 경량화합니다.
+
+conftest는 get_screenshot_as_png()의 원본 해상도 PNG와 stop_recording_screen() MP4를
+그대로 첨부하므로, Blob 용량(500MB)과 업로드 시간·대시보드 로딩이 미디어 바이트에 좌우됩니다.
+pytest가 끝난 직후(allure generate / 업로드 전에) 결과 폴더에서 실행합니다.
+
+  - 스크린샷: 긴 변 max_side 이하 WebP(미지원 시 JPEG)로 변환
+  - 녹화(MP4): ffmpeg가 있으면 저해상도·저비트레이트 미리보기로 변환 (없으면 건너뜀)
+  - 원본은 <results>/originals/ 로 옮겨 로컬에 보존
+  - *-result.json / *-container.json의 첨부 source/type/size를 새 파일로 갱신
+  - 변환은 프로세스 풀에서 병렬 실행, 이미 변환된 첨부는 다시 처리하지 않음
+
+사용법:
+  python tools/media_optimizer.py allure-results/20260127_153847
+  python tools/media_optimizer.py allure-results/20260127_153847 --max-side 960 --format jpeg
+  python tools/media_optimizer.py allure-results/20260127_153847 --no-video --dry-run
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from image_utils import downscale_image
+
+ORIGINALS_DIR = "originals"
+DEFAULT_MAX_SIDE = 1280
+DEFAULT_QUALITY = 75
+# 미리보기 영상: 세로 최대 해상도 / CRF / 최대 비트레이트
+VIDEO_MAX_HEIGHT = 720
+VIDEO_CRF = 32
+VIDEO_MAXRATE = "600k"
+VIDEO_TIMEOUT = 300
+# 이 개수 미만이면 프로세스 풀 없이 현재 프로세스에서 변환
+_POOL_MIN_JOBS = 4
+
+_IMAGE_TYPES = {"image/png"}
+_VIDEO_TYPES = {"video/mp4"}
+_SUFFIX = {"image/webp": ".webp", "image/jpeg": ".jpg"}
+
+
+@dataclass
+class MediaJob:
+    source: str
+    kind: str  # "image" | "video"
+
+
+@dataclass
+class MediaResult:
+    source: str
+    new_source: str | None = None
+    new_type: str = ""
+    original_size: int = 0
+    new_size: int = 0
+    error: str = ""
+
+
+def _iter_attachments(obj):
+    """dict/list에서 attachments 항목(dict)을 재귀적으로 순회합니다 (steps, befores/afters 포함)."""
+    if isinstance(obj, dict):
+        for att in obj.get("attachments") or []:
+            if isinstance(att, dict) and att.get("source"):
+                yield att
+        for key in ("steps", "befores", "afters"):
+            yield from _iter_attachments(obj.get(key))
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _iter_attachments(item)
+
+
+def _kind(att: dict) -> str | None:
+    media_type = str(att.get("type") or "")
+    source = str(att["source"]).lower()
+    if media_type in _IMAGE_TYPES or (not media_type and source.endswith(".png")):
+        return "image"
+    if media_type in _VIDEO_TYPES or (not media_type and source.endswith(".mp4")):
+        return "video"
+    return None
+
+
+def _transcode_video(src: Path, dest: Path) -> str:
+    """ffmpeg로 미리보기 MP4를 만듭니다. 실패 시 오류 메시지를 반환합니다."""
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        return "ffmpeg 없음"
+    cmd = [
+        ffmpeg, "-y", "-loglevel", "error", "-i", str(src),
+        "-vf", f"scale=-2:'min({VIDEO_MAX_HEIGHT},ih)'",
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", str(VIDEO_CRF),
+        "-maxrate", VIDEO_MAXRATE, "-bufsize", "1200k",
+        "-an", "-movflags", "+faststart", str(dest),
+    ]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=VIDEO_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return str(e)
+    return proc.stderr.strip()[-200:] if proc.returncode != 0 else ""
+
+
+def _optimize_one(results_dir: str, job: MediaJob, max_side: int, quality: int, fmt: str) -> MediaResult:
+    """첨부 하나를 변환합니다 (프로세스 풀 워커). 더 작아지지 않으면 원본을 유지합니다."""
+    src = Path(results_dir) / job.source
+    result = MediaResult(job.source)
+    try:
+        result.original_size = src.stat().st_size
+    except OSError as e:
+        result.error = str(e)
+        return result
+
+    stem = src.name.rsplit(".", 1)[0]
+    if job.kind == "image":
+        try:
+            data, media_type = downscale_image(src, max_side, quality, fmt=fmt)
+        except OSError as e:
+            result.error = str(e)
+            return result
+        if media_type not in _SUFFIX or len(data) >= result.original_size:
+            return result
+        dest = src.with_name(stem + _SUFFIX[media_type])
+        tmp = dest.with_name(f".{dest.name}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, dest)
+        media_type_out = media_type
+    else:
+        dest = src.with_name(f"{stem}-preview.mp4")
+        error = _transcode_video(src, dest)
+        if error:
+            dest.unlink(missing_ok=True)
+            result.error = error
+            return result
+        if dest.stat().st_size >= result.original_size:
+            dest.unlink()
+            return result
+        media_type_out = "video/mp4"
+
+    # 원본 보존 (originals/ 로 이동)
+    originals = src.parent / ORIGINALS_DIR
+    originals.mkdir(exist_ok=True)
+    os.replace(src, originals / src.name)
+    result.new_source = dest.name
+    result.new_type = media_type_out
+    result.new_size = dest.stat().st_size
+    return result
+
+
+def _run_jobs(results_dir: Path, jobs: list[MediaJob], workers: int | None,
+              max_side: int, quality: int, fmt: str) -> list[MediaResult]:
+    args = (str(results_dir),)
+    if len(jobs) < _POOL_MIN_JOBS or workers == 1:
+        return [_optimize_one(*args, job, max_side, quality, fmt) for job in jobs]
+    try:
+        # 호출자(run_allure)에 다른 스레드가 있을 수 있어 fork 대신 spawn
+        with ProcessPoolExecutor(
+            max_workers=workers or min(8, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = [pool.submit(_optimize_one, *args, job, max_side, quality, fmt) for job in jobs]
+            return [f.result() for f in futures]
+    except (OSError, NotImplementedError) as e:
+        print(f"[media_optimizer] 프로세스 풀 사용 불가 ({e}) → 순차 변환")
+        return [_optimize_one(*args, job, max_side, quality, fmt) for job in jobs]
+
+
+def optimize_results(
+    results_dir: Path,
+    max_side: int = DEFAULT_MAX_SIDE,
+    quality: int = DEFAULT_QUALITY,
+    fmt: str = "WEBP",
+    videos: bool = True,
+    workers: int | None = None,
+    dry_run: bool = False,
+) -> dict:
+    """결과 폴더의 스크린샷/녹화를 경량화하고 결과 JSON의 첨부 참조를 갱신합니다.
+
+    Returns:
+        {"images": n, "videos": n, "before": bytes, "after": bytes, "errors": n}
+    """
+    results_dir = Path(results_dir)
+    stats = {"images": 0, "videos": 0, "before": 0, "after": 0, "errors": 0}
+    json_files = sorted([*results_dir.glob("*-result.json"), *results_dir.glob("*-container.json")])
+
+    documents: dict[Path, dict] = {}
+    jobs: dict[str, MediaJob] = {}
+    for path in json_files:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        documents[path] = data
+        for att in _iter_attachments(data):
+            kind = _kind(att)
+            if kind is None or (kind == "video" and not videos):
+                continue
+            source = str(att["source"])
+            if source not in jobs and (results_dir / source).is_file():
+                jobs[source] = MediaJob(source, kind)
+
+    if dry_run:
+        for job in jobs.values():
+            stats["images" if job.kind == "image" else "videos"] += 1
+            stats["before"] += (results_dir / job.source).stat().st_size
+        stats["after"] = stats["before"]
+        return stats
+
+    results = {r.source: r for r in _run_jobs(results_dir, list(jobs.values()), workers, max_side, quality, fmt)}
+    for r in results.values():
+        stats["before"] += r.original_size
+        stats["after"] += r.new_size if r.new_source else r.original_size
+        if r.error:
+            stats["errors"] += 1
+        elif r.new_source:
+            stats["images" if jobs[r.source].kind == "image" else "videos"] += 1
+
+    # 결과 JSON의 첨부 참조 갱신 (원자적 교체)
+    for path, data in documents.items():
+        changed = False
+        for att in _iter_attachments(data):
+            r = results.get(str(att["source"]))
+            if r is None or not r.new_source:
+                continue
+            att["source"] = r.new_source
+            att["type"] = r.new_type
+            if "size" in att:
+                att["size"] = r.new_size
+            changed = True
+        if changed:
+            tmp = path.with_name(f".{path.name}.tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+    return stats
+
+
+def _format_mb(size: int) -> str:
+    return f"{size / 1024 / 1024:.1f}MB"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Allure 결과 첨부 미디어 경량화 (스크린샷 WebP/JPEG, 녹화 미리보기)")
+    parser.add_argument("results_dir", help="Allure results 폴더 (예: allure-results/20260127_153847)")
+    parser.add_argument("--max-side", type=int, default=DEFAULT_MAX_SIDE, help=f"스크린샷 긴 변 최대 px (기본: {DEFAULT_MAX_SIDE})")
+    parser.add_argument("--quality", type=int, default=DEFAULT_QUALITY, help=f"인코딩 품질 (기본: {DEFAULT_QUALITY})")
+    parser.add_argument("--format", choices=("webp", "jpeg"), default="webp", help="스크린샷 포맷 (기본: webp)")
+    parser.add_argument("--no-video", action="store_true", help="녹화(MP4) 변환 건너뜀")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본: CPU 수, 최대 8)")
+    parser.add_argument("--dry-run", action="store_true", help="대상만 집계하고 변환하지 않음")
+    args = parser.parse_args()
+
+    results_dir = Path(args.results_dir)
+    if not results_dir.is_dir():
+        print(f"[media_optimizer] 결과 폴더 없음: {results_dir}")
+        return 1
+
+    stats = optimize_results(
+        results_dir,
+        max_side=args.max_side,
+        quality=args.quality,
+        fmt=args.format.upper(),
+        videos=not args.no_video,
+        workers=args.workers,
+        dry_run=args.dry_run,
+    )
+    label = "대상" if args.dry_run else "변환"
+    print(
+        f"[media_optimizer] {label}: 스크린샷 {stats['images']}개, 녹화 {stats['videos']}개 | "
+        f"{_format_mb(stats['before'])} → {_format_mb(stats['after'])}"
+        + (f" | 실패 {stats['errors']}개" if stats["errors"] else "")
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
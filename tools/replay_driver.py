@@ -0,0 +1,784 @@
+# -*- coding: utf-8 -*-
+"""녹화된 page_source 시퀀스로 utils 흐름을 재생하는 오프라인 WebDriver 대역입니다.
+
+ui_dumps/<세션>/ 폴더의 XML(ui_dump.py watch 모드 결과)을 화면으로, session.json의 전이 표를
+화면 이동 규칙으로 사용합니다. 에뮬레이터 없이 page_source / find_element(s) / current_activity /
+click / swipe / back을 흉내 내므로 utils/auth.py, utils/initial_screens.py, utils/language.py,
+explore_app의 팝업 처리 등을 일반 pytest에서 밀리초 단위로 실행할 수 있습니다.
+
+session.json (없으면 파일명 순서대로 화면만 등록):
+  {
+    "start": "001_Main",
+    "package": "com.gmeremit.online.gmeremittance_native.stag",
+    "window": {"width": 1080, "height": 2400},
+    "transitions": [
+      {"from": "001_Main", "click": "selectedLanguageText", "to": "002_LanguageList"},
+      {"from": "002_LanguageList", "click": "English", "to": "003_Main"},
+      {"from": "002_LanguageList", "swipe": "up", "to": "004_LanguageListBottom"},
+      {"from": "005_Splash", "after": 2.0, "to": "001_Main"},
+      {"from": "*", "back": true, "to": "001_Main"}
+    ]
+  }
+  - click: 클릭한 요소(또는 그 하위 요소)의 resource-id(전체 또는 ':id/' 뒤), text, content-desc
+  - swipe: 손가락 방향 (up = 목록을 아래로 스크롤). UiScrollable.scrollIntoView도 이 전이를 따라갑니다
+  - after: 화면 진입 후 경과 시간(초) — ReplayClock과 함께 쓰면 대기 없이 진행
+  - from "*": 모든 화면에 적용
+
+사용법 (테스트):
+  driver = ReplayDriver(ReplaySession.load("tests/replay/sessions/first_run"))
+  with ReplayClock():
+      assert handle_initial_screens(driver)
+
+사용법 (CLI):
+  python tools/replay_driver.py init ui_dumps/20260216_024413   # session.json 뼈대 생성
+  python tools/replay_driver.py show ui_dumps/20260216_024413   # 화면별 클릭 가능 요소 출력
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+
+SESSION_FILE = "session.json"
+DEFAULT_WINDOW = {"width": 1080, "height": 2400}
+# scrollIntoView가 따라갈 최대 스크롤 전이 수
+MAX_SCROLL_STEPS = 30
+
+_ACTIVITY_COMMENT_RE = re.compile(r"<!--\s*Activity:\s*(\S+)\s*\|\s*Package:\s*(\S+)\s*-->")
+_BOUNDS_RE = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+
+
+# ─── 세션 (화면 + 전이 표) ─────────────────────────────────────────────
+
+@dataclass
+class ReplayScreen:
+    name: str
+    xml: str
+    activity: str = ""
+    package: str = ""
+    root: ET.Element | None = None
+    parents: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        # ui_dump.py가 XML 선언 뒤에 넣은 Activity 주석 (실제 page_source에는 없음)
+        match = _ACTIVITY_COMMENT_RE.search(self.xml[:1000])
+        if match:
+            self.activity = self.activity or match.group(1)
+            self.package = self.package or match.group(2)
+            self.xml = self.xml[:match.start()] + self.xml[match.end():].lstrip("\n")
+        self.root = ET.fromstring(self.xml.encode("utf-8"))
+        self.parents = {child: parent for parent in self.root.iter() for child in parent}
+
+
+@dataclass
+class ReplaySession:
+    screens: dict[str, ReplayScreen]
+    start: str
+    transitions: list[dict[str, Any]] = field(default_factory=list)
+    package: str = ""
+    window: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_WINDOW))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ReplaySession":
+        """덤프 폴더(+ session.json)를 읽습니다."""
+        path = Path(path)
+        screens = {
+            xml_path.stem: ReplayScreen(xml_path.stem, xml_path.read_text(encoding="utf-8"))
+            for xml_path in sorted(path.glob("*.xml"))
+        }
+        if not screens:
+            raise FileNotFoundError(f"XML 덤프가 없습니다: {path}")
+
+        config: dict[str, Any] = {}
+        if (path / SESSION_FILE).exists():
+            config = json.loads((path / SESSION_FILE).read_text(encoding="utf-8"))
+        for t in config.get("transitions", []):
+            for key in ("from", "to"):
+                if t.get(key, "*") != "*" and t[key] not in screens:
+                    raise ValueError(f"{SESSION_FILE}: 없는 화면 '{t[key]}' ({t})")
+
+        start = config.get("start") or next(iter(screens))
+        package = config.get("package") or next((s.package for s in screens.values() if s.package), "")
+        return cls(
+            screens=screens,
+            start=start,
+            transitions=list(config.get("transitions", [])),
+            package=package,
+            window={**DEFAULT_WINDOW, **config.get("window", {})},
+        )
+
+    def next_screen(self, current: str, event: str, **match: Any) -> str | None:
+        """이벤트(click/swipe/back/after)에 맞는 전이의 목적지 화면."""
+        for t in self.transitions:
+            if t.get("from", "*") not in (current, "*") or event not in t:
+                continue
+            if event == "click" and not _node_matches_key(match["node"], str(t["click"])):
+                continue
+            if event == "swipe" and t["swipe"] != match["direction"]:
+                continue
+            if event == "after" and match["elapsed"] < float(t["after"]):
+                continue
+            return t["to"]
+        return None
+
+
+# ─── 요소 ─────────────────────────────────────────────
+
+def _is_android(node: ET.Element) -> bool:
+    return "resource-id" in node.attrib or node.tag.startswith("android.")
+
+
+def _node_text(node: ET.Element) -> str:
+    if _is_android(node):
+        return node.get("text", "")
+    return node.get("value") or node.get("label") or ""
+
+
+def _node_matches_key(node: ET.Element, key: str) -> bool:
+    """전이 표의 click 키가 이 요소(또는 하위 요소)를 가리키는지."""
+    for n in node.iter():
+        rid = n.get("resource-id", "")
+        if key and key in (rid, rid.split(":id/")[-1], n.get("text"), n.get("content-desc"), n.get("name"), n.get("label")):
+            return True
+    return False
+
+
+class ReplayElement:
+    """WebElement 대역. 화면이 바뀐 뒤 조작하면 StaleElementReferenceException."""
+
+    def __init__(self, driver: "ReplayDriver", node: ET.Element, screen: str):
+        self._driver = driver
+        self._node = node
+        self._screen = screen
+
+    def _check_stale(self) -> None:
+        if self._driver._screen != self._screen:
+            raise StaleElementReferenceException(f"화면이 바뀌었습니다: {self._screen} → {self._driver._screen}")
+
+    @property
+    def id(self) -> str:
+        return f"{self._screen}:{id(self._node):x}"
+
+    @property
+    def text(self) -> str:
+        self._check_stale()
+        return _node_text(self._node)
+
+    @property
+    def tag_name(self) -> str:
+        return self._node.get("class") or self._node.get("type") or self._node.tag
+
+    @property
+    def rect(self) -> dict[str, int]:
+        match = _BOUNDS_RE.match(self._node.get("bounds", ""))
+        if match:
+            x1, y1, x2, y2 = map(int, match.groups())
+            return {"x": x1, "y": y1, "width": x2 - x1, "height": y2 - y1}
+        return {k: int(self._node.get(k, 0) or 0) for k in ("x", "y", "width", "height")}
+
+    @property
+    def location(self) -> dict[str, int]:
+        return {k: self.rect[k] for k in ("x", "y")}
+
+    @property
+    def size(self) -> dict[str, int]:
+        return {k: self.rect[k] for k in ("width", "height")}
+
+    def get_attribute(self, name: str) -> str | None:
+        self._check_stale()
+        aliases = {"contentDescription": "content-desc", "resourceId": "resource-id", "className": "class"}
+        return self._node.get(aliases.get(name, name))
+
+    def is_displayed(self) -> bool:
+        self._check_stale()
+        return self._node.get("displayed", self._node.get("visible", "true")) != "false"
+
+    def is_enabled(self) -> bool:
+        self._check_stale()
+        return self._node.get("enabled", "true") != "false"
+
+    def is_selected(self) -> bool:
+        self._check_stale()
+        return "true" in (self._node.get("selected"), self._node.get("checked"))
+
+    def click(self) -> None:
+        self._check_stale()
+        self._driver._on_click(self._node)
+
+    def send_keys(self, *values: str) -> None:
+        self._check_stale()
+        text = "".join(str(v) for v in values)
+        self._driver.actions.append(("send_keys", self._driver._screen, _describe(self._node), text))
+        self._node.set("text" if _is_android(self._node) else "value", _node_text(self._node) + text)
+
+    def clear(self) -> None:
+        self._check_stale()
+        self._node.set("text" if _is_android(self._node) else "value", "")
+
+    def find_element(self, by: str = "id", value: str | None = None) -> "ReplayElement":
+        self._check_stale()
+        return self._driver._find(by, value, context=self._node)[0]
+
+    def find_elements(self, by: str = "id", value: str | None = None) -> list["ReplayElement"]:
+        self._check_stale()
+        return self._driver._find(by, value, context=self._node, required=False)
+
+    def __repr__(self) -> str:
+        return f"<ReplayElement {self._screen} {_describe(self._node)}>"
+
+
+def _describe(node: ET.Element) -> str:
+    rid = node.get("resource-id") or node.get("name") or ""
+    text = node.get("text") or node.get("label") or node.get("content-desc") or ""
+    if not text:
+        # 텍스트 없는 행(ViewGroup 등)은 하위 요소의 텍스트로 표시
+        text = next((n.get("text") for n in node.iter() if n.get("text")), "")
+    return f"{node.tag}[{rid.split(':id/')[-1]}]{'(' + text + ')' if text else ''}"
+
+
+# ─── XPath (UiAutomator2/XCUITest에서 쓰는 부분집합) ─────────────────────────────────────────────
+
+_XPATH_TOKEN_RE = re.compile(
+    r"\s*(?:(@[\w:.-]+|@\*)|('[^']*'|\"[^\"]*\")|(\d+)|(!=|=|\(|\)|,)|(text\(\)|last\(\)|[A-Za-z_][\w.-]*))"
+)
+
+
+def _split_steps(path: str) -> list[tuple[str, str]]:
+    """'//a[...]/b/..' → [('//', 'a[...]'), ('/', 'b'), ('/', '..')]"""
+    steps: list[tuple[str, str]] = []
+    depth, quote, i, start, axis = 0, "", 0, 0, ""
+    while i < len(path):
+        ch = path[i]
+        if quote:
+            quote = "" if ch == quote else quote
+        elif ch in "'\"":
+            quote = ch
+        elif ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+        elif ch == "/" and depth == 0:
+            if i > start:
+                steps.append((axis, path[start:i]))
+            axis = "//" if path[i:i + 2] == "//" else "/"
+            i += len(axis)
+            start = i
+            continue
+        i += 1
+    if start < len(path):
+        steps.append((axis, path[start:]))
+    return steps
+
+
+def _split_predicates(step: str) -> tuple[str, list[str]]:
+    name_end = step.find("[")
+    if name_end < 0:
+        return step.strip(), []
+    name, predicates, depth, quote, start = step[:name_end].strip(), [], 0, "", name_end
+    for i in range(name_end, len(step)):
+        ch = step[i]
+        if quote:
+            quote = "" if ch == quote else quote
+        elif ch in "'\"":
+            quote = ch
+        elif ch == "[":
+            depth += 1
+            if depth == 1:
+                start = i + 1
+        elif ch == "]":
+            depth -= 1
+            if depth == 0:
+                predicates.append(step[start:i])
+    return name, predicates
+
+
+class _Predicate:
+    """술어 파서/평가기: = != and or not() contains() starts-with() 위치([1], [last()])."""
+
+    def __init__(self, source: str):
+        self.tokens = []
+        pos = 0
+        source = source.strip()
+        while pos < len(source):
+            match = _XPATH_TOKEN_RE.match(source, pos)
+            if not match or match.end() == pos:
+                raise InvalidSelectorException(f"지원하지 않는 XPath 술어: [{source}]")
+            self.tokens.append(next(g for g in match.groups() if g is not None))
+            pos = match.end()
+            while pos < len(source) and source[pos].isspace():
+                pos += 1
+        self.source = source
+
+    def evaluate(self, node: ET.Element, position: int, size: int) -> bool:
+        self._node, self._position, self._size, self._i = node, position, size, 0
+        value = self._or()
+        if self._i != len(self.tokens):
+            raise InvalidSelectorException(f"지원하지 않는 XPath 술어: [{self.source}]")
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value == position
+        return bool(value)
+
+    def _peek(self) -> str | None:
+        return self.tokens[self._i] if self._i < len(self.tokens) else None
+
+    def _take(self, expected: str | None = None) -> str:
+        token = self._peek()
+        if token is None or (expected is not None and token != expected):
+            raise InvalidSelectorException(f"XPath 술어 파싱 실패: [{self.source}]")
+        self._i += 1
+        return token
+
+    def _or(self):
+        value = self._and()
+        while self._peek() == "or":
+            self._take()
+            right = self._and()
+            value = bool(value) or bool(right)
+        return value
+
+    def _and(self):
+        value = self._compare()
+        while self._peek() == "and":
+            self._take()
+            right = self._compare()
+            value = bool(value) and bool(right)
+        return value
+
+    def _compare(self):
+        left = self._operand()
+        if self._peek() in ("=", "!="):
+            op = self._take()
+            right = self._operand()
+            left, right = str(left if left is not None else ""), str(right if right is not None else "")
+            return (left == right) if op == "=" else (left != right)
+        return left
+
+    def _operand(self):
+        token = self._take()
+        if token == "(":
+            value = self._or()
+            self._take(")")
+            return value
+        if token.startswith("@"):
+            return self._node.get(token[1:])
+        if token[0] in "'\"":
+            return token[1:-1]
+        if token.isdigit():
+            return int(token)
+        if token == "text()":
+            return _node_text(self._node)
+        if token == "last()":
+            return self._size
+        if token in ("not", "contains", "starts-with", "normalize-space", "string-length"):
+            self._take("(")
+            args = [self._or()]
+            while self._peek() == ",":
+                self._take()
+                args.append(self._or())
+            self._take(")")
+            text = [str(a) if a is not None else "" for a in args]
+            if token == "not":
+                return not args[0]
+            if token == "contains":
+                return text[1] in text[0]
+            if token == "starts-with":
+                return text[0].startswith(text[1])
+            if token == "normalize-space":
+                return " ".join(text[0].split())
+            return len(text[0])
+        raise InvalidSelectorException(f"지원하지 않는 XPath 함수/토큰 '{token}': [{self.source}]")
+
+
+def _xpath(screen: ReplayScreen, path: str, context: ET.Element | None) -> list[ET.Element]:
+    path = path.strip()
+    if path.startswith("("):
+        raise InvalidSelectorException(f"지원하지 않는 XPath: {path}")
+    absolute = path.startswith("/")
+    if not absolute and not path.startswith("."):
+        path = "./" + path
+    order = {node: i for i, node in enumerate(screen.root.iter())}
+
+    # 문서 루트(가상 노드)의 자식은 hierarchy 루트 요소
+    document = ET.Element("#document")
+    nodes: list[ET.Element] = [document] if absolute or context is None else [context]
+
+    def children(node: ET.Element) -> list[ET.Element]:
+        return [screen.root] if node is document else list(node)
+
+    def descendants_or_self(node: ET.Element) -> list[ET.Element]:
+        if node is document:
+            return [document, *screen.root.iter()]
+        return list(node.iter())
+
+    for axis, step in _split_steps(path):
+        name, predicates = _split_predicates(step)
+        compiled = [_Predicate(p) for p in predicates]
+        result: list[ET.Element] = []
+        for node in nodes:
+            if name == ".":
+                groups = [[node]]
+            elif name == "..":
+                parent = screen.parents.get(node)
+                groups = [[parent if parent is not None else document]] if node is not document else [[]]
+            else:
+                bases = descendants_or_self(node) if axis == "//" else [node]
+                groups = [[c for c in children(base) if name in ("*", c.tag)] for base in bases]
+            for group in groups:
+                for predicate in compiled:
+                    group = [n for i, n in enumerate(group, 1) if predicate.evaluate(n, i, len(group))]
+                result.extend(group)
+        seen: set[int] = set()
+        nodes = []
+        for node in sorted(result, key=lambda n: order.get(n, -1)):
+            if id(node) not in seen:
+                seen.add(id(node))
+                nodes.append(node)
+    return [n for n in nodes if n is not document]
+
+
+# ─── UiSelector / UiScrollable ─────────────────────────────────────────────
+
+_UI_METHOD_RE = re.compile(r'\.(\w+)\(\s*("(?:[^"\\]|\\.)*"|[\w.-]*)\s*\)')
+_SCROLL_ACTIONS = ("scrollIntoView", "scrollTextIntoView", "scrollToEnd", "scrollToBeginning",
+                   "setAsVerticalList", "setAsHorizontalList", "setMaxSearchSwipes", "flingToEnd")
+
+
+def _parse_ui_selector(chunk: str) -> list[tuple[str, Any]]:
+    criteria = []
+    for method, raw in _UI_METHOD_RE.findall(chunk):
+        if method in _SCROLL_ACTIONS:
+            continue
+        if raw.startswith('"'):
+            value: Any = raw[1:-1].replace('\\"', '"')
+        elif raw in ("true", "false"):
+            value = raw == "true"
+        elif raw.isdigit():
+            value = int(raw)
+        else:
+            value = raw
+        criteria.append((method, value))
+    return criteria
+
+
+def _selector_matches(node: ET.Element, criteria: list[tuple[str, Any]]) -> bool:
+    for method, value in criteria:
+        text, desc = node.get("text", ""), node.get("content-desc", "")
+        rid, cls = node.get("resource-id", ""), node.get("class", node.tag)
+        checks = {
+            "resourceId": lambda: rid == value,
+            "resourceIdMatches": lambda: re.fullmatch(value, rid) is not None,
+            "text": lambda: text == value,
+            "textContains": lambda: value in text,
+            "textStartsWith": lambda: text.startswith(value),
+            "textMatches": lambda: re.fullmatch(value, text) is not None,
+            "description": lambda: desc == value,
+            "descriptionContains": lambda: value in desc,
+            "descriptionStartsWith": lambda: desc.startswith(value),
+            "descriptionMatches": lambda: re.fullmatch(value, desc) is not None,
+            "className": lambda: cls == value,
+            "classNameMatches": lambda: re.fullmatch(value, cls) is not None,
+            "index": lambda: node.get("index") == str(value),
+        }
+        if method in checks:
+            if not checks[method]():
+                return False
+        elif method in ("clickable", "enabled", "scrollable", "checked", "selected", "focusable", "focused",
+                        "checkable", "longClickable"):
+            if (node.get(method.lower() if method != "longClickable" else "long-clickable", "false") == "true") != value:
+                return False
+        elif method != "instance":
+            raise InvalidSelectorException(f"지원하지 않는 UiSelector 메서드: {method}")
+    return True
+
+
+# ─── 드라이버 ─────────────────────────────────────────────
+
+class ReplayDriver:
+    """녹화된 세션을 재생하는 WebDriver 대역.
+
+    actions에 클릭/입력/스와이프/화면 이동 기록이 쌓이므로 테스트에서 흐름을 검증할 수 있습니다.
+    """
+
+    def __init__(self, session: ReplaySession, platform: str = "android"):
+        self.session = session
+        self.actions: list[tuple] = []
+        self.capabilities = {
+            "platformName": platform.capitalize() if platform != "ios" else "iOS",
+            "automationName": "UiAutomator2" if platform == "android" else "XCUITest",
+            "deviceName": "replay",
+            "platformVersion": "",
+            "appPackage": session.package,
+        }
+        self._implicit_wait = 0.0
+        self._screen = ""
+        self._entered_at = 0.0
+        self._goto(session.start)
+
+    # 화면 이동
+
+    def _goto(self, name: str) -> None:
+        if name != self._screen:
+            self.actions.append(("screen", name))
+        self._screen = name
+        self._entered_at = time.monotonic()
+
+    def _current(self) -> ReplayScreen:
+        # 시간 전이 (스플래시 등)
+        for _ in range(len(self.session.screens)):
+            target = self.session.next_screen(self._screen, "after", elapsed=time.monotonic() - self._entered_at)
+            if target is None or target == self._screen:
+                break
+            self._goto(target)
+        return self.session.screens[self._screen]
+
+    def _on_click(self, node: ET.Element) -> None:
+        self.actions.append(("click", self._screen, _describe(node)))
+        target = self.session.next_screen(self._screen, "click", node=node)
+        if target:
+            self._goto(target)
+
+    @property
+    def screen(self) -> str:
+        """현재 재생 중인 화면 (덤프 파일명)."""
+        return self._current().name
+
+    @property
+    def clicks(self) -> list[str]:
+        return [a[2] for a in self.actions if a[0] == "click"]
+
+    @property
+    def visited(self) -> list[str]:
+        return [a[1] for a in self.actions if a[0] == "screen"]
+
+    # WebDriver API
+
+    @property
+    def page_source(self) -> str:
+        return self._current().xml
+
+    @property
+    def current_activity(self) -> str:
+        return self._current().activity
+
+    @property
+    def current_package(self) -> str:
+        return self._current().package or self.session.package
+
+    def implicitly_wait(self, seconds: float) -> None:
+        self._implicit_wait = seconds
+
+    def get_window_size(self, *_: Any) -> dict[str, int]:
+        return dict(self.session.window)
+
+    def swipe(self, start_x: int, start_y: int, end_x: int, end_y: int, duration: int = 0) -> None:
+        dx, dy = end_x - start_x, end_y - start_y
+        direction = ("left" if dx < 0 else "right") if abs(dx) > abs(dy) else ("up" if dy < 0 else "down")
+        self.actions.append(("swipe", self._current().name, direction))
+        target = self.session.next_screen(self._screen, "swipe", direction=direction)
+        if target:
+            self._goto(target)
+
+    def back(self) -> None:
+        self.actions.append(("back", self._current().name))
+        target = self.session.next_screen(self._screen, "back")
+        if target:
+            self._goto(target)
+
+    def activate_app(self, app_id: str) -> None:
+        self.actions.append(("activate_app", app_id))
+
+    def hide_keyboard(self, *_: Any, **__: Any) -> None:
+        pass
+
+    def get_log(self, log_type: str) -> list:
+        return []
+
+    def get_screenshot_as_png(self) -> bytes:
+        return b""
+
+    def save_screenshot(self, filename: str) -> bool:
+        return False
+
+    def quit(self) -> None:
+        self.actions.append(("quit",))
+
+    def find_element(self, by: str = "id", value: str | None = None) -> ReplayElement:
+        return self._find(by, value)[0]
+
+    def find_elements(self, by: str = "id", value: str | None = None) -> list[ReplayElement]:
+        return self._find(by, value, required=False)
+
+    # 요소 탐색
+
+    def _find(self, by: str, value: str | None, context: ET.Element | None = None,
+              required: bool = True) -> list[ReplayElement]:
+        screen = self._current()
+        value = value or ""
+        if by == "-android uiautomator" and "UiScrollable" in value:
+            nodes = self._scrollable(value)
+            screen = self._current()
+        else:
+            nodes = self._match(screen, by, value, context)
+        if required and not nodes:
+            raise NoSuchElementException(f"[{screen.name}] 요소 없음: {by}={value}")
+        return [ReplayElement(self, node, screen.name) for node in nodes]
+
+    def _match(self, screen: ReplayScreen, by: str, value: str, context: ET.Element | None) -> list[ET.Element]:
+        scope = list((context if context is not None else screen.root).iter())
+        if context is not None:
+            scope = scope[1:]
+        if by == "xpath":
+            return _xpath(screen, value, context)
+        if by == "id":
+            if _is_android(screen.root) or screen.root.tag == "hierarchy":
+                full = value if ":id/" in value else f"{self.current_package}:id/{value}"
+                return [n for n in scope if n.get("resource-id") in (value, full)]
+            return [n for n in scope if n.get("name") == value]
+        if by == "accessibility id":
+            return [n for n in scope if value in (n.get("content-desc"), n.get("name"))]
+        if by == "class name":
+            return [n for n in scope if value in (n.get("class"), n.get("type"), n.tag)]
+        if by == "-android uiautomator":
+            chunks = value.split("new UiSelector()")[1:]
+            if not chunks:
+                raise InvalidSelectorException(f"UiSelector 파싱 실패: {value}")
+            criteria = _parse_ui_selector(chunks[-1])
+            nodes = [n for n in scope if _selector_matches(n, criteria)]
+            instance = dict(criteria).get("instance")
+            return nodes[instance:instance + 1] if instance is not None else nodes
+        raise InvalidSelectorException(f"재생 드라이버가 지원하지 않는 locator: {by}")
+
+    def _scrollable(self, value: str) -> list[ET.Element]:
+        """UiScrollable: 현재 화면에 없으면 swipe up 전이를 따라가며 찾습니다."""
+        chunks = value.split("new UiSelector()")[1:]
+        action = next((a for a in _SCROLL_ACTIONS if f".{a}(" in value), "")
+        container = _parse_ui_selector(chunks[0]) if chunks else []
+
+        if action in ("scrollIntoView", "scrollTextIntoView"):
+            if action == "scrollTextIntoView":
+                match = re.search(r'scrollTextIntoView\(\s*"((?:[^"\\]|\\.)*)"', value)
+                target = [("text", match.group(1) if match else "")]
+            else:
+                target = _parse_ui_selector(chunks[-1]) if len(chunks) > 1 else []
+            visited = {self._screen}
+            limit = re.search(r"setMaxSearchSwipes\(\s*(\d+)", value)
+            steps = int(limit.group(1)) if limit else MAX_SCROLL_STEPS
+            for step in range(steps + 1):
+                screen = self._current()
+                nodes = [n for n in screen.root.iter() if _selector_matches(n, target)]
+                if nodes:
+                    return nodes[:1]
+                if step == steps:
+                    return []
+                following = self.session.next_screen(self._screen, "swipe", direction="up")
+                if not following or following in visited:
+                    return []
+                self.actions.append(("swipe", self._screen, "up"))
+                self._goto(following)
+                visited.add(following)
+            return []
+
+        if action in ("scrollToEnd", "flingToEnd", "scrollToBeginning"):
+            direction = "down" if action == "scrollToBeginning" else "up"
+            match = re.search(rf"{action}\(\s*(\d+)", value)
+            for _ in range(int(match.group(1)) if match else MAX_SCROLL_STEPS):
+                following = self.session.next_screen(self._screen, "swipe", direction=direction)
+                if not following or following == self._screen:
+                    break
+                self.actions.append(("swipe", self._screen, direction))
+                self._goto(following)
+        return [n for n in self._current().root.iter() if _selector_matches(n, container)][:1]
+
+
+# ─── 가상 시계 ─────────────────────────────────────────────
+
+class ReplayClock:
+    """time.sleep / time.monotonic / time.time을 가상 시계로 바꿉니다.
+
+    utils 흐름의 sleep과 WebDriverWait 타임아웃이 실제로 기다리지 않고 즉시 진행됩니다.
+    """
+
+    def __init__(self):
+        self.elapsed = 0.0
+        self._saved: tuple = ()
+
+    def sleep(self, seconds: float) -> None:
+        self.elapsed += max(0.0, float(seconds))
+
+    def __enter__(self) -> "ReplayClock":
+        real_monotonic, real_time = time.monotonic, time.time
+        base_monotonic, base_time = real_monotonic(), real_time()
+        self._saved = (time.sleep, real_monotonic, real_time)
+        time.sleep = self.sleep
+        time.monotonic = lambda: base_monotonic + self.elapsed
+        time.time = lambda: base_time + self.elapsed
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        time.sleep, time.monotonic, time.time = self._saved
+
+
+# ─── CLI ─────────────────────────────────────────────
+
+def _clickables(screen: ReplayScreen) -> list[str]:
+    keys = []
+    for node in screen.root.iter():
+        if node.get("clickable") == "true" or node.get("accessible") == "true":
+            rid = node.get("resource-id", "").split(":id/")[-1]
+            text = next((n.get("text") for n in node.iter() if n.get("text")), "")
+            label = rid or node.get("content-desc") or node.get("name") or text
+            if label:
+                keys.append(f"{label}" + (f" ({text})" if text and text != label else ""))
+    return keys
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="녹화된 UI 덤프 재생 세션 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+    init_parser = sub.add_parser("init", help="덤프 폴더에 session.json 뼈대 생성 (순서대로 click 전이)")
+    init_parser.add_argument("path", help="ui_dumps/<세션> 폴더")
+    init_parser.add_argument("--force", action="store_true", help="기존 session.json 덮어쓰기")
+    show_parser = sub.add_parser("show", help="화면별 activity와 클릭 가능 요소 출력")
+    show_parser.add_argument("path", help="ui_dumps/<세션> 폴더")
+    args = parser.parse_args()
+
+    path = Path(args.path)
+    session = ReplaySession.load(path)
+
+    if args.command == "show":
+        for name, screen in session.screens.items():
+            print(f"[replay] {name}  ({screen.activity or '-'})")
+            for key in _clickables(screen):
+                print(f"    - {key}")
+        return 0
+
+    target = path / SESSION_FILE
+    if target.exists() and not args.force:
+        print(f"[replay] 이미 있습니다: {target} (--force로 덮어쓰기)")
+        return 1
+    names = list(session.screens)
+    skeleton = {
+        "start": names[0],
+        "package": session.package,
+        "window": session.window,
+        # click 값은 화면별 실제 클릭 요소로 채워야 합니다 (show 명령 참고)
+        "transitions": [{"from": a, "click": "", "to": b} for a, b in zip(names, names[1:])],
+    }
+    target.write_text(json.dumps(skeleton, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(f"[replay] {target} 생성 (화면 {len(names)}개, 전이 {len(names) - 1}개)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
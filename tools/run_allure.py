@@ -1,10 +1,18 @@
 import argparse
+import json
 import os
 import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
+
+# 후처리 단계(media_optimizer, update_dashboard, upload_to_dashboard, export_summary)를 같은 프로세스에서 import
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 # 필수 패키지 목록 (import명, pip 패키지명)
 _REQUIRED_PACKAGES = [
@@ -47,6 +55,30 @@ def _ensure_dependencies() -> None:
         sys.exit(1)
 
 
+def _claim_results_dir(results_root: Path) -> tuple[str, Path]:
+    """타임스탬프 결과 폴더를 원자적으로 만듭니다.
+
+    동시에 실행된 다른 run_allure가 같은 초의 폴더를 먼저 만들었으면 다음 초로 넘어갑니다.
+    """
+    results_root.mkdir(parents=True, exist_ok=True)
+    while True:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_dir = results_root / timestamp
+        try:
+            results_dir.mkdir(exist_ok=False)
+            return timestamp, results_dir
+        except FileExistsError:
+            time.sleep(1.0 - (time.time() % 1.0) + 0.01)
+
+
+def _write_manifest(path: Path, data: dict) -> None:
+    """호출자(trigger_listener 등)가 읽는 실행 정보 JSON을 원자적으로 씁니다."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
 def _find_latest_timestamp_dir(root: Path) -> Path | None:
     if not root.exists():
         return None
@@ -160,6 +192,47 @@ def _inject_custom_css(report_dir: Path) -> None:
         index_file.write_text(html, encoding="utf-8")
 
 
+@dataclass
+class _Stage:
+    """후처리 단계. after에 적힌 단계가 모두 성공해야 실행되고, wait_for는 끝나기만 기다립니다."""
+    name: str
+    func: Callable[[], object]
+    after: tuple[str, ...] = ()
+    wait_for: tuple[str, ...] = ()
+
+
+def _run_stages(stages: list[_Stage]) -> dict[str, bool]:
+    """의존 관계가 없는 단계는 동시에 실행합니다. 단계별 성공 여부를 반환합니다.
+
+    stages는 의존하는 단계보다 뒤에 오도록 나열해야 합니다.
+    """
+    futures: dict[str, Future] = {}
+    names = {stage.name for stage in stages}
+
+    def run(stage: _Stage) -> bool:
+        for dep in stage.wait_for:
+            if dep in names:
+                futures[dep].result()
+        failed_deps = [dep for dep in stage.after if dep in names and not futures[dep].result()]
+        if failed_deps:
+            print(f"[run_allure] stage {stage.name}: 건너뜀 (선행 단계 실패: {', '.join(failed_deps)})")
+            return False
+        started = time.perf_counter()
+        try:
+            ok = stage.func() is not False
+        except Exception as e:
+            print(f"[run_allure] stage {stage.name}: 실패 ({e})")
+            ok = False
+        print(f"[run_allure] stage {stage.name}: {'완료' if ok else '실패'} ({time.perf_counter() - started:.1f}s)")
+        return ok
+
+    # 단계마다 스레드 1개 (선행 단계를 기다리는 동안 다른 단계가 막히지 않도록)
+    with ThreadPoolExecutor(max_workers=max(1, len(stages))) as pool:
+        for stage in stages:
+            futures[stage.name] = pool.submit(run, stage)
+        return {name: future.result() for name, future in futures.items()}
+
+
 def main() -> int:
     _ensure_dependencies()
 
@@ -214,6 +287,38 @@ def main() -> int:
         default="https://allure-dashboard-three.vercel.app",
         help="대시보드 API URL (기본: 프로덕션)",
     )
+    parser.add_argument(
+        "--report",
+        choices=("now", "defer", "skip"),
+        default="now",
+        help=(
+            "HTML 리포트(allure generate) 생성 시점: now=후처리와 병렬 생성(기본), "
+            "defer=위젯을 직접 계산해 업로드를 먼저 끝낸 뒤 생성, skip=생성 안 함"
+        ),
+    )
+    parser.add_argument(
+        "--summary-html",
+        action="store_true",
+        default=False,
+        help="리포트 생성 후 단일 파일 요약 HTML(export/summary_<ts>.html)도 생성",
+    )
+    parser.add_argument(
+        "--optimize-media",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=(
+            "pytest 종료 후 스크린샷(WebP/JPEG)·녹화(미리보기 MP4)를 경량화, 원본은 originals/에 보존 "
+            "(기본: 켜짐, --no-optimize-media로 끄기)"
+        ),
+    )
+    parser.add_argument(
+        "--manifest",
+        default=None,
+        help=(
+            "실행 정보 JSON 경로 (timestamp, resultsDir, reportDir, pytest 종료 코드, 단계별 결과). "
+            "결과 폴더를 만든 직후와 종료 시 기록"
+        ),
+    )
     parser.add_argument(
         "pytest_args",
         nargs=argparse.REMAINDER,
@@ -234,76 +339,160 @@ def main() -> int:
     # Default is handled in conftest.py: --allure-attach=hybrid
     # Users can override with --allure-attach=all if they want to attach everything.
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    results_dir = Path(args.results_root) / timestamp
+    timestamp, results_dir = _claim_results_dir(Path(args.results_root))
     report_dir = Path(args.reports_root) / timestamp
 
-    results_dir.mkdir(parents=True, exist_ok=False)
     report_dir.parent.mkdir(parents=True, exist_ok=True)
 
+    manifest_path = Path(args.manifest) if args.manifest else None
+    manifest = {
+        "timestamp": timestamp,
+        "resultsDir": str(results_dir.resolve()),
+        "reportDir": str(report_dir.resolve()),
+        "status": "running",
+    }
+    if manifest_path:
+        _write_manifest(manifest_path, manifest)
+
     if args.keep_history:
         previous_report_dir = _find_latest_timestamp_dir(Path(args.reports_root))
         if previous_report_dir is not None and previous_report_dir.name != timestamp:
             _copy_history(previous_report_dir, results_dir)
 
     env = os.environ.copy()
+    # conftest --quarantine이 이 --reports-root의 격리 목록을 읽도록
+    from run_history import QUARANTINE_ENV, quarantine_path
+
+    env.setdefault(QUARANTINE_ENV, str(quarantine_path(Path(args.reports_root)).resolve()))
 
     pytest_cmd = [sys.executable, "-m", "pytest", *pytest_args, "--alluredir", str(results_dir)]
     print("[run_allure] pytest:", " ".join(pytest_cmd))
     pytest_proc = subprocess.run(pytest_cmd, env=env)
 
-    allure_generate_cmd = [
-        "allure",
-        "generate",
-        str(results_dir),
-        "-o",
-        str(report_dir),
-        "--clean",
-    ]
-    print("[run_allure] allure generate:", " ".join(allure_generate_cmd))
-    subprocess.run(allure_generate_cmd, env=env, check=True)
-
-    _inject_custom_css(report_dir)
-
-    latest_file = Path(args.reports_root) / "LATEST.txt"
-    latest_file.write_text(f"{timestamp}\n", encoding="utf-8")
-
-    _write_latest_entry(Path(args.reports_root), timestamp)
-
-    # Generate/update a simple dashboard that lists all saved runs.
-    # (Static HTML + runs.json; browser cannot list directories by itself.)
-    try:
-        dashboard_script = Path(__file__).resolve().parent / "update_dashboard.py"
-        dashboard_cmd = [sys.executable, str(dashboard_script), "--reports-root", str(args.reports_root)]
-        print("[run_allure] dashboard:", " ".join(dashboard_cmd))
-        subprocess.run(dashboard_cmd, env=env, check=False)
-    except Exception as e:
-        print(f"[run_allure] dashboard update skipped: {e}")
-
-    print(f"[run_allure] results: {results_dir}")
-    print(f"[run_allure] report  : {report_dir}")
-    print(f"[run_allure] latest  : {Path(args.reports_root) / 'LATEST' / 'index.html'}")
-    print(f"[run_allure] dash    : {Path(args.reports_root) / 'dashboard' / 'index.html'}")
+    if args.optimize_media:
+        # 리포트/업로드/요약 HTML이 모두 경량화된 첨부를 쓰도록 후처리 전에 실행
+        from media_optimizer import _format_mb, optimize_results
 
-    if args.upload:
+        started = time.perf_counter()
         try:
-            upload_script = Path(__file__).resolve().parent / "upload_to_dashboard.py"
-            upload_cmd = [
-                sys.executable, str(upload_script),
-                "--reports-root", str(args.reports_root),
-                "--dashboard-url", args.dashboard_url,
-                timestamp,
-            ]
-            print("[run_allure] upload:", " ".join(upload_cmd))
-            subprocess.run(upload_cmd, env=env, check=False)
+            media = optimize_results(results_dir)
+            print(
+                f"[run_allure] media: 스크린샷 {media['images']}개, 녹화 {media['videos']}개 경량화 "
+                f"({_format_mb(media['before'])} → {_format_mb(media['after'])}, "
+                f"{time.perf_counter() - started:.1f}s)"
+            )
         except Exception as e:
-            print(f"[run_allure] upload skipped: {e}")
+            print(f"[run_allure] media: 경량화 실패 ({e}) → 원본 사용")
+
+    reports_root = Path(args.reports_root)
+    results_root = Path(args.results_root)
+    analyzed: dict[str, list[dict]] = {}
+
+    def generate_report() -> None:
+        allure_generate_cmd = [
+            "allure",
+            "generate",
+            str(results_dir),
+            "-o",
+            str(report_dir),
+            "--clean",
+        ]
+        print("[run_allure] allure generate:", " ".join(allure_generate_cmd))
+        subprocess.run(allure_generate_cmd, env=env, check=True)
+
+        _inject_custom_css(report_dir)
+
+        latest_file = reports_root / "LATEST.txt"
+        latest_file.write_text(f"{timestamp}\n", encoding="utf-8")
+
+        _write_latest_entry(reports_root, timestamp)
+
+    def widgets_stage() -> bool:
+        # allure generate 없이 대시보드/업로드용 위젯(summary, suites 등)만 계산
+        from allure_widgets import write_widgets
+
+        return write_widgets(results_dir, report_dir)
+
+    def update_dashboard_stage() -> None:
+        # Generate/update a simple dashboard that lists all saved runs.
+        # (Static HTML + runs.json; browser cannot list directories by itself.)
+        from update_dashboard import update_dashboard
 
-    if args.open:
+        update_dashboard(reports_root, results_root)
+
+    def analyze_stage() -> None:
+        # 테스트 케이스 추출 + AI 실패 분석은 allure-results만 필요하므로 리포트 생성과 병렬 실행
+        from upload_to_dashboard import _extract_test_cases
+
+        analyzed["cases"] = _extract_test_cases(report_dir)
+
+    def upload_stage() -> bool:
+        import upload_to_dashboard as uploader
+
+        blob_token = os.environ.get("BLOB_READ_WRITE_TOKEN", "")
+        if not blob_token:
+            print("[run_allure] BLOB_READ_WRITE_TOKEN 미설정 → 첨부파일 업로드 건너뜀")
+        journal, ledger = uploader.open_upload_state(reports_root)
+        try:
+            return uploader.upload_report(
+                report_dir,
+                args.dashboard_url,
+                reports_root.resolve().parent,
+                journal,
+                ledger,
+                blob_token=blob_token,
+                with_attachments=bool(blob_token),
+                test_cases=analyzed.get("cases"),
+            )
+        finally:
+            ledger.close()
+
+    def summary_stage() -> None:
+        from export_summary import generate_summary_html
+
+        generate_summary_html(report_dir, reports_root / "export" / f"summary_{timestamp}.html")
+
+    # 위젯 공급 단계: now는 allure generate 결과, defer/skip은 allure_widgets로 직접 계산
+    widgets = "report" if args.report == "now" else "widgets"
+    stages: list[_Stage] = []
+    if args.report == "now":
+        stages.append(_Stage("report", generate_report))
+    else:
+        stages.append(_Stage("widgets", widgets_stage))
+    if args.upload:
+        stages.append(_Stage("analyze", analyze_stage))
+        stages.append(_Stage("upload", upload_stage, after=(widgets, "analyze")))
+    if args.report == "defer":
+        # 업로드(대시보드/Teams에 필요한 데이터)를 먼저 끝내고 리포트 생성
+        stages.append(_Stage("report", generate_report, wait_for=("upload",)))
+    stages.append(_Stage("dashboard", update_dashboard_stage, after=(widgets,), wait_for=("report",)))
+    if args.summary_html and args.report != "skip":
+        stages.append(_Stage("summary", summary_stage, after=("report",)))
+
+    started = time.perf_counter()
+    stage_ok = _run_stages(stages)
+    print(f"[run_allure] 후처리 {len(stages)}단계: {time.perf_counter() - started:.1f}s")
+
+    print(f"[run_allure] results: {results_dir}")
+    if stage_ok.get("report"):
+        print(f"[run_allure] report  : {report_dir}")
+        print(f"[run_allure] latest  : {reports_root / 'LATEST' / 'index.html'}")
+    if stage_ok.get("dashboard"):
+        print(f"[run_allure] dash    : {reports_root / 'dashboard' / 'index.html'}")
+
+    if args.open and stage_ok.get("report"):
         allure_open_cmd = ["allure", "open", str(report_dir)]
         print("[run_allure] allure open:", " ".join(allure_open_cmd))
         subprocess.run(allure_open_cmd, env=env, check=False)
 
+    if manifest_path:
+        _write_manifest(manifest_path, {
+            **manifest,
+            "status": "done",
+            "pytestExitCode": int(pytest_proc.returncode),
+            "stages": stage_ok,
+        })
+
     return int(pytest_proc.returncode)
 
 
@@ -0,0 +1,487 @@
+"""테스트 실행 이력을 로컬 SQLite DB에 누적하고, 테스트별 소요시간 추이와 회귀를 확인합니다.
+
+allure-results/<timestamp>/*-result.json을 읽어 실행(run)과 테스트별 결과를 저장합니다.
+결과 파일 목록(개수/크기/mtime) 서명이 같은 타임스탬프는 다시 파싱하지 않으므로 매 실행 후
+호출해도 새 실행분만 반영됩니다. 병렬 작업이 아직 쓰고 있는 폴더를 먼저 반영했더라도
+나중에 서명이 바뀌면(결과 추가, 세션 종료 시 flaky_reruns.json 기록) 다시 반영합니다.
+
+사용법:
+  # 새 실행만 DB에 반영
+  python tools/run_history.py ingest
+
+  # 테스트별 p50/p95 소요시간 추이 출력
+  python tools/run_history.py trends
+
+  # 최신 실행의 소요시간 회귀 검사 (회귀 발견 시 exit 1)
+  python tools/run_history.py check --threshold 1.5
+  python tools/run_history.py check --timestamp 20260216_024413
+
+  # 테스트별 불안정(flaky) 비율 + 격리 목록(allure-reports/quarantine.json) 갱신
+  python tools/run_history.py flaky --threshold 0.3 --min-runs 5
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from allure_model import load_results
+from file_lock import file_lock
+
+_TIMESTAMP_DIR_RE = re.compile(r"^\d{8}_\d{6}$")
+
+DEFAULT_DB_NAME = "run_history.sqlite3"
+# conftest가 실행 폴더에 남기는 재실행 기록 / 읽는 격리 목록
+RERUNS_FILE_NAME = "flaky_reruns.json"
+QUARANTINE_NAME = "quarantine.json"
+# 격리 목록 경로 (run_allure가 --reports-root 기준으로 pytest에 넘기고, conftest가 읽음)
+QUARANTINE_ENV = "QUARANTINE_FILE"
+
+# 격리 기준: 최근 실행 중 불안정 비율이 이 값 이상이고 실행 수가 MIN 이상인 테스트
+DEFAULT_FLAKY_THRESHOLD = 0.3
+DEFAULT_FLAKY_MIN_RUNS = 5
+
+# 추이 계산에 사용할 최근 실행 수
+DEFAULT_WINDOW = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    timestamp   TEXT PRIMARY KEY,
+    ingested_at TEXT NOT NULL,
+    total       INTEGER NOT NULL,
+    passed      INTEGER NOT NULL,
+    failed      INTEGER NOT NULL,
+    broken      INTEGER NOT NULL,
+    skipped     INTEGER NOT NULL,
+    duration_ms INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    timestamp   TEXT NOT NULL,
+    uuid        TEXT NOT NULL,
+    full_name   TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    start_ms    INTEGER NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    PRIMARY KEY (timestamp, uuid)
+);
+CREATE INDEX IF NOT EXISTS idx_test_results_full_name ON test_results (full_name, timestamp);
+CREATE TABLE IF NOT EXISTS reruns (
+    timestamp   TEXT NOT NULL,
+    full_name   TEXT NOT NULL,
+    attempt     INTEGER NOT NULL,
+    signature   TEXT NOT NULL,
+    outcome     TEXT NOT NULL,
+    PRIMARY KEY (timestamp, full_name, attempt)
+);
+CREATE TABLE IF NOT EXISTS run_sources (
+    timestamp   TEXT PRIMARY KEY,
+    signature   TEXT NOT NULL
+);
+"""
+
+
+def default_db_path(reports_root: Path) -> Path:
+    """reports 루트 기준 기본 DB 경로를 반환합니다."""
+    return reports_root / DEFAULT_DB_NAME
+
+
+def quarantine_path(reports_root: Path) -> Path:
+    """격리 목록 경로. QUARANTINE_FILE 환경 변수가 있으면 우선합니다."""
+    return Path(os.environ.get(QUARANTINE_ENV) or reports_root / QUARANTINE_NAME)
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """DB에 연결하고 스키마를 보장합니다."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _parse_results_dir(results_dir: Path) -> list[dict[str, Any]]:
+    """*-result.json에서 테스트별 상태/소요시간을 추출합니다."""
+    return [
+        {
+            "uuid": r.uuid,
+            "full_name": r.full_name,
+            "name": r.name,
+            "status": r.status,
+            "start_ms": r.start,
+            "duration_ms": r.duration_ms,
+        }
+        for r in load_results(results_dir).results
+        if r.full_name
+    ]
+
+
+def _parse_reruns(results_dir: Path) -> list[tuple[str, str, int, str, str]]:
+    """conftest의 flaky_reruns.json → (timestamp, full_name, attempt, signature, outcome) 행."""
+    try:
+        data = json.loads((results_dir / RERUNS_FILE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    rows = []
+    for test in data.get("tests", []) if isinstance(data, dict) else []:
+        for attempt in test.get("attempts", []):
+            rows.append((
+                results_dir.name,
+                str(test.get("fullName", "")),
+                int(attempt.get("attempt", 0)),
+                str(attempt.get("signature", "")),
+                str(test.get("outcome", "")),
+            ))
+    return [row for row in rows if row[1]]
+
+
+def _source_signature(results_dir: Path) -> str:
+    """결과 JSON / flaky_reruns.json의 개수·크기·mtime 서명 (파싱 없이 변경 감지)."""
+    count = size = latest = 0
+    try:
+        with os.scandir(results_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith("-result.json") or entry.name == RERUNS_FILE_NAME:
+                    st = entry.stat()
+                    count += 1
+                    size += st.st_size
+                    latest = max(latest, st.st_mtime_ns)
+    except OSError:
+        return ""
+    return f"{count}:{size}:{latest}"
+
+
+def ingest_results(results_root: Path, db_path: Path) -> list[str]:
+    """새 타임스탬프 폴더와, 마지막 반영 후 결과 파일이 바뀐 폴더를 파싱하여 반영합니다.
+
+    Returns:
+        새로 추가되거나 다시 반영된 타임스탬프 목록
+    """
+    if not results_root.exists():
+        return []
+
+    added: list[str] = []
+    with closing(connect(db_path)) as conn:
+        known = dict(conn.execute("SELECT timestamp, signature FROM run_sources"))
+        for child in sorted(results_root.iterdir(), key=lambda p: p.name):
+            if not child.is_dir() or not _TIMESTAMP_DIR_RE.match(child.name):
+                continue
+            signature = _source_signature(child)
+            if not signature or known.get(child.name) == signature:
+                continue
+            rows = _parse_results_dir(child)
+            if not rows:
+                # 실행 중이거나 비어 있는 폴더는 다음 번에 다시 확인
+                continue
+
+            stats = {"passed": 0, "failed": 0, "broken": 0, "skipped": 0}
+            for r in rows:
+                if r["status"] in stats:
+                    stats[r["status"]] += 1
+            starts = [r["start_ms"] for r in rows if r["start_ms"]]
+            stops = [r["start_ms"] + r["duration_ms"] for r in rows if r["start_ms"]]
+            run_duration = (max(stops) - min(starts)) if starts else 0
+
+            with conn:
+                # 실행 중에 일부만 반영된 폴더는 지우고 다시 씀
+                for table in ("runs", "test_results", "reruns"):
+                    conn.execute(f"DELETE FROM {table} WHERE timestamp = ?", (child.name,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO run_sources VALUES (?, ?)", (child.name, signature)
+                )
+                conn.execute(
+                    "INSERT OR IGNORE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        child.name,
+                        datetime.now().isoformat(timespec="seconds"),
+                        len(rows),
+                        stats["passed"],
+                        stats["failed"],
+                        stats["broken"],
+                        stats["skipped"],
+                        run_duration,
+                    ),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO test_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (child.name, r["uuid"], r["full_name"], r["name"], r["status"],
+                         r["start_ms"], r["duration_ms"])
+                        for r in rows
+                    ],
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO reruns VALUES (?, ?, ?, ?, ?)",
+                    _parse_reruns(child),
+                )
+            added.append(child.name)
+    return added
+
+
+def _percentile(values: list[int], pct: float) -> int:
+    """선형 보간 백분위수 (values가 비어 있으면 0)."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    pos = (len(ordered) - 1) * pct / 100
+    lower = int(pos)
+    upper = min(lower + 1, len(ordered) - 1)
+    return int(round(ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower)))
+
+
+def _history_by_test(conn: sqlite3.Connection) -> dict[str, list[tuple[str, str, str, int]]]:
+    """full_name별 (timestamp, name, status, duration_ms) 목록 (오래된 순)."""
+    grouped: dict[str, list[tuple[str, str, str, int]]] = {}
+    cursor = conn.execute(
+        "SELECT full_name, timestamp, name, status, duration_ms FROM test_results "
+        "ORDER BY timestamp, start_ms"
+    )
+    for full_name, ts, name, status, duration_ms in cursor:
+        grouped.setdefault(full_name, []).append((ts, name, status, duration_ms))
+    return grouped
+
+
+def build_trends(db_path: Path, window: int = DEFAULT_WINDOW) -> list[dict[str, Any]]:
+    """테스트별 최근 window회 실행의 p50/p95 소요시간 추이를 계산합니다.
+
+    백분위수는 passed 결과만으로 계산합니다 (실패는 대기/타임아웃으로 왜곡되기 쉬움).
+    """
+    with closing(connect(db_path)) as conn:
+        grouped = _history_by_test(conn)
+
+    trends: list[dict[str, Any]] = []
+    for full_name, history in grouped.items():
+        recent = history[-window:]
+        passed = [d for _, _, status, d in recent if status == "passed"]
+        latest_ts, latest_name, latest_status, latest_ms = recent[-1]
+        trends.append({
+            "fullName": full_name,
+            "name": latest_name,
+            "runs": len(recent),
+            "p50": _percentile(passed, 50),
+            "p95": _percentile(passed, 95),
+            "latestTimestamp": latest_ts,
+            "latestStatus": latest_status,
+            "latestMs": latest_ms,
+            "history": [
+                {"timestamp": ts, "status": status, "durationMs": d}
+                for ts, _, status, d in recent
+            ],
+        })
+    trends.sort(key=lambda t: t["p50"], reverse=True)
+    return trends
+
+
+def find_regressions(
+    db_path: Path,
+    timestamp: str | None = None,
+    threshold: float = 1.5,
+    window: int = DEFAULT_WINDOW,
+    min_samples: int = 3,
+    min_delta_ms: int = 2000,
+) -> list[dict[str, Any]]:
+    """지정 실행(기본: 최신)에서 소요시간이 기준선 대비 threshold배를 넘은 테스트를 찾습니다.
+
+    기준선은 해당 실행 이전 window회의 passed 결과 p50입니다.
+    짧은 테스트의 노이즈를 막기 위해 증가폭이 min_delta_ms 미만이면 무시합니다.
+    """
+    with closing(connect(db_path)) as conn:
+        if not timestamp:
+            row = conn.execute("SELECT MAX(timestamp) FROM runs").fetchone()
+            timestamp = row[0] if row else None
+        if not timestamp:
+            return []
+        grouped = _history_by_test(conn)
+
+    regressions: list[dict[str, Any]] = []
+    for full_name, history in grouped.items():
+        current = [(s, d) for ts, _, s, d in history if ts == timestamp]
+        if not current:
+            continue
+        status, duration_ms = current[-1]
+        if status != "passed":
+            continue
+        baseline = [d for ts, _, s, d in history if ts < timestamp and s == "passed"][-window:]
+        if len(baseline) < min_samples:
+            continue
+        p50 = _percentile(baseline, 50)
+        if p50 <= 0:
+            continue
+        ratio = duration_ms / p50
+        if ratio > threshold and duration_ms - p50 >= min_delta_ms:
+            regressions.append({
+                "fullName": full_name,
+                "timestamp": timestamp,
+                "durationMs": duration_ms,
+                "baselineP50": p50,
+                "baselineP95": _percentile(baseline, 95),
+                "ratio": round(ratio, 2),
+                "samples": len(baseline),
+            })
+    regressions.sort(key=lambda r: r["ratio"], reverse=True)
+    return regressions
+
+
+def build_flakiness(db_path: Path, window: int = DEFAULT_WINDOW) -> list[dict[str, Any]]:
+    """테스트별 최근 window회 실행의 불안정 비율을 계산합니다.
+
+    불안정한 실행 = 같은 세션 재실행으로 통과한 실행 + 직전 실행과 통과/실패가 뒤바뀐 실행.
+    """
+    with closing(connect(db_path)) as conn:
+        grouped = _history_by_test(conn)
+        recovered: dict[str, set[str]] = {}
+        signatures: dict[str, dict[str, int]] = {}
+        for full_name, ts, signature, outcome in conn.execute(
+            "SELECT full_name, timestamp, signature, outcome FROM reruns"
+        ):
+            if outcome == "passed":
+                recovered.setdefault(full_name, set()).add(ts)
+            counts = signatures.setdefault(full_name, {})
+            counts[signature] = counts.get(signature, 0) + 1
+
+    flaky: list[dict[str, Any]] = []
+    for full_name, history in grouped.items():
+        recent = history[-window:]
+        flaky_runs = 0
+        prev_ok = None
+        for ts, _, status, _ in recent:
+            if status == "skipped":
+                continue
+            ok = status == "passed"
+            if ts in recovered.get(full_name, ()) or (prev_ok is not None and ok != prev_ok):
+                flaky_runs += 1
+            prev_ok = ok
+        runs = sum(1 for _, _, status, _ in recent if status != "skipped")
+        if not runs:
+            continue
+        flaky.append({
+            "fullName": full_name,
+            "runs": runs,
+            "flakyRuns": flaky_runs,
+            "rate": round(flaky_runs / runs, 3),
+            "recovered": len(recovered.get(full_name, ())),
+            "signatures": signatures.get(full_name, {}),
+            "latestStatus": recent[-1][2],
+        })
+    flaky.sort(key=lambda f: (f["rate"], f["runs"]), reverse=True)
+    return flaky
+
+
+def write_quarantine(
+    db_path: Path,
+    path: Path,
+    threshold: float = DEFAULT_FLAKY_THRESHOLD,
+    min_runs: int = DEFAULT_FLAKY_MIN_RUNS,
+    window: int = DEFAULT_WINDOW,
+) -> list[dict[str, Any]]:
+    """격리 대상 테스트 목록을 JSON으로 씁니다 (conftest --quarantine이 읽음)."""
+    quarantined = [
+        f for f in build_flakiness(db_path, window)
+        if f["runs"] >= min_runs and f["rate"] >= threshold
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 병렬 작업이 같은 목록을 동시에 갱신하므로 잠근 뒤 프로세스별 임시 파일로 교체
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with file_lock(path):
+        try:
+            tmp.write_text(json.dumps({
+                "updatedAt": datetime.now().isoformat(timespec="seconds"),
+                "threshold": threshold,
+                "minRuns": min_runs,
+                "tests": quarantined,
+            }, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+    return quarantined
+
+
+def _fmt_ms(ms: int) -> str:
+    return f"{ms / 1000:.1f}s"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="테스트 실행 이력 DB (소요시간 추이/회귀 검사)")
+    parser.add_argument("--results-root", default="allure-results", help="Allure results 루트 폴더")
+    parser.add_argument("--reports-root", default="allure-reports", help="Allure reports 루트 폴더 (DB 기본 위치)")
+    parser.add_argument("--db", default=None, help=f"DB 경로 (기본: <reports-root>/{DEFAULT_DB_NAME})")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="추이 계산에 사용할 최근 실행 수")
+
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("ingest", help="새 실행 결과를 DB에 반영")
+
+    trends_parser = sub.add_parser("trends", help="테스트별 p50/p95 추이 출력")
+    trends_parser.add_argument("--limit", type=int, default=20, help="출력할 테스트 수")
+
+    check_parser = sub.add_parser("check", help="소요시간 회귀 검사 (회귀 시 exit 1)")
+    check_parser.add_argument("--timestamp", default=None, help="검사할 실행 (기본: 최신)")
+    check_parser.add_argument("--threshold", type=float, default=1.5, help="기준선(p50) 대비 허용 배수")
+    check_parser.add_argument("--min-samples", type=int, default=3, help="기준선 최소 표본 수")
+    check_parser.add_argument("--min-delta-ms", type=int, default=2000, help="무시할 최소 증가폭(ms)")
+
+    flaky_parser = sub.add_parser("flaky", help="테스트별 불안정 비율 출력 + 격리 목록 갱신")
+    flaky_parser.add_argument("--threshold", type=float, default=DEFAULT_FLAKY_THRESHOLD,
+                              help="격리 기준 불안정 비율")
+    flaky_parser.add_argument("--min-runs", type=int, default=DEFAULT_FLAKY_MIN_RUNS,
+                              help="격리 판단 최소 실행 수")
+    flaky_parser.add_argument("--limit", type=int, default=20, help="출력할 테스트 수")
+
+    args = parser.parse_args()
+
+    db_path = Path(args.db) if args.db else default_db_path(Path(args.reports_root))
+
+    # 모든 명령은 최신 결과를 먼저 반영한 뒤 수행
+    added = ingest_results(Path(args.results_root), db_path)
+    if added:
+        print(f"[run_history] {len(added)}개 실행 반영: {', '.join(added)}")
+
+    if args.command == "ingest":
+        print(f"[run_history] db: {db_path}")
+        return 0
+
+    if args.command == "trends":
+        trends = build_trends(db_path, window=args.window)
+        print(f"{'p50':>8} {'p95':>8} {'latest':>8} {'runs':>5}  test")
+        for t in trends[: args.limit]:
+            print(f"{_fmt_ms(t['p50']):>8} {_fmt_ms(t['p95']):>8} {_fmt_ms(t['latestMs']):>8} "
+                  f"{t['runs']:>5}  {t['fullName']}")
+        return 0
+
+    if args.command == "flaky":
+        flaky = build_flakiness(db_path, window=args.window)
+        q_path = quarantine_path(Path(args.reports_root))
+        quarantined = write_quarantine(db_path, q_path, args.threshold, args.min_runs, args.window)
+        print(f"{'rate':>6} {'flaky':>5} {'runs':>5}  test")
+        for f in flaky[: args.limit]:
+            mark = "Q" if f in quarantined else " "
+            print(f"{f['rate']:>6.2f} {f['flakyRuns']:>5} {f['runs']:>5} {mark} {f['fullName']}")
+        print(f"[run_history] 격리 {len(quarantined)}건 → {q_path}")
+        return 0
+
+    regressions = find_regressions(
+        db_path,
+        timestamp=args.timestamp,
+        threshold=args.threshold,
+        window=args.window,
+        min_samples=args.min_samples,
+        min_delta_ms=args.min_delta_ms,
+    )
+    if not regressions:
+        print(f"[run_history] 소요시간 회귀 없음 (threshold: x{args.threshold})")
+        return 0
+
+    print(f"[run_history] 소요시간 회귀 {len(regressions)}건 (threshold: x{args.threshold})")
+    for r in regressions:
+        print(f"  ✗ {r['fullName']}: {_fmt_ms(r['durationMs'])} "
+              f"(기준 p50 {_fmt_ms(r['baselineP50'])}, x{r['ratio']}, 표본 {r['samples']})")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -179,6 +179,11 @@ def build_result_card(result: dict) -> dict:
         },
     ]
 
+    # 실패 근본 원인 수 (failure_clusters로 묶은 결과)
+    root_causes = result.get("root_causes")
+    if root_causes:
+        body[3]["facts"].append({"title": "🧩 실패 원인", "value": f"{failed + broken}건 실패 / {root_causes}개 원인"})
+
     # 요청자 정보 (있으면 추가)
     if requested_by:
         body[3]["facts"].append({"title": "👤 요청자", "value": requested_by})
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""테스트 영향 분석: 변경된 utils/pages 함수나 앱 화면에 닿는 테스트만 골라 실행합니다.
+
+pytest --record-impact로 실행하면 conftest가 allure-results/<ts>/test_impact.json에
+테스트별로 호출한 utils.* / pages.* 함수(모듈:qualname)와 거친 화면(Activity)을 기록합니다.
+이 도구는 그 파일들을 영향 맵(allure-reports/test_impact_map.json)으로 합치고,
+git diff 또는 변경된 화면 목록으로 실행할 최소 테스트 집합을 계산합니다.
+
+선택 규칙:
+  - utils/, pages/ 변경 → 변경된 줄을 포함하는 함수/클래스를 호출한 테스트
+    (함수 밖 모듈 수준 변경이면 그 모듈을 쓰는 테스트 전체)
+  - tests/ 변경 → 변경된 테스트 파일 전체
+  - conftest.py, config/, requirements.txt, pytest.ini 변경 → 전체 실행
+  - 새 APK: --screens로 바뀐 화면을 주면 그 화면을 거친 테스트, 없으면 전체 실행
+  - 맵에 없는 테스트 파일(새 테스트)은 항상 포함
+
+사용법:
+  # 새 실행의 test_impact.json을 맵에 반영
+  python tools/test_impact.py ingest
+
+  # 맵을 기록한 커밋 이후 변경분 기준 선택 (pytest 인자 출력)
+  python tools/test_impact.py select --platform android
+  python tools/test_impact.py select --base origin/main
+  python tools/test_impact.py select --screens .transfer.LocalTransferActivity
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+from file_lock import file_lock
+
+IMPACT_FILE_NAME = "test_impact.json"
+MAP_NAME = "test_impact_map.json"
+
+_TIMESTAMP_DIR_RE = re.compile(r"^\d{8}_\d{6}$")
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+_TRACKED_PACKAGES = ("utils/", "pages/")
+# 바뀌면 어떤 테스트가 영향받는지 알 수 없어 전체 실행하는 파일
+_GLOBAL_FILES = ("conftest.py", "pytest.ini", "requirements.txt", "setup.cfg", "pyproject.toml")
+_GLOBAL_DIRS = ("config/",)
+
+
+# ─── 영향 맵 ─────────────────────────────────────────────
+
+def default_map_path(reports_root: Path) -> Path:
+    return reports_root / MAP_NAME
+
+
+def load_map(map_path: Path) -> dict:
+    try:
+        data = json.loads(map_path.read_text(encoding="utf-8"))
+        if isinstance(data, dict):
+            return data
+    except (OSError, ValueError):
+        pass
+    return {"ingested": [], "gitCommit": "", "appVersion": {}, "tests": {}}
+
+
+def _save_map(map_path: Path, data: dict) -> None:
+    map_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = map_path.with_name(f".{map_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, map_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def ingest_impact(results_root: Path, map_path: Path) -> list[str]:
+    """아직 반영하지 않은 실행의 test_impact.json을 맵에 합칩니다.
+
+    테스트별 함수/화면은 실행마다 분기가 다를 수 있으므로 누적(합집합)합니다.
+    병렬 작업이 같은 맵을 갱신할 수 있어 읽기부터 저장까지 파일 잠금 안에서 처리하고,
+    맵을 쓸 수 없으면 경고만 출력합니다 (기존 맵으로 선택 계속).
+
+    Returns:
+        새로 반영한 타임스탬프 목록
+    """
+    if not results_root.exists():
+        return []
+    try:
+        with file_lock(map_path):
+            return _ingest_locked(results_root, map_path)
+    except OSError as e:
+        print(f"[test_impact] 영향 맵 갱신 실패 ({map_path}): {e}")
+        return []
+
+
+def _ingest_locked(results_root: Path, map_path: Path) -> list[str]:
+    data = load_map(map_path)
+    known = set(data.get("ingested", []))
+    added: list[str] = []
+    for child in sorted(results_root.iterdir(), key=lambda p: p.name):
+        if not child.is_dir() or not _TIMESTAMP_DIR_RE.match(child.name) or child.name in known:
+            continue
+        try:
+            run = json.loads((child / IMPACT_FILE_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        platform = run.get("platform", "")
+        for nodeid, entry in (run.get("tests") or {}).items():
+            merged = data["tests"].setdefault(nodeid, {"symbols": [], "screens": [], "platform": platform})
+            for key in ("symbols", "screens"):
+                merged[key] = sorted(set(merged.get(key, [])) | set(entry.get(key, [])))
+            merged["platform"] = platform or merged.get("platform", "")
+            merged["lastSeen"] = child.name
+        if run.get("gitCommit"):
+            data["gitCommit"] = run["gitCommit"]
+        if run.get("appVersion"):
+            data.setdefault("appVersion", {})[platform] = run["appVersion"]
+        data.setdefault("ingested", []).append(child.name)
+        added.append(child.name)
+    if added:
+        data["updatedAt"] = datetime.now().isoformat(timespec="seconds")
+        _save_map(map_path, data)
+    return added
+
+
+# ─── 변경 분석 ─────────────────────────────────────────────
+
+def _git(repo_root: Path, *args: str) -> str:
+    proc = subprocess.run(["git", *args], cwd=str(repo_root), capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip() or f"git {' '.join(args)} 실패")
+    return proc.stdout
+
+
+def _changed_lines(diff_text: str) -> dict[str, list[tuple[int, int]]]:
+    """unified=0 diff → 파일별 변경 줄 범위 (새 파일 기준, 삭제만 있으면 그 위치 1줄)."""
+    changes: dict[str, list[tuple[int, int]]] = {}
+    old = current = None
+    for line in diff_text.splitlines():
+        if line.startswith("--- "):
+            path = line[4:].strip()
+            old = path[2:] if path.startswith("a/") else None
+        elif line.startswith("+++ "):
+            path = line[4:].strip()
+            current = path[2:] if path.startswith("b/") else None
+            # 삭제된 파일은 +++ /dev/null → 이전 경로로 기록 (줄 범위 없음)
+            changes.setdefault(current or old, [])
+        elif current and (m := _HUNK_RE.match(line)):
+            start, count = int(m.group(3)), int(m.group(4) or 1)
+            changes[current].append((max(start, 1), start + max(count, 1) - 1))
+    return changes
+
+
+def _symbols_in_ranges(source: str, module: str, ranges: list[tuple[int, int]]) -> set[str]:
+    """변경 줄 범위와 겹치는 함수/클래스의 '모듈:qualname'. 함수 밖 변경이면 '모듈:*'."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return {f"{module}:*"}
+
+    spans: list[tuple[int, int, str]] = []
+
+    def visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                qualname = f"{prefix}{child.name}"
+                first = min([child.lineno, *(d.lineno for d in child.decorator_list)])
+                spans.append((first, child.end_lineno or child.lineno, qualname))
+                inner = f"{qualname}.<locals>." if not isinstance(child, ast.ClassDef) else f"{qualname}."
+                visit(child, inner)
+
+    visit(tree, "")
+    symbols: set[str] = set()
+    for start, end in ranges:
+        hits = [q for s, e, q in spans if s <= end and start <= e]
+        # 메서드 안 변경이면 감싸는 클래스 전체가 아니라 그 메서드만
+        hits = [q for q in hits if not any(h.startswith(f"{q}.") for h in hits)]
+        if hits:
+            symbols.update(f"{module}:{q}" for q in hits)
+        else:
+            symbols.add(f"{module}:*")
+    return symbols
+
+
+def analyze_diff(repo_root: Path, base: str) -> dict:
+    """base 커밋 대비 작업 트리 변경을 분석합니다.
+
+    Returns:
+        {"symbols": set, "test_files": set, "global": [파일...], "files": [파일...]}
+    """
+    diff_text = _git(repo_root, "diff", "--unified=0", "--no-color", base, "--")
+    untracked = _git(repo_root, "ls-files", "--others", "--exclude-standard").splitlines()
+    changes = _changed_lines(diff_text)
+    for path in untracked:
+        if path.endswith(".py"):
+            changes.setdefault(path, [(1, 10**9)])
+
+    symbols: set[str] = set()
+    test_files: set[str] = set()
+    global_files: list[str] = []
+    for path, ranges in changes.items():
+        if path in _GLOBAL_FILES or path.startswith(_GLOBAL_DIRS):
+            global_files.append(path)
+        elif path.startswith("tests/") and path.endswith(".py"):
+            test_files.add(path)
+        elif path.startswith(_TRACKED_PACKAGES) and path.endswith(".py"):
+            module = path[:-3].replace("/", ".")
+            file_path = repo_root / path
+            if not file_path.exists():
+                symbols.add(f"{module}:*")
+                continue
+            symbols |= _symbols_in_ranges(file_path.read_text(encoding="utf-8"), module, ranges or [(1, 10**9)])
+    return {"symbols": symbols, "test_files": test_files, "global": global_files, "files": sorted(changes)}
+
+
+# ─── 선택 ─────────────────────────────────────────────
+
+def _touches(entry: dict, symbols: set[str]) -> bool:
+    used = set(entry.get("symbols", []))
+    if used & symbols:
+        return True
+    wildcard_modules = {s[:-2] for s in symbols if s.endswith(":*")}
+    # 클래스 변경은 그 메서드를 호출한 테스트에도 해당
+    class_prefixes = tuple(f"{s}." for s in symbols if not s.endswith(":*"))
+    return any(
+        u.split(":", 1)[0] in wildcard_modules or (class_prefixes and u.startswith(class_prefixes))
+        for u in used
+    )
+
+
+def select_tests(
+    impact_map: dict,
+    platform: str,
+    symbols: set[str] = frozenset(),
+    test_files: set[str] = frozenset(),
+    screens: set[str] = frozenset(),
+) -> list[str]:
+    """영향받는 테스트의 pytest 인자(노드 ID 또는 파일 경로) 목록."""
+    selected: set[str] = set()
+    tests = {
+        nodeid: entry for nodeid, entry in impact_map.get("tests", {}).items()
+        if not platform or entry.get("platform", platform) == platform
+    }
+    for nodeid, entry in tests.items():
+        path = nodeid.split("::", 1)[0]
+        if path in test_files:
+            continue
+        if _touches(entry, set(symbols)):
+            selected.add(nodeid)
+        elif screens and any(s.endswith(screen) or screen.endswith(s)
+                             for s in entry.get("screens", []) for screen in screens):
+            selected.add(nodeid)
+    platform_dir = f"tests/{platform}/" if platform else "tests/"
+    selected |= {f for f in test_files if f.startswith(platform_dir)}
+    return sorted(selected)
+
+
+def impacted_pytest_args(
+    repo_root: Path,
+    results_root: Path,
+    reports_root: Path,
+    platform: str,
+    base: str | None = None,
+    screens: list[str] | None = None,
+) -> list[str] | None:
+    """trigger_listener용: 영향받는 테스트 목록. 전체 실행이 필요하면 None."""
+    map_path = default_map_path(reports_root)
+    added = ingest_impact(results_root, map_path)
+    if added:
+        print(f"[test_impact] {len(added)}개 실행 반영")
+    impact_map = load_map(map_path)
+    if not impact_map.get("tests"):
+        print("[test_impact] 영향 맵이 비어 있음 → 전체 실행")
+        return None
+
+    base = base or impact_map.get("gitCommit") or "HEAD"
+    try:
+        diff = analyze_diff(repo_root, base)
+    except RuntimeError as e:
+        print(f"[test_impact] git diff 실패 ({e}) → 전체 실행")
+        return None
+    if diff["global"]:
+        print(f"[test_impact] 공통 설정 변경 ({', '.join(diff['global'])}) → 전체 실행")
+        return None
+
+    screens = [s for s in (screens or []) if s]
+    recorded_version = (impact_map.get("appVersion") or {}).get(platform, "")
+    current_version = _current_app_version(repo_root, platform)
+    if current_version and recorded_version and current_version != recorded_version and not screens:
+        print(f"[test_impact] 앱 버전 변경 ({recorded_version} → {current_version}), 변경 화면 미지정 → 전체 실행")
+        return None
+
+    selected = select_tests(impact_map, platform, diff["symbols"], diff["test_files"], set(screens))
+    # 맵에 없는 테스트 파일(새로 추가된 테스트)은 항상 실행
+    known_files = {nodeid.split("::", 1)[0] for nodeid in impact_map.get("tests", {})}
+    test_root = repo_root / "tests" / platform
+    if test_root.is_dir():
+        for path in sorted(test_root.glob("*_test.py")) + sorted(test_root.glob("test_*.py")):
+            rel = path.relative_to(repo_root).as_posix()
+            if rel not in known_files and rel not in selected:
+                selected.append(rel)
+    print(f"[test_impact] 기준 {base[:12]}: 변경 심볼 {len(diff['symbols'])}개, "
+          f"테스트 파일 {len(diff['test_files'])}개, 화면 {len(screens)}개 → {len(selected)}개 선택")
+    return selected
+
+
+def _current_app_version(repo_root: Path, platform: str) -> str:
+    """apk/<APP_ENV>/ 파일명에서 버전 추출 (Android만, conftest 없이 빠르게 확인)."""
+    if platform != "android":
+        return ""
+    apk_dir = repo_root / "apk" / os.environ.get("APP_ENV", "stage")
+    apks = sorted(apk_dir.glob("*.apk")) if apk_dir.is_dir() else []
+    m = re.search(r"(\d+\.\d+\.\d+)", apks[-1].stem) if apks else None
+    return m.group(1) if m else ""
+
+
+# ─── CLI ─────────────────────────────────────────────
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="테스트 영향 분석 (변경분에 닿는 테스트만 선택)")
+    parser.add_argument("--results-root", default="allure-results", help="Allure results 루트 폴더")
+    parser.add_argument("--reports-root", default="allure-reports", help="Allure reports 루트 폴더 (맵 위치)")
+    parser.add_argument("--repo-root", default=".", help="git 저장소 루트")
+
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("ingest", help="새 실행의 test_impact.json을 맵에 반영")
+
+    select_parser = sub.add_parser("select", help="영향받는 테스트 선택 (pytest 인자 출력)")
+    select_parser.add_argument("--platform", default="android", choices=["android", "ios"])
+    select_parser.add_argument("--base", default=None, help="비교 기준 git ref (기본: 맵을 기록한 커밋)")
+    select_parser.add_argument("--screens", default="", help="새 APK에서 바뀐 화면(Activity), 쉼표 구분")
+
+    args = parser.parse_args()
+    results_root = Path(args.results_root)
+    reports_root = Path(args.reports_root)
+
+    if args.command == "ingest":
+        added = ingest_impact(results_root, default_map_path(reports_root))
+        print(f"[test_impact] {len(added)}개 실행 반영 → {default_map_path(reports_root)}")
+        return 0
+
+    selected = impacted_pytest_args(
+        Path(args.repo_root).resolve(),
+        results_root,
+        reports_root,
+        args.platform,
+        base=args.base,
+        screens=[s.strip() for s in args.screens.split(",")],
+    )
+    if selected is None:
+        print(f"tests/{args.platform}/")
+    else:
+        print(" ".join(selected))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
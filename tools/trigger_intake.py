@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+"""대시보드 트리거 수신 계층입니다.
+
+수신 방식 (mode):
+  sse       GET /api/trigger/stream 이벤트 스트림 (연결 유지, 지연 거의 없음)
+  longpoll  GET /api/trigger?status=pending&wait=<초> (서버가 트리거가 생길 때까지 응답 보류)
+  poll      GET /api/trigger?status=pending 고정 간격 조회
+  auto      sse → longpoll 순으로 시도하고, 서버가 지원하지 않으면 다음 방식으로 내려갑니다.
+
+HTTP 연결은 http.client로 유지(keep-alive)하며, 오류는 출력하고 지수 백오프 + 지터로 재시도합니다.
+
+TriggerPushServer는 CI가 트리거를 직접 넣을 수 있는 로컬 HTTP 엔드포인트입니다:
+  POST /trigger        {"testTarget": "gme1", "platform": "android", "marker": "smoke"} → 202 {"id": "local-1"}
+                       영향 분석: {"testTarget": "impacted", "baseRef": "origin/main", "changedScreens": [...]}
+  GET  /trigger/<id>   상태/결과 조회
+  GET  /health
+TRIGGER_PUSH_TOKEN이 설정되어 있으면 Authorization: Bearer <token> 헤더가 필요합니다.
+"""
+
+import http.client
+import json
+import random
+import threading
+import time
+import urllib.parse
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+INTAKE_MODES = ("auto", "sse", "longpoll", "poll")
+LONG_POLL_WAIT = 25
+# 서버 keep-alive 주석(15초)보다 넉넉하게
+SSE_READ_TIMEOUT = 60
+REQUEST_TIMEOUT = 10
+MAX_BACKOFF = 300
+
+
+class IntakeError(Exception):
+    """트리거 API 응답 오류 (2xx가 아닌 응답, 잘못된 본문)."""
+
+
+class _Unsupported(IntakeError):
+    """서버가 해당 수신 방식을 지원하지 않음 (404/405, 이벤트 스트림이 아님)."""
+
+
+def backoff_delay(attempt: int, base: float, cap: float = MAX_BACKOFF) -> float:
+    """지수 백오프 + 지터 (equal jitter): [d/2, d] 범위, d = min(cap, base * 2^attempt)."""
+    delay = min(cap, base * (2 ** max(attempt - 1, 0)))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class _KeepAliveClient:
+    """http.client 연결 1개를 재사용합니다. 실패하면 다음 요청에서 다시 연결합니다."""
+
+    def __init__(self, base_url: str):
+        parts = urllib.parse.urlsplit(base_url)
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self._conn: http.client.HTTPConnection | None = None
+
+    def connect(self, timeout: float) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+        return cls(self._host, self._port, timeout=timeout)
+
+    def url(self, path: str) -> str:
+        return f"{self._prefix}{path}"
+
+    def get_json(self, path: str, timeout: float) -> Any:
+        if self._conn is None:
+            self._conn = self.connect(timeout)
+        self._conn.timeout = timeout
+        if self._conn.sock is not None:
+            self._conn.sock.settimeout(timeout)
+        try:
+            self._conn.request("GET", self.url(path), headers={"Accept": "application/json"})
+            resp = self._conn.getresponse()
+            body = resp.read()
+        except (OSError, http.client.HTTPException):
+            self.close()
+            raise
+        if resp.will_close:
+            self.close()
+        if resp.status in (404, 405):
+            raise _Unsupported(f"HTTP {resp.status} {path}")
+        if resp.status >= 400:
+            raise IntakeError(f"HTTP {resp.status} {path}: {body[:200]!r}")
+        try:
+            return json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as e:
+            raise IntakeError(f"JSON 파싱 실패 {path}: {e}") from e
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class TriggerIntake:
+    """대시보드에서 pending 트리거를 받아 on_trigger(trigger)로 넘깁니다.
+
+    같은 트리거가 여러 번 전달될 수 있으므로 on_trigger 쪽(TriggerScheduler.submit)에서
+    ID로 중복을 거릅니다.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        on_trigger: Callable[[dict], None],
+        mode: str = "auto",
+        interval: float = 10,
+        max_backoff: float = MAX_BACKOFF,
+        long_poll_wait: int = LONG_POLL_WAIT,
+    ):
+        if mode not in INTAKE_MODES:
+            raise ValueError(f"알 수 없는 수신 방식: {mode}")
+        self.base_url = base_url.rstrip("/")
+        self._on_trigger = on_trigger
+        self._fixed = mode != "auto"
+        self.mode = "sse" if mode == "auto" else mode
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.long_poll_wait = long_poll_wait
+        self._client = _KeepAliveClient(self.base_url)
+        self.errors = 0
+        self.last_error = ""
+        self.received = 0
+
+    # ─── 전달 ─────────────────────────────────────────────
+
+    def _deliver(self, triggers: Any) -> None:
+        if isinstance(triggers, dict):
+            triggers = triggers.get("triggers", [triggers] if triggers.get("id") else [])
+        for trigger in triggers or []:
+            if isinstance(trigger, dict) and trigger.get("id"):
+                self.received += 1
+                self._on_trigger(trigger)
+
+    # ─── 방식별 1회 수신 ─────────────────────────────────────────────
+
+    def _poll_once(self) -> None:
+        self._deliver(self._client.get_json("/api/trigger?status=pending", REQUEST_TIMEOUT))
+
+    def _long_poll_once(self, stop: threading.Event) -> None:
+        start = time.time()
+        path = f"/api/trigger?status=pending&wait={self.long_poll_wait}"
+        data = self._client.get_json(path, self.long_poll_wait + REQUEST_TIMEOUT)
+        self._deliver(data)
+        # wait를 무시하는 서버면 바로 빈 응답이 오므로 폴링 간격만큼 쉼
+        if not (data or {}).get("triggers") and time.time() - start < 1.0:
+            stop.wait(self.interval)
+
+    def _run_sse(self, stop: threading.Event) -> None:
+        """스트림이 끊길 때까지 이벤트를 읽습니다. 연결 직후 누락분을 한 번 조회합니다."""
+        conn = self._client.connect(SSE_READ_TIMEOUT)
+        try:
+            conn.request("GET", self._client.url("/api/trigger/stream"),
+                         headers={"Accept": "text/event-stream", "Cache-Control": "no-cache"})
+            resp = conn.getresponse()
+            content_type = resp.getheader("Content-Type", "")
+            if resp.status in (404, 405) or (resp.status < 400 and "text/event-stream" not in content_type):
+                raise _Unsupported(f"HTTP {resp.status} ({content_type or '-'}) /api/trigger/stream")
+            if resp.status >= 400:
+                raise IntakeError(f"HTTP {resp.status} /api/trigger/stream")
+
+            print(f"[trigger_intake] SSE 연결됨: {self.base_url}/api/trigger/stream")
+            self._poll_once()
+            self.errors = 0
+
+            data_lines: list[str] = []
+            while not stop.is_set():
+                raw = resp.readline()
+                if not raw:
+                    raise IntakeError("SSE 스트림이 서버에서 닫혔습니다")
+                line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+                if not line:
+                    if data_lines:
+                        try:
+                            self._deliver(json.loads("\n".join(data_lines)))
+                        except ValueError as e:
+                            print(f"[trigger_intake] SSE 이벤트 파싱 실패: {e}")
+                        data_lines = []
+                elif line.startswith("data:"):
+                    data_lines.append(line[5:].lstrip())
+                # ":" 주석(keep-alive), event:/id:/retry: 필드는 무시
+        finally:
+            conn.close()
+
+    # ─── 루프 ─────────────────────────────────────────────
+
+    def _downgrade(self, reason: str) -> None:
+        next_mode = {"sse": "longpoll", "longpoll": "poll"}.get(self.mode, "poll")
+        print(f"[trigger_intake] {self.mode} 미지원 ({reason}) → {next_mode} 방식으로 전환")
+        self.mode = next_mode
+
+    def run(self, stop: threading.Event) -> None:
+        """stop이 설정될 때까지 트리거를 수신합니다."""
+        print(f"[trigger_intake] 수신 시작: {self.base_url} ({self.mode}{'' if self._fixed else ', auto'})")
+        while not stop.is_set():
+            try:
+                if self.mode == "sse":
+                    self._run_sse(stop)
+                elif self.mode == "longpoll":
+                    self._long_poll_once(stop)
+                else:
+                    self._poll_once()
+                    stop.wait(self.interval)
+                if self.errors:
+                    print(f"[trigger_intake] 복구됨 (연속 오류 {self.errors}회 후)")
+                self.errors = 0
+            except _Unsupported as e:
+                if not self._fixed and self.mode != "poll":
+                    self._downgrade(str(e))
+                    continue
+                self._on_error(e, stop)
+            except (IntakeError, OSError, http.client.HTTPException) as e:
+                self._on_error(e, stop)
+        self._client.close()
+
+    def _on_error(self, error: Exception, stop: threading.Event) -> None:
+        self.errors += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        delay = backoff_delay(self.errors, max(self.interval, 1), self.max_backoff)
+        print(f"[trigger_intake] {self.mode} 오류 (연속 {self.errors}회): {self.last_error} "
+              f"→ {delay:.1f}초 후 재시도")
+        stop.wait(delay)
+
+
+# ─── 로컬 푸시 엔드포인트 ─────────────────────────────────────────────
+
+class _PushHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "TriggerPushServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send_json(self, status: int, obj: Any) -> None:
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorized(self) -> bool:
+        token = self.server.token
+        if not token or self.headers.get("Authorization", "") == f"Bearer {token}":
+            return True
+        self._send_json(401, {"error": "unauthorized"})
+        return False
+
+    def do_GET(self) -> None:
+        path = urllib.parse.urlsplit(self.path).path.rstrip("/")
+        if path == "/health":
+            self._send_json(200, {"ok": True, "triggers": len(self.server.triggers)})
+            return
+        if not self._authorized():
+            return
+        if path.startswith("/trigger/"):
+            trigger = self.server.get(path[len("/trigger/"):])
+            if trigger is None:
+                self._send_json(404, {"error": "trigger not found"})
+            else:
+                self._send_json(200, trigger)
+            return
+        self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        if not self._authorized():
+            return
+        if urllib.parse.urlsplit(self.path).path.rstrip("/") != "/trigger":
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            data = json.loads(body.decode("utf-8")) if body else {}
+        except (UnicodeDecodeError, ValueError):
+            data = None
+        if not isinstance(data, dict):
+            self._send_json(400, {"error": "JSON object required"})
+            return
+        trigger = self.server.push(data)
+        self._send_json(202, trigger)
+
+
+class TriggerPushServer(ThreadingHTTPServer):
+    """CI 등에서 트리거를 직접 넣는 로컬 HTTP 서버. 받은 트리거는 local-<n> ID를 받습니다."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], on_trigger: Callable[[dict], None], token: str = ""):
+        super().__init__(address, _PushHandler)
+        self.on_trigger = on_trigger
+        self.token = token
+        self.triggers: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def push(self, data: dict) -> dict:
+        with self._lock:
+            trigger_id = f"local-{self._next_id}"
+            self._next_id += 1
+            trigger = {
+                "id": trigger_id,
+                "status": "pending",
+                "testTarget": data.get("testTarget"),
+                "platform": data.get("platform", "android"),
+                "marker": data.get("marker"),
+                "requestedBy": data.get("requestedBy", "ci"),
+                "timeoutSec": data.get("timeoutSec"),
+                # testTarget="impacted"의 비교 기준 ref / 새 APK에서 바뀐 화면 (목록 또는 쉼표 구분 문자열)
+                "baseRef": data.get("baseRef"),
+                "changedScreens": data.get("changedScreens"),
+                "createdAt": datetime.now().isoformat(timespec="seconds"),
+            }
+            self.triggers[trigger_id] = trigger
+        print(f"[trigger_intake] 푸시 트리거 수신: {trigger_id}")
+        self.on_trigger(dict(trigger))
+        return trigger
+
+    def get(self, trigger_id: str) -> dict | None:
+        with self._lock:
+            trigger = self.triggers.get(trigger_id)
+            return dict(trigger) if trigger else None
+
+    def update_status(self, trigger_id: str, status: str, result: dict | None = None) -> bool:
+        """로컬 트리거면 상태를 갱신하고 True (대시보드로 보낼 필요 없음)."""
+        with self._lock:
+            trigger = self.triggers.get(trigger_id)
+            if trigger is None:
+                return False
+            trigger["status"] = status
+            if result:
+                trigger["result"] = result
+            trigger["updatedAt"] = datetime.now().isoformat(timespec="seconds")
+        return True
+
+
+def start_push_server(
+    on_trigger: Callable[[dict], None],
+    host: str = "127.0.0.1",
+    port: int = 0,
+    token: str = "",
+) -> TriggerPushServer:
+    """백그라운드 스레드에서 푸시 서버를 시작합니다. port=0이면 빈 포트를 자동 선택합니다."""
+    server = TriggerPushServer((host, port), on_trigger, token=token)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -18,9 +18,23 @@ if sys.platform == "win32":
   python tools/trigger_listener.py --manual --target local_transfer --marker smoke
   python tools/trigger_listener.py --manual --platform ios
 
-  # 폴링 모드 — Vercel API에서 트리거 대기 (대시보드 API 구축 후)
+  # 대기 모드 — Vercel API에서 트리거 대기 (SSE → long-poll → 폴링 순으로 자동 선택)
   python tools/trigger_listener.py
-  python tools/trigger_listener.py --interval 15
+  python tools/trigger_listener.py --intake poll --interval 15
+
+  # 변경 영향받는 테스트만 실행 (test_impact.py 영향 맵 기준)
+  python tools/trigger_listener.py --manual --target impacted
+  python tools/trigger_listener.py --manual --target impacted --impact-base origin/main
+
+  # CI에서 직접 트리거 푸시 (로컬 엔드포인트)
+  python tools/trigger_listener.py --push-port 8790
+  curl -X POST localhost:8790/trigger -d '{"testTarget": "gme1", "platform": "android"}'
+
+  # 디바이스별 병렬 실행 (config/devices.json 형식은 trigger_scheduler.py 참고)
+  python tools/trigger_listener.py --devices config/devices.json --job-timeout 900
+
+  # 웜 에뮬레이터 풀에서 작업마다 에뮬레이터 임대 (emulator_pool.py serve)
+  python tools/trigger_listener.py --emulator-pool http://127.0.0.1:8791
 
   # Teams 알림 없이 실행
   python tools/trigger_listener.py --manual --no-notify
@@ -29,11 +43,12 @@ if sys.platform == "win32":
 import argparse
 import json
 import re
+import signal
 import subprocess
+import tempfile
+import threading
 import time
 import urllib.request
-import urllib.error
-from datetime import datetime
 from pathlib import Path
 
 # 프로젝트 루트
@@ -52,8 +67,12 @@ except ImportError:
                 key, _, val = line.partition("=")
                 os.environ.setdefault(key.strip(), val.strip())
 
-# teams_notify 모듈 import
+# teams_notify 모듈 import (allure_model, failure_clusters, test_impact는 실행 후처리/영향 분석 때 import)
 sys.path.insert(0, str(Path(__file__).resolve().parent))
+from emulator_pool import PoolError, lease_emulator, pool_status, release_emulator
+from trigger_intake import INTAKE_MODES, TriggerIntake, start_push_server
+from trigger_scheduler import DEFAULT_JOB_TIMEOUT, DeviceSlot, Job, TriggerScheduler, load_device_slots
+
 try:
     from teams_notify import send_test_result, send_trigger_started, send_error
     TEAMS_AVAILABLE = True
@@ -75,20 +94,40 @@ TEST_TARGET_MAP = {
     "ios_contacts": "tests/ios/ios_contacts_test.py",
     "ios_first": "tests/ios/test_ios_first.py",
     # "all" → 전체 실행 (별도 처리)
+    # "impacted" → 변경 영향받는 테스트만 (test_impact.py, 맵이 없으면 전체)
 }
 
-# 타임스탬프 정규식 (Allure 결과 폴더)
-_TIMESTAMP_RE = re.compile(r"^\d{8}_\d{6}$")
+# 불안정 테스트 격리 레인 작업 ID 접미사
+QUARANTINE_LANE_SUFFIX = "#quarantine"
+
+# pytest 종료 코드: 선택된 테스트 없음 (격리로 대상 테스트가 모두 빠진 경우)
+PYTEST_NO_TESTS_COLLECTED = 5
+
+# 트리거 실행의 불안정 실패(타임아웃/stale element) 본문 재실행 횟수 (conftest 기본값은 0)
+FLAKY_RERUNS = 1
+
+# 디바이스 슬롯 설정 파일 (없으면 Android/iOS 슬롯 1개씩)
+DEFAULT_DEVICES_FILE = PROJECT_ROOT / "config" / "devices.json"
+
+# 웜 에뮬레이터 풀 임대 API (emulator_pool.py serve, 비어 있으면 사용 안 함)
+EMULATOR_POOL_URL = os.environ.get("EMULATOR_POOL_URL", "")
+
+# 타임아웃 시 SIGTERM 후 SIGKILL까지 기다리는 시간 (초)
+KILL_GRACE_SECONDS = 10
+
 
 
 def _resolve_pytest_args(target: str | None, marker: str | None,
-                         platform: str = "android") -> list[str]:
+                         platform: str = "android", selected: list[str] | None = None,
+                         quarantine: str = "off") -> list[str]:
     """트리거 옵션을 pytest 인자로 변환합니다.
 
     Args:
         target: 테스트 타겟 이름 (예: "local_transfer") 또는 None (전체)
         marker: pytest 마커 (예: "smoke") 또는 None
         platform: "android" 또는 "ios"
+        selected: target="impacted"일 때 영향 분석으로 고른 테스트 (None이면 전체)
+        quarantine: 불안정 테스트 격리 (off/exclude/only)
 
     Returns:
         pytest 인자 리스트 (예: ["tests/android/local_transfer_test.py", "-v"])
@@ -96,7 +135,9 @@ def _resolve_pytest_args(target: str | None, marker: str | None,
     args = []
 
     # 테스트 대상 결정
-    if target and target != "all":
+    if target == "impacted":
+        args.extend(selected or [f"tests/{platform}/"])
+    elif target and target != "all":
         if target in TEST_TARGET_MAP:
             args.append(TEST_TARGET_MAP[target])
         elif target.endswith(".py"):
@@ -120,6 +161,16 @@ def _resolve_pytest_args(target: str | None, marker: str | None,
     if marker:
         args.extend(["-m", marker])
 
+    # 테스트 영향 맵 기록 (다음 impacted 실행의 선택 근거)
+    args.append("--record-impact")
+
+    # 불안정 테스트 격리 (exclude: 본 실행, only: 격리 레인)
+    if quarantine != "off":
+        args.extend(["--quarantine", quarantine])
+
+    # 불안정 실패는 같은 세션에서 본문만 재실행
+    args.extend(["--flaky-reruns", str(FLAKY_RERUNS)])
+
     # 기본 옵션
     args.append("-v")
 
@@ -132,26 +183,15 @@ def _parse_allure_results(results_dir: Path) -> dict:
     Returns:
         {"passed": int, "failed": int, "broken": int, "skipped": int, "total": int, "duration": str}
     """
-    stats = {"passed": 0, "failed": 0, "broken": 0, "skipped": 0}
-    total_duration_ms = 0
-
     if not results_dir.exists():
-        return {**stats, "total": 0, "duration": "-"}
+        return {"passed": 0, "failed": 0, "broken": 0, "skipped": 0, "total": 0, "duration": "-"}
 
-    for f in results_dir.glob("*-result.json"):
-        try:
-            data = json.loads(f.read_text(encoding="utf-8"))
-            status = data.get("status", "unknown")
-            if status in stats:
-                stats[status] += 1
-
-            # 소요시간 합산
-            start = data.get("start", 0)
-            stop = data.get("stop", 0)
-            if stop > start:
-                total_duration_ms += (stop - start)
-        except (json.JSONDecodeError, OSError):
-            continue
+    from allure_model import load_results
+
+    model = load_results(results_dir)
+    counts = model.stats()
+    stats = {key: counts[key] for key in ("passed", "failed", "broken", "skipped")}
+    total_duration_ms = model.sum_duration_ms()
 
     total = sum(stats.values())
 
@@ -169,9 +209,10 @@ def _parse_allure_results(results_dir: Path) -> dict:
     return {**stats, "total": total, "duration": duration}
 
 
-def _get_env_info() -> dict:
-    """현재 환경 정보를 수집합니다."""
-    app_env = os.environ.get("APP_ENV", "stage")
+def _get_env_info(env: dict | None = None) -> dict:
+    """현재 환경 정보를 수집합니다 (env: 디바이스 슬롯 환경변수, 기본은 os.environ)."""
+    env = env if env is not None else os.environ
+    app_env = env.get("APP_ENV", "stage")
     platform = "Android"  # 기본값
 
     # APK 버전 추출 시도
@@ -187,7 +228,7 @@ def _get_env_info() -> dict:
                 app_version = match.group(1)
 
     # 디바이스 이름
-    device = os.environ.get("ANDROID_DEVICE_NAME", "Emulator")
+    device = env.get("ANDROID_DEVICE_NAME", "Emulator")
 
     return {
         "platform": platform,
@@ -196,9 +237,48 @@ def _get_env_info() -> dict:
     }
 
 
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """proc이 만든 프로세스 그룹 전체(run_allure → pytest → 자식)를 종료합니다."""
+    if sys.platform == "win32":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True)
+        proc.wait()
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+        proc.wait(timeout=KILL_GRACE_SECONDS)
+    except (ProcessLookupError, subprocess.TimeoutExpired):
+        pass
+    # 그룹 리더가 끝나도 남은 손자 프로세스까지 정리
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    proc.wait()
+
+
+def _run_process_group(cmd: list[str], cwd: str, env: dict, timeout: int) -> int:
+    """cmd를 새 프로세스 그룹으로 실행하고 종료 코드를 반환합니다.
+
+    subprocess.run(timeout=)은 직계 자식만 종료하므로 pytest가 고아로 남아 디바이스를
+    계속 점유합니다. 제한 시간을 넘기거나 중단되면 그룹 전체를 종료하고 예외를 다시 던집니다.
+    """
+    if sys.platform == "win32":
+        proc = subprocess.Popen(cmd, cwd=cwd, env=env, creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+    else:
+        proc = subprocess.Popen(cmd, cwd=cwd, env=env, start_new_session=True)
+    try:
+        return proc.wait(timeout=timeout)
+    except BaseException:
+        _kill_process_group(proc)
+        raise
+
+
 def run_tests(target: str | None = None, marker: str | None = None,
               platform: str = "android", notify: bool = True,
-              requested_by: str = "") -> dict:
+              requested_by: str = "", report_mode: str = "defer",
+              timeout: int = DEFAULT_JOB_TIMEOUT, env_overrides: dict | None = None,
+              impact_base: str | None = None, changed_screens: list[str] | None = None,
+              quarantine: str = "off", emulator_pool: str = "") -> dict:
     """pytest를 실행하고 결과를 반환합니다.
 
     Args:
@@ -207,16 +287,47 @@ def run_tests(target: str | None = None, marker: str | None = None,
         platform: "android" 또는 "ios"
         notify: Teams 알림 여부
         requested_by: 요청자 이름
+        report_mode: run_allure --report 값 (now/defer/skip)
+        timeout: 작업 제한 시간 (초)
+        env_overrides: 디바이스 슬롯 환경변수 (ANDROID_UDID, APPIUM_PORT 등)
+        impact_base: target="impacted"의 비교 기준 git ref (기본: 맵을 기록한 커밋)
+        changed_screens: target="impacted"에서 새 APK로 바뀐 화면(Activity) 목록
+        quarantine: 불안정 테스트 격리 (off/exclude/only, conftest --quarantine)
+        emulator_pool: Android 실행 시 에뮬레이터를 임대할 풀 API 주소 (emulator_pool.py)
 
     Returns:
         실행 결과 dict (teams_notify 형식)
     """
-    test_target_display = target or "전체"
+    test_target_display = (target or "전체") + (" (격리 레인)" if quarantine == "only" else "")
     print(f"\n{'='*60}")
     print(f"[trigger_listener] 테스트 실행 시작: {test_target_display}")
     print(f"[trigger_listener] 플랫폼: {platform}, 마커: {marker or '없음'}")
     print(f"{'='*60}\n")
 
+    # 영향 분석 (impacted) — 영향받는 테스트가 없으면 실행 생략
+    selected = None
+    if target == "impacted":
+        from test_impact import impacted_pytest_args
+
+        selected = impacted_pytest_args(
+            PROJECT_ROOT,
+            PROJECT_ROOT / "allure-results",
+            PROJECT_ROOT / "allure-reports",
+            platform,
+            base=impact_base,
+            screens=changed_screens,
+        )
+        if selected == []:
+            print("[trigger_listener] 변경 영향받는 테스트가 없습니다 — 실행 생략")
+            return {
+                "passed": 0, "failed": 0, "broken": 0, "skipped": 0, "total": 0,
+                "duration": "-",
+                "platform": platform.capitalize(),
+                "test_target": test_target_display,
+                "requested_by": requested_by,
+                "returncode": 0,
+            }
+
     # Teams 시작 알림
     if notify and TEAMS_AVAILABLE:
         send_trigger_started({
@@ -226,17 +337,18 @@ def run_tests(target: str | None = None, marker: str | None = None,
         })
 
     # pytest 인자 구성
-    pytest_args = _resolve_pytest_args(target, marker, platform)
+    pytest_args = _resolve_pytest_args(target, marker, platform, selected, quarantine)
     if not pytest_args:
         error_msg = f"테스트 타겟을 찾을 수 없습니다: {target}"
         if notify and TEAMS_AVAILABLE:
             send_error(error_msg, test_target_display)
         return {"error": error_msg}
 
-    # 타임스탬프 & 결과 디렉토리
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    results_dir = PROJECT_ROOT / "allure-results" / timestamp
+    # 결과 디렉토리 — run_allure.py가 만든 타임스탬프 폴더를 manifest로 전달받음
     reports_dir = PROJECT_ROOT / "allure-reports"
+    fd, manifest_name = tempfile.mkstemp(prefix="run_allure_", suffix=".json")
+    os.close(fd)
+    manifest_path = Path(manifest_name)
 
     # run_allure.py를 통해 실행 (히스토리 + 리포트 생성 + 업로드 포함)
     run_allure_script = Path(__file__).resolve().parent / "run_allure.py"
@@ -244,49 +356,79 @@ def run_tests(target: str | None = None, marker: str | None = None,
         sys.executable, str(run_allure_script),
         "--results-root", str(PROJECT_ROOT / "allure-results"),
         "--reports-root", str(reports_dir),
+        "--report", report_mode,
+        "--manifest", str(manifest_path),
         "--", *pytest_args,
     ]
 
     print(f"[trigger_listener] 실행 명령: {' '.join(cmd)}")
     start_time = time.time()
+    env = {**os.environ, **(env_overrides or {})}
+
+    # 웜 에뮬레이터 임대 — pytest 실행 동안만 점유하고 결과 집계 전에 반납
+    lease = None
+    emulator_healthy = True
+    if emulator_pool and platform == "android":
+        try:
+            lease = lease_emulator(emulator_pool, owner=requested_by or "trigger_listener", ttl=timeout + 300)
+        except PoolError as e:
+            error_msg = str(e)
+            print(f"[trigger_listener] ❌ {error_msg}")
+            if notify and TEAMS_AVAILABLE:
+                send_error(error_msg, test_target_display)
+            manifest_path.unlink(missing_ok=True)
+            return {"error": error_msg}
+        env.update(lease["env"])
+        print(f"[trigger_listener] 에뮬레이터 임대: {lease['serial']} ({lease['id']})")
 
     try:
-        proc = subprocess.run(
-            cmd,
-            cwd=str(PROJECT_ROOT),
-            env=os.environ.copy(),
-            timeout=600,  # 10분 타임아웃
-        )
-        returncode = proc.returncode
+        returncode = _run_process_group(cmd, str(PROJECT_ROOT), env, timeout)
     except subprocess.TimeoutExpired:
-        error_msg = "테스트 실행 타임아웃 (10분 초과)"
+        emulator_healthy = False
+        error_msg = f"테스트 실행 타임아웃 ({timeout}초 초과)"
         print(f"[trigger_listener] ❌ {error_msg}")
         if notify and TEAMS_AVAILABLE:
             send_error(error_msg, test_target_display)
-        return {"error": error_msg}
+        manifest = _read_manifest(manifest_path)
+        return {"error": error_msg, **({"timestamp": manifest["timestamp"]} if manifest else {})}
     except Exception as e:
         error_msg = f"테스트 실행 오류: {e}"
         print(f"[trigger_listener] ❌ {error_msg}")
         if notify and TEAMS_AVAILABLE:
             send_error(error_msg, test_target_display)
+        manifest_path.unlink(missing_ok=True)
         return {"error": error_msg}
+    finally:
+        if lease is not None:
+            release_emulator(lease["id"], emulator_pool, healthy=emulator_healthy)
+
+    if returncode == PYTEST_NO_TESTS_COLLECTED and quarantine != "off":
+        # 타겟의 테스트가 모두 격리 레인으로 빠졌으면 본 실행은 실패가 아님
+        print("[trigger_listener] 격리 적용 후 실행할 테스트가 없습니다 — 성공으로 처리")
+        returncode = 0
 
     elapsed = time.time() - start_time
     mins, secs = divmod(int(elapsed), 60)
     elapsed_str = f"{mins}분 {secs}초" if mins > 0 else f"{secs}초"
 
-    # Allure 결과 파싱
-    # run_allure.py가 생성한 타임스탬프 디렉토리 찾기
-    actual_results_dir = _find_latest_results_dir(PROJECT_ROOT / "allure-results")
-    if actual_results_dir:
-        stats = _parse_allure_results(actual_results_dir)
-        actual_timestamp = actual_results_dir.name
+    # Allure 결과 파싱 — 이 실행이 만든 폴더만 (동시 실행 중인 다른 작업과 섞이지 않음)
+    manifest = _read_manifest(manifest_path)
+    root_causes = None
+    if manifest:
+        stats = _parse_allure_results(Path(manifest["resultsDir"]))
+        actual_timestamp = manifest["timestamp"]
+        if stats["failed"] + stats["broken"]:
+            from failure_clusters import cluster_run
+
+            _, clusters = cluster_run(Path(manifest["resultsDir"]), PROJECT_ROOT / "allure-reports")
+            root_causes = clusters["rootCauses"]
     else:
+        print("[trigger_listener] run_allure manifest가 없습니다 — 결과 집계 불가")
         stats = {"passed": 0, "failed": 0, "broken": 0, "skipped": 0, "total": 0}
-        actual_timestamp = timestamp
+        actual_timestamp = ""
 
     # 환경 정보
-    env_info = _get_env_info()
+    env_info = _get_env_info(env)
 
     # 최종 결과
     result = {
@@ -299,6 +441,7 @@ def run_tests(target: str | None = None, marker: str | None = None,
         "timestamp": actual_timestamp,
         "requested_by": requested_by,
         "returncode": returncode,
+        **({"root_causes": root_causes} if root_causes is not None else {}),
     }
 
     # 결과 출력
@@ -316,41 +459,20 @@ def run_tests(target: str | None = None, marker: str | None = None,
     return result
 
 
-def _find_latest_results_dir(root: Path) -> Path | None:
-    """allure-results에서 가장 최근 타임스탬프 디렉토리를 찾습니다."""
-    if not root.exists():
-        return None
-    dirs = [p for p in root.iterdir() if p.is_dir() and _TIMESTAMP_RE.match(p.name)]
-    if not dirs:
-        return None
-    return sorted(dirs, key=lambda p: p.name)[-1]
-
-
-# ─── 폴링 모드 (Vercel API) ────────────────────────────────────────
-
-def _fetch_pending_trigger() -> dict | None:
-    """Vercel API에서 대기 중인 트리거를 조회합니다.
-
-    Returns:
-        트리거 정보 dict 또는 None
-    """
-    url = f"{DASHBOARD_API_URL}/api/trigger?status=pending"
-    req = urllib.request.Request(url, method="GET")
-    req.add_header("Accept", "application/json")
-
+def _read_manifest(path: Path) -> dict | None:
+    """run_allure --manifest 파일을 읽고 삭제합니다. 결과 폴더를 만들기 전에 끝났으면 None."""
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-            triggers = data.get("triggers", [])
-            if triggers:
-                return triggers[0]  # 가장 오래된 pending 트리거
-    except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError):
-        pass  # 폴링 실패는 조용히 무시 (다음 주기에 재시도)
-    except Exception:
-        pass
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = None
+    finally:
+        path.unlink(missing_ok=True)
+    if not isinstance(data, dict) or not data.get("resultsDir"):
+        return None
+    return data
 
-    return None
 
+# ─── 대기 모드 (Vercel API) ────────────────────────────────────────
 
 def _update_trigger_status(trigger_id: str, status: str, result: dict | None = None):
     """Vercel API에서 트리거 상태를 업데이트합니다."""
@@ -368,65 +490,168 @@ def _update_trigger_status(trigger_id: str, status: str, result: dict | None = N
 
     try:
         with urllib.request.urlopen(req, timeout=10) as resp:
-            print(f"[trigger_listener] 트리거 상태 업데이트: {status}")
+            print(f"[trigger_listener] 트리거 상태 업데이트: {trigger_id} → {status}")
     except Exception as e:
         print(f"[trigger_listener] 트리거 상태 업데이트 실패: {e}")
 
 
-def polling_loop(interval: int = 10, notify: bool = True):
-    """Vercel API를 폴링하며 트리거를 대기합니다.
+def _target_prefix(target: str | None, platform: str) -> str:
+    """트리거 타겟이 실행할 테스트의 allure fullName 접두사.
+
+    파일 타겟은 "tests.android.gme1_test#", 전체/impacted는 플랫폼 전체 ("tests.android.").
+    impacted는 영향 분석 전이라 범위를 알 수 없어 플랫폼 전체로 봅니다.
+    """
+    path = TEST_TARGET_MAP.get(target or "", target or "")
+    if path.endswith(".py"):
+        return path[:-3].replace("/", ".").replace("\\", ".") + "#"
+    return f"tests.{platform}."
+
+
+def _quarantined_tests(platform: str, target: str | None = None) -> list[str]:
+    """run_history가 갱신한 격리 목록 중 이 트리거가 실행할 테스트 (fullName)."""
+    from run_history import quarantine_path
+
+    try:
+        data = json.loads(quarantine_path(PROJECT_ROOT / "allure-reports").read_text(encoding="utf-8"))
+        names = [t["fullName"] for t in data.get("tests", [])]
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+    prefix = _target_prefix(target, platform)
+    return [name for name in names if name.startswith(f"tests.{platform}.") and name.startswith(prefix)]
+
+
+def _job_from_trigger(trigger: dict, default_timeout: int) -> Job:
+    """대시보드 트리거 dict → 스케줄러 작업. 트리거에 timeoutSec이 있으면 우선합니다."""
+    try:
+        timeout = int(trigger.get("timeoutSec") or default_timeout)
+    except (TypeError, ValueError):
+        timeout = default_timeout
+    options = {key: trigger[key] for key in ("baseRef", "changedScreens") if trigger.get(key)}
+    if isinstance(options.get("changedScreens"), str):
+        options["changedScreens"] = [s.strip() for s in options["changedScreens"].split(",") if s.strip()]
+    return Job(
+        trigger_id=str(trigger.get("id", "")),
+        platform=str(trigger.get("platform") or "android").lower(),
+        target=trigger.get("testTarget"),
+        marker=trigger.get("marker"),
+        requested_by=trigger.get("requestedBy", ""),
+        timeout=timeout,
+        options=options,
+    )
+
+
+def polling_loop(interval: int = 10, notify: bool = True, report_mode: str = "defer",
+                 slots: list[DeviceSlot] | None = None, job_timeout: int = DEFAULT_JOB_TIMEOUT,
+                 intake_mode: str = "auto", push_port: int = 0, push_host: str = "127.0.0.1",
+                 emulator_pool: str = ""):
+    """대시보드 트리거를 받아 디바이스 슬롯별로 병렬 실행합니다.
+
+    받은 트리거는 로컬에서 점유(lease)되어 다시 수신돼도 중복 실행되지 않고,
+    빈 디바이스가 생길 때까지 큐에서 대기합니다.
 
     Args:
-        interval: 폴링 간격 (초)
+        interval: 폴링 간격 / 오류 백오프 기준 (초)
         notify: Teams 알림 여부
+        report_mode: run_allure --report 값 (now/defer/skip)
+        slots: 디바이스 슬롯 (기본: config/devices.json 또는 Android/iOS 1개씩)
+        job_timeout: 작업당 기본 제한 시간 (초)
+        intake_mode: 수신 방식 (auto/sse/longpoll/poll)
+        push_port: 로컬 푸시 엔드포인트 포트 (0이면 사용 안 함)
+        push_host: 로컬 푸시 엔드포인트 바인드 호스트
+        emulator_pool: 웜 에뮬레이터 풀 API 주소 — Android 슬롯을 풀 크기만큼 만들고 작업마다 임대
     """
-    print(f"[trigger_listener] 폴링 모드 시작 (간격: {interval}초)")
+    slots = slots or load_device_slots(DEFAULT_DEVICES_FILE)
+    if emulator_pool:
+        try:
+            pool_size = pool_status(emulator_pool)["size"]
+            slots = [s for s in slots if s.platform != "android"] + [
+                DeviceSlot(f"pool-{i + 1}", "android") for i in range(pool_size)
+            ]
+        except (PoolError, KeyError) as e:
+            print(f"[trigger_listener] 에뮬레이터 풀 사용 불가 ({e}) → 디바이스 슬롯 설정 사용")
+            emulator_pool = ""
+    push_server = None
+
+    def run_job(job: Job, slot: DeviceSlot) -> dict:
+        return run_tests(
+            target=job.target,
+            marker=job.marker,
+            platform=job.platform,
+            notify=notify,
+            requested_by=job.requested_by,
+            report_mode=report_mode,
+            timeout=job.timeout,
+            env_overrides=slot.env,
+            impact_base=job.options.get("baseRef"),
+            changed_screens=job.options.get("changedScreens"),
+            quarantine=job.options.get("quarantine", "off"),
+            emulator_pool=emulator_pool,
+        )
+
+    def on_status(trigger_id: str, status: str, result: dict | None = None):
+        # 격리 레인은 대시보드 트리거가 아니므로 로그만
+        if trigger_id.endswith(QUARANTINE_LANE_SUFFIX):
+            print(f"[trigger_listener] 격리 레인 {trigger_id}: {status}")
+            return
+        # 로컬 푸시 트리거는 대시보드에 없으므로 푸시 서버 상태만 갱신
+        if push_server is not None and push_server.update_status(trigger_id, status, result):
+            return
+        _update_trigger_status(trigger_id, status, result)
+
+    scheduler = TriggerScheduler(slots, run_job, on_status)
+
+    def on_trigger(trigger: dict):
+        job = _job_from_trigger(trigger, job_timeout)
+        quarantined = _quarantined_tests(job.platform, job.target)
+        if quarantined:
+            job.options["quarantine"] = "exclude"
+        if not job.trigger_id or not scheduler.submit(job):
+            return
+        print(f"[trigger_listener] 🔔 트리거 감지! ID: {job.trigger_id}")
+        print(f"[trigger_listener]    타겟: {job.target or '전체'}, 플랫폼: {job.platform}")
+        if quarantined:
+            # 불안정 테스트는 별도 레인으로 (빈 디바이스가 있으면 본 실행과 병렬)
+            lane = _job_from_trigger(trigger, job_timeout)
+            lane.trigger_id += QUARANTINE_LANE_SUFFIX
+            lane.options["quarantine"] = "only"
+            scheduler.submit(lane)
+            print(f"[trigger_listener]    격리 레인: {len(quarantined)}개 테스트")
+
+    intake = TriggerIntake(DASHBOARD_API_URL, on_trigger, mode=intake_mode, interval=interval)
+    if push_port:
+        push_server = start_push_server(on_trigger, host=push_host, port=push_port,
+                                        token=os.environ.get("TRIGGER_PUSH_TOKEN", ""))
+
+    print(f"[trigger_listener] 대기 모드 시작 (수신: {intake_mode}, 작업 제한: {job_timeout}초)")
     print(f"[trigger_listener] API: {DASHBOARD_API_URL}/api/trigger")
+    if push_server is not None:
+        print(f"[trigger_listener] 푸시 엔드포인트: {push_server.base_url}/trigger")
+    print(f"[trigger_listener] 디바이스: {', '.join(f'{s.name}({s.platform})' for s in slots)}")
     print(f"[trigger_listener] Ctrl+C로 종료\n")
 
-    while True:
-        try:
-            trigger = _fetch_pending_trigger()
-            if trigger:
-                trigger_id = trigger.get("id", "")
-                target = trigger.get("testTarget")
-                platform = trigger.get("platform", "android")
-                requested_by = trigger.get("requestedBy", "")
-                marker = trigger.get("marker")
-
-                print(f"[trigger_listener] 🔔 트리거 감지! ID: {trigger_id}")
-                print(f"[trigger_listener]    타겟: {target or '전체'}, 플랫폼: {platform}")
-
-                # 상태 → running
-                _update_trigger_status(trigger_id, "running")
-
-                # 테스트 실행
-                result = run_tests(
-                    target=target,
-                    marker=marker,
-                    platform=platform,
-                    notify=notify,
-                    requested_by=requested_by,
-                )
-
-                # 상태 → complete 또는 failed
-                if "error" in result:
-                    _update_trigger_status(trigger_id, "failed", result)
-                else:
-                    _update_trigger_status(trigger_id, "complete", result)
-
-            time.sleep(interval)
-
-        except KeyboardInterrupt:
-            print("\n[trigger_listener] 폴링 중지.")
-            break
+    stop = threading.Event()
+    intake_thread = threading.Thread(target=intake.run, args=(stop,), name="trigger-intake", daemon=True)
+    intake_thread.start()
+    try:
+        while intake_thread.is_alive():
+            intake_thread.join(1.0)
+    except KeyboardInterrupt:
+        stop.set()
+        running = scheduler.running_jobs()
+        if running:
+            print(f"\n[trigger_listener] 실행 중 작업 {len(running)}건: "
+                  + ", ".join(f"{j.trigger_id}@{j.device}" for j in running))
+        scheduler.stop()
+        if push_server is not None:
+            push_server.shutdown()
+        print("\n[trigger_listener] 대기 중지.")
 
 
 # ─── CLI ─────────────────────────────────────────────────────────────
 
 def main():
     parser = argparse.ArgumentParser(
-        description="테스트 트리거 리스너 (수동/폴링 모드)",
+        description="테스트 트리거 리스너 (수동/대기 모드)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 사용 예시:
@@ -439,12 +664,13 @@ def main():
   # iOS 테스트 실행
   python tools/trigger_listener.py --manual --platform ios --target ios_first
 
-  # 폴링 모드 (대시보드 API 트리거 대기)
-  python tools/trigger_listener.py --interval 15
+  # 대기 모드 (대시보드 API 트리거 대기, CI 푸시 엔드포인트 포함)
+  python tools/trigger_listener.py --push-port 8790
 
 사용 가능한 테스트 타겟:
   """ + "\n  ".join(f"{k:20s} → {v}" for k, v in TEST_TARGET_MAP.items()) + """
   all                  → 플랫폼 전체 테스트
+  impacted             → 변경 영향받는 테스트만 (test_impact.py)
         """,
     )
 
@@ -460,10 +686,26 @@ def main():
     parser.add_argument("--platform", type=str, default="android",
                         choices=["android", "ios"],
                         help="테스트 플랫폼 (기본: android)")
+    parser.add_argument("--impact-base", type=str, default=None,
+                        help="--target impacted 비교 기준 git ref (기본: 영향 맵을 기록한 커밋)")
+    parser.add_argument("--changed-screens", type=str, default="",
+                        help="--target impacted: 새 APK에서 바뀐 화면(Activity), 쉼표 구분")
 
     # 폴링 옵션
     parser.add_argument("--interval", type=int, default=10,
-                        help="폴링 간격 초 (기본: 10)")
+                        help="폴링 간격 / 오류 재시도 기준 초 (기본: 10)")
+    parser.add_argument("--intake", type=str, default="auto", choices=INTAKE_MODES,
+                        help="트리거 수신 방식 (기본: auto — SSE → long-poll → 폴링)")
+    parser.add_argument("--push-port", type=int, default=0,
+                        help="CI 트리거 푸시용 로컬 HTTP 포트 (기본: 0 — 사용 안 함)")
+    parser.add_argument("--push-host", type=str, default="127.0.0.1",
+                        help="푸시 엔드포인트 바인드 호스트 (기본: 127.0.0.1)")
+    parser.add_argument("--devices", type=str, default=str(DEFAULT_DEVICES_FILE),
+                        help="디바이스 슬롯 설정 JSON (기본: config/devices.json, 없으면 Android/iOS 1개씩)")
+    parser.add_argument("--emulator-pool", type=str, default=EMULATOR_POOL_URL,
+                        help="웜 에뮬레이터 풀 API 주소 (emulator_pool.py serve, 기본: EMULATOR_POOL_URL)")
+    parser.add_argument("--job-timeout", type=int, default=DEFAULT_JOB_TIMEOUT,
+                        help=f"작업당 제한 시간 초 (기본: {DEFAULT_JOB_TIMEOUT}, 트리거의 timeoutSec이 우선)")
 
     # 알림 옵션
     parser.add_argument("--no-notify", action="store_true",
@@ -471,6 +713,15 @@ def main():
     parser.add_argument("--requested-by", type=str, default="",
                         help="요청자 이름 (Teams 카드에 표시)")
 
+    parser.add_argument("--quarantine", type=str, default="off",
+                        choices=["off", "exclude", "only"],
+                        help="수동 모드: 불안정 테스트 격리 (exclude=제외, only=격리 테스트만)")
+
+    # 리포트 옵션
+    parser.add_argument("--report", type=str, default="defer",
+                        choices=["now", "defer", "skip"],
+                        help="HTML 리포트 생성 시점 (기본: defer — 업로드 후 생성, skip — 생성 안 함)")
+
     args = parser.parse_args()
     notify = not args.no_notify
 
@@ -482,14 +733,30 @@ def main():
             platform=args.platform,
             notify=notify,
             requested_by=args.requested_by,
+            report_mode=args.report,
+            timeout=args.job_timeout,
+            impact_base=args.impact_base,
+            changed_screens=[s.strip() for s in args.changed_screens.split(",") if s.strip()],
+            quarantine=args.quarantine,
+            emulator_pool=args.emulator_pool,
         )
         # 종료 코드 반환
         if "error" in result:
             sys.exit(1)
         sys.exit(result.get("returncode", 0))
     else:
-        # 폴링 모드
-        polling_loop(interval=args.interval, notify=notify)
+        # 대기 모드
+        polling_loop(
+            interval=args.interval,
+            notify=notify,
+            report_mode=args.report,
+            slots=load_device_slots(Path(args.devices)),
+            job_timeout=args.job_timeout,
+            intake_mode=args.intake,
+            push_port=args.push_port,
+            push_host=args.push_host,
+            emulator_pool=args.emulator_pool,
+        )
 
 
 if __name__ == "__main__":
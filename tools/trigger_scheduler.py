@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""트리거 작업을 디바이스(Appium 서버) 슬롯별로 병렬 실행하는 스케줄러입니다.
+
+- 작업은 로컬 큐에 쌓이고, 플랫폼이 맞는 빈 슬롯이 생기면 먼저 들어온 순서대로 실행됩니다.
+- 슬롯마다 환경변수(ANDROID_UDID, APPIUM_PORT 등)를 덮어써서 pytest를 서로 다른 디바이스로 보냅니다.
+- 실행 중인 작업은 heartbeat 간격마다 진행 상황을 on_status로 알립니다.
+
+디바이스 설정 파일 (config/devices.json, 없으면 Android/iOS 슬롯 1개씩):
+  [
+    {"name": "pixel7", "platform": "android", "env": {"ANDROID_UDID": "emulator-5554", "APPIUM_PORT": "4723"}},
+    {"name": "galaxy", "platform": "android", "env": {"ANDROID_UDID": "R3CT30", "APPIUM_PORT": "4725"}},
+    {"name": "iphone", "platform": "ios", "env": {"APPIUM_PORT": "4724"}}
+  ]
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+DEFAULT_JOB_TIMEOUT = 600
+HEARTBEAT_INTERVAL = 30
+# 끝난 트리거 ID를 중복 수신 방지용으로 기억하는 시간 (초) — 대시보드 상태 갱신이 늦어도 재실행하지 않도록
+SEEN_RETENTION = 3600
+
+
+@dataclass
+class DeviceSlot:
+    name: str
+    platform: str
+    env: dict[str, str] = field(default_factory=dict)
+    busy: bool = False
+
+
+@dataclass
+class Job:
+    trigger_id: str
+    platform: str = "android"
+    target: str | None = None
+    marker: str | None = None
+    requested_by: str = ""
+    timeout: int = DEFAULT_JOB_TIMEOUT
+    # 트리거의 부가 옵션 (baseRef, changedScreens 등)
+    options: dict = field(default_factory=dict)
+    enqueued_at: float = field(default_factory=time.time)
+    started_at: float = 0.0
+    device: str = ""
+
+
+def load_device_slots(path: Path | None) -> list[DeviceSlot]:
+    """디바이스 설정 파일을 읽습니다. 없거나 잘못되면 플랫폼별 기본 슬롯 1개씩."""
+    if path and path.exists():
+        try:
+            items = json.loads(path.read_text(encoding="utf-8"))
+            slots = [
+                DeviceSlot(
+                    name=str(item["name"]),
+                    platform=str(item.get("platform", "android")).lower(),
+                    env={str(k): str(v) for k, v in (item.get("env") or {}).items()},
+                )
+                for item in items
+            ]
+            if slots:
+                return slots
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"[scheduler] 디바이스 설정 오류 ({path}): {e} → 기본 슬롯 사용")
+    return [DeviceSlot("android", "android"), DeviceSlot("ios", "ios")]
+
+
+def _now_iso() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class TriggerScheduler:
+    """작업 큐 + 디바이스 슬롯 배정.
+
+    Args:
+        slots: 디바이스 슬롯 목록
+        run_job: (job, slot) → 결과 dict. 결과에 "error"가 있으면 실패로 처리
+        on_status: (trigger_id, status, payload) 상태 알림 콜백
+    """
+
+    def __init__(
+        self,
+        slots: list[DeviceSlot],
+        run_job: Callable[[Job, DeviceSlot], dict],
+        on_status: Callable[[str, str, dict | None], None],
+        heartbeat_interval: float = HEARTBEAT_INTERVAL,
+        seen_retention: float = SEEN_RETENTION,
+    ):
+        self.slots = slots
+        self._run_job = run_job
+        self._on_status = on_status
+        self._heartbeat_interval = heartbeat_interval
+        self._queue: deque[Job] = deque()
+        self._running: dict[str, Job] = {}
+        # 받은 트리거 ID → 끝난 시각 (대기/실행 중이면 0.0)
+        self._leased: dict[str, float] = {}
+        self._seen_retention = seen_retention
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="trigger-dispatch", daemon=True)
+        self._dispatcher.start()
+
+    # ─── 큐 ─────────────────────────────────────────────
+
+    def submit(self, job: Job) -> bool:
+        """작업을 큐에 넣습니다. 이미 받은 트리거(같은 ID)면 False."""
+        with self._cond:
+            self._prune_leased()
+            if job.trigger_id in self._leased:
+                return False
+            if not any(slot.platform == job.platform for slot in self.slots):
+                self._leased[job.trigger_id] = time.time()
+                threading.Thread(
+                    target=self._on_status,
+                    args=(job.trigger_id, "failed", {"error": f"{job.platform} 디바이스 슬롯이 없습니다"}),
+                    daemon=True,
+                ).start()
+                return False
+            self._leased[job.trigger_id] = 0.0
+            self._queue.append(job)
+            self._cond.notify_all()
+        print(f"[scheduler] 큐 등록: {job.trigger_id} ({job.platform}, 대기 {self.pending_count()}건)")
+        return True
+
+    def _prune_leased(self) -> None:
+        """seen_retention보다 오래전에 끝난 트리거 ID를 잊습니다 (호출자가 lock 보유)."""
+        cutoff = time.time() - self._seen_retention
+        for trigger_id in [t for t, done_at in self._leased.items() if 0 < done_at < cutoff]:
+            del self._leased[trigger_id]
+
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+    def running_jobs(self) -> list[Job]:
+        with self._cond:
+            return list(self._running.values())
+
+    def idle(self) -> bool:
+        with self._cond:
+            return not self._queue and not self._running
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._cond:
+            while self._queue or self._running:
+                remaining = deadline - time.time() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    # ─── 배정 / 실행 ─────────────────────────────────────────────
+
+    def _next_assignment(self) -> tuple[Job, DeviceSlot] | None:
+        """빈 슬롯에 배정할 수 있는 가장 오래된 작업 (호출자가 lock 보유)."""
+        for job in self._queue:
+            for slot in self.slots:
+                if not slot.busy and slot.platform == job.platform:
+                    return job, slot
+        return None
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            with self._cond:
+                assignment = self._next_assignment()
+                while assignment is None and not self._stopped:
+                    self._cond.wait()
+                    assignment = self._next_assignment()
+                if self._stopped:
+                    return
+                job, slot = assignment
+                self._queue.remove(job)
+                slot.busy = True
+                job.device = slot.name
+                job.started_at = time.time()
+                self._running[job.trigger_id] = job
+            threading.Thread(
+                target=self._execute, args=(job, slot), name=f"job-{job.trigger_id}", daemon=True
+            ).start()
+
+    def _heartbeat(self, job: Job, done: threading.Event) -> None:
+        while not done.wait(self._heartbeat_interval):
+            self._on_status(job.trigger_id, "running", {
+                "device": job.device,
+                "elapsedSec": int(time.time() - job.started_at),
+                "timeoutSec": job.timeout,
+            })
+
+    def _execute(self, job: Job, slot: DeviceSlot) -> None:
+        waited = job.started_at - job.enqueued_at
+        print(f"[scheduler] 실행: {job.trigger_id} → {slot.name} (대기 {waited:.0f}s, 제한 {job.timeout}s)")
+        self._on_status(job.trigger_id, "running", {"device": slot.name, "startedAt": _now_iso()})
+
+        done = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job, done), daemon=True)
+        heartbeat.start()
+        try:
+            result = self._run_job(job, slot)
+        except Exception as e:
+            result = {"error": f"작업 실행 오류: {e}"}
+        finally:
+            done.set()
+
+        result = {**result, "device": slot.name}
+        self._on_status(job.trigger_id, "failed" if "error" in result else "complete", result)
+
+        with self._cond:
+            slot.busy = False
+            self._running.pop(job.trigger_id, None)
+            self._leased[job.trigger_id] = time.time()
+            self._cond.notify_all()
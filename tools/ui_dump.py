@@ -30,6 +30,14 @@ sys.path.insert(0, PROJECT_ROOT)
 
 from config.capabilities import ANDROID_CAPS, get_appium_server_url
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from image_utils import frame_change_ratio, screen_frame
+
+# Watch 모드: 축소 프레임 블록 변화가 이 비율 이상일 때만 page_source 조회
+WATCH_FRAME_CHANGE_RATIO = 0.01
+# 프레임 변화가 없어도 이 간격(초)마다 page_source 재확인 (프레임 없이 바뀌는 계층 대비)
+WATCH_FORCE_REFRESH = 5.0
+
 
 # =============================================================================
 # 민감 정보 마스킹 기능
@@ -506,6 +514,7 @@ def watch_mode(interval: float = 0.2):
     print("=" * 50)
     print()
     print("  화면이 변경되면 자동으로 캡처됩니다.")
+    print("  (스크린샷 프레임이 바뀔 때만 UI 계층을 조회, MJPEG_URL 설정 시 스트림 프레임 사용)")
     print("  [Ctrl+C] 종료")
     print()
 
@@ -549,6 +558,8 @@ def watch_mode(interval: float = 0.2):
     last_screen_hash = None
     last_screen_name = None
     captured_screens = set()  # 이미 캡처한 화면 이름 추적
+    last_frame = None
+    last_fetch = 0.0
 
     print("-" * 50)
     print("감시 시작! 앱에서 화면을 이동해보세요.")
@@ -558,6 +569,19 @@ def watch_mode(interval: float = 0.2):
     try:
         while True:
             try:
+                # 축소 스크린샷(MJPEG_URL이 있으면 스트림 프레임)이 그대로면 page_source 생략
+                frame = screen_frame(driver)
+                now = time.monotonic()
+                if (
+                    frame is not None
+                    and frame_change_ratio(last_frame, frame) < WATCH_FRAME_CHANGE_RATIO
+                    and now - last_fetch < WATCH_FORCE_REFRESH
+                ):
+                    time.sleep(interval)
+                    continue
+                last_frame = frame
+                last_fetch = now
+
                 page_source = driver.page_source
                 current_hash = _get_screen_hash(page_source)
 
@@ -1,5 +1,6 @@
 import argparse
 import json
+import os
 import re
 import subprocess
 from dataclasses import dataclass
@@ -7,6 +8,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from allure_model import load_report
+from file_lock import file_lock
+from run_history import build_trends, default_db_path, ingest_results, quarantine_path, write_quarantine
+
 
 _TIMESTAMP_DIR_RE = re.compile(r"^\d{8}_\d{6}$")
 
@@ -22,6 +27,8 @@ class RunSummary:
     suites: list[dict[str, int | str]]
     behaviors: list[dict[str, int | str]]
     packages: list[dict[str, int | str]]
+    # False면 위젯만 있고 HTML 리포트(index.html)는 없음 (run_allure --report defer/skip)
+    has_report: bool = True
 
 
 def _read_json(path: Path) -> dict[str, Any] | None:
@@ -115,8 +122,14 @@ def _extract_widget_items(data: dict[str, Any] | None) -> list[dict[str, int | s
     return output
 
 
-def _load_run_summary(report_dir: Path) -> RunSummary | None:
-    summary = _read_json(report_dir / "widgets" / "summary.json")
+def _results_dir(report_dir: Path, results_root: Path | None = None) -> Path:
+    """allure-reports/<ts>에 대응하는 allure-results/<ts> (기본: reports 루트와 같은 위치)."""
+    return (results_root or report_dir.parent.parent / "allure-results") / report_dir.name
+
+
+def _load_run_summary(report_dir: Path, results_root: Path | None = None) -> RunSummary | None:
+    model = load_report(report_dir)
+    summary = model.widget("summary") if model else None
     if not summary:
         return None
 
@@ -143,11 +156,11 @@ def _load_run_summary(report_dir: Path) -> RunSummary | None:
         "sumDuration": _safe_int(time_raw.get("sumDuration"), 0),
     }
 
-    executors = _read_json(report_dir / "widgets" / "executors.json")
-    environment = _read_json(report_dir / "widgets" / "environment.json")
-    suites = _extract_widget_items(_read_json(report_dir / "widgets" / "suites.json"))
-    behaviors = _extract_widget_items(_read_json(report_dir / "widgets" / "behaviors.json"))
-    packages = _extract_widget_items(_read_json(report_dir / "widgets" / "packages.json"))
+    executors = model.widget("executors")
+    environment = model.widget("environment")
+    suites = _extract_widget_items(model.widget("suites"))
+    behaviors = _extract_widget_items(model.widget("behaviors"))
+    packages = _extract_widget_items(model.widget("packages"))
 
     executor_first = {}
     if isinstance(executors, list):
@@ -171,8 +184,7 @@ def _load_run_summary(report_dir: Path) -> RunSummary | None:
 
     # Allure CLI가 environment.properties를 Latin-1로 읽어 한글이 깨지는 문제 보정
     # allure-results 원본 파일에서 UTF-8로 직접 읽어 덮어쓰기
-    results_dir = report_dir.parent.parent / "allure-results" / report_dir.name
-    env_props = results_dir / "environment.properties"
+    env_props = _results_dir(report_dir, results_root) / "environment.properties"
     if env_props.exists():
         try:
             for line in env_props.read_text(encoding="utf-8").splitlines():
@@ -195,67 +207,159 @@ def _load_run_summary(report_dir: Path) -> RunSummary | None:
         suites=suites,
         behaviors=behaviors,
         packages=packages,
+        has_report=(report_dir / "index.html").exists(),
     )
 
 
-def update_dashboard(reports_root: Path) -> Path:
+_MANIFEST_NAME = "manifest.json"
+_MANIFEST_VERSION = 1
+
+# _load_run_summary가 읽는 위젯 파일 (변경 감지용)
+_SUMMARY_WIDGETS = (
+    "summary.json",
+    "executors.json",
+    "environment.json",
+    "suites.json",
+    "behaviors.json",
+    "packages.json",
+)
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 절반만 쓰인 JSON을 보지 않도록 합니다."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _run_signature(report_dir: Path, results_root: Path | None = None) -> str:
+    """리포트 폴더의 입력 파일 mtime/size로 변경 감지용 서명을 만듭니다."""
+    paths = [report_dir / "widgets" / name for name in _SUMMARY_WIDGETS]
+    paths.append(_results_dir(report_dir, results_root) / "environment.properties")
+    # HTML 리포트 생성 여부 (hasReport)
+    paths.append(report_dir / "index.html")
+    parts: list[str] = []
+    for path in paths:
+        try:
+            st = path.stat()
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
+
+
+def _load_manifest(path: Path) -> dict[str, Any]:
+    data = _read_json(path)
+    if not isinstance(data, dict) or data.get("version") != _MANIFEST_VERSION:
+        return {"version": _MANIFEST_VERSION, "runs": {}, "gitMessages": {}}
+    data.setdefault("runs", {})
+    data.setdefault("gitMessages", {})
+    return data
+
+
+def _build_run_entry(r: RunSummary, repo_root: Path, git_messages: dict[str, str]) -> dict[str, Any]:
+    """RunSummary를 runs.json 항목으로 변환합니다. git 메시지는 커밋별로 메모이즈합니다."""
+    env = dict(r.environment or {})
+    build_name = r.executor.get("buildName", "")
+    branch = str(env.get("gitBranch") or "").strip()
+    commit = str(env.get("gitCommit") or "").strip()
+    message = str(env.get("gitMessage") or "").strip()
+    if not branch or not commit:
+        parsed_branch, parsed_commit = _extract_branch_commit(build_name)
+        branch = branch or parsed_branch
+        commit = commit or parsed_commit
+    if not message and commit:
+        if commit not in git_messages:
+            git_messages[commit] = _safe_git_message(repo_root, commit)
+        message = git_messages[commit]
+    env.update({"gitBranch": branch or None, "gitCommit": commit or None, "gitMessage": message or None})
+    return {
+        "timestamp": r.timestamp,
+        "href": f"/allure-reports/{r.timestamp}/index.html",
+        "hasReport": r.has_report,
+        "reportName": r.report_name,
+        "stats": r.stats,
+        "time": r.time,
+        "durationText": _duration_ms_to_hms(r.time.get("duration", 0)),
+        "executor": {
+            "name": r.executor.get("name", ""),
+            "type": r.executor.get("type", ""),
+            "buildName": r.executor.get("buildName", ""),
+            "buildUrl": r.executor.get("buildUrl", ""),
+        },
+        "environment": env,
+        "suites": r.suites,
+        "behaviors": r.behaviors,
+        "packages": r.packages,
+    }
+
+
+def update_dashboard(reports_root: Path, results_root: Path | None = None) -> Path:
     dashboard_dir = reports_root / "dashboard"
     dashboard_dir.mkdir(parents=True, exist_ok=True)
+    # 병렬 트리거 작업이 동시에 갱신할 수 있으므로 manifest 읽기부터 HTML 쓰기까지 잠금
+    with file_lock(dashboard_dir / _MANIFEST_NAME):
+        return _update_dashboard_locked(reports_root, dashboard_dir, results_root)
+
+
+def _update_dashboard_locked(reports_root: Path, dashboard_dir: Path, results_root: Path | None) -> Path:
     repo_root = reports_root.resolve().parent
+    results_root = results_root or reports_root.parent / "allure-results"
+
+    # manifest: 타임스탬프별 입력 파일 서명 + 변환된 runs.json 항목 캐시
+    # 서명이 같은 폴더는 다시 파싱하지 않음 (summary.json이 없는 폴더도 기록해 재시도 방지)
+    manifest_path = dashboard_dir / _MANIFEST_NAME
+    manifest = _load_manifest(manifest_path)
+    cached_runs: dict[str, Any] = manifest["runs"]
+    git_messages: dict[str, str] = manifest["gitMessages"]
 
-    runs: list[RunSummary] = []
+    next_runs: dict[str, Any] = {}
+    parsed = 0
     for child in reports_root.iterdir():
         if not child.is_dir():
             continue
         if not _TIMESTAMP_DIR_RE.match(child.name):
             continue
-        run = _load_run_summary(child)
-        if run:
-            runs.append(run)
+        signature = _run_signature(child, results_root)
+        cached = cached_runs.get(child.name)
+        if cached and cached.get("signature") == signature:
+            next_runs[child.name] = cached
+            continue
+        run = _load_run_summary(child, results_root)
+        parsed += 1
+        next_runs[child.name] = {
+            "signature": signature,
+            "entry": _build_run_entry(run, repo_root, git_messages) if run else None,
+        }
 
     # Latest first
-    runs.sort(key=lambda r: r.timestamp, reverse=True)
-
-    # Build runs.json
-    payload: list[dict[str, Any]] = []
-    for r in runs:
-        env = dict(r.environment or {})
-        build_name = r.executor.get("buildName", "")
-        branch = str(env.get("gitBranch") or "").strip()
-        commit = str(env.get("gitCommit") or "").strip()
-        message = str(env.get("gitMessage") or "").strip()
-        if not branch or not commit:
-            parsed_branch, parsed_commit = _extract_branch_commit(build_name)
-            branch = branch or parsed_branch
-            commit = commit or parsed_commit
-        if not message and commit:
-            message = _safe_git_message(repo_root, commit)
-        env.update({"gitBranch": branch or None, "gitCommit": commit or None, "gitMessage": message or None})
-        payload.append(
-            {
-                "timestamp": r.timestamp,
-                "href": f"/allure-reports/{r.timestamp}/index.html",
-                "reportName": r.report_name,
-                "stats": r.stats,
-                "time": r.time,
-                "durationText": _duration_ms_to_hms(r.time.get("duration", 0)),
-                "executor": {
-                    "name": r.executor.get("name", ""),
-                    "type": r.executor.get("type", ""),
-                    "buildName": r.executor.get("buildName", ""),
-                    "buildUrl": r.executor.get("buildUrl", ""),
-                },
-                "environment": env,
-                "suites": r.suites,
-                "behaviors": r.behaviors,
-                "packages": r.packages,
-            }
-        )
-
-    (dashboard_dir / "runs.json").write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
+    payload: list[dict[str, Any]] = [
+        next_runs[ts]["entry"]
+        for ts in sorted(next_runs, reverse=True)
+        if next_runs[ts].get("entry")
+    ]
+
+    _write_json_atomic(dashboard_dir / "runs.json", payload)
+    _write_json_atomic(
+        manifest_path,
+        {"version": _MANIFEST_VERSION, "runs": next_runs, "gitMessages": git_messages},
     )
+    print(f"[update_dashboard] runs: {len(payload)} (parsed: {parsed}, cached: {len(next_runs) - parsed})")
+
+    # 테스트별 소요시간 추이 (run_history DB에 새 실행만 누적)
+    db_path = default_db_path(reports_root)
+    try:
+        ingest_results(results_root, db_path)
+        trends = build_trends(db_path)
+        # 불안정 테스트 격리 목록 (conftest --quarantine, trigger_listener 격리 레인이 사용)
+        write_quarantine(db_path, quarantine_path(reports_root))
+    except Exception as e:
+        print(f"[update_dashboard] run history skipped: {e}")
+        trends = []
+    _write_json_atomic(dashboard_dir / "trends.json", trends)
 
     # Static dashboard HTML/CSS
     (dashboard_dir / "styles.css").write_text(
@@ -302,6 +406,13 @@ tr:hover td{background:rgba(255,255,255,.03)}
 .ellipsis{max-width:260px;white-space:nowrap;overflow:hidden;text-overflow:ellipsis}
 .result{font-weight:700;font-style:italic}
 .footer{margin-top:12px;color:var(--muted);font-size:12px}
+.section-title{margin:28px 0 10px;font-size:16px;font-weight:700}
+.spark{display:inline-flex;gap:2px;align-items:flex-end;height:22px}
+.spark i{display:block;width:4px;background:var(--passed);border-radius:1px}
+.spark i.failed{background:var(--failed)}
+.spark i.broken{background:var(--broken)}
+.spark i.skipped{background:var(--skipped)}
+.slow{color:var(--failed);font-weight:700}
 """,
         encoding="utf-8",
     )
@@ -362,6 +473,23 @@ tr:hover td{background:rgba(255,255,255,.03)}
     </div>
 
     <div class="footer" id="meta"></div>
+
+    <div class="section-title">Test Duration Trends (p50 / p95)</div>
+    <div class="card">
+      <table class="table" id="trends">
+        <thead>
+          <tr>
+            <th style="text-align:left">Test</th>
+            <th style="width:70px">Runs</th>
+            <th style="width:80px">p50</th>
+            <th style="width:80px">p95</th>
+            <th style="width:80px">Latest</th>
+            <th style="width:180px">History</th>
+          </tr>
+        </thead>
+        <tbody></tbody>
+      </table>
+    </div>
   </div>
 
 <script>
@@ -459,7 +587,9 @@ tr:hover td{background:rgba(255,255,255,.03)}
     const ts = formatTimestamp(run.timestamp);
     return `
       <tr>
-        <td style="text-align:left"><a href="${href}"><div>${ts.date}</div><div class="small">${ts.time}</div></a></td>
+        <td style="text-align:left">${run.hasReport === false
+          ? `<div>${ts.date}</div><div class="small">${ts.time} · no report</div>`
+          : `<a href="${href}"><div>${ts.date}</div><div class="small">${ts.time}</div></a>`}</td>
         <td style="text-align:left">
           <div><strong>${deviceName}</strong></div>
           ${osLine ? `<div class="small">${osLine}</div>` : ''}
@@ -572,6 +702,36 @@ tr:hover td{background:rgba(255,255,255,.03)}
     const meta = document.getElementById('meta');
     meta.textContent = 'runs.json 로딩 실패: ' + err;
   });
+
+  const sec = (ms) => ((ms || 0) / 1000).toFixed(1) + 's';
+
+  function trendRow(t) {
+    const history = Array.isArray(t.history) ? t.history : [];
+    const maxMs = Math.max(1, ...history.map(h => h.durationMs || 0));
+    const bars = history.map(h => {
+      const height = Math.max(2, Math.round((h.durationMs || 0) / maxMs * 22));
+      return `<i class="${fmt(h.status)}" style="height:${height}px" title="${fmt(h.timestamp)} · ${sec(h.durationMs)}"></i>`;
+    }).join('');
+    // 최신 소요시간이 p95를 넘으면 강조
+    const slow = t.latestStatus === 'passed' && t.p95 > 0 && t.latestMs > t.p95;
+    return `
+      <tr>
+        <td style="text-align:left"><div>${fmt(t.name)}</div><div class="small ellipsis" style="max-width:520px">${fmt(t.fullName)}</div></td>
+        <td>${fmt(t.runs)}</td>
+        <td>${sec(t.p50)}</td>
+        <td>${sec(t.p95)}</td>
+        <td class="${slow ? 'slow' : ''}">${sec(t.latestMs)}</td>
+        <td><span class="spark">${bars}</span></td>
+      </tr>
+    `;
+  }
+
+  fetch('trends.json', { cache: 'no-store' })
+    .then(res => res.json())
+    .then(trends => {
+      document.querySelector('#trends tbody').innerHTML = trends.map(trendRow).join('');
+    })
+    .catch(() => {});
 </script>
 </body>
 </html>
@@ -585,10 +745,16 @@ tr:hover td{background:rgba(255,255,255,.03)}
 def main() -> int:
     parser = argparse.ArgumentParser(description="Generate a simple dashboard for allure-reports history.")
     parser.add_argument("--reports-root", default="allure-reports", help="Allure reports root directory")
+    parser.add_argument(
+        "--results-root",
+        default=None,
+        help="Allure results root directory (default: <reports-root>/../allure-results)",
+    )
     args = parser.parse_args()
 
     reports_root = Path(args.reports_root)
-    dashboard_dir = update_dashboard(reports_root)
+    results_root = Path(args.results_root) if args.results_root else None
+    dashboard_dir = update_dashboard(reports_root, results_root)
     print(f"[update_dashboard] dashboard: {dashboard_dir}")
     print(f"[update_dashboard] open     : {dashboard_dir / 'index.html'}")
     return 0
@@ -1,709 +1,997 @@
-# -*- coding: utf-8 -*-
-import sys
-import os
-# Windows cp949 인코딩 문제 방지
-if sys.platform == "win32":
-    os.environ.setdefault("PYTHONIOENCODING", "utf-8")
-    if hasattr(sys.stdout, "reconfigure"):
-        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
-    if hasattr(sys.stderr, "reconfigure"):
-        sys.stderr.reconfigure(encoding="utf-8", errors="replace")
-
-"""Allure 테스트 결과를 Next.js 대시보드 API로 업로드합니다.
-
-사용법:
-  # 단일 타임스탬프 업로드 (메타데이터 + 첨부파일)
-  python tools/upload_to_dashboard.py 20260216_024413
-
-  # 모든 기존 리포트 일괄 업로드 (마이그레이션)
-  python tools/upload_to_dashboard.py --all
-
-  # 메타데이터만 업로드 (첨부파일 제외)
-  python tools/upload_to_dashboard.py --no-attachments 20260216_024413
-
-  # 커스텀 대시보드 URL
-  python tools/upload_to_dashboard.py --dashboard-url https://my-dashboard.vercel.app 20260216_024413
-"""
-
-import argparse
-import json
-import os
-import re
-import subprocess
-import sys
-import urllib.request
-import urllib.error
-from pathlib import Path
-
-# .env 파일 자동 로드 (python-dotenv가 있으면 사용, 없으면 수동 파싱)
-_env_file = Path(__file__).resolve().parent.parent / ".env"
-try:
-    from dotenv import load_dotenv
-    load_dotenv(_env_file)
-except ImportError:
-    if _env_file.exists():
-        for line in _env_file.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, _, val = line.partition("=")
-                os.environ.setdefault(key.strip(), val.strip())
-
-# update_dashboard.py의 로직을 재사용
-sys.path.insert(0, str(Path(__file__).resolve().parent))
-from update_dashboard import (
-    _load_run_summary,
-    _extract_branch_commit,
-    _duration_ms_to_hms,
-    _safe_git_message,
-    _TIMESTAMP_DIR_RE,
-    _read_json,
-)
-
-DEFAULT_DASHBOARD_URL = os.environ.get("DASHBOARD_URL", "https://your-dashboard.vercel.app")
-
-# ─── AI 분석 ─────────────────────────────────────────────
-
-def _analyze_failed_case(test_name: str, error_message: str, status_trace: str,
-                         screenshot_path: str | None, page_source_path: str | None) -> str:
-    """AI API로 실패한 테스트 케이스를 분석합니다.
-
-    Returns:
-        분석 결과 텍스트. API 키 미설정이나 오류 시 빈 문자열.
-    """
-    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-    gateway_key = os.environ.get("AI_GATEWAY_API_KEY", "")
-
-    if not api_key and not gateway_key:
-        return ""
-
-    try:
-        import base64
-
-        # API 설정 (AI Gateway 우선)
-        if gateway_key:
-            headers = {
-                "x-api-key": gateway_key,
-                "Content-Type": "application/json",
-                "anthropic-version": "2023-06-01",
-            }
-            url = os.environ.get("AI_GATEWAY_URL", "https://ai-gateway.vercel.sh/v1/messages")
-            model = os.environ.get("AI_MODEL_GATEWAY", "anthropic/claude-sonnet-4-6")
-        else:
-            headers = {
-                "x-api-key": api_key,
-                "Content-Type": "application/json",
-                "anthropic-version": "2023-06-01",
-            }
-            url = os.environ.get("AI_API_URL", "https://api.anthropic.com/v1/messages")
-            model = os.environ.get("AI_MODEL", "claude-sonnet-4-6")
-
-        # 프롬프트 구성
-        prompt = f"""당신은 모바일 앱 QA 자동화 테스트 분석 전문가입니다.
-아래 실패한 테스트 케이스를 분석하고, **이슈 발생 사유**와 **수정 방향**을 간결하게 한국어로 설명해주세요.
-
-## 테스트 정보
-- **테스트명**: {test_name}
-- **에러 메시지**: {error_message}
-"""
-        if status_trace:
-            prompt += f"\n## 스택 트레이스 (앞부분)\n```\n{status_trace[:1500]}\n```\n"
-
-        # page_source 일부
-        if page_source_path and os.path.isfile(page_source_path):
-            try:
-                with open(page_source_path, "r", encoding="utf-8") as f:
-                    snippet = f.read(1000)
-                prompt += f"\n## Page Source (일부)\n```xml\n{snippet}\n```\n"
-            except Exception:
-                pass
-
-        prompt += """
-## 요청사항
-1. **이슈 발생 사유**: 왜 이 테스트가 실패했는지 (1~2문장)
-2. **수정 방향**: 어떻게 수정하면 되는지 (구체적 액션, 1~3줄)
-
-간결하게 답변해주세요."""
-
-        content = [{"type": "text", "text": prompt}]
-
-        # 스크린샷 이미지 추가
-        if screenshot_path and os.path.isfile(screenshot_path):
-            try:
-                with open(screenshot_path, "rb") as f:
-                    img_data = base64.b64encode(f.read()).decode("utf-8")
-                content.append({
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": "image/png",
-                        "data": img_data,
-                    },
-                })
-                content.append({
-                    "type": "text",
-                    "text": "위 스크린샷은 테스트 실패 시점의 앱 화면입니다. 화면 상태도 참고하여 분석해주세요.",
-                })
-            except Exception:
-                pass
-
-        payload = json.dumps({
-            "model": model,
-            "max_tokens": 500,
-            "messages": [{"role": "user", "content": content}],
-        }).encode("utf-8")
-
-        req = urllib.request.Request(url, data=payload, headers=headers, method="POST")
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
-            blocks = result.get("content", [])
-            texts = [b["text"] for b in blocks if b.get("type") == "text"]
-            return "\n".join(texts) if texts else ""
-
-    except Exception as e:
-        print(f"    [ai] 분석 실패: {e}")
-        return ""
-
-
-def _find_attachment_path(results_dir: Path, result_json: dict, suffix: str) -> str | None:
-    """allure result.json의 attachments에서 특정 확장자 파일 경로를 찾습니다."""
-    for att in result_json.get("attachments", []):
-        source = att.get("source", "")
-        if source.endswith(suffix):
-            path = results_dir / source
-            if path.is_file():
-                return str(path)
-    # steps 내부 attachments도 탐색
-    for step in result_json.get("steps", []):
-        found = _find_attachment_path(results_dir, step, suffix)
-        if found:
-            return found
-    return None
-BLOB_API_URL = "https://blob.vercel-storage.com"
-BLOB_STORAGE_LIMIT_MB = 500  # Vercel Hobby 플랜 한도
-BLOB_CLEANUP_THRESHOLD = 0.8  # 80% 초과 시 정리 시작
-
-
-# ─── Blob 용량 관리 함수 ─────────────────────────────────────────────
-
-def _get_blob_usage(token: str) -> tuple[float, list[dict]]:
-    """Vercel Blob의 현재 사용량(MB)과 파일 목록을 반환합니다."""
-    url = f"{BLOB_API_URL}?limit=1000"
-    req = urllib.request.Request(
-        url,
-        headers={"Authorization": f"Bearer {token}"},
-        method="GET",
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
-            blobs = result.get("blobs", [])
-            total_bytes = sum(b.get("size", 0) for b in blobs)
-            return total_bytes / (1024 * 1024), blobs
-    except Exception as e:
-        print(f"    [warn] Blob 사용량 조회 실패: {e}")
-        return 0.0, []
-
-
-def _extract_timestamp_from_blob(pathname: str) -> str:
-    """Blob 경로에서 타임스탬프를 추출합니다. (예: attachments/20260221_153012/xxx → 20260221_153012)"""
-    parts = pathname.strip("/").split("/")
-    if len(parts) >= 2:
-        candidate = parts[1]
-        if _TIMESTAMP_DIR_RE.match(candidate):
-            return candidate
-    return ""
-
-
-def _delete_blob(url: str, token: str) -> bool:
-    """Vercel Blob 파일을 삭제합니다."""
-    data = json.dumps({"urls": [url]}).encode("utf-8")
-    req = urllib.request.Request(
-        f"{BLOB_API_URL}/delete",
-        data=data,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "x-api-version": "7",
-        },
-        method="POST",
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=30):
-            return True
-    except Exception:
-        return False
-
-
-def _cleanup_old_blobs(token: str, needed_mb: float = 0) -> None:
-    """용량이 80%를 초과하면 가장 오래된 리포트의 첨부파일부터 삭제합니다."""
-    usage_mb, blobs = _get_blob_usage(token)
-    threshold_mb = BLOB_STORAGE_LIMIT_MB * BLOB_CLEANUP_THRESHOLD
-
-    if usage_mb + needed_mb <= threshold_mb:
-        return
-
-    print(f"    [cleanup] Blob 사용량: {usage_mb:.1f}MB / {BLOB_STORAGE_LIMIT_MB}MB ({usage_mb/BLOB_STORAGE_LIMIT_MB*100:.0f}%)")
-
-    # 타임스탬프별로 그룹화
-    ts_groups: dict[str, list[dict]] = {}
-    for blob in blobs:
-        ts = _extract_timestamp_from_blob(blob.get("pathname", ""))
-        if ts:
-            ts_groups.setdefault(ts, []).append(blob)
-
-    if not ts_groups:
-        return
-
-    # 오래된 타임스탬프 순으로 정렬
-    sorted_timestamps = sorted(ts_groups.keys())
-
-    freed_mb = 0.0
-    target_mb = (usage_mb + needed_mb) - threshold_mb + 50  # 50MB 여유 확보
-
-    for ts in sorted_timestamps:
-        if freed_mb >= target_mb:
-            break
-
-        group_blobs = ts_groups[ts]
-        group_size = sum(b.get("size", 0) for b in group_blobs) / (1024 * 1024)
-        deleted = 0
-
-        for blob in group_blobs:
-            if _delete_blob(blob["url"], token):
-                deleted += 1
-
-        if deleted > 0:
-            freed_mb += group_size
-            print(f"    [cleanup] {ts}: {deleted}개 파일 삭제 ({group_size:.1f}MB 확보)")
-
-    print(f"    [cleanup] 총 {freed_mb:.1f}MB 확보 완료")
-
-
-# ─── 첨부파일 관련 함수 ─────────────────────────────────────────────
-
-def _collect_attachments(report_dir: Path) -> list[dict]:
-    """test-cases JSON에서 첨부파일 메타데이터를 수집합니다.
-
-    첨부파일은 testStage, beforeStages, afterStages 안에 중첩되어 있습니다.
-    """
-    test_cases_dir = report_dir / "data" / "test-cases"
-    attachments_dir = report_dir / "data" / "attachments"
-
-    if not test_cases_dir.exists() or not attachments_dir.exists():
-        return []
-
-    seen_sources: set[str] = set()
-    # 동일 이름 + 동일 사이즈 조합으로 내용 중복 제거 (stdout 등)
-    seen_content: set[str] = set()
-    result: list[dict] = []
-
-    def _extract_from(obj):
-        """dict 또는 list[dict]에서 attachments를 재귀적으로 추출합니다."""
-        if isinstance(obj, dict):
-            for att in obj.get("attachments") or []:
-                source = att.get("source", "")
-                if not source or source in seen_sources:
-                    continue
-                file_path = attachments_dir / source
-                if not file_path.exists():
-                    continue
-                # 동일 이름 + 동일 사이즈 중복 제거
-                name = att.get("name", source)
-                size = att.get("size") or file_path.stat().st_size
-                content_key = f"{name}::{size}"
-                if content_key in seen_content:
-                    print(f"  [skip] 중복 첨부파일: {name} ({size}B)")
-                    continue
-                seen_sources.add(source)
-                seen_content.add(content_key)
-                result.append({
-                    "name": name,
-                    "source": source,
-                    "type": att.get("type", "application/octet-stream"),
-                    "size": size,
-                    "file_path": str(file_path),
-                })
-            # steps 안에도 첨부파일이 있을 수 있음
-            for step in obj.get("steps") or []:
-                _extract_from(step)
-        elif isinstance(obj, list):
-            for item in obj:
-                _extract_from(item)
-
-    for tc_file in test_cases_dir.glob("*.json"):
-        tc = _read_json(tc_file)
-        if not tc:
-            continue
-        # 테스트 케이스명 (stdout 파일명에 사용)
-        tc_name = tc.get("name", "")
-        # stdout 첨부파일에 테스트명 추가하는 래퍼
-        _orig_len = len(result)
-        # testStage, beforeStages, afterStages에서 첨부파일 추출
-        for stage_key in ("testStage", "beforeStages", "afterStages"):
-            _extract_from(tc.get(stage_key))
-        # 이번 TC에서 추가된 항목 중 stdout → "stdout — 테스트명" 으로 변경
-        if tc_name:
-            for item in result[_orig_len:]:
-                if item["name"] == "stdout":
-                    item["name"] = f"stdout — {tc_name}"
-
-    return result
-
-
-def _upload_to_blob(file_path: str, blob_path: str, content_type: str, token: str) -> str | None:
-    """Vercel Blob REST API로 파일을 직접 업로드합니다. 성공 시 URL을 반환합니다."""
-    with open(file_path, "rb") as f:
-        data = f.read()
-
-    req = urllib.request.Request(
-        f"{BLOB_API_URL}/{blob_path}",
-        data=data,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "x-content-type": content_type,
-            "x-api-version": "7",
-        },
-        method="PUT",
-    )
-
-    try:
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
-            return result.get("url", "")
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")[:200]
-        print(f"    [blob-error] {blob_path} → HTTP {e.code}: {body}")
-        return None
-    except Exception as e:
-        print(f"    [blob-error] {blob_path} → {e}")
-        return None
-
-
-def _save_artifact_metadata(
-    timestamp: str,
-    artifacts: list[dict],
-    dashboard_url: str,
-) -> bool:
-    """첨부파일 메타데이터를 대시보드 API에 POST합니다."""
-    url = f"{dashboard_url.rstrip('/')}/api/runs/{timestamp}/artifacts"
-    payload = [
-        {
-            "type": a["type"],
-            "name": a["name"],
-            "source": a["source"],
-            "url": a["url"],
-            "contentType": a["type"],
-            "sizeBytes": a.get("size"),
-        }
-        for a in artifacts
-    ]
-
-    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            if resp.status in (200, 201):
-                result = json.loads(resp.read().decode("utf-8"))
-                print(f"    [artifacts] {result.get('saved', 0)}개 메타데이터 저장")
-                return True
-            return False
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")[:200]
-        print(f"    [artifacts-error] HTTP {e.code}: {body}")
-        return False
-    except Exception as e:
-        print(f"    [artifacts-error] {e}")
-        return False
-
-
-def upload_attachments(
-    report_dir: Path,
-    timestamp: str,
-    dashboard_url: str,
-    blob_token: str,
-) -> bool:
-    """첨부파일을 Vercel Blob에 업로드하고 메타데이터를 대시보드에 저장합니다."""
-    attachments = _collect_attachments(report_dir)
-    if not attachments:
-        print(f"    [info] {timestamp}: 첨부파일 없음")
-        return True
-
-    # 업로드 전 용량 체크 + 필요 시 오래된 파일 정리
-    needed_mb = sum(a.get("size", 0) for a in attachments) / (1024 * 1024)
-    _cleanup_old_blobs(blob_token, needed_mb)
-
-    print(f"    [blob] {len(attachments)}개 첨부파일 업로드 중...")
-    uploaded: list[dict] = []
-
-    for att in attachments:
-        blob_path = f"attachments/{timestamp}/{att['source']}"
-        url = _upload_to_blob(att["file_path"], blob_path, att["type"], blob_token)
-        if url:
-            att["url"] = url
-            uploaded.append(att)
-            size_kb = att["size"] / 1024
-            print(f"      ✓ {att['source']} ({size_kb:.0f}KB)")
-        else:
-            print(f"      ✗ {att['source']} (업로드 실패)")
-
-    if not uploaded:
-        print(f"    [warn] {timestamp}: 업로드된 첨부파일 없음")
-        return False
-
-    return _save_artifact_metadata(timestamp, uploaded, dashboard_url)
-
-
-# ─── 기존 함수 ────────────────────────────────────────────────────
-
-def _extract_test_cases(report_dir: Path, analyze: bool = True) -> list[dict]:
-    """allure-results의 *-result.json에서 개별 테스트 케이스 목록을 추출합니다.
-
-    Args:
-        report_dir: allure-reports/<timestamp> 경로
-        analyze: True이면 failed/broken 케이스에 AI 분석 수행
-    """
-    # allure-results 폴더 경로 계산 (allure-reports/<ts> → allure-results/<ts>)
-    results_dir = report_dir.parent.parent / "allure-results" / report_dir.name
-    if not results_dir.is_dir():
-        return []
-
-    cases = []
-    for f in results_dir.glob("*-result.json"):
-        data = _read_json(f)
-        if not data:
-            continue
-
-        # labels에서 feature, story, severity, suite 추출
-        labels = {}
-        for label in data.get("labels", []):
-            name = label.get("name", "")
-            if name in ("feature", "story", "severity", "suite", "subSuite"):
-                labels[name] = label.get("value", "")
-
-        duration_ms = 0
-        start = data.get("start", 0)
-        stop = data.get("stop", 0)
-        if start and stop:
-            duration_ms = stop - start
-
-        status = data.get("status", "unknown")
-        error_msg = (data.get("statusDetails") or {}).get("message", "")
-        status_trace = (data.get("statusDetails") or {}).get("trace", "")
-
-        # failed/broken 케이스 AI 분석
-        ai_analysis = ""
-        if analyze and status in ("failed", "broken") and error_msg:
-            screenshot_path = _find_attachment_path(results_dir, data, ".png")
-            page_source_path = _find_attachment_path(results_dir, data, ".xml")
-            print(f"    [ai] {data.get('name', '')} 분석 중...")
-            ai_analysis = _analyze_failed_case(
-                test_name=data.get("name", ""),
-                error_message=error_msg,
-                status_trace=status_trace,
-                screenshot_path=screenshot_path,
-                page_source_path=page_source_path,
-            )
-            if ai_analysis:
-                print(f"    [ai] 분석 완료 ({len(ai_analysis)}자)")
-
-        cases.append({
-            "uid": data.get("testCaseId") or data.get("historyId") or data.get("fullName", ""),
-            "name": data.get("name", ""),
-            "fullName": data.get("fullName", ""),
-            "status": status,
-            "durationMs": duration_ms,
-            "feature": labels.get("feature", ""),
-            "story": labels.get("story", ""),
-            "severity": labels.get("severity", ""),
-            "suite": labels.get("suite", ""),
-            "statusMessage": error_msg,
-            "statusTrace": status_trace,
-            "description": ai_analysis,
-        })
-
-    # fullName 기준 정렬
-    cases.sort(key=lambda c: c.get("fullName", ""))
-    return cases
-
-
-def _build_payload(report_dir: Path, repo_root: Path) -> dict | None:
-    """report_dir에서 메타데이터를 읽어 API POST 페이로드를 생성합니다."""
-    run = _load_run_summary(report_dir)
-    if not run:
-        print(f"  [skip] {report_dir.name}: summary.json 없음")
-        return None
-
-    env = dict(run.environment or {})
-    build_name = run.executor.get("buildName", "")
-    branch = str(env.get("gitBranch") or "").strip()
-    commit = str(env.get("gitCommit") or "").strip()
-    message = str(env.get("gitMessage") or "").strip()
-
-    if not branch or not commit:
-        parsed_branch, parsed_commit = _extract_branch_commit(build_name)
-        branch = branch or parsed_branch
-        commit = commit or parsed_commit
-
-    if not message and commit:
-        message = _safe_git_message(repo_root, commit)
-
-    env.update({
-        "gitBranch": branch or None,
-        "gitCommit": commit or None,
-        "gitMessage": message or None,
-    })
-
-    # 개별 테스트 케이스 목록 추출
-    test_cases = _extract_test_cases(report_dir)
-
-    return {
-        "timestamp": run.timestamp,
-        "stats": run.stats,
-        "time": run.time,
-        "durationText": _duration_ms_to_hms(run.time.get("duration", 0)),
-        "executor": {
-            "name": run.executor.get("name", ""),
-            "type": run.executor.get("type", ""),
-            "buildName": run.executor.get("buildName", ""),
-            "buildUrl": run.executor.get("buildUrl", ""),
-        },
-        "environment": env,
-        "suites": run.suites,
-        "behaviors": run.behaviors,
-        "packages": run.packages,
-        "testCases": test_cases,
-    }
-
-
-def upload_run(payload: dict, dashboard_url: str) -> bool:
-    """페이로드를 대시보드 API에 POST합니다."""
-    url = f"{dashboard_url.rstrip('/')}/api/runs"
-    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-
-    req = urllib.request.Request(
-        url,
-        data=data,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-
-    try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            status = resp.status
-            if status in (200, 201):
-                print(f"  [ok] {payload['timestamp']} → {status}")
-                return True
-            else:
-                print(f"  [warn] {payload['timestamp']} → HTTP {status}")
-                return False
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")[:200]
-        print(f"  [error] {payload['timestamp']} → HTTP {e.code}: {body}")
-        return False
-    except Exception as e:
-        print(f"  [error] {payload['timestamp']} → {e}")
-        return False
-
-
-def main() -> int:
-    parser = argparse.ArgumentParser(
-        description="Allure 테스트 결과를 Next.js 대시보드 API로 업로드합니다."
-    )
-    parser.add_argument(
-        "timestamps",
-        nargs="*",
-        help="업로드할 타임스탬프 (예: 20260216_024413)",
-    )
-    parser.add_argument(
-        "--all",
-        action="store_true",
-        help="모든 기존 리포트를 일괄 업로드 (마이그레이션용)",
-    )
-    parser.add_argument(
-        "--no-attachments",
-        action="store_true",
-        help="첨부파일 업로드 건너뛰기 (메타데이터만 업로드)",
-    )
-    parser.add_argument(
-        "--reports-root",
-        default="allure-reports",
-        help="Allure reports 루트 디렉토리 (기본: allure-reports)",
-    )
-    parser.add_argument(
-        "--dashboard-url",
-        default=DEFAULT_DASHBOARD_URL,
-        help=f"대시보드 API URL (기본: {DEFAULT_DASHBOARD_URL})",
-    )
-    args = parser.parse_args()
-
-    reports_root = Path(args.reports_root)
-    repo_root = reports_root.resolve().parent
-
-    if not reports_root.exists():
-        print(f"[error] reports-root 경로가 존재하지 않습니다: {reports_root}")
-        return 1
-
-    # Blob 토큰 확인
-    blob_token = os.environ.get("BLOB_READ_WRITE_TOKEN", "")
-    if not args.no_attachments and not blob_token:
-        print("[warn] BLOB_READ_WRITE_TOKEN 미설정 → 첨부파일 업로드 건너뜀")
-        print("       .env 파일에 BLOB_READ_WRITE_TOKEN을 추가하거나 --no-attachments 옵션을 사용하세요.")
-        args.no_attachments = True
-
-    # 업로드 대상 결정
-    if args.all:
-        targets = sorted(
-            [d for d in reports_root.iterdir() if d.is_dir() and _TIMESTAMP_DIR_RE.match(d.name)],
-            key=lambda p: p.name,
-        )
-    elif args.timestamps:
-        targets = []
-        for ts in args.timestamps:
-            d = reports_root / ts
-            if d.is_dir():
-                targets.append(d)
-            else:
-                print(f"  [skip] {ts}: 디렉토리 없음")
-    else:
-        print("[error] 타임스탬프를 지정하거나 --all 옵션을 사용하세요.")
-        return 2
-
-    if not targets:
-        print("[info] 업로드할 리포트가 없습니다.")
-        return 0
-
-    attachment_mode = "포함" if not args.no_attachments else "제외"
-    print(f"[upload] {len(targets)}개 리포트 → {args.dashboard_url} (첨부파일: {attachment_mode})")
-    ok = 0
-    fail = 0
-
-    for report_dir in targets:
-        payload = _build_payload(report_dir, repo_root)
-        if payload is None:
-            fail += 1
-            continue
-        if upload_run(payload, args.dashboard_url):
-            ok += 1
-            # 첨부파일 업로드
-            if not args.no_attachments:
-                upload_attachments(
-                    report_dir,
-                    payload["timestamp"],
-                    args.dashboard_url,
-                    blob_token,
-                )
-        else:
-            fail += 1
-
-    print(f"[done] 성공: {ok}, 실패: {fail}")
-    return 0 if fail == 0 else 1
-
-
-if __name__ == "__main__":
-    raise SystemExit(main())
+# -*- coding: utf-8 -*-
+import sys
+import os
+# Windows cp949 인코딩 문제 방지
+if sys.platform == "win32":
+    os.environ.setdefault("PYTHONIOENCODING", "utf-8")
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    if hasattr(sys.stderr, "reconfigure"):
+        sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+
+"""Allure 테스트 결과를 Next.js 대시보드 API로 업로드합니다.
+
+사용법:
+  # 단일 타임스탬프 업로드 (메타데이터 + 첨부파일)
+  python tools/upload_to_dashboard.py 20260216_024413
+
+  # 모든 기존 리포트 일괄 업로드 (마이그레이션)
+  python tools/upload_to_dashboard.py --all
+
+  # 메타데이터만 업로드 (첨부파일 제외)
+  python tools/upload_to_dashboard.py --no-attachments 20260216_024413
+
+  # 커스텀 대시보드 URL
+  python tools/upload_to_dashboard.py --dashboard-url https://my-dashboard.vercel.app 20260216_024413
+
+  # 동시 업로드 수 조정 / 저널 무시하고 전체 재업로드
+  python tools/upload_to_dashboard.py --all --workers 8
+  python tools/upload_to_dashboard.py --all --force
+"""
+
+import argparse
+import hashlib
+import http.client
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+# .env 파일 자동 로드 (python-dotenv가 있으면 사용, 없으면 수동 파싱)
+_env_file = Path(__file__).resolve().parent.parent / ".env"
+try:
+    from dotenv import load_dotenv
+    load_dotenv(_env_file)
+except ImportError:
+    if _env_file.exists():
+        for line in _env_file.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, val = line.partition("=")
+                os.environ.setdefault(key.strip(), val.strip())
+
+# update_dashboard.py의 로직을 재사용
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from update_dashboard import (
+    _load_run_summary,
+    _extract_branch_commit,
+    _duration_ms_to_hms,
+    _safe_git_message,
+    _TIMESTAMP_DIR_RE,
+)
+from allure_model import ReportCase, ReportModel, TestResult, load_report, load_results
+from failure_cache import CACHE_NAME, FailureAnalysisCache, failure_signature, signature_key
+from image_utils import IMAGE_SUFFIXES, dhash, dhash_many, downscale_image, group_similar, is_similar
+from blob_ledger import (
+    DEFAULT_KEEP_LAST,
+    DEFAULT_POLICY,
+    EVICTION_MARGIN_BYTES,
+    EVICTION_POLICIES,
+    LEDGER_NAME,
+    BlobLedger,
+    ensure_capacity,
+)
+
+DEFAULT_DASHBOARD_URL = os.environ.get("DASHBOARD_URL", "https://your-dashboard.vercel.app")
+AI_ANALYSIS_WORKERS = 4
+AI_SCREENSHOT_MAX_SIDE = 1024
+# 첨부 스크린샷 중복 제거: 256bit dHash 기준 이 거리 이하면 같은 화면으로 보고 Blob 1개만 저장
+DEDUPE_HASH_SIZE = 16
+DEDUPE_DISTANCE = 3
+
+# ─── AI 분석 ─────────────────────────────────────────────
+
+def _analyze_failed_case(test_name: str, error_message: str, status_trace: str,
+                         screenshot_path: str | None, page_source_path: str | None) -> str:
+    """AI API로 실패한 테스트 케이스를 분석합니다.
+
+    Returns:
+        분석 결과 텍스트. API 키 미설정이나 오류 시 빈 문자열.
+    """
+    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
+    gateway_key = os.environ.get("AI_GATEWAY_API_KEY", "")
+
+    if not api_key and not gateway_key:
+        return ""
+
+    try:
+        import base64
+
+        # API 설정 (AI Gateway 우선)
+        if gateway_key:
+            headers = {
+                "x-api-key": gateway_key,
+                "Content-Type": "application/json",
+                "anthropic-version": "2023-06-01",
+            }
+            url = os.environ.get("AI_GATEWAY_URL", "https://ai-gateway.vercel.sh/v1/messages")
+            model = os.environ.get("AI_MODEL_GATEWAY", "anthropic/claude-sonnet-4-6")
+        else:
+            headers = {
+                "x-api-key": api_key,
+                "Content-Type": "application/json",
+                "anthropic-version": "2023-06-01",
+            }
+            url = os.environ.get("AI_API_URL", "https://api.anthropic.com/v1/messages")
+            model = os.environ.get("AI_MODEL", "claude-sonnet-4-6")
+
+        # 프롬프트 구성
+        prompt = f"""당신은 모바일 앱 QA 자동화 테스트 분석 전문가입니다.
+아래 실패한 테스트 케이스를 분석하고, **이슈 발생 사유**와 **수정 방향**을 간결하게 한국어로 설명해주세요.
+
+## 테스트 정보
+- **테스트명**: {test_name}
+- **에러 메시지**: {error_message}
+"""
+        if status_trace:
+            prompt += f"\n## 스택 트레이스 (앞부분)\n```\n{status_trace[:1500]}\n```\n"
+
+        # page_source 일부
+        if page_source_path and os.path.isfile(page_source_path):
+            try:
+                with open(page_source_path, "r", encoding="utf-8") as f:
+                    snippet = f.read(1000)
+                prompt += f"\n## Page Source (일부)\n```xml\n{snippet}\n```\n"
+            except Exception:
+                pass
+
+        prompt += """
+## 요청사항
+1. **이슈 발생 사유**: 왜 이 테스트가 실패했는지 (1~2문장)
+2. **수정 방향**: 어떻게 수정하면 되는지 (구체적 액션, 1~3줄)
+
+간결하게 답변해주세요."""
+
+        content = [{"type": "text", "text": prompt}]
+
+        # 스크린샷 이미지 추가
+        if screenshot_path and os.path.isfile(screenshot_path):
+            try:
+                # 원본 PNG 대신 축소한 JPEG 전송 (요청 크기/지연 감소)
+                img_bytes, media_type = downscale_image(screenshot_path, AI_SCREENSHOT_MAX_SIDE)
+                img_data = base64.b64encode(img_bytes).decode("utf-8")
+                content.append({
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": media_type,
+                        "data": img_data,
+                    },
+                })
+                content.append({
+                    "type": "text",
+                    "text": "위 스크린샷은 테스트 실패 시점의 앱 화면입니다. 화면 상태도 참고하여 분석해주세요.",
+                })
+            except Exception:
+                pass
+
+        payload = json.dumps({
+            "model": model,
+            "max_tokens": 500,
+            "messages": [{"role": "user", "content": content}],
+        }).encode("utf-8")
+
+        req = urllib.request.Request(url, data=payload, headers=headers, method="POST")
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            result = json.loads(resp.read().decode("utf-8"))
+            blocks = result.get("content", [])
+            texts = [b["text"] for b in blocks if b.get("type") == "text"]
+            return "\n".join(texts) if texts else ""
+
+    except Exception as e:
+        print(f"    [ai] 분석 실패: {e}")
+        return ""
+
+
+BLOB_API_URL = os.environ.get("BLOB_API_URL", "https://blob.vercel-storage.com")
+BLOB_STORAGE_LIMIT_MB = 500  # Vercel Hobby 플랜 한도
+BLOB_CLEANUP_THRESHOLD = 0.8  # 80% 초과 시 정리 시작
+
+
+# ─── Blob 용량 관리 함수 ─────────────────────────────────────────────
+
+def _cleanup_old_blobs(
+    token: str,
+    ledger: BlobLedger,
+    needed_bytes: int = 0,
+    policy: str = DEFAULT_POLICY,
+    keep_last: int = DEFAULT_KEEP_LAST,
+    protect: set[str] | None = None,
+) -> None:
+    """장부 기준 사용량이 80%를 넘으면 정리 정책에 따라 오래된 리포트의 첨부파일을 삭제합니다."""
+    ensure_capacity(
+        ledger,
+        token,
+        BLOB_API_URL,
+        needed_bytes=needed_bytes,
+        limit_bytes=BLOB_STORAGE_LIMIT_MB * 1024 * 1024,
+        threshold=BLOB_CLEANUP_THRESHOLD,
+        policy=policy,
+        keep_last=keep_last,
+        protect=protect,
+        margin_bytes=EVICTION_MARGIN_BYTES,
+    )
+
+
+# ─── 첨부파일 관련 함수 ─────────────────────────────────────────────
+
+def _collect_attachments(report_dir: Path) -> list[dict]:
+    """test-cases의 첨부파일 메타데이터를 수집합니다.
+
+    첨부파일은 testStage, beforeStages, afterStages 안에 중첩되어 있습니다 (allure_model에서 평탄화).
+    HTML 리포트 없이 위젯만 만든 경우(run_allure --report defer/skip)에는
+    allure-results의 결과 파일과 원본 첨부파일을 사용합니다 (파일명이 같아 Blob 경로도 동일).
+    """
+    attachments_dir = report_dir / "data" / "attachments"
+    model = load_report(report_dir)
+    if model is None or not model.cases or not attachments_dir.exists():
+        attachments_dir = report_dir.parent.parent / "allure-results" / report_dir.name
+        model = load_results(attachments_dir)
+        if not model.results:
+            return []
+        model = ReportModel(report_dir, {}, tuple(
+            ReportCase(r.uuid, r.name, r.full_name, r.status, r.duration_ms, attachments=r.attachments)
+            for r in model.results
+        ))
+
+    seen_sources: set[str] = set()
+    result: list[dict] = []
+
+    for case in model.cases:
+        for att in case.attachments:
+            if att.source in seen_sources:
+                continue
+            file_path = attachments_dir / att.source
+            if not file_path.exists():
+                continue
+            seen_sources.add(att.source)
+            result.append({
+                # stdout 첨부파일은 "stdout — 테스트명" 으로 구분
+                "name": f"stdout — {case.name}" if att.name == "stdout" and case.name else att.name,
+                "source": att.source,
+                "type": att.type,
+                "size": att.size or file_path.stat().st_size,
+                "file_path": str(file_path),
+            })
+
+    _group_similar_screenshots(result)
+    return result
+
+
+def _group_similar_screenshots(attachments: list[dict]) -> None:
+    """거의 같은 스크린샷(setup/call/teardown, 팝업 캡처 등)을 테스트 간에도 묶습니다.
+
+    그룹 대표가 아닌 스크린샷에는 dedupe_key(대표 source)를 붙이고,
+    upload_attachments가 대표 1개만 업로드한 뒤 나머지는 대표 Blob URL을 참조합니다.
+    """
+    images = [a for a in attachments if a["type"].startswith("image/")]
+    if len(images) < 2:
+        return
+    hashes = dhash_many([a["file_path"] for a in images], DEDUPE_HASH_SIZE)
+    groups = group_similar(hashes, DEDUPE_DISTANCE)
+    grouped = 0
+    for att, rep in zip(images, groups):
+        att["dedupe_key"] = f"image:{images[rep]['source']}"
+        grouped += images[rep] is not att
+    if grouped:
+        print(f"  [dedupe] 스크린샷 {len(images)}개 → {len(images) - grouped}개 (유사 화면 {grouped}개는 대표 파일 참조)")
+
+
+DEFAULT_UPLOAD_WORKERS = 4
+UPLOAD_MAX_RETRIES = 3
+UPLOAD_JOURNAL_NAME = "upload_journal.jsonl"
+
+# 재시도할 HTTP 상태 코드 (Rate limit / 서버 오류)
+_RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class _BlobClient:
+    """스레드별 keep-alive 연결을 재사용하는 Vercel Blob REST 클라이언트.
+
+    urllib.request는 요청마다 새 TCP/TLS 연결을 열기 때문에, 업로드 스레드마다
+    http.client 연결 하나를 유지하며 재사용합니다.
+    """
+
+    def __init__(self, token: str, base_url: str = BLOB_API_URL, timeout: float = 120):
+        parsed = urllib.parse.urlsplit(base_url)
+        self._https = parsed.scheme == "https"
+        self._netloc = parsed.netloc
+        self._base_path = parsed.path.rstrip("/")
+        self._token = token
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            conn = conn_cls(self._netloc, timeout=self._timeout)
+            self._local.conn = conn
+        return conn
+
+    def _reset_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._local.conn = None
+
+    def put_file(self, file_path: str, blob_path: str, content_type: str, size: int) -> str | None:
+        """파일을 스트리밍으로 PUT합니다. 일시적 오류는 지수 백오프로 재시도합니다.
+
+        Returns:
+            업로드된 Blob URL. 실패 시 None.
+        """
+        path = f"{self._base_path}/{urllib.parse.quote(blob_path, safe='/')}"
+        headers = {
+            "Authorization": f"Bearer {self._token}",
+            "x-content-type": content_type,
+            "x-api-version": "7",
+            "Content-Length": str(size),
+        }
+
+        for attempt in range(1, UPLOAD_MAX_RETRIES + 1):
+            error = ""
+            try:
+                conn = self._connection()
+                with open(file_path, "rb") as f:
+                    conn.request("PUT", path, body=f, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+                if resp.status in (200, 201):
+                    try:
+                        return json.loads(body.decode("utf-8")).get("url", "")
+                    except ValueError:
+                        # 프록시 오류 페이지 등 JSON이 아닌 성공 응답 — 재시도해도 같으므로 실패 처리
+                        print(f"    [blob-error] {blob_path} → 응답 파싱 실패: {body[:200]!r}")
+                        return None
+                error = f"HTTP {resp.status}: {body.decode('utf-8', errors='replace')[:200]}"
+                if resp.status not in _RETRYABLE_STATUS:
+                    print(f"    [blob-error] {blob_path} → {error}")
+                    return None
+                if resp.will_close:
+                    self._reset_connection()
+            except (OSError, http.client.HTTPException) as e:
+                # 끊긴 keep-alive 연결은 새로 맺어서 재시도
+                error = str(e) or type(e).__name__
+                self._reset_connection()
+
+            if attempt < UPLOAD_MAX_RETRIES:
+                delay = 2 ** (attempt - 1) + random.uniform(0, 0.5)
+                print(f"    [blob-retry] {blob_path} ({attempt}/{UPLOAD_MAX_RETRIES}) {error} → {delay:.1f}s 후 재시도")
+                time.sleep(delay)
+            else:
+                print(f"    [blob-error] {blob_path} → {error}")
+        return None
+
+
+class _UploadJournal:
+    """업로드 진행 상황을 기록하는 append-only JSONL 저널.
+
+    중단된 --all 마이그레이션을 다시 실행하면 완료된 리포트와 이미 올라간
+    첨부파일(같은 경로 + 같은 sha256)을 건너뛰고 이어서 진행합니다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._blobs: dict[str, dict] = {}
+        self._runs: dict[str, dict] = {}
+        if path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 중단 시점에 잘린 마지막 줄은 무시
+                    continue
+                if "blob" in entry:
+                    self._blobs[entry["blob"]] = entry
+                elif "run" in entry:
+                    self._runs[entry["run"]] = entry
+
+    def _append(self, entry: dict) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def uploaded_url(self, blob_path: str, sha256: str) -> str | None:
+        entry = self._blobs.get(blob_path)
+        if entry and entry.get("sha256") == sha256 and entry.get("url"):
+            return entry["url"]
+        return None
+
+    def record_blob(self, blob_path: str, sha256: str, size: int, url: str) -> None:
+        entry = {"blob": blob_path, "sha256": sha256, "size": size, "url": url}
+        self._blobs[blob_path] = entry
+        self._append(entry)
+
+    def is_run_complete(self, timestamp: str, with_attachments: bool) -> bool:
+        entry = self._runs.get(timestamp)
+        if not entry:
+            return False
+        return bool(entry.get("attachments")) or not with_attachments
+
+    def mark_run_complete(self, timestamp: str, with_attachments: bool) -> None:
+        entry = {
+            "run": timestamp,
+            "attachments": with_attachments,
+            "completedAt": datetime.now().isoformat(timespec="seconds"),
+        }
+        self._runs[timestamp] = entry
+        self._append(entry)
+
+
+def _sha256_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _sha256_or_none(file_path: str) -> str | None:
+    """해시 계산 중 파일이 사라졌거나 읽을 수 없으면 None (업로드 실패로 집계)."""
+    try:
+        return _sha256_file(file_path)
+    except OSError as e:
+        print(f"    [blob-skip] {Path(file_path).name}: {e}")
+        return None
+
+
+def _save_artifact_metadata(
+    timestamp: str,
+    artifacts: list[dict],
+    dashboard_url: str,
+) -> bool:
+    """첨부파일 메타데이터를 대시보드 API에 POST합니다."""
+    url = f"{dashboard_url.rstrip('/')}/api/runs/{timestamp}/artifacts"
+    payload = [
+        {
+            "type": a["type"],
+            "name": a["name"],
+            "source": a["source"],
+            "url": a["url"],
+            "contentType": a["type"],
+            "sizeBytes": a.get("size"),
+        }
+        for a in artifacts
+    ]
+
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    req = urllib.request.Request(
+        url,
+        data=data,
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            if resp.status in (200, 201):
+                result = json.loads(resp.read().decode("utf-8"))
+                print(f"    [artifacts] {result.get('saved', 0)}개 메타데이터 저장")
+                return True
+            return False
+    except urllib.error.HTTPError as e:
+        body = e.read().decode("utf-8", errors="replace")[:200]
+        print(f"    [artifacts-error] HTTP {e.code}: {body}")
+        return False
+    except Exception as e:
+        print(f"    [artifacts-error] {e}")
+        return False
+
+
+def upload_attachments(
+    report_dir: Path,
+    timestamp: str,
+    dashboard_url: str,
+    blob_token: str,
+    workers: int = DEFAULT_UPLOAD_WORKERS,
+    journal: _UploadJournal | None = None,
+    ledger: BlobLedger | None = None,
+    policy: str = DEFAULT_POLICY,
+    keep_last: int = DEFAULT_KEEP_LAST,
+    force: bool = False,
+) -> bool:
+    """첨부파일을 Vercel Blob에 병렬 업로드하고 메타데이터를 대시보드에 저장합니다.
+
+    - sha256이 저널 기록과 같은 파일은 다시 올리지 않음 (중단 후 재개, force면 무시)
+      단, ledger가 있으면 장부에 남아 있는(정리로 삭제되지 않은) Blob만 재사용
+    - 같은 리포트 안에서 내용이 동일한 파일은 한 번만 업로드하고 URL 공유
+    - 거의 같은 스크린샷(dedupe_key가 같은 그룹)도 대표 1개만 업로드하고 URL 공유
+    - ledger가 주어지면 업로드 전 용량을 확인하고, 업로드한 Blob을 장부에 기록
+    """
+    attachments = _collect_attachments(report_dir)
+    if not attachments:
+        print(f"    [info] {timestamp}: 첨부파일 없음")
+        return True
+
+    workers = max(1, workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        hashes = list(pool.map(lambda a: _sha256_or_none(a["file_path"]), attachments))
+
+    # 읽을 수 없는 파일은 제외하고 실패로 집계
+    total = len(attachments)
+    attachments = [dict(a, sha256=h) for a, h in zip(attachments, hashes) if h is not None]
+
+    # 업로드 대상: 저널에 없는 내용만, 그룹(유사 스크린샷) 또는 sha256별 대표 1개
+    pending: dict[str, dict] = {}
+    resumed = 0
+    for att in attachments:
+        sha256 = att["sha256"]
+        att["blob_path"] = f"attachments/{timestamp}/{att['source']}"
+        key = att.get("dedupe_key") or sha256
+        url = journal.uploaded_url(att["blob_path"], sha256) if journal and not force else None
+        if url and ledger and not ledger.has_blob(att["blob_path"], url):
+            # 용량 정리(evict)로 이미 삭제된 Blob — 저널 기록을 믿지 않고 다시 업로드
+            url = None
+        if url:
+            att["url"] = url
+            resumed += 1
+            # 재개 시 같은 그룹의 나머지도 이 URL 참조
+            pending.setdefault(key, att)
+        elif key not in pending:
+            pending[key] = att
+
+    if resumed:
+        print(f"    [blob] 저널 기준 {resumed}개 첨부파일 건너뜀 (업로드 완료됨)")
+
+    to_upload = [a for a in pending.values() if "url" not in a]
+    if to_upload and ledger:
+        # 업로드 전 용량 체크 + 필요 시 오래된 파일 정리 (현재 리포트는 보존)
+        needed_bytes = sum(a.get("size", 0) for a in to_upload)
+        _cleanup_old_blobs(blob_token, ledger, needed_bytes, policy, keep_last, protect={timestamp})
+
+    if to_upload:
+
+        print(f"    [blob] {len(to_upload)}개 첨부파일 업로드 중... (workers: {workers})")
+        client = _BlobClient(blob_token)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(client.put_file, a["file_path"], a["blob_path"], a["type"], a["size"]): a
+                for a in to_upload
+            }
+            for future in as_completed(futures):
+                att = futures[future]
+                try:
+                    url = future.result()
+                except Exception as e:
+                    # 예상 못 한 예외 하나로 나머지 결과 처리가 중단되지 않도록 실패로 집계
+                    print(f"    [blob-error] {att['blob_path']} → {type(e).__name__}: {e}")
+                    url = None
+                if url:
+                    att["url"] = url
+                    if journal:
+                        journal.record_blob(att["blob_path"], att["sha256"], att["size"], url)
+                    if ledger:
+                        ledger.record_blob(att["blob_path"], url, att["size"])
+                    print(f"      ✓ {att['source']} ({att['size'] / 1024:.0f}KB)")
+                else:
+                    print(f"      ✗ {att['source']} (업로드 실패)")
+
+    # 동일 내용/유사 스크린샷 첨부파일은 대표 파일의 URL 공유
+    uploaded: list[dict] = []
+    for att in attachments:
+        if "url" not in att:
+            shared = pending.get(att.get("dedupe_key") or att["sha256"], {}).get("url")
+            if not shared:
+                continue
+            att["url"] = shared
+            if journal:
+                journal.record_blob(att["blob_path"], att["sha256"], att["size"], shared)
+        uploaded.append(att)
+
+    if not uploaded:
+        print(f"    [warn] {timestamp}: 업로드된 첨부파일 없음")
+        return False
+
+    failed = total - len(uploaded)
+    saved = _save_artifact_metadata(timestamp, uploaded, dashboard_url)
+    return saved and failed == 0
+
+
+# ─── 기존 함수 ────────────────────────────────────────────────────
+
+def _analyze_failures(failed: list[tuple[int, TestResult]], results_dir: Path,
+                      cache: FailureAnalysisCache, clusters: dict[str, int] | None = None) -> dict[int, str]:
+    """실패 케이스를 시그니처 캐시로 거르고, 남은 케이스만 병렬로 AI 분석합니다.
+
+    clusters(결과 uuid → 실패 클러스터 id)를 넘기면 같은 근본 원인으로 묶인 케이스도 한 번만 분석합니다.
+
+    Returns:
+        케이스 index → 분석 결과
+    """
+    # 시그니처가 같고 화면이 비슷한 케이스는 한 번만 분석
+    groups: list[dict] = []
+    analyses: dict[int, str] = {}
+    hits = 0
+    for index, r in failed:
+        screenshot_path = r.find_attachment(results_dir, IMAGE_SUFFIXES)
+        page_source_path = r.find_attachment(results_dir, ".xml")
+        key = signature_key(failure_signature(r.message, r.trace, page_source_path))
+        phash = dhash(screenshot_path) if screenshot_path else None
+
+        cached = cache.get(key, phash)
+        if cached:
+            analyses[index] = cached
+            hits += 1
+            continue
+
+        cluster = (clusters or {}).get(r.uuid)
+        for group in groups:
+            if (group["key"] == key and is_similar(group["phash"], phash)) or (
+                cluster is not None and group["cluster"] == cluster
+            ):
+                group["indexes"].append(index)
+                break
+        else:
+            groups.append({
+                "key": key,
+                "phash": phash,
+                "cluster": cluster,
+                "indexes": [index],
+                "kwargs": {
+                    "test_name": r.name,
+                    "error_message": r.message,
+                    "status_trace": r.trace,
+                    "screenshot_path": screenshot_path,
+                    "page_source_path": page_source_path,
+                },
+            })
+
+    if hits:
+        print(f"    [ai] 캐시 재사용: {hits}건")
+    if not groups:
+        return analyses
+
+    print(f"    [ai] {len(groups)}건 분석 중... (workers: {AI_ANALYSIS_WORKERS})")
+    with ThreadPoolExecutor(max_workers=min(AI_ANALYSIS_WORKERS, len(groups))) as pool:
+        futures = {pool.submit(_analyze_failed_case, **g["kwargs"]): g for g in groups}
+        for future in as_completed(futures):
+            group = futures[future]
+            analysis = future.result()
+            if not analysis:
+                continue
+            cache.put(group["key"], group["phash"], analysis)
+            for index in group["indexes"]:
+                analyses[index] = analysis
+            print(f"    [ai] {group['kwargs']['test_name']} 분석 완료 ({len(analysis)}자)")
+    try:
+        cache.save()
+    except OSError as e:
+        print(f"    [ai] 분석 캐시 저장 실패 ({cache.path}): {e}")
+    return analyses
+
+
+def _extract_test_cases(report_dir: Path, analyze: bool = True) -> list[dict]:
+    """allure-results의 *-result.json에서 개별 테스트 케이스 목록을 추출합니다.
+
+    Args:
+        report_dir: allure-reports/<timestamp> 경로
+        analyze: True이면 failed/broken 케이스에 AI 분석 수행 (시그니처 캐시 + 병렬)
+    """
+    # allure-results 폴더 경로 계산 (allure-reports/<ts> → allure-results/<ts>)
+    results_dir = report_dir.parent.parent / "allure-results" / report_dir.name
+    if not results_dir.is_dir():
+        return []
+
+    cases = []
+    failed: list[tuple[int, TestResult]] = []
+    for r in load_results(results_dir).results:
+        # failed/broken 케이스는 모아서 AI 분석
+        if analyze and r.status in ("failed", "broken") and r.message:
+            failed.append((len(cases), r))
+
+        cases.append({
+            "uid": r.test_case_id or r.history_id or r.full_name,
+            "name": r.name,
+            "fullName": r.full_name,
+            "status": r.status,
+            "durationMs": r.duration_ms,
+            "feature": r.labels.get("feature", ""),
+            "story": r.labels.get("story", ""),
+            "severity": r.labels.get("severity", ""),
+            "suite": r.labels.get("suite", ""),
+            "statusMessage": r.message,
+            "statusTrace": r.trace,
+            "description": "",
+        })
+
+    if failed and (os.environ.get("ANTHROPIC_API_KEY") or os.environ.get("AI_GATEWAY_API_KEY")):
+        from failure_clusters import cluster_run  # 클러스터링(NumPy)은 실패 분석 때만
+
+        cache = FailureAnalysisCache(report_dir.parent / CACHE_NAME)
+        clusters, _ = cluster_run(results_dir, report_dir.parent)
+        for index, analysis in _analyze_failures(failed, results_dir, cache, clusters).items():
+            cases[index]["description"] = analysis
+
+    # fullName 기준 정렬
+    cases.sort(key=lambda c: c.get("fullName", ""))
+    return cases
+
+
+def _build_payload(report_dir: Path, repo_root: Path, test_cases: list[dict] | None = None) -> dict | None:
+    """report_dir에서 메타데이터를 읽어 API POST 페이로드를 생성합니다.
+
+    test_cases를 넘기면 (run_allure에서 리포트 생성과 병렬로 미리 추출한 경우) 다시 추출하지 않습니다.
+    """
+    run = _load_run_summary(report_dir)
+    if not run:
+        print(f"  [skip] {report_dir.name}: summary.json 없음")
+        return None
+
+    env = dict(run.environment or {})
+    build_name = run.executor.get("buildName", "")
+    branch = str(env.get("gitBranch") or "").strip()
+    commit = str(env.get("gitCommit") or "").strip()
+    message = str(env.get("gitMessage") or "").strip()
+
+    if not branch or not commit:
+        parsed_branch, parsed_commit = _extract_branch_commit(build_name)
+        branch = branch or parsed_branch
+        commit = commit or parsed_commit
+
+    if not message and commit:
+        message = _safe_git_message(repo_root, commit)
+
+    env.update({
+        "gitBranch": branch or None,
+        "gitCommit": commit or None,
+        "gitMessage": message or None,
+    })
+
+    # 개별 테스트 케이스 목록 추출
+    if test_cases is None:
+        test_cases = _extract_test_cases(report_dir)
+
+    # 실패 근본 원인 클러스터 요약 ("N건 실패 / K개 원인")
+    failure_clusters = None
+    results_dir = report_dir.parent.parent / "allure-results" / report_dir.name
+    if results_dir.is_dir() and any(c["status"] in ("failed", "broken") for c in test_cases):
+        from failure_clusters import cluster_run
+
+        _, failure_clusters = cluster_run(results_dir, report_dir.parent)
+
+    return {
+        "timestamp": run.timestamp,
+        "stats": run.stats,
+        "time": run.time,
+        "durationText": _duration_ms_to_hms(run.time.get("duration", 0)),
+        "executor": {
+            "name": run.executor.get("name", ""),
+            "type": run.executor.get("type", ""),
+            "buildName": run.executor.get("buildName", ""),
+            "buildUrl": run.executor.get("buildUrl", ""),
+        },
+        "environment": env,
+        "suites": run.suites,
+        "behaviors": run.behaviors,
+        "packages": run.packages,
+        "testCases": test_cases,
+        "failureClusters": failure_clusters,
+    }
+
+
+def upload_run(payload: dict, dashboard_url: str) -> bool:
+    """페이로드를 대시보드 API에 POST합니다."""
+    url = f"{dashboard_url.rstrip('/')}/api/runs"
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    req = urllib.request.Request(
+        url,
+        data=data,
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            status = resp.status
+            if status in (200, 201):
+                print(f"  [ok] {payload['timestamp']} → {status}")
+                return True
+            else:
+                print(f"  [warn] {payload['timestamp']} → HTTP {status}")
+                return False
+    except urllib.error.HTTPError as e:
+        body = e.read().decode("utf-8", errors="replace")[:200]
+        print(f"  [error] {payload['timestamp']} → HTTP {e.code}: {body}")
+        return False
+    except Exception as e:
+        print(f"  [error] {payload['timestamp']} → {e}")
+        return False
+
+
+def open_upload_state(reports_root: Path) -> tuple[_UploadJournal, BlobLedger]:
+    """reports 루트의 업로드 저널과 Blob 사용량 장부를 엽니다."""
+    return _UploadJournal(reports_root / UPLOAD_JOURNAL_NAME), BlobLedger(reports_root / LEDGER_NAME)
+
+
+def upload_report(
+    report_dir: Path,
+    dashboard_url: str,
+    repo_root: Path,
+    journal: _UploadJournal,
+    ledger: BlobLedger,
+    blob_token: str = "",
+    with_attachments: bool = True,
+    workers: int = DEFAULT_UPLOAD_WORKERS,
+    policy: str = DEFAULT_POLICY,
+    keep_last: int = DEFAULT_KEEP_LAST,
+    test_cases: list[dict] | None = None,
+    force: bool = False,
+) -> bool:
+    """리포트 1개의 메타데이터와 첨부파일을 업로드합니다. 메타데이터 업로드 성공 여부를 반환합니다.
+
+    force면 업로드 저널의 첨부파일 기록을 무시하고 모두 다시 올립니다.
+    """
+    payload = _build_payload(report_dir, repo_root, test_cases)
+    if payload is None or not upload_run(payload, dashboard_url):
+        return False
+
+    stats = payload.get("stats") or {}
+    ledger.record_run(
+        payload["timestamp"],
+        payload["environment"].get("gitBranch") or "",
+        failed=bool(stats.get("failed") or stats.get("broken")),
+    )
+    # 첨부파일 업로드
+    attachments_ok = True
+    if with_attachments:
+        attachments_ok = upload_attachments(
+            report_dir,
+            payload["timestamp"],
+            dashboard_url,
+            blob_token,
+            workers=workers,
+            journal=journal,
+            ledger=ledger,
+            policy=policy,
+            keep_last=keep_last,
+            force=force,
+        )
+    if attachments_ok:
+        journal.mark_run_complete(payload["timestamp"], with_attachments)
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Allure 테스트 결과를 Next.js 대시보드 API로 업로드합니다."
+    )
+    parser.add_argument(
+        "timestamps",
+        nargs="*",
+        help="업로드할 타임스탬프 (예: 20260216_024413)",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="모든 기존 리포트를 일괄 업로드 (마이그레이션용)",
+    )
+    parser.add_argument(
+        "--no-attachments",
+        action="store_true",
+        help="첨부파일 업로드 건너뛰기 (메타데이터만 업로드)",
+    )
+    parser.add_argument(
+        "--reports-root",
+        default="allure-reports",
+        help="Allure reports 루트 디렉토리 (기본: allure-reports)",
+    )
+    parser.add_argument(
+        "--dashboard-url",
+        default=DEFAULT_DASHBOARD_URL,
+        help=f"대시보드 API URL (기본: {DEFAULT_DASHBOARD_URL})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_UPLOAD_WORKERS,
+        help=f"첨부파일 동시 업로드 수 (기본: {DEFAULT_UPLOAD_WORKERS})",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="업로드 저널을 무시하고 완료된 리포트와 첨부파일도 다시 업로드",
+    )
+    parser.add_argument(
+        "--eviction-policy",
+        choices=sorted(EVICTION_POLICIES),
+        default=DEFAULT_POLICY,
+        help=f"Blob 용량 초과 시 정리 정책 (기본: {DEFAULT_POLICY})",
+    )
+    parser.add_argument(
+        "--keep-last",
+        type=int,
+        default=DEFAULT_KEEP_LAST,
+        help=f"keep-last-per-branch 정책의 브랜치별 보존 실행 수 (기본: {DEFAULT_KEEP_LAST})",
+    )
+    args = parser.parse_args()
+
+    reports_root = Path(args.reports_root)
+    repo_root = reports_root.resolve().parent
+
+    if not reports_root.exists():
+        print(f"[error] reports-root 경로가 존재하지 않습니다: {reports_root}")
+        return 1
+
+    # Blob 토큰 확인
+    blob_token = os.environ.get("BLOB_READ_WRITE_TOKEN", "")
+    if not args.no_attachments and not blob_token:
+        print("[warn] BLOB_READ_WRITE_TOKEN 미설정 → 첨부파일 업로드 건너뜀")
+        print("       .env 파일에 BLOB_READ_WRITE_TOKEN을 추가하거나 --no-attachments 옵션을 사용하세요.")
+        args.no_attachments = True
+
+    # 업로드 대상 결정
+    if args.all:
+        targets = sorted(
+            [d for d in reports_root.iterdir() if d.is_dir() and _TIMESTAMP_DIR_RE.match(d.name)],
+            key=lambda p: p.name,
+        )
+    elif args.timestamps:
+        targets = []
+        for ts in args.timestamps:
+            d = reports_root / ts
+            if d.is_dir():
+                targets.append(d)
+            else:
+                print(f"  [skip] {ts}: 디렉토리 없음")
+    else:
+        print("[error] 타임스탬프를 지정하거나 --all 옵션을 사용하세요.")
+        return 2
+
+    if not targets:
+        print("[info] 업로드할 리포트가 없습니다.")
+        return 0
+
+    # 업로드 저널 (중단된 --all 마이그레이션 재개용) + Blob 사용량 장부
+    journal, ledger = open_upload_state(reports_root)
+    with_attachments = not args.no_attachments
+    if args.all and not args.force:
+        done = [d for d in targets if journal.is_run_complete(d.name, with_attachments)]
+        if done:
+            print(f"[upload] 저널 기준 {len(done)}개 리포트 건너뜀 (--force로 재업로드)")
+            targets = [d for d in targets if d not in done]
+
+    attachment_mode = "포함" if with_attachments else "제외"
+    print(f"[upload] {len(targets)}개 리포트 → {args.dashboard_url} (첨부파일: {attachment_mode})")
+    ok = 0
+    fail = 0
+
+    for report_dir in targets:
+        uploaded = upload_report(
+            report_dir,
+            args.dashboard_url,
+            repo_root,
+            journal,
+            ledger,
+            blob_token=blob_token,
+            with_attachments=with_attachments,
+            workers=args.workers,
+            policy=args.eviction_policy,
+            keep_last=args.keep_last,
+            force=args.force,
+        )
+        if uploaded:
+            ok += 1
+        else:
+            fail += 1
+
+    ledger.close()
+    print(f"[done] 성공: {ok}, 실패: {fail}")
+    return 0 if fail == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -19,12 +19,20 @@
 
 from __future__ import annotations
 
+import json
 import os
 import time
+import xml.etree.ElementTree as ET
 from contextlib import contextmanager
+from pathlib import Path
 
 from appium.webdriver.common.appiumby import AppiumBy
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
@@ -38,6 +46,11 @@ from config.capabilities import get_env_config
 
 DEFAULT_RESOURCE_ID_PREFIX = get_env_config()["resource_id_prefix"]
 
+# 앱 버전별 언어 목록 순서 캐시 (LANGUAGE_ORDER_CACHE 환경변수로 경로 변경)
+LANGUAGE_ORDER_CACHE = Path(__file__).resolve().parent.parent / ".cache" / "language_order.json"
+# 순서를 모를 때 scrollIntoView / 스와이프 탐색 최대 횟수
+DEFAULT_MAX_SEARCH_SWIPES = 5
+
 
 def _id(resource_id_prefix: str, suffix: str) -> str:
     """resource-id 전체 경로 생성."""
@@ -223,6 +236,96 @@ def set_language(
         )
 
 
+def _language_order_path() -> Path:
+    return Path(os.environ.get("LANGUAGE_ORDER_CACHE") or LANGUAGE_ORDER_CACHE)
+
+
+def _app_version_key() -> str:
+    """언어 목록 캐시 키 (conftest가 APK/IPA에서 읽은 앱 버전).
+
+    버전을 모르면 빈 문자열 — 다른 버전의 목록(특히 complete 표시)을 재사용하지 않도록 캐시를 쓰지 않습니다.
+    """
+    return os.environ.get("GME_APP_VERSION", "")
+
+
+def _load_language_order(version: str) -> dict:
+    """앱 버전별 언어 목록 순서 캐시: {"order": [...], "rowsPerPage": n, "complete": bool}."""
+    if not version:
+        return {}
+    try:
+        data = json.loads(_language_order_path().read_text(encoding="utf-8"))
+        entry = data.get(version)
+        return dict(entry) if isinstance(entry, dict) else {}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _save_language_order(version: str, entry: dict) -> None:
+    if not version:
+        return
+    path = _language_order_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            data = {}
+    except (OSError, ValueError):
+        data = {}
+    data[version] = entry
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _merge_order(order: list[str], visible: list[str]) -> list[str]:
+    """화면에 보인 순서를 기존 순서에 끼워 넣습니다 (겹치는 항목 기준)."""
+    merged = list(order)
+    anchor = -1
+    for name in visible:
+        if name in merged:
+            anchor = merged.index(name)
+        else:
+            merged.insert(anchor + 1, name)
+            anchor += 1
+    return merged
+
+
+def _visible_languages(page_source: str, text_id: str) -> list[str]:
+    """page_source 한 번으로 화면에 보이는 언어 항목을 순서대로 읽습니다."""
+    try:
+        root = ET.fromstring(page_source.encode("utf-8"))
+    except ET.ParseError:
+        return []
+    return [
+        elem.get("text", "")
+        for elem in root.iter()
+        if elem.get("resource-id") == text_id and elem.get("text")
+    ]
+
+
+def _click_language(driver, text_id: str, language_text: str, list_id: str) -> bool:
+    """보이는 언어 항목을 클릭하고 목록이 닫힐 때까지 기다립니다."""
+    try:
+        driver.find_element(
+            AppiumBy.ANDROID_UIAUTOMATOR,
+            f'new UiSelector().resourceId("{text_id}").text("{_quote(language_text)}")',
+        ).click()
+    except (NoSuchElementException, StaleElementReferenceException):
+        return False
+    try:
+        WebDriverWait(driver, 3).until(EC.invisibility_of_element_located((AppiumBy.ID, list_id)))
+    except TimeoutException:
+        pass
+    return True
+
+
+def _quote(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
 def _select_language_from_list(
     driver,
     language_text: str,
@@ -231,6 +334,11 @@ def _select_language_from_list(
 ) -> bool:
     """언어 목록에서 지정된 언어를 선택합니다.
 
+    1. 이 앱 버전의 목록 순서를 처음 보는 경우 page_source 한 번으로 보이는 항목을 기록
+    2. UiScrollable.scrollIntoView 한 번으로 서버 측에서 스크롤 + 탐색
+       (캐시된 순서로 필요한 스와이프 수를 미리 정함)
+    3. 실패 시 page_source를 메모리에서 검색하며 스와이프 (캐시된 순서로 방향 결정)
+
     Args:
         driver: Appium WebDriver 인스턴스
         language_text: 선택할 언어 텍스트
@@ -240,38 +348,53 @@ def _select_language_from_list(
     Returns:
         bool: 언어 선택 성공 여부
     """
-    # 방법 1: UiSelector 사용 (Android 전용, 가장 안정적)
-    try:
-        ui_selector = f'new UiSelector().resourceId("{_id(resource_id_prefix, "countryLanguageText")}").text("{language_text}")'
-        language_element = WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located(
-                (AppiumBy.ANDROID_UIAUTOMATOR, ui_selector)
-            )
-        )
-        language_element.click()
-        time.sleep(1.5)
-        return True
-    except (NoSuchElementException, TimeoutException):
-        pass
+    list_id = _id(resource_id_prefix, "languageRv")
+    text_id = _id(resource_id_prefix, "countryLanguageText")
+    version = _app_version_key()
+    entry = _load_language_order(version)
+    order = entry.get("order", [])
+
+    if entry.get("complete") and language_text not in order:
+        # 이 버전의 전체 목록에 없는 언어
+        return False
 
-    # 방법 2: 텍스트로 직접 찾기 (폴백)
+    if not order:
+        visible = _visible_languages(driver.page_source, text_id)
+        if visible:
+            entry = {**entry, "order": visible, "rowsPerPage": len(visible)}
+            _save_language_order(version, entry)
+        if language_text in visible:
+            return _click_language(driver, text_id, language_text, list_id)
+
+    # 방법 1: 서버 측 scrollIntoView (명령 1회)
+    rows = max(1, int(entry.get("rowsPerPage") or 0) or 1)
+    if language_text in entry.get("order", []):
+        swipes = entry["order"].index(language_text) // rows + 1
+    else:
+        swipes = DEFAULT_MAX_SEARCH_SWIPES
+    scroll_selector = (
+        f'new UiScrollable(new UiSelector().resourceId("{list_id}"))'
+        f".setMaxSearchSwipes({swipes})"
+        f'.scrollIntoView(new UiSelector().resourceId("{text_id}").text("{_quote(language_text)}"))'
+    )
     try:
-        text_xpath = f"//android.widget.TextView[@text='{language_text}']"
-        language_element = WebDriverWait(driver, 3).until(
-            EC.presence_of_element_located((AppiumBy.XPATH, text_xpath))
-        )
-        language_element.click()
-        time.sleep(1.5)
+        driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, scroll_selector).click()
+        try:
+            WebDriverWait(driver, 3).until(EC.invisibility_of_element_located((AppiumBy.ID, list_id)))
+        except TimeoutException:
+            pass
         return True
-    except (NoSuchElementException, TimeoutException):
+    except WebDriverException:
         pass
 
-    # 방법 3: 스크롤하며 찾기
+    # 방법 2: page_source 메모리 검색 + 스와이프
     return _select_language_with_scroll(
         driver,
         language_text=language_text,
         resource_id_prefix=resource_id_prefix,
         timeout=timeout,
+        entry=entry,
+        version=version,
     )
 
 
@@ -280,48 +403,77 @@ def _select_language_with_scroll(
     language_text: str,
     resource_id_prefix: str = DEFAULT_RESOURCE_ID_PREFIX,
     timeout: float = 10,
-    max_scrolls: int = 3,
+    max_scrolls: int = DEFAULT_MAX_SEARCH_SWIPES,
+    entry: dict | None = None,
+    version: str | None = None,
 ) -> bool:
-    """스크롤하면서 언어를 찾아 선택합니다.
+    """page_source 한 번씩만 읽으며 스와이프해 언어를 찾아 선택합니다.
+
+    보이는 항목은 앱 버전별 순서 캐시에 합쳐지고, 목록 양 끝을 모두 확인하면 전체 목록으로 표시됩니다.
 
     Args:
         driver: Appium WebDriver 인스턴스
         language_text: 선택할 언어 텍스트
         resource_id_prefix: 앱의 resource-id 접두사
         timeout: 대기 시간 (초)
-        max_scrolls: 최대 스크롤 횟수
+        max_scrolls: 방향별 최대 스크롤 횟수
+        entry: 순서 캐시 항목 (없으면 읽음)
+        version: 캐시 키 (앱 버전)
 
     Returns:
         bool: 언어 선택 성공 여부
     """
-    ui_selector = f'new UiSelector().text("{language_text}")'
-
-    for _ in range(max_scrolls):
-        try:
-            language_element = WebDriverWait(driver, 2).until(
-                EC.presence_of_element_located(
-                    (AppiumBy.ANDROID_UIAUTOMATOR, ui_selector)
-                )
-            )
-            language_element.click()
-            time.sleep(1.5)
-            return True
-
-        except (NoSuchElementException, TimeoutException):
-            _scroll_down(driver)
-            time.sleep(0.5)
-
-    return False
-
-
-def _scroll_down(driver, scroll_ratio: float = 0.5) -> None:
-    """화면을 아래로 스크롤합니다."""
+    list_id = _id(resource_id_prefix, "languageRv")
+    text_id = _id(resource_id_prefix, "countryLanguageText")
+    version = version or _app_version_key()
+    entry = dict(entry if entry is not None else _load_language_order(version))
+
+    visible = _visible_languages(driver.page_source, text_id)
+    order = entry.get("order", [])
+    # 캐시된 순서로 스크롤 방향 결정 (목표가 보이는 항목보다 위면 아래로 스와이프)
+    backward = bool(visible) and language_text in order and visible[0] in order and (
+        order.index(language_text) < order.index(visible[0])
+    )
+    directions = ("down", "up") if backward else ("up", "down")
+
+    ends = 0
+    found = False
+    for direction in directions:
+        previous: list[str] | None = None
+        for _ in range(max_scrolls + 1):
+            if visible:
+                entry["order"] = _merge_order(entry.get("order", []), visible)
+                entry["rowsPerPage"] = max(int(entry.get("rowsPerPage") or 0), len(visible))
+            if language_text in visible:
+                found = _click_language(driver, text_id, language_text, list_id)
+                break
+            if visible == previous:
+                ends += 1
+                break
+            previous = visible
+            _scroll(driver, direction)
+            visible = _visible_languages(driver.page_source, text_id)
+        if found:
+            break
+
+    if ends == 2:
+        entry["complete"] = True
+    if entry.get("order"):
+        _save_language_order(version, entry)
+    return found
+
+
+def _scroll(driver, direction: str = "up", scroll_ratio: float = 0.5) -> None:
+    """손가락 방향으로 스와이프합니다 (up = 목록을 아래로 스크롤)."""
     size = driver.get_window_size()
     start_x = size["width"] // 2
-    start_y = int(size["height"] * 0.7)
-    end_y = int(size["height"] * (0.7 - scroll_ratio * 0.4))
-
-    driver.swipe(start_x, start_y, start_x, end_y, duration=300)
+    high = int(size["height"] * 0.7)
+    low = int(size["height"] * (0.7 - scroll_ratio * 0.4))
+    if direction == "up":
+        driver.swipe(start_x, high, start_x, low, duration=300)
+    else:
+        driver.swipe(start_x, low, start_x, high, duration=300)
+    time.sleep(0.5)
 
 
 def ensure_english_language(